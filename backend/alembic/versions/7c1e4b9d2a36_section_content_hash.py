@@ -0,0 +1,35 @@
+"""section_content_hash
+
+Revision ID: 7c1e4b9d2a36
+Revises: f6688172ca60
+Create Date: 2026-10-19 10:12:44.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c1e4b9d2a36'
+down_revision: Union[str, Sequence[str], None] = 'f6688172ca60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('sections', sa.Column('content_hash', sa.String(), nullable=True))
+    op.create_table(
+        'catalog_versions',
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('version', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('name'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('catalog_versions')
+    op.drop_column('sections', 'content_hash')
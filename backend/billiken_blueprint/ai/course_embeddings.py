@@ -1,3 +1,5 @@
+from billiken_blueprint import config
+from billiken_blueprint.ai import local_embeddings
 from billiken_blueprint.domain.courses.course import CourseWithDescription
 from billiken_blueprint.ai.genai_client import genai_client
 from typing import Sequence
@@ -6,16 +8,40 @@ from google.genai.errors import APIError
 from venv import logger
 client = genai_client
 
+GEMINI_EMBEDDING_MODEL = "gemini-embedding-001"
+# Largest number of contents the Gemini API accepts in one embed request.
+GEMINI_MAX_BATCH_SIZE = 100
+
+
+def embedding_model_version() -> str:
+    """Identifies the model that produced stored embeddings.
+
+    Embeddings from different model versions are not comparable, so this is
+    part of each course's content hash in the index.
+    """
+    if config.EMBEDDING_PROVIDER == "local":
+        return "local:" + local_embeddings.get_course_model().fingerprint()
+    return GEMINI_EMBEDDING_MODEL
+
+
+def max_batch_size() -> int | None:
+    """Most courses one ``get_retrieval_course_embeddings`` call should get."""
+    if config.EMBEDDING_PROVIDER == "local":
+        return None
+    return GEMINI_MAX_BATCH_SIZE
+
+
 def get_retrieval_course_embeddings(courses: Sequence[CourseWithDescription]):
+    if config.EMBEDDING_PROVIDER == "local":
+        return local_embeddings.get_retrieval_course_embeddings(courses)
 
-    batch_size = 100
+    batch_size = GEMINI_MAX_BATCH_SIZE
     embeddings = []
     for i in range(0, len(courses), batch_size):
         batch = courses[i:i + batch_size]
-        print(f"Processing batch {i // batch_size + 1} of {len(courses) // batch_size}")
         try:
             result = client.models.embed_content(
-                model="gemini-embedding-001",
+                model=GEMINI_EMBEDDING_MODEL,
                 contents=[course.description for course in batch],
                 config=types.EmbedContentConfig(
                 task_type="RETRIEVAL_DOCUMENT"
@@ -30,13 +56,14 @@ def get_retrieval_course_embeddings(courses: Sequence[CourseWithDescription]):
             raise
         
         embeddings.extend(result.embeddings)
-        break
     return embeddings
 
 def get_query_course_embedding(query: str):
+    if config.EMBEDDING_PROVIDER == "local":
+        return local_embeddings.get_query_course_embedding(query)
     try:
         result = client.models.embed_content(
-            model="gemini-embedding-001",
+            model=GEMINI_EMBEDDING_MODEL,
             contents=query,
             config=types.EmbedContentConfig(
                 task_type="RETRIEVAL_QUERY"
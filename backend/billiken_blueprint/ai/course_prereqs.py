@@ -0,0 +1,108 @@
+import html
+import logging
+import re
+from typing import Optional, Sequence
+
+from billiken_blueprint import config
+from billiken_blueprint.ai import course_prereqs_gemini
+from billiken_blueprint.courses_at_slu.prereq_parser import (
+    PrereqParseError,
+    parse_prereqs as parse_prereqs_locally,
+)
+from billiken_blueprint.domain.courses.course_prerequisite import (
+    NestedCoursePrerequisite,
+)
+from billiken_blueprint.rate_limit import AdaptiveRateLimiter
+from billiken_blueprint.response_cache import ResponseCache
+
+logger = logging.getLogger(__name__)
+
+# Keyed by normalized snippet text, so each snippet reaches the model once.
+prereq_cache = ResponseCache(config.PREREQ_CACHE_PATH)
+
+_TAG = re.compile(r"<[^>]*>")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_snippet(reqs_text: str) -> str:
+    """Snippet text without markup, so cosmetic HTML changes (links, classes,
+    whitespace) leave it unchanged. Link text keeps every course code."""
+    text = html.unescape(_TAG.sub(" ", reqs_text))
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+def parse_prereqs(reqs_text: str, cache: ResponseCache | None = prereq_cache) -> dict:
+    """Parse a prerequisite snippet, asking the model only when necessary.
+
+    The local parser handles the regular snippets. Snippets it rejects go to
+    Gemini once; the result is cached by normalized text for later runs.
+    """
+    try:
+        return parse_prereqs_locally(reqs_text)
+    except PrereqParseError as e:
+        logger.info("Falling back to the model for prerequisites: %s", e)
+
+    text = normalize_snippet(reqs_text)
+    key = ResponseCache.key("prereqs", text)
+    if cache is not None:
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+    result = _to_prerequisite_dict(course_prereqs_gemini.parse_prereqs(text))
+    if cache is not None:
+        cache.set(key, result)
+    return result
+
+
+async def parse_many_prereqs(
+    snippets: Sequence[str],
+    cache: ResponseCache | None = prereq_cache,
+    batch_size: int = config.PREREQ_BATCH_SIZE,
+    limiter: Optional[AdaptiveRateLimiter] = None,
+    genai_client=None,
+) -> list[dict]:
+    """Parse many snippets, sending only the ones the parser rejects and the
+    cache does not know to the model, ``batch_size`` per request.
+
+    Snippets the model leaves out of a batch are retried once in a later batch.
+    """
+    limiter = limiter or AdaptiveRateLimiter(config.PREREQ_REQUESTS_PER_MINUTE)
+    results: list[Optional[dict]] = [None] * len(snippets)
+    pending: dict[str, list[int]] = {}
+    for position, snippet in enumerate(snippets):
+        try:
+            results[position] = parse_prereqs_locally(snippet)
+            continue
+        except PrereqParseError:
+            pass
+        text = normalize_snippet(snippet)
+        cached = cache.get(ResponseCache.key("prereqs", text)) if cache else None
+        if cached is not None:
+            results[position] = cached
+        else:
+            pending.setdefault(text, []).append(position)
+
+    for _ in range(2):
+        texts = list(pending)
+        for start in range(0, len(texts), batch_size):
+            batch = texts[start : start + batch_size]
+            parsed = await course_prereqs_gemini.parse_prereqs_batch(
+                batch, limiter, genai_client=genai_client
+            )
+            for text, result in zip(batch, parsed):
+                if result is None:
+                    continue
+                result = _to_prerequisite_dict(result)
+                if cache is not None:
+                    cache.set(ResponseCache.key("prereqs", text), result)
+                for position in pending.pop(text):
+                    results[position] = result
+
+    if pending:
+        raise ValueError(f"The model returned no result for {len(pending)} snippets")
+    return results
+
+
+def _to_prerequisite_dict(data: dict) -> dict:
+    return NestedCoursePrerequisite.from_dict(data).to_dict()
@@ -1,13 +1,16 @@
-from pydoc import cli
-import time
-from typing import Literal, Sequence
+import asyncio
+from typing import Literal, Optional, Sequence
 from venv import logger
 from pydantic import BaseModel
 
-from google import genai
 from google.genai import types
 from google.genai.errors import APIError
 
+from billiken_blueprint.ai.genai_client import genai_client
+from billiken_blueprint.rate_limit import AdaptiveRateLimiter
+
+MODEL = "gemini-2.5-flash"
+
 
 class CoursePrereq(BaseModel):
     major_code: str
@@ -18,31 +21,48 @@ class CoursePrereq(BaseModel):
 
 class ResponseModel(BaseModel):
     operator: Literal["AND", "OR"]
-    operands: Sequence[ResponseModel | CoursePrereq]
+    operands: Sequence["ResponseModel | CoursePrereq"]
+
+
+ResponseModel.model_rebuild()
+
+
+class BatchItem(BaseModel):
+    id: int
+    prerequisites: ResponseModel
+
+
+class BatchResponseModel(BaseModel):
+    results: list[BatchItem]
 
 
 client = genai_client
 
+SYSTEM_PROMPT = (
+    "You must create an abstract syntax tree representation of course "
+    "prerequisites. You must only respond with a JSON object matching the "
+    "schema provided. Course numbers only exist as a full caps major code "
+    "followed by a space and then the course number (e.g., CSCI 1010). "
+    "If a course range is provided (e.g., CSCI 1010-1090), you must "
+    "represent it using the 'end_number' field. If a course cannot be "
+    "conformed to a course code (e.g. '1520 on the placement exam'), you must "
+    "omit it from the response."
+)
+
+BATCH_PROMPT = SYSTEM_PROMPT + (
+    " You will receive several prerequisite snippets, each inside a "
+    '<snippet id="N"> element. Respond with exactly one result per snippet, '
+    "carrying the snippet's id and its syntax tree in 'prerequisites'."
+)
 
-def parse_prereqs(reqs_text: str) -> dict:
-    time.sleep(12)
-    system_prompt = (
-        "You must create an abstract syntax tree representation of course "
-        "prerequisites. You must only respond with a JSON object matching the "
-        "schema provided. Course numbers only exist as a full caps major code "
-        "followed by a space and then the course number (e.g., CSCI 1010). "
-        "If a course range is provided (e.g., CSCI 1010-1090), you must "
-        "represent it using the 'end_number' field. If a course cannot be "
-        "conformed to a course code (e.g. '1520 on the placement exam'), you must "
-        "omit it from the response."
-    )
 
+def parse_prereqs(reqs_text: str) -> dict:
     try:
         response = client.models.generate_content(
-            model="gemini-2.5-flash",
+            model=MODEL,
             contents=reqs_text,
             config=types.GenerateContentConfig(
-                system_instruction=system_prompt,
+                system_instruction=SYSTEM_PROMPT,
                 response_mime_type="application/json",
                 response_json_schema=ResponseModel.model_json_schema(),
             ),
@@ -60,6 +80,67 @@ def parse_prereqs(reqs_text: str) -> dict:
         raise
 
 
+async def parse_prereqs_batch(
+    snippets: Sequence[str],
+    limiter: AdaptiveRateLimiter,
+    genai_client=None,
+    max_retries: int = 5,
+) -> list[Optional[dict]]:
+    """Parse many snippets with one structured-output request.
+
+    Requests go through ``limiter``, which slows down on every 429 and speeds
+    back up on success. The result at each position is ``None`` if the model
+    left that snippet out of its response.
+    """
+    genai_client = genai_client or client
+    contents = "\n".join(
+        f'<snippet id="{id}">{snippet}</snippet>' for id, snippet in enumerate(snippets)
+    )
+    config = types.GenerateContentConfig(
+        system_instruction=BATCH_PROMPT,
+        response_mime_type="application/json",
+        response_json_schema=BatchResponseModel.model_json_schema(),
+    )
+
+    attempt = 0
+    while True:
+        await limiter.acquire()
+        try:
+            response = await asyncio.to_thread(
+                genai_client.models.generate_content,
+                model=MODEL,
+                contents=contents,
+                config=config,
+            )
+            break
+        except APIError as e:
+            if e.code != 429 or attempt >= max_retries:
+                logger.error(f"API Error: {e.message}")
+                raise
+            attempt += 1
+            limiter.throttled(_retry_delay(e))
+    limiter.succeeded()
+
+    results: list[Optional[dict]] = [None] * len(snippets)
+    for item in BatchResponseModel.model_validate_json(response.text).results:
+        if 0 <= item.id < len(snippets):
+            results[item.id] = item.prerequisites.model_dump()
+    return results
+
+
+def _retry_delay(error: APIError) -> Optional[float]:
+    """Seconds from the RetryInfo of a 429 response (e.g. "17s"), if any."""
+    details = error.details.get("error", {}) if isinstance(error.details, dict) else {}
+    for detail in details.get("details", []):
+        delay = detail.get("retryDelay", "") if isinstance(detail, dict) else ""
+        if delay.endswith("s"):
+            try:
+                return float(delay[:-1])
+            except ValueError:
+                pass
+    return None
+
+
 if __name__ == "__main__":
     text = '<a href="/search/?p=CSCI%205030" data-action="result-detail" data-group="code:CSCI 5030" >CSCI 5030</a> with a grade of C- or higher'
     text = '((0 Course from <a href="/search/?p=CSCI%201010" data-action="result-detail" data-group="code:CSCI 1010"  class="notoffered">CSCI 1010</a>-<a href="/search/?p=CSCI%201090" data-action="result-detail" data-group="code:CSCI 1090"  class="notoffered">1090</a> with a grade of C- or higher, <a href="/search/?p=BME%202000" data-action="result-detail" data-group="code:BME 2000" >BME 2000</a> with a grade of C- or higher, <a href="/search/?p=CVNG%201500" data-action="result-detail" data-group="code:CVNG 1500"  class="notoffered">CVNG 1500</a> with a grade of C- or higher, <a href="/search/?p=MATH%203850" data-action="result-detail" data-group="code:MATH 3850"  class="notoffered">MATH 3850</a> with a grade of C- or higher, <a href="/search/?p=STAT%203850" data-action="result-detail" data-group="code:STAT 3850" >STAT 3850</a> with a grade of C- or higher, <a href="/search/?p=ECE%201001" data-action="result-detail" data-group="code:ECE 1001" >ECE 1001</a> with a grade of C- or higher, or <a href="/search/?p=GIS%204090" data-action="result-detail" data-group="code:GIS 4090"  class="notoffered">GIS 4090</a> with a grade of C- or higher); (<a href="/search/?p=MATH%201200" data-action="result-detail" data-group="code:MATH 1200" >MATH 1200</a> or 0 Course from <a href="/search/?p=MATH%201320" data-action="result-detail" data-group="code:MATH 1320" >MATH 1320</a>-<a href="/search/?p=MATH%204999" data-action="result-detail" data-group="code:MATH 4999"  class="notoffered">4999</a>))'
@@ -0,0 +1,280 @@
+"""Offline course embeddings: hashed TF-IDF features reduced with a truncated SVD.
+
+This is a latent semantic analysis model computed in-process with NumPy. It
+needs no network access, fits the whole catalog in a few seconds and is fully
+deterministic (tokens are hashed with CRC32 and the randomized SVD uses a fixed
+seed), so search and the index build work in CI and without ``GEMINI_API_KEY``.
+
+The fitted model is persisted to ``config.LOCAL_EMBEDDING_MODEL_PATH`` so query
+embeddings are projected into the same space as the indexed documents.
+"""
+
+import hashlib
+import re
+import zlib
+from functools import lru_cache
+from pathlib import Path
+from typing import Sequence
+
+import numpy as np
+from google.genai import types
+
+from billiken_blueprint import config
+from billiken_blueprint.domain.courses.course import CourseWithDescription
+
+HASH_BUCKETS = 2**20
+DEFAULT_DIMENSIONS = 256
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+_STOP_WORDS = frozenset(
+    """
+    a an and are as at be by for from has have in into is it its of on or
+    that the their this to was were will with within who which students
+    student course courses topics include including also may
+    """.split()
+)
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase word unigrams and bigrams with stop words removed."""
+    words = [w for w in _TOKEN_PATTERN.findall(text.lower()) if w not in _STOP_WORDS]
+    return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+
+def course_document(course: CourseWithDescription) -> str:
+    return f"{course.major_code} {course.course_number} {course.description}"
+
+
+class LocalEmbeddingModel:
+    def __init__(
+        self,
+        buckets: np.ndarray,
+        idf: np.ndarray,
+        components: np.ndarray,
+    ):
+        # Sorted hash buckets seen while fitting; the column of a bucket in the
+        # feature matrix is its position in this array.
+        self.buckets = buckets
+        self.idf = idf
+        self.components = components
+
+    @property
+    def dimensions(self) -> int:
+        return self.components.shape[1]
+
+    @classmethod
+    def fit(
+        cls,
+        documents: Sequence[str],
+        dimensions: int = DEFAULT_DIMENSIONS,
+        min_df: int = 2,
+        n_iter: int = 4,
+        seed: int = 0,
+    ) -> "LocalEmbeddingModel":
+        rows, hashes, counts = _hash_documents(documents)
+
+        buckets, columns = np.unique(hashes, return_inverse=True)
+        df = np.bincount(columns, minlength=len(buckets))
+        keep = df >= min(min_df, len(documents))
+        remap = np.cumsum(keep) - 1
+        entries = keep[columns]
+
+        buckets = buckets[keep]
+        df = df[keep]
+        idf = (np.log((1 + len(documents)) / (1 + df)) + 1).astype(np.float32)
+
+        matrix = _CsrMatrix.from_entries(
+            rows[entries],
+            remap[columns[entries]],
+            _tf(counts[entries]) * idf[remap[columns[entries]]],
+            shape=(len(documents), len(buckets)),
+        )
+        matrix.normalize_rows()
+
+        components = _randomized_svd_components(matrix, dimensions, n_iter, seed)
+        return cls(buckets, idf, components)
+
+    def transform(self, documents: Sequence[str]) -> np.ndarray:
+        """Embed documents as L2-normalized float32 rows."""
+        rows, hashes, counts = _hash_documents(documents)
+        columns = np.searchsorted(self.buckets, hashes)
+        columns = np.minimum(columns, len(self.buckets) - 1)
+        known = self.buckets[columns] == hashes
+
+        matrix = _CsrMatrix.from_entries(
+            rows[known],
+            columns[known],
+            _tf(counts[known]) * self.idf[columns[known]],
+            shape=(len(documents), len(self.buckets)),
+        )
+        matrix.normalize_rows()
+
+        embeddings = matrix.dot(self.components)
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return embeddings / norms
+
+    def fingerprint(self) -> str:
+        """Short digest of the fitted parameters; changes whenever a refit does."""
+        digest = hashlib.sha256()
+        for array in (self.buckets, self.idf, self.components):
+            digest.update(np.ascontiguousarray(array).tobytes())
+        return digest.hexdigest()[:16]
+
+    def save(self, path: str | Path) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        np.savez_compressed(
+            path, buckets=self.buckets, idf=self.idf, components=self.components
+        )
+
+    @classmethod
+    def load(cls, path: str | Path) -> "LocalEmbeddingModel":
+        with np.load(path) as data:
+            return cls(data["buckets"], data["idf"], data["components"])
+
+
+def fit_course_model(
+    courses: Sequence[CourseWithDescription],
+    path: str | Path | None = None,
+) -> LocalEmbeddingModel:
+    """Fit the model on the catalog and persist it for query-time use."""
+    model = LocalEmbeddingModel.fit([course_document(c) for c in courses])
+    model.save(path or config.LOCAL_EMBEDDING_MODEL_PATH)
+    get_course_model.cache_clear()
+    return model
+
+
+@lru_cache(maxsize=1)
+def get_course_model() -> LocalEmbeddingModel:
+    return LocalEmbeddingModel.load(config.LOCAL_EMBEDDING_MODEL_PATH)
+
+
+def get_retrieval_course_embeddings(
+    courses: Sequence[CourseWithDescription],
+) -> list[types.ContentEmbedding]:
+    if not Path(config.LOCAL_EMBEDDING_MODEL_PATH).exists():
+        fit_course_model(courses)
+
+    vectors = get_course_model().transform([course_document(c) for c in courses])
+    return [types.ContentEmbedding(values=row.tolist()) for row in vectors]
+
+
+def get_query_course_embedding(query: str) -> types.ContentEmbedding:
+    vector = get_course_model().transform([query])[0]
+    return types.ContentEmbedding(values=vector.tolist())
+
+
+def _hash_documents(
+    documents: Sequence[str],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return (row, bucket, count) triples for every distinct token per document."""
+    rows, hashes, counts = [], [], []
+    for row, document in enumerate(documents):
+        token_counts: dict[int, int] = {}
+        for token in tokenize(document):
+            bucket = zlib.crc32(token.encode()) % HASH_BUCKETS
+            token_counts[bucket] = token_counts.get(bucket, 0) + 1
+        rows.extend([row] * len(token_counts))
+        hashes.extend(token_counts.keys())
+        counts.extend(token_counts.values())
+    return (
+        np.array(rows, dtype=np.int64),
+        np.array(hashes, dtype=np.int64),
+        np.array(counts, dtype=np.float32),
+    )
+
+
+def _tf(counts: np.ndarray) -> np.ndarray:
+    return (1 + np.log(counts)).astype(np.float32)
+
+
+class _CsrMatrix:
+    """Just enough of a compressed sparse row matrix for TF-IDF and SVD."""
+
+    # Bounds the (nnz x k) temporary built by dot products.
+    CHUNK_ENTRIES = 1 << 16
+
+    def __init__(self, indptr, indices, data, shape):
+        self.indptr = indptr
+        self.indices = indices
+        self.data = data
+        self.shape = shape
+
+    @classmethod
+    def from_entries(cls, rows, columns, values, shape) -> "_CsrMatrix":
+        order = np.lexsort((columns, rows))
+        indptr = np.zeros(shape[0] + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=shape[0]), out=indptr[1:])
+        return cls(
+            indptr,
+            columns[order].astype(np.int64),
+            values[order].astype(np.float32),
+            shape,
+        )
+
+    def transpose(self) -> "_CsrMatrix":
+        rows = np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+        return _CsrMatrix.from_entries(
+            self.indices, rows, self.data, (self.shape[1], self.shape[0])
+        )
+
+    def normalize_rows(self) -> None:
+        squares = np.zeros(self.shape[0], dtype=np.float32)
+        lengths = np.diff(self.indptr)
+        nonempty = lengths > 0
+        squares[nonempty] = np.add.reduceat(
+            self.data**2, self.indptr[:-1][nonempty]
+        )
+        norms = np.sqrt(squares)
+        norms[norms == 0] = 1.0
+        self.data /= np.repeat(norms, lengths)
+
+    def dot(self, dense: np.ndarray) -> np.ndarray:
+        out = np.zeros((self.shape[0], dense.shape[1]), dtype=np.float32)
+        start_row = 0
+        while start_row < self.shape[0]:
+            stop_row = int(
+                np.searchsorted(
+                    self.indptr,
+                    self.indptr[start_row] + self.CHUNK_ENTRIES,
+                    side="right",
+                )
+            )
+            stop_row = min(max(stop_row - 1, start_row + 1), self.shape[0])
+
+            indptr = self.indptr[start_row : stop_row + 1]
+            lo, hi = indptr[0], indptr[-1]
+            if hi > lo:
+                products = self.data[lo:hi, None] * dense[self.indices[lo:hi]]
+                nonempty = np.diff(indptr) > 0
+                out[start_row:stop_row][nonempty] = np.add.reduceat(
+                    products, indptr[:-1][nonempty] - lo, axis=0
+                )
+            start_row = stop_row
+        return out
+
+
+def _randomized_svd_components(
+    matrix: _CsrMatrix, dimensions: int, n_iter: int, seed: int
+) -> np.ndarray:
+    """Top right singular vectors of ``matrix`` (Halko et al. range finder)."""
+    rank = max(1, min(dimensions, *matrix.shape))
+    sketch = min(rank + 10, *matrix.shape)
+    transposed = matrix.transpose()
+
+    rng = np.random.default_rng(seed)
+    omega = rng.standard_normal((matrix.shape[1], sketch)).astype(np.float32)
+    q, _ = np.linalg.qr(matrix.dot(omega))
+    for _ in range(n_iter):
+        q, _ = np.linalg.qr(transposed.dot(q))
+        q, _ = np.linalg.qr(matrix.dot(q))
+
+    b = transposed.dot(q).T  # q.T @ matrix
+    _, _, vt = np.linalg.svd(b, full_matrices=False)
+    components = vt[:rank].T
+
+    # Fix the sign of each component so refits produce identical embeddings.
+    signs = np.sign(components[np.abs(components).argmax(axis=0), range(rank)])
+    signs[signs == 0] = 1.0
+    return (components * signs).astype(np.float32)
@@ -1,10 +1,12 @@
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, HTTPException, Query, status
 from fastapi.routing import APIRoute
 
 from billiken_blueprint.dependencies import (
     CourseRepo,
     CourseDescriptionsCollection,
+    CourseLexicalIndex,
     CurrentStudent,
+    SimilarCourses,
 )
 from billiken_blueprint.use_cases.get_courses_from_user_query import (
     get_courses_from_user_query,
@@ -18,11 +20,15 @@ router = APIRouter(prefix="/courses", tags=["courses"])
 async def search_courses(
     query: str,
     collection: CourseDescriptionsCollection,
+    lexical_index: CourseLexicalIndex,
     student: CurrentStudent,
 ):
     excluded_ids = student.completed_course_ids + student.desired_course_ids
     results = get_courses_from_user_query(
-        query, collection, excluded_course_ids=excluded_ids
+        query,
+        collection,
+        excluded_course_ids=excluded_ids,
+        lexical_index=lexical_index,
     )
     return results
 
@@ -37,3 +43,24 @@ async def list_courses(course_repo: CourseRepo):
         )
         for course in courses
     ]
+
+
+@router.get("/{course_id}/similar")
+async def get_similar_courses(
+    course_id: int,
+    graph: SimilarCourses,
+    limit: int = Query(default=10, ge=1, le=50),
+):
+    if course_id not in graph:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Course not found",
+        )
+    return [
+        dict(
+            id=similar.course_id,
+            courseCode=similar.course_code,
+            score=similar.score,
+        )
+        for similar in graph.similar(course_id, limit=limit)
+    ]
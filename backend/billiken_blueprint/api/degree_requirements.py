@@ -1,42 +1,133 @@
+import asyncio
 from dataclasses import asdict
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, HTTPException, Query, status
 from pydantic import BaseModel
 
 from billiken_blueprint.courses_at_slu.semester import Semester
 from billiken_blueprint.dependencies import (
+    CatalogVersionRepo,
+    Coalescer,
     CourseAttributeRepo,
     CourseRepo,
     CurrentStudent,
     DegreeRepo,
     InstructorRepo,
     RatingRepo,
+    ScheduleExec,
     SectionRepo,
 )
 from billiken_blueprint.domain.courses.course import CourseWithAttributes
 from billiken_blueprint.domain.courses.course_code import CourseCode
-from billiken_blueprint.use_cases.get_schedule import (
-    get_combined_requirements,
-    get_schedule,
+from billiken_blueprint.repositories.course_attribute_repository import (
+    CourseAttributeRepository,
+)
+from billiken_blueprint.repositories.course_repository import CourseRepository
+from billiken_blueprint.repositories.instructor_repository import InstructorRepository
+from billiken_blueprint.repositories.rating_repository import RatingRepository
+from billiken_blueprint.repositories.catalog_version_repository import (
+    COURSES,
+    SECTIONS,
+)
+from billiken_blueprint.repositories.unit_of_work import (
+    run_concurrently,
+    unit_of_work,
+)
+from billiken_blueprint.use_cases.get_schedule import get_combined_requirements
+from billiken_blueprint.use_cases.schedule_executor import (
+    CatalogSnapshot,
+    ScheduleExecutorBusy,
+    ScheduleRequest,
+    ScheduleTimeout,
+    SnapshotUnavailable,
 )
 
 
 router = APIRouter(prefix="/degree-requirements", tags=["degree-requirements"])
 
 
+async def load_courses_with_attributes(
+    course_repo: CourseRepository, course_attribute_repo: CourseAttributeRepository
+) -> list[CourseWithAttributes]:
+    # A shared load runs outside the request's unit of work; open its own so
+    # the attribute lookups still share one session.
+    async with unit_of_work():
+        all_courses = await course_repo.get_all()
+        return [
+            await CourseWithAttributes.from_course(course, course_attribute_repo)
+            for course in all_courses
+        ]
+
+
+async def load_instructor_ratings_map(
+    instructor_repo: InstructorRepository, rating_repo: RatingRepository
+) -> dict[str, float]:
+    all_instructors, all_user_ratings = await run_concurrently(
+        instructor_repo.get_all(), rating_repo.get_all()
+    )
+
+    # Create a mapping of instructor name -> rating
+    # Priority: RMP rating > aggregated user-submitted ratings
+    instructor_ratings_map: dict[str, float] = {}
+
+    # First, add RMP ratings (for CSCI and MATH departments)
+    for instructor in all_instructors:
+        if instructor.rmp_rating is not None:
+            name_normalized = instructor.name.strip().lower()
+            instructor_ratings_map[name_normalized] = instructor.rmp_rating
+            instructor_ratings_map[instructor.name.strip()] = instructor.rmp_rating
+
+    # Then, aggregate user-submitted ratings for instructors without RMP ratings
+    # This covers all departments, not just CSCI and MATH
+
+    # Group ratings by instructor_id and calculate averages
+    instructor_ratings_by_id: dict[int, list[int]] = {}
+    for rating in all_user_ratings:
+        if rating.professor_id and rating.rating_value is not None:
+            if rating.professor_id not in instructor_ratings_by_id:
+                instructor_ratings_by_id[rating.professor_id] = []
+            instructor_ratings_by_id[rating.professor_id].append(rating.rating_value)
+
+    # Calculate average ratings and add to map (only if RMP rating doesn't exist)
+    for instructor in all_instructors:
+        # Skip if already has RMP rating
+        if instructor.rmp_rating is not None:
+            continue
+
+        # Check if instructor has user-submitted ratings
+        if instructor.id and instructor.id in instructor_ratings_by_id:
+            ratings = instructor_ratings_by_id[instructor.id]
+            if ratings:
+                avg_rating = sum(ratings) / len(ratings)
+                # Only add if we have at least 2 ratings (to avoid single biased ratings)
+                # Or if instructor doesn't have RMP rating and has user ratings
+                if len(ratings) >= 1:  # Allow single ratings as fallback
+                    name_normalized = instructor.name.strip().lower()
+                    # Only add if not already in map (RMP takes priority)
+                    if name_normalized not in instructor_ratings_map:
+                        instructor_ratings_map[name_normalized] = avg_rating
+                        instructor_ratings_map[instructor.name.strip()] = avg_rating
+
+    return instructor_ratings_map
+
+
 @router.get("")
 async def get_degree_requirements(
     student: CurrentStudent,
     degree_repo: DegreeRepo,
     course_repo: CourseRepo,
     course_attribute_repo: CourseAttributeRepo,
+    single_flight: Coalescer,
 ):
-    all_courses = await course_repo.get_all()
-    all_courses_with_attrs = [
-        await CourseWithAttributes.from_course(course, course_attribute_repo)
-        for course in all_courses
-    ]
-    degree = await degree_repo.get_by_id(student.degree_id)
+    # Concurrent requests share these loads instead of each running them.
+    all_courses_with_attrs = await single_flight.do(
+        "courses_with_attributes",
+        None,
+        lambda: load_courses_with_attributes(course_repo, course_attribute_repo),
+    )
+    degree = await single_flight.do(
+        "degree", student.degree_id, lambda: degree_repo.get_by_id(student.degree_id)
+    )
     all_requirements = get_combined_requirements(
         degree, student, all_courses_with_attrs
     )
@@ -102,6 +193,9 @@ async def autogenerate_schedule(
     course_attribute_repo: CourseAttributeRepo,
     instructor_repo: InstructorRepo,
     rating_repo: RatingRepo,
+    catalog_versions: CatalogVersionRepo,
+    schedule_executor: ScheduleExec,
+    single_flight: Coalescer,
     semester: str = Query(
         Semester.SPRING, description="Semester code (e.g., '202501' for Spring 2025)"
     ),
@@ -109,88 +203,89 @@ async def autogenerate_schedule(
         [], description="List of section IDs to exclude from the schedule"
     ),
 ):
-    degree = await degree_repo.get_by_id(student.degree_id)
-    all_courses = await course_repo.get_all()
-    all_courses_with_attrs = [
-        await CourseWithAttributes.from_course(course, course_attribute_repo)
-        for course in all_courses
-    ]
-    taken_courses = [
-        await course_repo.get_by_id(cid) for cid in student.completed_course_ids
-    ]
-    taken_courses_with_attrs = [
-        await CourseWithAttributes.from_course(course, course_attribute_repo)
-        for course in taken_courses
-        if course
-    ]
-    all_sections = await sections_repo.get_all_for_semester(semester)
-    all_sections = [
-        section
-        for section in all_sections
-        if section.campus_code == "North Campus (Main Campus)"
-    ]
-
-    # Get all instructors and create a mapping of instructor name -> rating
-    # Priority: RMP rating > aggregated user-submitted ratings
-    all_instructors = await instructor_repo.get_all()
-    instructor_ratings_map: dict[str, float] = {}
-
-    # First, add RMP ratings (for CSCI and MATH departments)
-    for instructor in all_instructors:
-        if instructor.rmp_rating is not None:
-            name_normalized = instructor.name.strip().lower()
-            instructor_ratings_map[name_normalized] = instructor.rmp_rating
-            instructor_ratings_map[instructor.name.strip()] = instructor.rmp_rating
+    # The loads are independent; issue them together. Concurrent requests
+    # share the degree, ratings and snapshot loads instead of each running them.
+    catalog_version, degree, instructor_ratings_map = await run_concurrently(
+        catalog_versions.get_many([COURSES, SECTIONS]),
+        single_flight.do(
+            "degree",
+            student.degree_id,
+            lambda: degree_repo.get_by_id(student.degree_id),
+        ),
+        single_flight.do(
+            "instructor_ratings_map",
+            None,
+            lambda: load_instructor_ratings_map(instructor_repo, rating_repo),
+        ),
+    )
 
-    # Then, aggregate user-submitted ratings for instructors without RMP ratings
-    # This covers all departments, not just CSCI and MATH
-    all_user_ratings = await rating_repo.get_all()
+    # Courses and sections go to the schedule workers once per catalog version;
+    # any course, attribute or section write moves the key.
+    courses_version, sections_version = catalog_version
+    snapshot_key = f"{courses_version}:{sections_version}:{semester}"
 
-    # Group ratings by instructor_id and calculate averages
-    instructor_ratings_by_id: dict[int, list[int]] = {}
-    for rating in all_user_ratings:
-        if rating.professor_id and rating.rating_value is not None:
-            if rating.professor_id not in instructor_ratings_by_id:
-                instructor_ratings_by_id[rating.professor_id] = []
-            instructor_ratings_by_id[rating.professor_id].append(rating.rating_value)
-
-    # Calculate average ratings and add to map (only if RMP rating doesn't exist)
-    for instructor in all_instructors:
-        # Skip if already has RMP rating
-        if instructor.rmp_rating is not None:
-            continue
+    async def publish_snapshot() -> None:
+        all_courses_with_attrs, all_sections = await run_concurrently(
+            single_flight.do(
+                "courses_with_attributes",
+                None,
+                lambda: load_courses_with_attributes(
+                    course_repo, course_attribute_repo
+                ),
+            ),
+            sections_repo.get_table_for_semester(semester),
+        )
+        all_sections = all_sections.take(
+            all_sections.campus_is("North Campus (Main Campus)")
+        )
+        await asyncio.to_thread(
+            schedule_executor.publish,
+            CatalogSnapshot(
+                snapshot_key, all_courses_with_attrs, all_sections, semester
+            ),
+        )
 
-        # Check if instructor has user-submitted ratings
-        if instructor.id and instructor.id in instructor_ratings_by_id:
-            ratings = instructor_ratings_by_id[instructor.id]
-            if ratings:
-                avg_rating = sum(ratings) / len(ratings)
-                # Only add if we have at least 2 ratings (to avoid single biased ratings)
-                # Or if instructor doesn't have RMP rating and has user ratings
-                if len(ratings) >= 1:  # Allow single ratings as fallback
-                    name_normalized = instructor.name.strip().lower()
-                    # Only add if not already in map (RMP takes priority)
-                    if name_normalized not in instructor_ratings_map:
-                        instructor_ratings_map[name_normalized] = avg_rating
-                        instructor_ratings_map[instructor.name.strip()] = avg_rating
+    if not schedule_executor.has_snapshot(snapshot_key):
+        await single_flight.do("catalog_snapshot", snapshot_key, publish_snapshot)
 
-    schedule = get_schedule(
-        degree,
-        student,
-        taken_courses_with_attrs,
-        all_courses_with_attrs,
-        all_sections,
-        [
-            [
-                CourseCode("CORE", "1900"),
-                CourseCode("ENGL", "1900"),
-            ]
-        ],
-        unavailability_times=student.unavailability_times,
-        avoid_times=student.avoid_times,
-        instructor_ratings_map=instructor_ratings_map,
-        discarded_section_ids=discarded_section_ids,
-    )
+    try:
+        schedule = await schedule_executor.run(
+            snapshot_key,
+            ScheduleRequest(
+                degree,
+                student,
+                student.completed_course_ids,
+                [
+                    [
+                        CourseCode("CORE", "1900"),
+                        CourseCode("ENGL", "1900"),
+                    ]
+                ],
+                unavailability_times=student.unavailability_times,
+                avoid_times=student.avoid_times,
+                instructor_ratings_map=instructor_ratings_map,
+                discarded_section_ids=discarded_section_ids,
+            ),
+        )
+    except ScheduleExecutorBusy:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many schedules are being generated; try again shortly",
+            headers={"Retry-After": "1"},
+        )
+    except SnapshotUnavailable:
+        # The catalog changed while this request was loading; a newer snapshot
+        # replaced the one it would have used.
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="The catalog was just updated; try again",
+            headers={"Retry-After": "1"},
+        )
+    except ScheduleTimeout:
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail="Generating the schedule took too long",
+        )
 
     return AutogenerateScheduleResponse(
         sections=[
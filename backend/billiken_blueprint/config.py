@@ -1,5 +1,73 @@
+import os
+
 with open("dev-certs/jwt.pem", "r") as f:
     JWT_PRIVATE_KEY = f.read()
 
 with open("dev-certs/jwt.pub", "r") as f:
     JWT_PUBLIC_KEY = f.read()
+
+# Embedding provider for course search: "gemini" or "local"
+EMBEDDING_PROVIDER = os.getenv("EMBEDDING_PROVIDER", "gemini")
+LOCAL_EMBEDDING_MODEL_PATH = os.getenv(
+    "LOCAL_EMBEDDING_MODEL_PATH", "data/local_embedding_model.npz"
+)
+# Rate limit and concurrency for remote embedding requests during index builds
+EMBEDDING_REQUESTS_PER_MINUTE = float(
+    os.getenv("EMBEDDING_REQUESTS_PER_MINUTE", "100")
+)
+EMBEDDING_MAX_IN_FLIGHT = int(os.getenv("EMBEDDING_MAX_IN_FLIGHT", "4"))
+# Embeddings from different providers live in separate collections
+COURSE_DESCRIPTIONS_COLLECTION = (
+    "course_descriptions"
+    if EMBEDDING_PROVIDER == "gemini"
+    else f"course_descriptions_{EMBEDDING_PROVIDER}"
+)
+
+# Retrieval backend for course search: "chroma" or "numpy"
+VECTOR_INDEX_BACKEND = os.getenv("VECTOR_INDEX_BACKEND", "chroma")
+VECTOR_INDEX_PATH = os.getenv(
+    "VECTOR_INDEX_PATH", f"data/vector_index/{COURSE_DESCRIPTIONS_COLLECTION}"
+)
+# Storage type for the numpy index: "float16" or "int8"
+VECTOR_INDEX_DTYPE = os.getenv("VECTOR_INDEX_DTYPE", "float16")
+# Precomputed nearest neighbours of every course, built with the index
+SIMILAR_COURSES_PATH = os.getenv(
+    "SIMILAR_COURSES_PATH",
+    f"data/similar_courses/{COURSE_DESCRIPTIONS_COLLECTION}.npz",
+)
+
+# Cache of courses.slu.edu API responses; TTL in seconds, unset keeps forever
+COURSES_AT_SLU_CACHE_PATH = os.getenv(
+    "COURSES_AT_SLU_CACHE_PATH", "data/courses_at_slu_cache.sqlite3"
+)
+COURSES_AT_SLU_CACHE_TTL = (
+    float(os.environ["COURSES_AT_SLU_CACHE_TTL"])
+    if os.getenv("COURSES_AT_SLU_CACHE_TTL")
+    else None
+)
+# Politeness limits for courses.slu.edu crawls
+COURSES_AT_SLU_REQUESTS_PER_SECOND = float(
+    os.getenv("COURSES_AT_SLU_REQUESTS_PER_SECOND", "2")
+)
+COURSES_AT_SLU_MAX_IN_FLIGHT = int(os.getenv("COURSES_AT_SLU_MAX_IN_FLIGHT", "4"))
+
+# Prerequisites the local parser could not handle, as parsed by the model
+PREREQ_CACHE_PATH = os.getenv("PREREQ_CACHE_PATH", "data/prereq_cache.sqlite3")
+# Snippets per model request, and the starting request rate (adapts to 429s)
+PREREQ_BATCH_SIZE = int(os.getenv("PREREQ_BATCH_SIZE", "25"))
+PREREQ_REQUESTS_PER_MINUTE = float(os.getenv("PREREQ_REQUESTS_PER_MINUTE", "5"))
+
+# Raw Degree Works audits, content-addressed, and politeness limits for fetching
+DEGREE_WORKS_AUDIT_CACHE_PATH = os.getenv(
+    "DEGREE_WORKS_AUDIT_CACHE_PATH", "data/degree_works_audits.sqlite3"
+)
+DEGREE_WORKS_REQUESTS_PER_SECOND = float(
+    os.getenv("DEGREE_WORKS_REQUESTS_PER_SECOND", "1")
+)
+DEGREE_WORKS_MAX_IN_FLIGHT = int(os.getenv("DEGREE_WORKS_MAX_IN_FLIGHT", "2"))
+
+# Schedule generation runs in a process pool; requests beyond
+# SCHEDULE_MAX_PENDING queued or running schedules are turned away (503)
+SCHEDULE_WORKERS = int(os.getenv("SCHEDULE_WORKERS", "2"))
+SCHEDULE_MAX_PENDING = int(os.getenv("SCHEDULE_MAX_PENDING", "8"))
+SCHEDULE_TIMEOUT = float(os.getenv("SCHEDULE_TIMEOUT", "30"))
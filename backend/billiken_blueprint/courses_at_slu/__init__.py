@@ -1,15 +1,20 @@
 from billiken_blueprint.courses_at_slu.course import Course
 from billiken_blueprint.courses_at_slu.semester import Semester
+from billiken_blueprint.courses_at_slu.client import CoursesAtSluClient
 from billiken_blueprint.courses_at_slu.get_courses import get_courses
 from billiken_blueprint.courses_at_slu.section import Section
 from billiken_blueprint.courses_at_slu.get_section import get_section
 from billiken_blueprint.courses_at_slu.get_sections import get_sections
+from billiken_blueprint.courses_at_slu.crawler import CatalogCrawler, CrawlReport
 
 __all__ = [
     "Course",
     "Semester",
+    "CoursesAtSluClient",
     "get_courses",
     "Section",
     "get_section",
     "get_sections",
+    "CatalogCrawler",
+    "CrawlReport",
 ]
@@ -0,0 +1,7 @@
+from billiken_blueprint import config
+from billiken_blueprint.response_cache import ResponseCache
+
+# Shared by every courses.slu.edu fetcher; keyed by route URL and payload.
+response_cache = ResponseCache(
+    config.COURSES_AT_SLU_CACHE_PATH, ttl=config.COURSES_AT_SLU_CACHE_TTL
+)
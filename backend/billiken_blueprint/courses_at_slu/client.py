@@ -0,0 +1,181 @@
+import asyncio
+import json
+import random
+import time
+import urllib.parse
+from dataclasses import dataclass, field
+from typing import Optional
+
+import httpx
+
+from billiken_blueprint import config
+from billiken_blueprint.courses_at_slu.cache import response_cache
+from billiken_blueprint.rate_limit import AsyncRateLimiter
+from billiken_blueprint.response_cache import ResponseCache
+
+BASE_URL = "https://courses.slu.edu/api/"
+HEADERS = {
+    "Content-Type": "application/json",
+    "Pragma": "no-cache",
+    "Accept": "application/json, text/javascript, */*; q=0.01",
+    "Sec-Fetch-Site": "same-origin",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Cache-Control": "no-cache",
+    "Sec-Fetch-Mode": "cors",
+    "Accept-Encoding": "gzip, deflate, br",
+    "Origin": "https://courses.slu.edu",
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/26.0.1 Safari/605.1.15",
+    "Referer": "https://courses.slu.edu/",
+    "Sec-Fetch-Dest": "empty",
+    "X-Requested-With": "XMLHttpRequest",
+    "Priority": "u=3, i",
+}
+
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+@dataclass
+class ClientStats:
+    requests: int = 0
+    cache_hits: int = 0
+    retries: int = 0
+    started_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def cache_hit_ratio(self) -> float:
+        lookups = self.requests + self.cache_hits
+        return self.cache_hits / lookups if lookups else 0.0
+
+    @property
+    def requests_per_second(self) -> float:
+        elapsed = time.monotonic() - self.started_at
+        return self.requests / elapsed if elapsed else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.requests} requests ({self.requests_per_second:.2f}/s), "
+            f"{self.retries} retries, {self.cache_hits} cache hits "
+            f"({self.cache_hit_ratio:.0%} hit ratio)"
+        )
+
+
+class CoursesAtSluClient:
+    """Pooled, polite client for the courses.slu.edu FOSE API.
+
+    One ``httpx.AsyncClient`` is shared by every request. Requests start no
+    faster than ``requests_per_second``, at most ``max_in_flight`` run at once,
+    and 429/5xx responses or transport errors are retried with jittered
+    exponential backoff (honouring ``Retry-After``). Responses are read from and
+    written to the response cache, so only misses reach the network.
+    """
+
+    def __init__(
+        self,
+        cache: Optional[ResponseCache] = response_cache,
+        requests_per_second: float = config.COURSES_AT_SLU_REQUESTS_PER_SECOND,
+        max_in_flight: int = config.COURSES_AT_SLU_MAX_IN_FLIGHT,
+        max_retries: int = 4,
+        backoff_base: float = 1.0,
+        backoff_cap: float = 30.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.cache = cache
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.stats = ClientStats()
+        self._limiter = AsyncRateLimiter(requests_per_second, period=1.0)
+        self._semaphore = asyncio.Semaphore(max_in_flight)
+        self._http = httpx.AsyncClient(
+            headers=HEADERS,
+            timeout=httpx.Timeout(30.0),
+            limits=httpx.Limits(max_connections=max_in_flight),
+            transport=transport,
+        )
+
+    async def __aenter__(self) -> "CoursesAtSluClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self._http.aclose()
+
+    async def search(
+        self,
+        semester: str,
+        keyword: Optional[str] = None,
+        attribute_tag: Optional[str] = None,
+    ) -> dict:
+        criteria = []
+        if keyword:
+            criteria.append({"field": "keyword", "value": keyword})
+        if attribute_tag:
+            criteria.append({"field": attribute_tag, "value": "Y"})
+        return await self.post(
+            f"{BASE_URL}?page=fose&route=search&keyword={keyword}",
+            {"other": {"srcdb": semester}, "criteria": criteria},
+        )
+
+    async def details(
+        self, course_code: str, semester: str, crns: list[str], crn: str = ""
+    ) -> dict:
+        """Details of a course group; ``allInGroup`` lists every section."""
+        return await self.post(
+            f"{BASE_URL}?page=fose&route=details",
+            dict(
+                group=f"code:{course_code}",
+                key=f"crn:{crn}" if crn else "",
+                srcdb=semester,
+                matched="crn:" + ",".join(crns),
+                userWithRolesStr="!!!!!!",
+            ),
+        )
+
+    async def post(self, url: str, payload: dict) -> dict:
+        content = urllib.parse.quote(json.dumps(payload))
+        cache_key = ResponseCache.key(url, content)
+        if self.cache is not None:
+            data = await self.cache.aget(cache_key)
+            if data is not None:
+                self.stats.cache_hits += 1
+                return data
+
+        data = await self._post_with_retries(url, content)
+        if self.cache is not None:
+            await self.cache.aset(cache_key, data)
+        return data
+
+    async def _post_with_retries(self, url: str, content: str) -> dict:
+        attempt = 0
+        while True:
+            async with self._semaphore:
+                await self._limiter.acquire()
+                self.stats.requests += 1
+                try:
+                    response = await self._http.post(url, content=content)
+                except httpx.TransportError:
+                    if attempt >= self.max_retries:
+                        raise
+                    response = None
+
+            if response is not None:
+                if (
+                    response.status_code not in RETRY_STATUS_CODES
+                    or attempt >= self.max_retries
+                ):
+                    response.raise_for_status()
+                    return response.json()
+
+            attempt += 1
+            self.stats.retries += 1
+            await asyncio.sleep(self._backoff(attempt, response))
+
+    def _backoff(self, attempt: int, response: Optional[httpx.Response]) -> float:
+        if response is not None:
+            retry_after = response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                return min(float(retry_after), self.backoff_cap)
+        delay = min(self.backoff_cap, self.backoff_base * 2 ** (attempt - 1))
+        return delay * random.uniform(0.5, 1.5)
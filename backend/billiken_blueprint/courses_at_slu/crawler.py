@@ -0,0 +1,112 @@
+"""Concurrent crawl of courses.slu.edu: departments -> courses -> sections.
+
+Work items go through one ``asyncio.Queue`` served by a pool of workers. A
+department search enqueues one item per course code, and each course fetches
+all of its sections with a single details call. Requests for different
+departments and courses overlap while the client keeps the overall request
+rate polite.
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Iterable
+
+from billiken_blueprint.courses_at_slu.client import ClientStats, CoursesAtSluClient
+from billiken_blueprint.courses_at_slu.get_courses import get_courses
+from billiken_blueprint.courses_at_slu.get_sections import get_sections
+from billiken_blueprint.domain.section import Section
+
+Job = Callable[[], Awaitable[None]]
+
+
+@dataclass
+class CrawlReport:
+    departments: int = 0
+    courses: int = 0
+    sections: int = 0
+    failures: list[str] = field(default_factory=list)
+    # Departments with a failed job; their listing is incomplete.
+    failed_departments: set[str] = field(default_factory=set)
+    stats: ClientStats = field(default_factory=ClientStats)
+
+    def __str__(self) -> str:
+        return (
+            f"Crawled {self.departments} departments, {self.courses} courses, "
+            f"{self.sections} sections ({len(self.failures)} failed); {self.stats}"
+        )
+
+
+class CatalogCrawler:
+    def __init__(self, client: CoursesAtSluClient, semester: str, workers: int = 8):
+        self.client = client
+        self.semester = semester
+        self.workers = workers
+
+    async def crawl(self, departments: Iterable[str]) -> tuple[list[Section], CrawlReport]:
+        self._queue: asyncio.Queue[tuple[str, str, Job]] = asyncio.Queue()
+        self._seen_codes: set[str] = set()
+        self._sections: list[Section] = []
+        self._report = CrawlReport(stats=self.client.stats)
+
+        for department in departments:
+            self._enqueue(
+                department,
+                f"department {department}",
+                lambda department=department: self._crawl_department(department),
+            )
+
+        workers = [asyncio.create_task(self._work()) for _ in range(self.workers)]
+        try:
+            await self._queue.join()
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+        self._report.sections = len(self._sections)
+        return self._sections, self._report
+
+    def _enqueue(self, department: str, name: str, job: Job) -> None:
+        self._queue.put_nowait((department, name, job))
+
+    async def _work(self) -> None:
+        while True:
+            department, name, job = await self._queue.get()
+            try:
+                await job()
+            except Exception as e:
+                self._report.failures.append(f"{name}: {e!r}")
+                self._report.failed_departments.add(department)
+            finally:
+                self._queue.task_done()
+
+    async def _crawl_department(self, department: str) -> None:
+        listings = await get_courses(
+            keyword=department,
+            semester=self.semester,
+            attribute_tag=None,
+            client=self.client,
+        )
+        self._report.departments += 1
+
+        crns_by_code: dict[str, list[str]] = {}
+        for listing in listings:
+            # Keyword searches also match other departments' courses.
+            if listing.code.split()[0].lower() != department.lower():
+                continue
+            crns_by_code.setdefault(listing.code, []).append(listing.crn)
+
+        for code, crns in crns_by_code.items():
+            if code in self._seen_codes:
+                continue
+            self._seen_codes.add(code)
+            self._enqueue(
+                department,
+                f"course {code}",
+                lambda code=code, crns=crns: self._crawl_course(code, crns),
+            )
+
+    async def _crawl_course(self, code: str, crns: list[str]) -> None:
+        sections = await get_sections(code, self.semester, crns, client=self.client)
+        self._report.courses += 1
+        self._sections.extend(sections)
@@ -1,41 +1,141 @@
-import urllib.parse
-import httpx
+import asyncio
 import json
+from typing import Optional
 
-import urllib
-
-
-url = "https://courses.slu.edu/api/?page=fose&route=details"
-headers = {
-    "Content-Type": "application/json",
-    "Pragma": "no-cache",
-    "Accept": "application/json, text/javascript, */*; q=0.01",
-    "Sec-Fetch-Site": "same-origin",
-    "Accept-Language": "en-US,en;q=0.9",
-    "Cache-Control": "no-cache",
-    "Sec-Fetch-Mode": "cors",
-    "Accept-Encoding": "gzip, deflate, br",
-    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/26.0.1 Safari/605.1.15",
-    "Referer": "https://courses.slu.edu/",
-    "Sec-Fetch-Dest": "empty",
-    "Cookie": "_sctr=1%7C1760677200000; _scid=saX9DKYl-movJjDa-Zr2BoS6uY2lUabt; _scid_r=saX9DKYl-movJjDa-Zr2BoS6uY2lUabt; _fbp=fb.1.1760718030332.864230374654775960; _ga=GA1.2.718985217.1760718030; _tt_enable_cookie=1; _ttp=01K7SFJ1JCYSHN7ZWYM01WMH11_.tt.1; nmstat=21598240-ad45-9b21-fd87-ce40fa1af76a; ttcsid=1760718030422::JC-Fggr2uihph7FPNF5r.1.1760718030734.0; ttcsid_CQT8A2BC77U2FBUJG0TG=1760718030421::xdUGsWLBMTRTRZSJ3zVd.1.1760718030735.0; __utmzz=utmcsr=google|utmcmd=organic|utmccn=(not set)|utmcct=(not set)|utmctr=(not provided)|utmgclid=(not set); _ga_5MQ9L3X3YS=GS2.1.s1760718029$o1$g0$t1760718029$j60$l0$h0; _ga_FTVG57K2SJ=GS2.1.s1760718029$o1$g0$t1760718029$j60$l0$h0; _gcl_au=1.1.1644772738.1760718030",
-    "X-Requested-With": "XMLHttpRequest",
-    "Priority": "u=3, i",
-}
-
-
-async def get_sections(course_code: str, semeseter: str, crns: list[str]):
-    payload = dict(
-        group=f"code:{course_code}",
-        key="",
-        srcdb=semeseter,
-        matched="crn:" + ",".join(crns),
-        userWithRolesStr="!!!!!!",
+import lxml.etree
+import lxml.html
+
+from billiken_blueprint.courses_at_slu.client import CoursesAtSluClient
+from billiken_blueprint.domain.section import MeetingTime, Section
+
+# Listed in ``instr`` for sections without an assigned instructor.
+PLACEHOLDER_INSTRUCTORS = frozenset({"staff", "tba"})
+
+
+async def get_sections(
+    course_code: str,
+    semeseter: str,
+    crns: list[str],
+    client: Optional[CoursesAtSluClient] = None,
+) -> list[Section]:
+    """Every section of ``course_code``, with full instructor names.
+
+    The details response lists all sections of the group in ``allInGroup``,
+    so one request covers the sections' meeting times and campuses however
+    many CRNs the course has. Full instructor names only come with the
+    section named by the request's ``key``, so sections listing other
+    instructors are requested once per distinct ``instr`` listing; sections
+    taught by the same instructors share one request.
+    """
+    if client is None:
+        async with CoursesAtSluClient() as client:
+            return await get_sections(course_code, semeseter, crns, client)
+
+    data = await client.details(
+        course_code, semeseter, crns, crn=crns[0] if crns else ""
     )
-    payload = urllib.parse.quote(json.dumps(payload))
 
-    async with httpx.AsyncClient() as client:
-        response = await client.post(url, headers=headers, content=payload)
-        response.raise_for_status()
-        data = response.json()
-        return data
+    instructors_by_listing = {}
+    detailed_crn = data.get("key", "").removeprefix("crn:")
+    crns_by_listing: dict[str, str] = {}
+    for entry in data["allInGroup"]:
+        listing = entry.get("instr", "")
+        if entry["crn"] == detailed_crn:
+            instructors_by_listing[listing] = parse_instructor_names(
+                data.get("instructordetail_html", "")
+            )
+        elif listed_instructors(listing):
+            crns_by_listing.setdefault(listing, entry["crn"])
+
+    missing = [
+        (listing, crn)
+        for listing, crn in crns_by_listing.items()
+        if listing not in instructors_by_listing
+    ]
+    details = await asyncio.gather(
+        *(
+            client.details(course_code, semeseter, crns, crn=crn)
+            for _, crn in missing
+        )
+    )
+    for (listing, _), detail in zip(missing, details):
+        instructors_by_listing[listing] = parse_instructor_names(
+            detail.get("instructordetail_html", "")
+        )
+
+    return parse_sections(data, course_code, semeseter, instructors_by_listing)
+
+
+def parse_sections(
+    data: dict,
+    course_code: str,
+    semester: str,
+    instructors_by_listing: Optional[dict[str, list[str]]] = None,
+) -> list[Section]:
+    """``Section``s from a details response.
+
+    ``instructors_by_listing`` maps ``instr`` listings to full names. Without
+    an entry, the keyed section takes the names in ``instructordetail_html``
+    and other sections fall back to the names in their listing.
+    """
+    instructors_by_listing = instructors_by_listing or {}
+    detailed_crn = data.get("key", "").removeprefix("crn:")
+    detailed_instructors = parse_instructor_names(data.get("instructordetail_html", ""))
+
+    sections = []
+    for entry in data["allInGroup"]:
+        listing = entry.get("instr", "")
+        if instructors_by_listing.get(listing):
+            instructor_names = instructors_by_listing[listing]
+        elif entry["crn"] == detailed_crn and detailed_instructors:
+            instructor_names = detailed_instructors
+        else:
+            instructor_names = listed_instructors(listing)
+        sections.append(
+            Section(
+                id=None,
+                crn=entry["crn"],
+                instructor_names=instructor_names,
+                campus_code=entry.get("campus_code") or data["campus_code"],
+                description=data["description"],
+                title=entry.get("title") or data["title"],
+                course_code=course_code,
+                semester=semester,
+                meeting_times=parse_meeting_times(entry),
+            )
+        )
+    return sections
+
+
+def listed_instructors(listing: str) -> list[str]:
+    """The (abbreviated) names in an ``instr`` listing, minus placeholders."""
+    return [
+        name.strip()
+        for name in listing.split(",")
+        if name.strip() and name.strip().lower() not in PLACEHOLDER_INSTRUCTORS
+    ]
+
+
+def parse_meeting_times(entry: dict) -> list[MeetingTime]:
+    return [
+        MeetingTime(
+            day=mt["meet_day"],
+            start_time=mt["start_time"],
+            end_time=mt["end_time"],
+        )
+        for mt in json.loads(entry.get("meetingTimes") or "[]")
+    ]
+
+
+def parse_instructor_names(html: str) -> list[str]:
+    try:
+        instructors_tree = lxml.html.fromstring(html)
+    except lxml.etree.ParserError:
+        return []
+    return [
+        name
+        for name in (
+            instructor.strip() for instructor in instructors_tree.xpath("//div/text()")
+        )
+        if name and name.lower() not in PLACEHOLDER_INSTRUCTORS
+    ]
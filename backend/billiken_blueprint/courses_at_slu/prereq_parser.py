@@ -0,0 +1,261 @@
+"""Recursive-descent parser for courses.slu.edu prerequisite snippets.
+
+Snippets are HTML such as::
+
+    (<a data-group="code:CSCI 2100">CSCI 2100</a> with a grade of C- or higher
+    or <a data-group="code:MATH 1660">MATH 1660</a> (Can be taken Concurrently));
+    0 Course from <a data-group="code:THEO 1600">THEO 1600</a>-<a ...>1699</a>
+
+and parse to the ``NestedCoursePrerequisite`` dict shape. ``;`` joins
+requirements with AND; within a clause, commas take the conjunction of the
+clause (``A, B, or C``). Requirements that are not a course (standing,
+placement scores) are omitted. Snippets whose structure is ambiguous, or with
+any other text, raise ``PrereqParseError`` so callers can fall back to the
+model: unrecognised prose ("permission of instructor", "Two of ...") may
+change what a course code in the snippet means.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Optional
+
+_TOKEN = re.compile(
+    r"""
+      (?P<link><a\b[^>]*?\bdata-group="code:(?P<link_major>[^"\s]+)\s+(?P<link_number>[^"]+)"[^>]*>.*?</a>)
+    | (?P<tag><[^>]*>)
+    | (?P<space>(?:\s|&nbsp;|&\#160;)+)
+    | (?P<grade>(?:with\ an?\ )?(?:minimum\ )?grade\ of\ [A-F][+-]?(?:\ or\ (?:higher|better))?)
+    | (?P<concurrent>\((?:can|may)\ be\ taken\ concurrently\))
+    | (?P<count>(?P<count_number>\d+)\ courses?\ from\b)
+    | (?P<standing>\b(?:freshman|sophomore|junior|senior|graduate)\ standing\b)
+    | (?P<score>
+          \b(?:(?:ALEKS|ACT|SAT)\ )?math\ (?:placement\ )?(?:exam\ )?score\ of\ \d+\b
+        | \b\d+\ on\ the\ math\ placement\ exam\b
+      )
+    | (?P<course>(?-i:\b(?P<course_major>[A-Z]{2,4})\ (?P<course_number>\d{3,4}[A-Z]?)\b))
+    | (?P<lparen>\()
+    | (?P<rparen>\))
+    | (?P<semi>;)
+    | (?P<comma>,)
+    | (?P<dash>[-\u2013])
+    | (?P<or>\bor\b)
+    | (?P<and>\band\b)
+    | (?P<word>[^\s<>();,\-\u2013]+)
+    """,
+    re.IGNORECASE | re.VERBOSE | re.DOTALL,
+)
+
+_COURSE_NUMBER = re.compile(r"\d{3,4}[A-Z]?")
+_SEPARATORS = {"semi", "comma", "or", "and"}
+# Requirements that are not a course and are omitted from the result.
+_NON_COURSE = {"standing", "score"}
+# The catalog writes "one course from a range" as "0 Course from"; other
+# counts need more than one course and are not implemented.
+_RANGE_COUNTS = {"0", "1"}
+
+
+class PrereqParseError(ValueError):
+    pass
+
+
+@dataclass
+class _Token:
+    kind: str
+    text: str
+    major: Optional[str] = None
+    number: Optional[str] = None
+
+
+def parse_prereqs(reqs_text: str) -> dict:
+    """Parse a prerequisite snippet into a prerequisite dict.
+
+    The result is always an operator group; it is an empty AND when the
+    snippet names no courses.
+    """
+    parser = _Parser(_tokenize(reqs_text))
+    node = parser.parse_expression()
+    if parser.peek() is not None:
+        raise PrereqParseError(f"unexpected {parser.peek().text!r}")
+    if node is None:
+        return {"operator": "AND", "operands": []}
+    if "operator" not in node:
+        return {"operator": "AND", "operands": [node]}
+    return node
+
+
+def _tokenize(text: str) -> list[_Token]:
+    tokens = []
+    for match in _TOKEN.finditer(text):
+        kind = match.lastgroup
+        if kind in ("tag", "space"):
+            continue
+        if kind == "link":
+            tokens.append(
+                _Token(
+                    "course",
+                    match.group(),
+                    major=match.group("link_major").upper(),
+                    number=match.group("link_number").strip().upper(),
+                )
+            )
+        elif kind == "course":
+            tokens.append(
+                _Token(
+                    "course",
+                    match.group(),
+                    major=match.group("course_major"),
+                    number=match.group("course_number"),
+                )
+            )
+        elif kind == "count":
+            tokens.append(
+                _Token(kind, match.group(), number=match.group("count_number"))
+            )
+        else:
+            tokens.append(_Token(kind, match.group()))
+    return tokens
+
+
+class _Parser:
+    def __init__(self, tokens: list[_Token]):
+        self.tokens = tokens
+        self.position = 0
+
+    def peek(self) -> Optional[_Token]:
+        if self.position < len(self.tokens):
+            return self.tokens[self.position]
+        return None
+
+    def next(self) -> _Token:
+        token = self.tokens[self.position]
+        self.position += 1
+        return token
+
+    def parse_expression(self) -> Optional[dict]:
+        """expression := clause (";" clause)*"""
+        clauses = [self.parse_clause()]
+        while self.peek() is not None and self.peek().kind == "semi":
+            self.next()
+            clauses.append(self.parse_clause())
+        return _group("AND", clauses)
+
+    def parse_clause(self) -> Optional[dict]:
+        """clause := term (("," | "or" | "and" | ", or" | ", and") term)*"""
+        terms = [self.parse_term()]
+        conjunctions = set()
+        while self.peek() is not None and self.peek().kind in ("comma", "or", "and"):
+            separator = self.next()
+            if separator.kind == "comma" and self.peek() is not None:
+                if self.peek().kind in ("or", "and"):
+                    separator = self.next()
+            if separator.kind != "comma":
+                conjunctions.add(separator.kind.upper())
+            terms.append(self.parse_term())
+
+        if len(conjunctions) > 1:
+            raise PrereqParseError("'and' and 'or' mixed without parentheses")
+        return _group(conjunctions.pop() if conjunctions else "AND", terms)
+
+    def parse_term(self) -> Optional[dict]:
+        """term := (group | run)+ where at most one part names a course."""
+        parts = []
+        while True:
+            token = self.peek()
+            if token is None or token.kind in _SEPARATORS or token.kind == "rparen":
+                break
+            if token.kind == "lparen":
+                parts.append(self.parse_group())
+            else:
+                parts.append(self.parse_run())
+
+        parts = [part for part in parts if part is not None]
+        if len(parts) > 1:
+            raise PrereqParseError("requirements not separated by a conjunction")
+        return parts[0] if parts else None
+
+    def parse_group(self) -> Optional[dict]:
+        """group := "(" expression ")" """
+        self.next()
+        node = self.parse_expression()
+        token = self.peek()
+        if token is None or token.kind != "rparen":
+            raise PrereqParseError("unbalanced parentheses")
+        self.next()
+        return node
+
+    def parse_run(self) -> Optional[dict]:
+        """run := [count] course [("-" course | "-" number)] qualifiers
+        | standing | score"""
+        course = None
+        end_number = None
+        concurrent_allowed = False
+        non_course = None
+        while True:
+            token = self.peek()
+            if token is None or token.kind in _SEPARATORS or token.kind in (
+                "lparen",
+                "rparen",
+            ):
+                break
+            self.next()
+
+            if token.kind == "course":
+                if course is not None:
+                    raise PrereqParseError(f"unexpected course {token.text!r}")
+                course = token
+            elif token.kind == "dash" and course is not None and end_number is None:
+                end_number = self._range_end(course)
+            elif token.kind == "concurrent":
+                concurrent_allowed = True
+            elif token.kind == "count" and token.number in _RANGE_COUNTS:
+                pass
+            elif token.kind == "grade" and course is not None:
+                pass
+            elif token.kind in _NON_COURSE and non_course is None:
+                non_course = token
+            else:
+                raise PrereqParseError(f"unrecognised text {token.text!r}")
+
+        if course is not None and non_course is not None:
+            raise PrereqParseError(f"unrecognised text {non_course.text!r}")
+        if course is None or not _COURSE_NUMBER.fullmatch(course.number):
+            # Not a course requirement (or not a real course code), so omitted.
+            return None
+        return {
+            "major_code": course.major,
+            "course_number": course.number,
+            "end_number": end_number,
+            "concurrent_allowed": concurrent_allowed,
+        }
+
+    def _range_end(self, start: _Token) -> int:
+        token = self.peek()
+        if token is None:
+            raise PrereqParseError("range without an end")
+        self.next()
+        if token.kind == "course":
+            if token.major != start.major:
+                raise PrereqParseError(f"range across majors: {token.text!r}")
+            number = token.number
+        else:
+            number = token.text
+        if not number.isdigit():
+            raise PrereqParseError(f"invalid range end {token.text!r}")
+        return int(number)
+
+
+def _group(operator: str, operands: list[Optional[dict]]) -> Optional[dict]:
+    flattened = []
+    for operand in operands:
+        if operand is None:
+            continue
+        if operand.get("operator") == operator:
+            flattened.extend(operand["operands"])
+        else:
+            flattened.append(operand)
+
+    if not flattened:
+        return None
+    if len(flattened) == 1:
+        return flattened[0]
+    return {"operator": operator, "operands": flattened}
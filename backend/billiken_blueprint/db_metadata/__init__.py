@@ -14,6 +14,9 @@ from billiken_blueprint.repositories.degree_repository import DBDegree
 from billiken_blueprint.repositories.course_attribute_repository import (
     DBCourseAttribute,
 )
+from billiken_blueprint.repositories.catalog_version_repository import (
+    DBCatalogVersion,
+)
 
 __all__ = [
     "Base",
@@ -26,4 +29,5 @@ __all__ = [
     "DBRmpReview",
     "DBDegree",
     "DBCourseAttribute",
+    "DBCatalogVersion",
 ]
@@ -11,6 +11,7 @@ from billiken_blueprint.degree_works.api import (
     Degrees,
     Colleges,
 )
+from billiken_blueprint.degree_works.client import DegreeWorksClient
 
 __all__ = [
     "DegreeWorksAnyCourseWithAttribute",
@@ -22,4 +23,5 @@ __all__ = [
     "Majors",
     "Degrees",
     "Colleges",
+    "DegreeWorksClient",
 ]
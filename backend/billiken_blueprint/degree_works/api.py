@@ -1,16 +1,14 @@
 from dataclasses import dataclass
-import json
-from operator import ne
-
-import httpx
-
-from billiken_blueprint.degree_works.course import (
-    DegreeWorksAnyCourseWithAttribute,
-    DegreeWorksCourseGroup,
-    DegreeWorksCourseRange,
-    DegreeWorksCourse,
+from typing import Optional
+
+from billiken_blueprint.degree_works.client import DegreeWorksClient
+from billiken_blueprint.domain.degrees.degree_requirement import (
+    CourseInRange,
+    CourseRule,
+    CourseWithAttribute,
+    CourseWithCode,
+    DegreeRequirement,
 )
-from billiken_blueprint.domain.degrees.degree_requirement import DegreeRequirement
 
 
 class Majors:
@@ -72,13 +70,13 @@ def req_to_degree_requirement(req: dict, label: str) -> "DegreeRequirement":
     for course in course_array:
         if course["discipline"] == "@" and course["number"] == "@":
             courses.append(
-                DegreeWorksAnyCourseWithAttribute(
-                    attributes=course["withArray"][0]["valueList"]
+                CourseWithAttribute(
+                    attribute_names=course["withArray"][0]["valueList"]
                 )
             )
         elif "numberEnd" in course:
             courses.append(
-                DegreeWorksCourseRange(
+                CourseInRange(
                     major_code=course["discipline"],
                     course_number=course["number"],
                     end_course_number=course["numberEnd"],
@@ -86,7 +84,7 @@ def req_to_degree_requirement(req: dict, label: str) -> "DegreeRequirement":
             )
         else:
             courses.append(
-                DegreeWorksCourse(
+                CourseWithCode(
                     major_code=course["discipline"],
                     course_number=course["number"],
                 )
@@ -96,7 +94,7 @@ def req_to_degree_requirement(req: dict, label: str) -> "DegreeRequirement":
     if "except" in req:
         for course in req["except"]["courseArray"]:
             exclude.append(
-                DegreeWorksCourse(
+                CourseWithCode(
                     major_code=course["discipline"],
                     course_number=course["number"],
                 )
@@ -105,7 +103,7 @@ def req_to_degree_requirement(req: dict, label: str) -> "DegreeRequirement":
     return DegreeRequirement(
         label=label,
         needed=needed,
-        course_rules=DegreeWorksCourseGroup(courses=courses, exclude=exclude),
+        course_rules=CourseRule(courses=courses, exclude=exclude),
     )
 
 
@@ -122,60 +120,12 @@ def parse_rule_array(rule_array: list[dict]) -> list["DegreeRequirement"]:
     return reqs
 
 
-async def get_degree_requirements(
-    major: str,
-    degree_type: str,
-    college: str,
-    auth_info: DegreeWorksAuth,
-    catalog_year: str = "2025",
-) -> list["DegreeRequirement"]:
-
-    url = "https://degree-works.slu.edu:8546/ResponsiveDashboard/api/audit"
-
-    payload = json.dumps(
-        {
-            "studentId": "001272417",
-            "isIncludeInprogress": True,
-            "isIncludePreregistered": True,
-            "isKeepCurriculum": False,
-            "school": "UG",
-            "degree": degree_type,
-            "catalogYear": catalog_year,
-            "goals": [
-                {"code": "MAJOR", "value": major, "catalogYear": ""},
-                # {"code": "PROGRAM", "value": program, "catalogYear": ""},
-                {"code": "COLLEGE", "value": college, "catalogYear": ""},
-            ],
-            "classes": [],
-        }
-    )
-
-    # headers = {
-    #    "Content-Type": "application/json",
-    #    "Pragma": "no-cache",
-    #    "Accept": "*/*",
-    #    "Sec-Fetch-Site": "same-origin",
-    #    "Accept-Language": "en-US,en;q=0.9",
-    #    "Cache-Control": "no-cache",
-    #    "Sec-Fetch-Mode": "cors",
-    #    "Accept-Encoding": "gzip, deflate, br",
-    #    "Origin": "https://degree-works.slu.edu:8546",
-    #    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/26.1 Safari/605.1.15",
-    #    "Referer": "https://degree-works.slu.edu:8546/ResponsiveDashboard/worksheets/whatif",
-    #    "Connection": "keep-alive",
-    #    "Sec-Fetch-Dest": "empty",
-    #    "Priority": "u=3, i",
-    # }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.post(url, headers=headers, content=payload)
-        response.raise_for_status()
-        response = response.json()
-
+def parse_audit(audit: dict) -> list["DegreeRequirement"]:
+    """Core and major requirements of a what-if audit response."""
     cores = parse_rule_array(
         next(
             block
-            for block in response["blockArray"]
+            for block in audit["blockArray"]
             if block["requirementValue"] == "COREUNIV"
         )["ruleArray"]
     )
@@ -183,9 +133,29 @@ async def get_degree_requirements(
     majors = parse_rule_array(
         next(
             block
-            for block in response["blockArray"]
+            for block in audit["blockArray"]
             if block["requirementType"] == "MAJOR"
         )["ruleArray"]
     )
 
     return cores + majors
+
+
+async def get_degree_requirements(
+    major: str,
+    degree_type: str,
+    college: str,
+    auth_info: DegreeWorksAuth,
+    catalog_year: str = "2025",
+    client: Optional[DegreeWorksClient] = None,
+) -> list["DegreeRequirement"]:
+    if client is None:
+        async with DegreeWorksClient(
+            auth_info.auth_cookie, auth_info.banner_id
+        ) as client:
+            return await get_degree_requirements(
+                major, degree_type, college, auth_info, catalog_year, client
+            )
+
+    audit = await client.audit(major, degree_type, college, catalog_year)
+    return parse_audit(audit)
@@ -0,0 +1,75 @@
+import asyncio
+from typing import Optional
+
+import httpx
+
+from billiken_blueprint import config
+from billiken_blueprint.rate_limit import AsyncRateLimiter
+
+AUDIT_URL = "https://degree-works.slu.edu:8546/ResponsiveDashboard/api/audit"
+HEADERS = {
+    "Content-Type": "application/json",
+    "Accept": "*/*",
+    "Origin": "https://degree-works.slu.edu:8546",
+    "Referer": "https://degree-works.slu.edu:8546/ResponsiveDashboard/worksheets/whatif",
+}
+
+
+class DegreeWorksClient:
+    """Pooled client for Degree Works what-if audits.
+
+    Every audit shares one ``httpx.AsyncClient``; audits start no faster than
+    ``requests_per_second`` and at most ``max_in_flight`` run at once.
+    """
+
+    def __init__(
+        self,
+        auth_cookie: str,
+        banner_id: str,
+        requests_per_second: float = config.DEGREE_WORKS_REQUESTS_PER_SECOND,
+        max_in_flight: int = config.DEGREE_WORKS_MAX_IN_FLIGHT,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.banner_id = banner_id
+        self.requests = 0
+        self._limiter = AsyncRateLimiter(requests_per_second, period=1.0)
+        self._semaphore = asyncio.Semaphore(max_in_flight)
+        self._http = httpx.AsyncClient(
+            headers={**HEADERS, "Cookie": auth_cookie},
+            timeout=httpx.Timeout(60.0),
+            limits=httpx.Limits(max_connections=max_in_flight),
+            transport=transport,
+        )
+
+    async def __aenter__(self) -> "DegreeWorksClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self._http.aclose()
+
+    async def audit(
+        self, major: str, degree_type: str, college: str, catalog_year: str
+    ) -> dict:
+        payload = {
+            "studentId": self.banner_id,
+            "isIncludeInprogress": True,
+            "isIncludePreregistered": True,
+            "isKeepCurriculum": False,
+            "school": "UG",
+            "degree": degree_type,
+            "catalogYear": catalog_year,
+            "goals": [
+                {"code": "MAJOR", "value": major, "catalogYear": ""},
+                {"code": "COLLEGE", "value": college, "catalogYear": ""},
+            ],
+            "classes": [],
+        }
+        async with self._semaphore:
+            await self._limiter.acquire()
+            self.requests += 1
+            response = await self._http.post(AUDIT_URL, json=payload)
+        response.raise_for_status()
+        return response.json()
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import Generator, Sequence
 
-from billiken_blueprint.domain.courses.course import Course
+from billiken_blueprint.domain.courses.course import Course, CourseWithAttributes
 
 
 @dataclass
@@ -76,7 +76,7 @@ class DegreeWorksAnyCourseWithAttribute:
     def from_dict(data: dict) -> "DegreeWorksAnyCourseWithAttribute":
         return DegreeWorksAnyCourseWithAttribute(attributes=data["attributes"])
 
-    def is_satisfied_by(self, course: MinimalCourse) -> bool:
+    def is_satisfied_by(self, course: CourseWithAttributes) -> bool:
         return any(
             attr.degree_works_label in self.attributes for attr in course.attributes
         )
@@ -0,0 +1,139 @@
+"""Incremental ingestion of degree requirements from Degree Works audits.
+
+Raw audits are stored content-addressed: each payload is kept under a hash
+of its requirement blocks, and a pointer per degree and catalog year records
+which payload is current. An audit is requested only for degrees that have
+no payload for the catalog year yet (or on ``refresh``), and requirements are
+parsed only when the current payload differs from the one they were last
+parsed from.
+"""
+
+import asyncio
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+from billiken_blueprint import config
+from billiken_blueprint.degree_works.api import DegreeWorksDegree, parse_audit
+from billiken_blueprint.degree_works.client import DegreeWorksClient
+from billiken_blueprint.domain.degrees.degree_requirement import DegreeRequirement
+from billiken_blueprint.response_cache import ResponseCache
+
+
+class AuditStore:
+    def __init__(self, cache: ResponseCache):
+        self.cache = cache
+
+    @staticmethod
+    def content_hash(audit: dict) -> str:
+        # Only the blocks requirements are parsed from; headers carry run dates.
+        encoded = json.dumps(
+            audit.get("blockArray"), sort_keys=True, separators=(",", ":")
+        )
+        return hashlib.sha256(encoded.encode()).hexdigest()
+
+    async def current(
+        self, degree: DegreeWorksDegree, catalog_year: str
+    ) -> Optional[tuple[str, dict]]:
+        pointer = await self.cache.aget(self._pointer_key(degree, catalog_year))
+        if pointer is None:
+            return None
+        audit = await self.cache.aget(self._audit_key(pointer["content_hash"]))
+        if audit is None:
+            return None
+        return pointer["content_hash"], audit
+
+    async def put(
+        self, degree: DegreeWorksDegree, catalog_year: str, audit: dict
+    ) -> str:
+        content_hash = self.content_hash(audit)
+        await self.cache.aset(self._audit_key(content_hash), audit)
+        await self.cache.aset(
+            self._pointer_key(degree, catalog_year),
+            {"content_hash": content_hash, "catalog_year": catalog_year},
+        )
+        return content_hash
+
+    async def parsed_hash(self, degree: DegreeWorksDegree) -> Optional[str]:
+        parsed = await self.cache.aget(self._parsed_key(degree))
+        return parsed["content_hash"] if parsed else None
+
+    async def mark_parsed(
+        self, degree: DegreeWorksDegree, catalog_year: str, content_hash: str
+    ) -> None:
+        await self.cache.aset(
+            self._parsed_key(degree),
+            {"content_hash": content_hash, "catalog_year": catalog_year},
+        )
+
+    @staticmethod
+    def _audit_key(content_hash: str) -> str:
+        return ResponseCache.key("audit", content_hash)
+
+    @staticmethod
+    def _pointer_key(degree: DegreeWorksDegree, catalog_year: str) -> str:
+        return ResponseCache.key(
+            "current", degree.major, degree.degree_type, degree.college, catalog_year
+        )
+
+    @staticmethod
+    def _parsed_key(degree: DegreeWorksDegree) -> str:
+        return ResponseCache.key(
+            "parsed", degree.major, degree.degree_type, degree.college
+        )
+
+
+def open_audit_store() -> AuditStore:
+    return AuditStore(ResponseCache(config.DEGREE_WORKS_AUDIT_CACHE_PATH))
+
+
+@dataclass
+class DegreeIngestResult:
+    degree: DegreeWorksDegree
+    catalog_year: str
+    content_hash: str
+    fetched: bool
+    # None when the payload is the one the saved requirements came from.
+    requirements: Optional[list[DegreeRequirement]]
+
+    @property
+    def changed(self) -> bool:
+        return self.requirements is not None
+
+
+async def ingest_degrees(
+    degrees: Iterable[DegreeWorksDegree],
+    catalog_year: str,
+    client: DegreeWorksClient,
+    store: AuditStore,
+    refresh: bool = False,
+) -> list[DegreeIngestResult]:
+    """Fetch (when needed) and parse (when changed) every degree concurrently.
+
+    Call ``store.mark_parsed`` once a changed result's requirements are saved.
+    """
+
+    async def ingest(degree: DegreeWorksDegree) -> DegreeIngestResult:
+        current = None if refresh else await store.current(degree, catalog_year)
+        fetched = current is None
+        if current is None:
+            audit = await client.audit(
+                degree.major, degree.degree_type, degree.college, catalog_year
+            )
+            content_hash = await store.put(degree, catalog_year, audit)
+        else:
+            content_hash, audit = current
+
+        requirements = None
+        if await store.parsed_hash(degree) != content_hash:
+            requirements = parse_audit(audit)
+        return DegreeIngestResult(
+            degree=degree,
+            catalog_year=catalog_year,
+            content_hash=content_hash,
+            fetched=fetched,
+            requirements=requirements,
+        )
+
+    return list(await asyncio.gather(*(ingest(degree) for degree in degrees)))
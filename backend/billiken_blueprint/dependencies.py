@@ -1,4 +1,4 @@
-from typing import Annotated, Optional
+from typing import Annotated, AsyncIterator, Optional, Union
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
@@ -9,6 +9,11 @@ from billiken_blueprint.domain.courses.course_attribute import CourseAttribute
 from billiken_blueprint.domain.student import Student
 from billiken_blueprint.identity.identity_user import IdentityUser
 from billiken_blueprint.identity.token_payload import TokenPayload
+from billiken_blueprint.repositories.catalog_version_repository import (
+    COURSES,
+    SECTIONS,
+    CatalogVersionRepository,
+)
 from billiken_blueprint.repositories.course_attribute_repository import (
     CourseAttributeRepository,
 )
@@ -22,9 +27,35 @@ from billiken_blueprint.repositories.rating_repository import RatingRepository
 from billiken_blueprint.repositories.rmp_review_repository import RmpReviewRepository
 from billiken_blueprint.repositories.student_repository import StudentRepository
 from billiken_blueprint.repositories.section_repository import SectionRepository
+from billiken_blueprint.repositories.unit_of_work import UnitOfWork, unit_of_work
+from billiken_blueprint.search.bm25 import Bm25Index
+from billiken_blueprint.search.similar_courses import (
+    SimilarCoursesGraph,
+    load_similar_courses_graph,
+)
+from billiken_blueprint.search.vector_index import (
+    NumpyVectorIndex,
+    load_course_descriptions_index,
+)
+from billiken_blueprint.single_flight import SingleFlight
+from billiken_blueprint.use_cases.get_courses_with_descriptions import (
+    get_courses_with_descriptions,
+)
+from billiken_blueprint.use_cases.schedule_executor import ScheduleExecutor
 import chromadb
 
 
+async def get_unit_of_work() -> AsyncIterator[UnitOfWork]:
+    """Share one database session among the repositories used by a request.
+
+    Registered as an app-wide dependency, so each request checks out a single
+    connection and runs its reads in one transaction instead of opening a
+    session per repository call.
+    """
+    async with unit_of_work() as work:
+        yield work
+
+
 def get_identity_user_repository() -> IdentityUserRepository:
     """Get the identity user repository instance.
 
@@ -147,8 +178,25 @@ def get_section_repository() -> SectionRepository:
     """
     return services.section_repository
 
-def get_course_descriptions_collection() -> chromadb.Collection:
-    """Get the course descriptions collection instance."""
+
+def get_catalog_version_repository() -> CatalogVersionRepository:
+    """Get the catalog version repository instance.
+
+    This is the single source of truth for the catalog version repository dependency.
+    Override this in tests to use a test repository.
+    """
+    return services.catalog_version_repository
+
+
+def get_course_descriptions_collection() -> Union[chromadb.Collection, NumpyVectorIndex]:
+    """Get the course descriptions collection instance.
+
+    Returns the in-process numpy index when ``VECTOR_INDEX_BACKEND`` is
+    ``"numpy"``, otherwise the ChromaDB collection.
+    """
+    if config.VECTOR_INDEX_BACKEND == "numpy":
+        return load_course_descriptions_index(config.VECTOR_INDEX_PATH)
+
     from billiken_blueprint.chromadb import course_descriptions_collection
     
     return course_descriptions_collection
@@ -164,7 +212,85 @@ RatingRepo = Annotated[RatingRepository, Depends(get_rating_repository)]
 RmpReviewRepo = Annotated[RmpReviewRepository, Depends(get_rmp_review_repository)]
 DegreeRepo = Annotated[DegreeRepository, Depends(get_degree_repository)]
 SectionRepo = Annotated[SectionRepository, Depends(get_section_repository)]
-CourseDescriptionsCollection = Annotated[chromadb.Collection, Depends(get_course_descriptions_collection)]
+CatalogVersionRepo = Annotated[
+    CatalogVersionRepository, Depends(get_catalog_version_repository)
+]
+CourseDescriptionsCollection = Annotated[
+    Union[chromadb.Collection, NumpyVectorIndex],
+    Depends(get_course_descriptions_collection),
+]
+
+
+def get_schedule_executor() -> ScheduleExecutor:
+    """Get the process pool that computes schedules.
+
+    Override this in tests to use a test executor.
+    """
+    return services.schedule_executor
+
+
+ScheduleExec = Annotated[ScheduleExecutor, Depends(get_schedule_executor)]
+
+
+def get_single_flight() -> SingleFlight:
+    """Get the coalescer that shares concurrent identical catalog loads."""
+    return services.single_flight
+
+
+Coalescer = Annotated[SingleFlight, Depends(get_single_flight)]
+
+
+_course_lexical_index: tuple[tuple[int, ...], Bm25Index] | None = None
+
+
+async def get_course_lexical_index(
+    course_repo: CourseRepo,
+    section_repo: SectionRepo,
+    catalog_versions: CatalogVersionRepo,
+    single_flight: Coalescer,
+) -> Bm25Index:
+    """Get the BM25 index over course codes, titles and descriptions.
+
+    The index is built from the catalog on first use and rebuilt only when a
+    course or section write bumps the catalog versions; requests arriving
+    during a build wait for it. Override this in tests to use a test index.
+    """
+    global _course_lexical_index
+    version = await catalog_versions.get_many([COURSES, SECTIONS])
+    if _course_lexical_index is None or _course_lexical_index[0] != version:
+
+        async def build() -> Bm25Index:
+            courses = await course_repo.get_all()
+            sections = await section_repo.get_all()
+            return Bm25Index.from_courses(
+                get_courses_with_descriptions(courses, sections)
+            )
+
+        index = await single_flight.do("course_lexical_index", version, build)
+        _course_lexical_index = (version, index)
+        return index
+    return _course_lexical_index[1]
+
+
+CourseLexicalIndex = Annotated[Bm25Index, Depends(get_course_lexical_index)]
+
+
+def get_similar_courses_graph() -> SimilarCoursesGraph:
+    """Get the precomputed similar courses graph.
+
+    This is the single source of truth for the similar courses dependency.
+    Override this in tests to use a test graph.
+    """
+    try:
+        return load_similar_courses_graph(config.SIMILAR_COURSES_PATH)
+    except FileNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Similar courses have not been built",
+        )
+
+
+SimilarCourses = Annotated[SimilarCoursesGraph, Depends(get_similar_courses_graph)]
 
 
 async def get_current_identity(auth: AuthPayload, repo: IdentityUserRepo):
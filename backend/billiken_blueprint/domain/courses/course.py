@@ -8,7 +8,7 @@ from billiken_blueprint.repositories.course_attribute_repository import (
 )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Course(CourseCode):
     id: int | None
     attribute_ids: list[int]
@@ -40,7 +40,7 @@ class Course(CourseCode):
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CourseWithAttributes(Course):
     attributes: list[CourseAttribute]
 
@@ -64,6 +64,7 @@ class CourseWithAttributes(Course):
     def __hash__(self) -> int:
         return hash((self.major_code, self.course_number))
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CourseWithDescription(Course):
-    description: str
\ No newline at end of file
+    description: str
+    title: str = ""
\ No newline at end of file
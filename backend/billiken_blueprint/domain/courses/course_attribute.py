@@ -1,13 +1,19 @@
+import sys
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CourseAttribute:
     id: int | None
     name: str
     degree_works_label: str
     courses_at_slu_label: str
 
+    def __post_init__(self):
+        # Loaded once per course that carries the attribute.
+        for name in ("name", "degree_works_label", "courses_at_slu_label"):
+            object.__setattr__(self, name, sys.intern(getattr(self, name)))
+
     def to_dict(self) -> dict:
         return {
             "id": self.id,
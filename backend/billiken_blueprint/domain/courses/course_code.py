@@ -1,11 +1,15 @@
+import sys
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CourseCode:
     major_code: str
     course_number: str
 
+    def __post_init__(self):
+        object.__setattr__(self, "major_code", sys.intern(self.major_code))
+
     def __hash__(self) -> int:
         return hash((self.major_code, self.course_number))
 
@@ -1,17 +1,20 @@
+import sys
 from dataclasses import dataclass
-import stat
 from typing import Literal, Sequence
 
 from billiken_blueprint.domain.courses.course_code import CourseCode
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CourseCoursePrerequisite:
     major_code: str
     course_number: str
     end_number: int | None
     concurrent_allowed: bool
 
+    def __post_init__(self):
+        object.__setattr__(self, "major_code", sys.intern(self.major_code))
+
     def to_dict(self) -> dict:
         return {
             "major_code": self.major_code,
@@ -46,7 +49,7 @@ class CourseCoursePrerequisite:
         return True
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NestedCoursePrerequisite:
     operator: Literal["AND", "OR"]
     operands: "list[CourseCoursePrerequisite | NestedCoursePrerequisite]"
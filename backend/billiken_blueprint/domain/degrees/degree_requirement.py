@@ -1,3 +1,4 @@
+import sys
 from dataclasses import dataclass
 from typing import Iterator, Sequence
 
@@ -5,11 +6,14 @@ from billiken_blueprint.domain.courses.course import Course, CourseWithAttribute
 from billiken_blueprint.domain.courses.course_code import CourseCode
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CourseWithCode:
     major_code: str
     course_number: str
 
+    def __post_init__(self):
+        object.__setattr__(self, "major_code", sys.intern(self.major_code))
+
     def is_satisfied_by(self, course_code: CourseCode) -> bool:
         return (
             self.major_code == course_code.major_code
@@ -31,12 +35,15 @@ class CourseWithCode:
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CourseInRange:
     major_code: str
     course_number: str
     end_course_number: str
 
+    def __post_init__(self):
+        object.__setattr__(self, "major_code", sys.intern(self.major_code))
+
     def is_satisfied_by(self, course_code: CourseCode) -> bool:
         if course_code.major_code != self.major_code:
             return False
@@ -63,7 +70,7 @@ class CourseInRange:
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CourseWithAttribute:
     attribute_names: Sequence[str]
 
@@ -84,7 +91,7 @@ class CourseWithAttribute:
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CourseRule:
     courses: Sequence[CourseWithCode | CourseInRange | CourseWithAttribute]
     exclude: Sequence[CourseWithCode]
@@ -123,14 +130,14 @@ class CourseRule:
         return (course for course in courses if self.is_satisfied_by(course))
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DegreeRequirement:
     label: str
     needed: int
     course_rules: CourseRule
 
     def __post_init__(self):
-        self.needed = int(self.needed)
+        object.__setattr__(self, "needed", int(self.needed))
 
     def to_dict(self) -> dict:
         return {
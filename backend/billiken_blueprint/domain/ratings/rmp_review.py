@@ -1,3 +1,5 @@
+import hashlib
+import json
 from dataclasses import dataclass
 from typing import Optional
 from datetime import datetime
@@ -18,3 +20,21 @@ class RmpReview:
     review_date: Optional[datetime]
     course_id: Optional[int] = None  # Foreign key to courses table
 
+    def content_hash(self) -> str:
+        """Hash of the review as scraped, for telling new reviews from stored ones.
+
+        The ids (including the matched ``course_id``) are left out.
+        """
+        data = {
+            "course": self.course,
+            "quality": self.quality,
+            "difficulty": self.difficulty,
+            "comment": self.comment,
+            "would_take_again": self.would_take_again,
+            "grade": self.grade,
+            "attendance": self.attendance,
+            "tags": sorted(self.tags or []),
+            "review_date": self.review_date.isoformat() if self.review_date else None,
+        }
+        encoded = json.dumps(data, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(encoded.encode()).hexdigest()
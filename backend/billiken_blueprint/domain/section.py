@@ -1,29 +1,53 @@
-from dataclasses import dataclass
-from pydoc import describe
+import functools
+import hashlib
+import json
+import sys
+from dataclasses import dataclass, field
 
 
-@dataclass
+@functools.cache
+def time_to_minutes(time: str) -> int | None:
+    """Minutes after midnight of an ``HHMM`` (or ``HH:MM``) time."""
+    digits = time.replace(":", "")
+    if not digits.isdigit():
+        return None
+    hours, minutes = divmod(int(digits), 100)
+    return hours * 60 + minutes
+
+
+@dataclass(slots=True, frozen=True)
 class MeetingTime:
     day: int
     start_time: str
     end_time: str
+    # Parsed once here rather than on every overlap check.
+    start_minute: int | None = field(init=False, repr=False, compare=False)
+    end_minute: int | None = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
-        self.day = int(self.day)
-        
+        object.__setattr__(self, "day", int(self.day))
+        object.__setattr__(self, "start_time", sys.intern(self.start_time))
+        object.__setattr__(self, "end_time", sys.intern(self.end_time))
+        object.__setattr__(self, "start_minute", time_to_minutes(self.start_time))
+        object.__setattr__(self, "end_minute", time_to_minutes(self.end_time))
+
     def overlaps(self, other: "MeetingTime") -> bool:
         if self.day != other.day:
             return False
-        
-        start1 = int(self.start_time)
-        end1 = int(self.end_time)
-        start2 = int(other.start_time)
-        end2 = int(other.end_time)
+        if None in (
+            self.start_minute,
+            self.end_minute,
+            other.start_minute,
+            other.end_minute,
+        ):
+            return False
 
-        return max(start1, start2) < min(end1, end2)
+        return max(self.start_minute, other.start_minute) < min(
+            self.end_minute, other.end_minute
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class Section:
     id: int | None
     crn: str
@@ -35,11 +59,28 @@ class Section:
     semester: str
     meeting_times: list[MeetingTime]
 
+    def __post_init__(self):
+        # Thousands of sections share a few campuses, semesters and instructors.
+        self.instructor_names = [sys.intern(name) for name in self.instructor_names]
+        self.campus_code = sys.intern(self.campus_code)
+        self.course_code = sys.intern(self.course_code)
+        self.semester = sys.intern(self.semester)
+
     def overlaps(self, other: "Section") -> bool:
         return any(
             mt1.overlaps(mt2) for mt1 in self.meeting_times for mt2 in other.meeting_times
         )
 
+    def content_hash(self) -> str:
+        """Hash of everything but the id, for detecting changed sections."""
+        data = self.to_dict()
+        del data["id"]
+        data["meeting_times"].sort(
+            key=lambda mt: (mt["day"], mt["start_time"], mt["end_time"])
+        )
+        encoded = json.dumps(data, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(encoded.encode()).hexdigest()
+
     def to_dict(self) -> dict:
         return {
             "id": self.id,
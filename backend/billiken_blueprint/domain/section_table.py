@@ -0,0 +1,341 @@
+"""Columnar view of a semester's sections for the scheduler.
+
+Scoring and filtering only look at a section's course, campus, instructors,
+id and meeting times. ``SectionTable`` keeps those as NumPy columns (codes and
+names as indexes into small lookup lists), so the filters run over whole
+columns at once, and rebuilds ``Section`` objects only for the rows a caller
+asks for.
+
+Meeting times are also kept as a bitmask per section: one bit for each
+five-minute slot of the week. Two sets of meeting times overlap exactly when
+their masks share a bit, as long as every time falls on the five-minute grid;
+sections with meeting times off the grid (or on days outside the week) are
+compared against the flat meeting columns instead.
+"""
+
+import sys
+from typing import Callable, Iterable, Optional, Sequence
+
+import numpy as np
+
+from billiken_blueprint.domain.section import MeetingTime, Section, time_to_minutes
+from billiken_blueprint.domain.student import TimeSlot
+
+SLOT_MINUTES = 5
+DAYS = 7
+SLOTS_PER_DAY = 24 * 60 // SLOT_MINUTES
+
+# (day, start minute, end minute); minutes are None when unparseable.
+Meeting = tuple[int, Optional[int], Optional[int]]
+
+
+def _meetings_mask(meetings: Iterable[Meeting]) -> tuple[np.ndarray, bool]:
+    """Week bitmask covering ``meetings``, and whether it is exact.
+
+    Slots partly covered by a meeting are set, so the mask never misses an
+    overlap; it is exact when every meeting lies on the slot grid.
+    """
+    bits = np.zeros(DAYS * SLOTS_PER_DAY, dtype=bool)
+    exact = True
+    for day, start, end in meetings:
+        if start is None or end is None:
+            # Never overlaps anything.
+            continue
+        if not (0 <= day < DAYS and end <= 24 * 60):
+            exact = False
+            continue
+        if start % SLOT_MINUTES or end % SLOT_MINUTES:
+            exact = False
+        first = start // SLOT_MINUTES
+        last = -(-end // SLOT_MINUTES)
+        if first < last:
+            bits[day * SLOTS_PER_DAY + first : day * SLOTS_PER_DAY + last] = True
+    return np.packbits(bits), exact
+
+
+class SectionTable:
+    def __init__(self):
+        self.course_codes: list[str] = []
+        self.campus_codes: list[str] = []
+        self.instructor_names: list[str] = []
+
+        # One entry per section.
+        self.ids = np.zeros(0, dtype=np.int64)  # -1 for unsaved sections
+        self.course_index = np.zeros(0, dtype=np.int32)
+        self.campus_ids = np.zeros(0, dtype=np.int32)
+        self.meeting_masks = np.zeros((0, DAYS * SLOTS_PER_DAY // 8), dtype=np.uint8)
+        # False where the mask alone cannot answer overlap checks.
+        self.exact_masks = np.zeros(0, dtype=bool)
+        # Section i's instructors are instructor_ids[instructor_offsets[i]:
+        # instructor_offsets[i + 1]]; meeting times likewise.
+        self.instructor_offsets = np.zeros(1, dtype=np.int32)
+        self.instructor_ids = np.zeros(0, dtype=np.int32)
+        self.meeting_offsets = np.zeros(1, dtype=np.int32)
+        # One entry per meeting time; minutes are -1 when unparseable.
+        self.meeting_rows = np.zeros(0, dtype=np.int32)
+        self.meeting_days = np.zeros(0, dtype=np.int32)
+        self.meeting_starts = np.zeros(0, dtype=np.int32)
+        self.meeting_ends = np.zeros(0, dtype=np.int32)
+
+        # Only needed to rebuild sections.
+        self._crns: list[str] = []
+        self._descriptions: list[str] = []
+        self._titles: list[str] = []
+        self._semesters: list[str] = []
+        self._meetings: list[Meeting] = []
+        self._meeting_times: list[tuple[str, str]] = []
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @staticmethod
+    def from_sections(sections: Iterable[Section]) -> "SectionTable":
+        builder = SectionTableBuilder()
+        for section in sections:
+            builder.add(
+                section.id,
+                section.crn,
+                section.instructor_names,
+                section.campus_code,
+                section.description,
+                section.title,
+                section.course_code,
+                section.semester,
+                [(mt.day, mt.start_time, mt.end_time) for mt in section.meeting_times],
+            )
+        return builder.build()
+
+    # ------------------------------------------------------------------ #
+    # Filters: each returns a boolean column
+    # ------------------------------------------------------------------ #
+
+    def campus_is(self, campus_code: str) -> np.ndarray:
+        try:
+            campus_id = self.campus_codes.index(campus_code)
+        except ValueError:
+            return np.zeros(len(self), dtype=bool)
+        return self.campus_ids == campus_id
+
+    def has_id(self, section_ids: Iterable[int]) -> np.ndarray:
+        return np.isin(self.ids, np.fromiter(section_ids, dtype=np.int64))
+
+    def overlaps_timeslots(self, time_slots: Sequence[TimeSlot]) -> np.ndarray:
+        return self._overlapping(
+            [
+                (int(slot.day), time_to_minutes(slot.start), time_to_minutes(slot.end))
+                for slot in time_slots
+            ]
+        )
+
+    def overlaps_rows(self, rows: Iterable[int]) -> np.ndarray:
+        """Sections overlapping any of the sections at ``rows``."""
+        return self._overlapping(
+            [meeting for row in rows for meeting in self._row_meetings(row)]
+        )
+
+    def mean_instructor_rating(
+        self, rating: Callable[[str], Optional[float]]
+    ) -> np.ndarray:
+        """Mean ``rating`` of each section's rated instructors (0 if none)."""
+        ratings = np.array(
+            [rating(name) for name in self.instructor_names], dtype=float
+        )
+        section_of = np.repeat(
+            np.arange(len(self)), np.diff(self.instructor_offsets)
+        )
+        values = ratings[self.instructor_ids]
+        rated = ~np.isnan(values)
+        totals = np.bincount(
+            section_of, weights=np.where(rated, values, 0.0), minlength=len(self)
+        )
+        counts = np.bincount(section_of, weights=rated, minlength=len(self))
+        means = np.zeros(len(self))
+        np.divide(totals, counts, out=means, where=counts > 0)
+        return means
+
+    # ------------------------------------------------------------------ #
+    # Rows
+    # ------------------------------------------------------------------ #
+
+    def take(self, rows: np.ndarray) -> "SectionTable":
+        """The sections at ``rows`` (indexes or a boolean column)."""
+        rows = np.arange(len(self))[rows]
+        builder = SectionTableBuilder()
+        for row in rows:
+            builder.add(
+                int(self.ids[row]) if self.ids[row] >= 0 else None,
+                self._crns[row],
+                self._row_instructors(row),
+                self.campus_codes[self.campus_ids[row]],
+                self._descriptions[row],
+                self._titles[row],
+                self.course_codes[self.course_index[row]],
+                self._semesters[row],
+                [
+                    (meeting[0], *times)
+                    for meeting, times in zip(
+                        self._row_meetings(row), self._row_meeting_times(row)
+                    )
+                ],
+            )
+        return builder.build()
+
+    def section(self, row: int) -> Section:
+        return Section(
+            id=int(self.ids[row]) if self.ids[row] >= 0 else None,
+            crn=self._crns[row],
+            instructor_names=self._row_instructors(row),
+            campus_code=self.campus_codes[self.campus_ids[row]],
+            description=self._descriptions[row],
+            title=self._titles[row],
+            course_code=self.course_codes[self.course_index[row]],
+            semester=self._semesters[row],
+            meeting_times=[
+                MeetingTime(day=meeting[0], start_time=start, end_time=end)
+                for meeting, (start, end) in zip(
+                    self._row_meetings(row), self._row_meeting_times(row)
+                )
+            ],
+        )
+
+    def sections(self, rows: Iterable[int]) -> list[Section]:
+        return [self.section(row) for row in rows]
+
+    def _row_instructors(self, row: int) -> list[str]:
+        start, end = self.instructor_offsets[row], self.instructor_offsets[row + 1]
+        return [self.instructor_names[i] for i in self.instructor_ids[start:end]]
+
+    def _row_meetings(self, row: int) -> list[Meeting]:
+        return self._meetings[self.meeting_offsets[row] : self.meeting_offsets[row + 1]]
+
+    def _row_meeting_times(self, row: int) -> list[tuple[str, str]]:
+        return self._meeting_times[
+            self.meeting_offsets[row] : self.meeting_offsets[row + 1]
+        ]
+
+    def _overlapping(self, meetings: list[Meeting]) -> np.ndarray:
+        if not meetings or not len(self):
+            return np.zeros(len(self), dtype=bool)
+
+        mask, exact = _meetings_mask(meetings)
+        if not exact:
+            return self._overlapping_exactly(meetings)
+        slots = np.flatnonzero(mask)
+        hits = (self.meeting_masks[:, slots] & mask[slots]).any(axis=1)
+        if self.exact_masks.all():
+            return hits
+        return np.where(self.exact_masks, hits, self._overlapping_exactly(meetings))
+
+    def _overlapping_exactly(self, meetings: list[Meeting]) -> np.ndarray:
+        """``_overlapping`` without the masks, one query meeting at a time."""
+        parsed = self.meeting_starts >= 0
+        hits = np.zeros(len(self.meeting_rows), dtype=bool)
+        for day, start, end in meetings:
+            if start is None or end is None:
+                continue
+            hits |= (
+                parsed
+                & (self.meeting_days == day)
+                & (
+                    np.maximum(self.meeting_starts, start)
+                    < np.minimum(self.meeting_ends, end)
+                )
+            )
+        return np.bincount(self.meeting_rows[hits], minlength=len(self)) > 0
+
+
+class SectionTableBuilder:
+    """Accumulates sections row by row, then builds a ``SectionTable``."""
+
+    def __init__(self):
+        self._table = SectionTable()
+        self._course_ids: dict[str, int] = {}
+        self._campus_ids: dict[str, int] = {}
+        self._instructor_ids: dict[str, int] = {}
+        self._ids: list[int] = []
+        self._course_index: list[int] = []
+        self._campus_index: list[int] = []
+        self._masks: list[np.ndarray] = []
+        self._exact: list[bool] = []
+        self._instructor_offsets = [0]
+        self._instructors: list[int] = []
+        self._meeting_offsets = [0]
+
+    def add(
+        self,
+        id: int | None,
+        crn: str,
+        instructor_names: Sequence[str],
+        campus_code: str,
+        description: str,
+        title: str,
+        course_code: str,
+        semester: str,
+        meeting_times: Sequence[tuple[int, str, str]],
+    ) -> None:
+        table = self._table
+        self._ids.append(-1 if id is None else id)
+        self._course_index.append(
+            _lookup_id(self._course_ids, table.course_codes, course_code)
+        )
+        self._campus_index.append(
+            _lookup_id(self._campus_ids, table.campus_codes, campus_code)
+        )
+        self._instructors.extend(
+            _lookup_id(self._instructor_ids, table.instructor_names, name)
+            for name in instructor_names
+        )
+        self._instructor_offsets.append(len(self._instructors))
+
+        meetings = [
+            (int(day), time_to_minutes(start), time_to_minutes(end))
+            for day, start, end in meeting_times
+        ]
+        mask, exact = _meetings_mask(meetings)
+        self._masks.append(mask)
+        self._exact.append(exact)
+        table._meetings.extend(meetings)
+        table._meeting_times.extend(
+            (sys.intern(start), sys.intern(end)) for _, start, end in meeting_times
+        )
+        self._meeting_offsets.append(len(table._meetings))
+
+        table._crns.append(crn)
+        table._descriptions.append(description)
+        table._titles.append(title)
+        table._semesters.append(sys.intern(semester))
+
+    def build(self) -> SectionTable:
+        table = self._table
+        table.ids = np.array(self._ids, dtype=np.int64)
+        table.course_index = np.array(self._course_index, dtype=np.int32)
+        table.campus_ids = np.array(self._campus_index, dtype=np.int32)
+        if self._masks:
+            table.meeting_masks = np.stack(self._masks)
+        table.exact_masks = np.array(self._exact, dtype=bool)
+        table.instructor_offsets = np.array(self._instructor_offsets, dtype=np.int32)
+        table.instructor_ids = np.array(self._instructors, dtype=np.int32)
+        table.meeting_offsets = np.array(self._meeting_offsets, dtype=np.int32)
+        table.meeting_rows = np.repeat(
+            np.arange(len(table.ids), dtype=np.int32),
+            np.diff(table.meeting_offsets),
+        )
+        table.meeting_days = np.array(
+            [day for day, _, _ in table._meetings], dtype=np.int32
+        )
+        # A meeting with either end unparseable never overlaps, so both are -1.
+        parsed = [
+            (start, end) if start is not None and end is not None else (-1, -1)
+            for _, start, end in table._meetings
+        ]
+        table.meeting_starts = np.array([s for s, _ in parsed], dtype=np.int32)
+        table.meeting_ends = np.array([e for _, e in parsed], dtype=np.int32)
+        return table
+
+
+def _lookup_id(ids: dict[str, int], values: list[str], value: str) -> int:
+    index = ids.get(value)
+    if index is None:
+        index = ids[value] = len(values)
+        values.append(sys.intern(value))
+    return index
@@ -0,0 +1,80 @@
+import asyncio
+import time
+
+
+class AsyncRateLimiter:
+    """Token bucket that allows ``rate`` acquisitions per ``period`` seconds.
+
+    Up to ``burst`` acquisitions may happen back to back; after that callers
+    wait until a token refills. Safe to share between concurrent tasks.
+    """
+
+    def __init__(self, rate: float, period: float = 60.0, burst: int = 1):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.interval = period / rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._updated_at) / self.interval
+                )
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) * self.interval)
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+class AdaptiveRateLimiter(AsyncRateLimiter):
+    """Rate limiter that adapts to the throttling a server actually applies.
+
+    Each ``throttled()`` call (e.g. on HTTP 429) multiplies the rate by
+    ``decrease`` and pauses for the server's retry delay; each ``succeeded()``
+    call adds ``increase`` back, up to ``max_rate``.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        period: float = 60.0,
+        min_rate: float | None = None,
+        max_rate: float | None = None,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+    ):
+        super().__init__(rate, period=period)
+        self.period = period
+        self.min_rate = min_rate if min_rate is not None else rate / 16
+        self.max_rate = max_rate if max_rate is not None else rate * 4
+        self.increase = increase
+        self.decrease = decrease
+
+    @property
+    def rate(self) -> float:
+        return self.period / self.interval
+
+    def throttled(self, retry_after: float | None = None) -> None:
+        self._set_rate(max(self.min_rate, self.rate * self.decrease))
+        # An empty bucket refilling from ``retry_after`` seconds from now.
+        self._tokens = 0.0
+        self._updated_at = time.monotonic() + (retry_after or 0.0)
+
+    def succeeded(self) -> None:
+        self._set_rate(min(self.max_rate, self.rate + self.increase))
+
+    def _set_rate(self, rate: float) -> None:
+        self.interval = self.period / rate
@@ -0,0 +1,65 @@
+from typing import Sequence
+
+import sqlalchemy
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Mapped, mapped_column
+
+from billiken_blueprint.base import Base
+
+# Bumped by every write to courses or course attributes.
+COURSES = "courses"
+# Bumped by every write to sections.
+SECTIONS = "sections"
+
+
+class DBCatalogVersion(Base):
+    __tablename__ = "catalog_versions"
+
+    name: Mapped[str] = mapped_column(primary_key=True)
+    version: Mapped[int] = mapped_column(default=0)
+
+
+async def bump_catalog_version(session: AsyncSession, name: str) -> int:
+    """Increment ``name``'s version inside the caller's transaction."""
+    db_entity = await session.get(DBCatalogVersion, name)
+    if db_entity is None:
+        db_entity = DBCatalogVersion(name=name, version=0)
+        session.add(db_entity)
+    db_entity.version += 1
+    return db_entity.version
+
+
+class CatalogVersionRepository:
+    """Versions of catalog data that in-process caches are derived from.
+
+    Writers bump a version in the same transaction as their changes; a cache
+    remembers the version it was built from and rebuilds once it moves.
+    """
+
+    def __init__(self, async_sessionmaker: async_sessionmaker[AsyncSession]) -> None:
+        self.async_sessionmaker = async_sessionmaker
+
+    async def get(self, name: str) -> int:
+        async with self.async_sessionmaker() as session:
+            result = await session.execute(
+                sqlalchemy.select(DBCatalogVersion.version).where(
+                    DBCatalogVersion.name == name
+                )
+            )
+            return result.scalar_one_or_none() or 0
+
+    async def get_many(self, names: Sequence[str]) -> tuple[int, ...]:
+        async with self.async_sessionmaker() as session:
+            result = await session.execute(
+                sqlalchemy.select(
+                    DBCatalogVersion.name, DBCatalogVersion.version
+                ).where(DBCatalogVersion.name.in_(names))
+            )
+            versions = dict(result.all())
+            return tuple(versions.get(name, 0) for name in names)
+
+    async def bump(self, name: str) -> int:
+        async with self.async_sessionmaker() as session:
+            version = await bump_catalog_version(session, name)
+            await session.commit()
+            return version
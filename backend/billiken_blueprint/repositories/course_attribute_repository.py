@@ -3,6 +3,10 @@ from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.ext.asyncio import async_sessionmaker, AsyncSession
 
 from billiken_blueprint.domain.courses.course_attribute import CourseAttribute
+from billiken_blueprint.repositories.catalog_version_repository import (
+    COURSES,
+    bump_catalog_version,
+)
 
 
 class DBCourseAttribute(Base):
@@ -52,6 +56,7 @@ class CourseAttributeRepository:
                     courses_at_slu_label=attribute.courses_at_slu_label,
                 )
                 session.add(db_attribute)
+            await bump_catalog_version(session, COURSES)
             await session.commit()
             await session.refresh(db_attribute)
             return db_attribute.to_domain()
@@ -4,6 +4,10 @@ from sqlalchemy.orm import mapped_column, Mapped
 from sqlalchemy import JSON, select
 
 from billiken_blueprint.base import Base
+from billiken_blueprint.repositories.catalog_version_repository import (
+    COURSES,
+    bump_catalog_version,
+)
 from billiken_blueprint.domain.courses.course import Course
 from billiken_blueprint.domain.courses.course_prerequisite import (
     NestedCoursePrerequisite,
@@ -68,6 +72,7 @@ class CourseRepository:
                     course_number=course.course_number,
                 )
                 session.add(db_course)
+            await bump_catalog_version(session, COURSES)
             await session.commit()
             return db_course.to_domain()
 
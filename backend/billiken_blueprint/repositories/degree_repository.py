@@ -62,6 +62,21 @@ class DegreeRepository:
             data = [req.to_dict() for req in requirements]
             json.dump(data, f, indent=2)
 
+    async def get_ids_by_degree_works_codes(self) -> dict[tuple[str, str, str], int]:
+        """Degree ids keyed by (major code, degree type, college code)."""
+        stmt = select(
+            DBDegree.degree_works_major_code,
+            DBDegree.degree_works_degree_type,
+            DBDegree.degree_works_college_code,
+            DBDegree.id,
+        )
+        async with self.async_sessionmaker() as session:
+            result = await session.execute(stmt)
+            return {
+                (major, degree_type, college): id
+                for major, degree_type, college, id in result.all()
+            }
+
     async def get_all(self) -> Sequence[Degree]:
         stmt = select(DBDegree)
         async with self.async_sessionmaker() as session:
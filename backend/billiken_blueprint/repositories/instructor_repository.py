@@ -1,12 +1,27 @@
-from typing import Optional, TYPE_CHECKING
+from dataclasses import dataclass, field
+from typing import Optional, Sequence, TYPE_CHECKING
 from sqlalchemy.dialects.sqlite import insert
-from sqlalchemy import Column, ForeignKey, Table, select
+from sqlalchemy import (
+    Column,
+    ForeignKey,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    delete,
+    func,
+    or_,
+    select,
+    update,
+)
 from billiken_blueprint.base import Base
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, aliased, mapped_column, relationship
 from sqlalchemy.ext.asyncio import async_sessionmaker, AsyncSession
 
 from billiken_blueprint.domain.instructor import Professor
 from billiken_blueprint.repositories.course_repository import DBCourse
+from billiken_blueprint.repositories.rating_repository import DBRating
+from billiken_blueprint.repositories.rmp_review_repository import DBRmpReview
 
 
 class DBInstructor(Base):
@@ -20,6 +35,47 @@ class DBInstructor(Base):
     department: Mapped[Optional[str]] = mapped_column(nullable=True)
 
 
+# Duplicate -> canonical instructor mapping, loaded per merge.
+_merge_table = Table(
+    "instructor_merge",
+    MetaData(),
+    Column("duplicate_id", Integer, primary_key=True),
+    Column("canonical_id", Integer, nullable=False),
+    Column("canonical_name", String, nullable=False),
+    prefixes=["TEMPORARY"],
+)
+
+_MERGED_FIELDS = ("name", "rmp_rating", "rmp_num_ratings", "rmp_url", "department")
+
+
+@dataclass
+class InstructorMerge:
+    duplicate_id: int
+    canonical_id: int
+    canonical_name: str
+
+
+@dataclass
+class InstructorMergeReport:
+    dry_run: bool
+    merged: int = 0
+    ratings_moved: int = 0
+    reviews_moved: int = 0
+    # canonical id -> field -> (before, after)
+    changes: dict[int, dict[str, tuple]] = field(default_factory=dict)
+
+    def __str__(self) -> str:
+        lines = [
+            f"{'Would merge' if self.dry_run else 'Merged'} {self.merged} duplicate "
+            f"instructors; {self.ratings_moved} ratings and {self.reviews_moved} "
+            f"RMP reviews reassigned"
+        ]
+        for instructor_id, fields in sorted(self.changes.items()):
+            for name, (before, after) in fields.items():
+                lines.append(f"  ID {instructor_id} {name}: {before!r} -> {after!r}")
+        return "\n".join(lines)
+
+
 class InstructorRepository:
     def __init__(self, async_sessionmaker: async_sessionmaker[AsyncSession]) -> None:
         self._async_sessionmaker = async_sessionmaker
@@ -102,3 +158,128 @@ class InstructorRepository:
                 department=getattr(db_instructor, "department", None),
             )
         return None
+
+    async def merge(
+        self, merges: Sequence[InstructorMerge], dry_run: bool = False
+    ) -> InstructorMergeReport:
+        """Merge duplicate instructors into their canonical instructors.
+
+        The mapping is loaded into a temporary table and applied with a few
+        set-based statements in one transaction: canonical instructors take
+        their canonical name and any RMP data or department they lack from a
+        duplicate, ratings and RMP reviews are reassigned, and duplicates are
+        deleted. With ``dry_run`` the transaction is rolled back, so the report
+        shows exactly what would change.
+        """
+        report = InstructorMergeReport(dry_run=dry_run)
+        if not merges:
+            return report
+
+        merge = _merge_table
+        canonical_ids = sorted({m.canonical_id for m in merges})
+        async with self._async_sessionmaker() as session:
+            connection = await session.connection()
+            # A rolled-back dry run also rolls back the DROP at the end.
+            await connection.run_sync(merge.drop, checkfirst=True)
+            await connection.run_sync(merge.create)
+            try:
+                await session.execute(
+                    merge.insert(),
+                    [
+                        {
+                            "duplicate_id": m.duplicate_id,
+                            "canonical_id": m.canonical_id,
+                            "canonical_name": m.canonical_name,
+                        }
+                        for m in merges
+                    ],
+                )
+                before = await self._merged_fields(session, canonical_ids)
+
+                await session.execute(
+                    update(DBInstructor)
+                    .where(DBInstructor.id == merge.c.canonical_id)
+                    .values(name=merge.c.canonical_name)
+                )
+                await self._fill_from_duplicates(
+                    session, ("rmp_rating", "rmp_num_ratings", "rmp_url")
+                )
+                await self._fill_from_duplicates(session, ("department",))
+
+                result = await session.execute(
+                    update(DBRating)
+                    .where(DBRating.professor_id == merge.c.duplicate_id)
+                    .values(professor_id=merge.c.canonical_id)
+                )
+                report.ratings_moved = result.rowcount
+                result = await session.execute(
+                    update(DBRmpReview)
+                    .where(DBRmpReview.instructor_id == merge.c.duplicate_id)
+                    .values(instructor_id=merge.c.canonical_id)
+                )
+                report.reviews_moved = result.rowcount
+                result = await session.execute(
+                    delete(DBInstructor).where(
+                        DBInstructor.id.in_(select(merge.c.duplicate_id))
+                    )
+                )
+                report.merged = result.rowcount
+
+                after = await self._merged_fields(session, canonical_ids)
+                for instructor_id, old in before.items():
+                    new = after.get(instructor_id, old)
+                    changed = {
+                        name: (old[name], new[name])
+                        for name in _MERGED_FIELDS
+                        if old[name] != new[name]
+                    }
+                    if changed:
+                        report.changes[instructor_id] = changed
+            finally:
+                await connection.run_sync(merge.drop)
+
+            if dry_run:
+                await session.rollback()
+            else:
+                await session.commit()
+        return report
+
+    @staticmethod
+    async def _merged_fields(
+        session: AsyncSession, instructor_ids: list[int]
+    ) -> dict[int, dict]:
+        columns = [getattr(DBInstructor, name) for name in _MERGED_FIELDS]
+        result = await session.execute(
+            select(DBInstructor.id, *columns).where(DBInstructor.id.in_(instructor_ids))
+        )
+        return {row[0]: dict(zip(_MERGED_FIELDS, row[1:])) for row in result.all()}
+
+    @staticmethod
+    async def _fill_from_duplicates(session: AsyncSession, fields: tuple[str, ...]):
+        """Copy ``fields`` from a duplicate (the lowest id that has the first
+        field set) to canonical instructors where the first field is empty."""
+        merge = _merge_table
+        duplicate = aliased(DBInstructor)
+        key = getattr(duplicate, fields[0])
+        donor = (
+            select(
+                merge.c.canonical_id,
+                *[getattr(duplicate, name).label(name) for name in fields],
+                func.row_number()
+                .over(partition_by=merge.c.canonical_id, order_by=duplicate.id)
+                .label("rank"),
+            )
+            .join(duplicate, duplicate.id == merge.c.duplicate_id)
+            .where(key.is_not(None), func.coalesce(key, "") != "", key != 0)
+            .subquery()
+        )
+        target = getattr(DBInstructor, fields[0])
+        await session.execute(
+            update(DBInstructor)
+            .where(
+                DBInstructor.id == donor.c.canonical_id,
+                donor.c.rank == 1,
+                or_(target.is_(None), target == "", target == 0),
+            )
+            .values({name: donor.c[name] for name in fields})
+        )
@@ -1,6 +1,6 @@
 from typing import Optional
 from sqlalchemy.dialects.sqlite import insert
-from sqlalchemy import select, delete, JSON
+from sqlalchemy import select, delete, update, JSON
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.ext.asyncio import async_sessionmaker, AsyncSession
 from datetime import datetime
@@ -337,6 +337,45 @@ class RmpReviewRepository:
 
         return reviews
 
+    async def get_stored_by_instructor_id(self, instructor_id: int) -> list[RmpReview]:
+        """Reviews stored for an instructor, without the JSON file fallback."""
+        stmt = select(DBRmpReview).where(DBRmpReview.instructor_id == instructor_id)
+
+        async with self._async_sessionmaker() as session:
+            result = await session.execute(stmt)
+            return [db_review.to_rmp_review() for db_review in result.scalars().all()]
+
+    async def apply_changes(
+        self, inserts: list[RmpReview], deleted_ids: list[int]
+    ) -> None:
+        """Insert new reviews and delete removed ones in a single transaction."""
+        async with self._async_sessionmaker() as session:
+            if inserts:
+                await session.execute(
+                    insert(DBRmpReview),
+                    [
+                        {
+                            "instructor_id": review.instructor_id,
+                            "course": review.course,
+                            "course_id": review.course_id,
+                            "quality": review.quality,
+                            "difficulty": review.difficulty,
+                            "comment": review.comment,
+                            "would_take_again": review.would_take_again,
+                            "grade": review.grade,
+                            "attendance": review.attendance,
+                            "tags": review.tags,
+                            "review_date": review.review_date,
+                        }
+                        for review in inserts
+                    ],
+                )
+            if deleted_ids:
+                await session.execute(
+                    delete(DBRmpReview).where(DBRmpReview.id.in_(deleted_ids))
+                )
+            await session.commit()
+
     async def delete_by_instructor_id(self, instructor_id: int) -> None:
         """Delete all RMP reviews for a specific instructor."""
         delete_stmt = delete(DBRmpReview).where(
@@ -346,3 +385,28 @@ class RmpReviewRepository:
         async with self._async_sessionmaker() as session:
             await session.execute(delete_stmt)
             await session.commit()
+
+    async def get_without_course_id(self) -> list[tuple[int, str]]:
+        """(id, course) of stored reviews that name a course but have no course_id."""
+        stmt = select(DBRmpReview.id, DBRmpReview.course).where(
+            DBRmpReview.course_id.is_(None), DBRmpReview.course.is_not(None)
+        )
+
+        async with self._async_sessionmaker() as session:
+            result = await session.execute(stmt)
+            return [(row.id, row.course) for row in result.all()]
+
+    async def set_course_ids(self, course_ids: dict[int, int]) -> None:
+        """Set course_id on many reviews (review id -> course id) in one statement."""
+        if not course_ids:
+            return
+
+        async with self._async_sessionmaker() as session:
+            await session.execute(
+                update(DBRmpReview),
+                [
+                    {"id": review_id, "course_id": course_id}
+                    for review_id, course_id in course_ids.items()
+                ],
+            )
+            await session.commit()
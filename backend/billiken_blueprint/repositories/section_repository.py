@@ -1,3 +1,5 @@
+from typing import Iterable, Sequence
+
 import sqlalchemy
 from billiken_blueprint.base import Base
 from sqlalchemy.orm import Mapped, mapped_column
@@ -5,6 +7,11 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy import JSON
 
 from billiken_blueprint.domain.section import Section, MeetingTime
+from billiken_blueprint.domain.section_table import SectionTable, SectionTableBuilder
+from billiken_blueprint.repositories.catalog_version_repository import (
+    SECTIONS,
+    bump_catalog_version,
+)
 
 
 class DBSection(Base):
@@ -19,6 +26,7 @@ class DBSection(Base):
     course_code: Mapped[str] = mapped_column()
     semester: Mapped[str] = mapped_column()
     meeting_times: Mapped[list[dict]] = mapped_column(JSON)
+    content_hash: Mapped[str | None] = mapped_column(nullable=True)
 
     def to_domain(self) -> Section:
         return Section(
@@ -75,6 +83,7 @@ class SectionRepository:
                     }
                     for mt in section.meeting_times
                 ]
+                db_entity.content_hash = section.content_hash()
             else:
                 db_entity = DBSection(
                     crn=section.crn,
@@ -92,9 +101,11 @@ class SectionRepository:
                         }
                         for mt in section.meeting_times
                     ],
+                    content_hash=section.content_hash(),
                 )
                 session.add(db_entity)
 
+            await bump_catalog_version(session, SECTIONS)
             await session.commit()
             await session.refresh(db_entity)
 
@@ -113,6 +124,36 @@ class SectionRepository:
             db_entities = result.scalars().all()
             return [db_entity.to_domain() for db_entity in db_entities]
 
+    async def get_table_for_semester(self, semester: str) -> SectionTable:
+        """``semester``'s sections as a ``SectionTable``.
+
+        Rows go straight into the table's columns without building a
+        ``Section`` per row.
+        """
+        async with self.async_sessionmaker() as session:
+            stmt = sqlalchemy.select(
+                DBSection.id,
+                DBSection.crn,
+                DBSection.instructor_names,
+                DBSection.campus_code,
+                DBSection.description,
+                DBSection.title,
+                DBSection.course_code,
+                DBSection.semester,
+                DBSection.meeting_times,
+            ).where(DBSection.semester == semester)
+            result = await session.execute(stmt)
+            builder = SectionTableBuilder()
+            for row in result:
+                builder.add(
+                    *row[:-1],
+                    [
+                        (mt["day"], mt["start_time"], mt["end_time"])
+                        for mt in row.meeting_times
+                    ],
+                )
+            return builder.build()
+
     async def get_by_course_code_and_semester(
         self, code: str, semester: str
     ) -> list[Section]:
@@ -124,3 +165,91 @@ class SectionRepository:
             result = await session.execute(stmt)
             db_entities = result.scalars().all()
             return [db_entity.to_domain() for db_entity in db_entities]
+
+    async def get_content_hashes(
+        self, semester: str, departments: Iterable[str] | None = None
+    ) -> dict[str, str | None]:
+        """Stored content hash of every section in ``semester`` by CRN.
+
+        ``departments`` limits the result to courses with those major codes.
+        """
+        async with self.async_sessionmaker() as session:
+            stmt = sqlalchemy.select(DBSection.crn, DBSection.content_hash).where(
+                DBSection.semester == semester
+            )
+            if departments is not None:
+                stmt = stmt.where(
+                    sqlalchemy.or_(
+                        *(
+                            sqlalchemy.func.upper(DBSection.course_code).startswith(
+                                department.upper() + " "
+                            )
+                            for department in departments
+                        ),
+                        sqlalchemy.false(),
+                    )
+                )
+            result = await session.execute(stmt)
+            return {crn: content_hash for crn, content_hash in result.all()}
+
+    async def apply_changes(
+        self,
+        semester: str,
+        upserts: Sequence[Section],
+        deleted_crns: Sequence[str],
+    ) -> int:
+        """Insert, update and delete ``semester``'s sections in one transaction.
+
+        Sections are matched by CRN. The sections catalog version is bumped in
+        the same transaction and returned.
+        """
+        async with self.async_sessionmaker() as session:
+            stmt = sqlalchemy.select(DBSection.crn, DBSection.id).where(
+                DBSection.semester == semester,
+                DBSection.crn.in_([section.crn for section in upserts]),
+            )
+            ids_by_crn = dict((await session.execute(stmt)).all())
+
+            inserts, updates = [], []
+            for section in upserts:
+                row = _to_row(section)
+                if section.crn in ids_by_crn:
+                    updates.append({"id": ids_by_crn[section.crn], **row})
+                else:
+                    inserts.append(row)
+
+            if inserts:
+                await session.execute(sqlalchemy.insert(DBSection), inserts)
+            if updates:
+                await session.execute(sqlalchemy.update(DBSection), updates)
+            if deleted_crns:
+                await session.execute(
+                    sqlalchemy.delete(DBSection).where(
+                        DBSection.semester == semester,
+                        DBSection.crn.in_(deleted_crns),
+                    )
+                )
+            version = await bump_catalog_version(session, SECTIONS)
+            await session.commit()
+            return version
+
+
+def _to_row(section: Section) -> dict:
+    return {
+        "crn": section.crn,
+        "instructor_names": section.instructor_names,
+        "campus_code": section.campus_code,
+        "description": section.description,
+        "title": section.title,
+        "course_code": section.course_code,
+        "semester": section.semester,
+        "meeting_times": [
+            {
+                "day": mt.day,
+                "start_time": mt.start_time,
+                "end_time": mt.end_time,
+            }
+            for mt in section.meeting_times
+        ],
+        "content_hash": section.content_hash(),
+    }
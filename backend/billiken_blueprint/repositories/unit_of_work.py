@@ -0,0 +1,97 @@
+"""Request-scoped sharing of database sessions between repositories.
+
+Repositories open a session per method (``async with factory() as session``),
+so a request that calls them in a loop checks a connection out of the pool
+once per call. ``SessionFactory`` is a drop-in for ``async_sessionmaker``:
+outside a unit of work it behaves exactly the same, inside one every call
+yields the unit's single session, so the whole request runs on one connection
+and its reads share one transaction.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Awaitable, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+_current: ContextVar[Optional["UnitOfWork"]] = ContextVar(
+    "unit_of_work", default=None
+)
+
+
+class UnitOfWork:
+    def __init__(self) -> None:
+        self._sessions: dict[async_sessionmaker[AsyncSession], AsyncSession] = {}
+
+    def session(self, sessionmaker: async_sessionmaker[AsyncSession]) -> AsyncSession:
+        session = self._sessions.get(sessionmaker)
+        if session is None:
+            session = self._sessions[sessionmaker] = sessionmaker()
+        return session
+
+    async def close(self) -> None:
+        for session in self._sessions.values():
+            await session.close()
+        self._sessions.clear()
+
+
+@asynccontextmanager
+async def unit_of_work() -> AsyncIterator[UnitOfWork]:
+    """Share one session per sessionmaker among repositories until exit."""
+    work = UnitOfWork()
+    token = _current.set(work)
+    try:
+        yield work
+    finally:
+        try:
+            _current.reset(token)
+        except ValueError:
+            # Exited from a copy of the context it was entered in.
+            _current.set(None)
+        await work.close()
+
+
+async def run_concurrently(*awaitables: Awaitable[Any]) -> list[Any]:
+    """Await independent loads concurrently, like ``asyncio.gather``.
+
+    A session cannot serve concurrent queries, so each load leaves the active
+    unit of work and opens sessions of its own (a connection each).
+    """
+
+    async def detached(awaitable: Awaitable[Any]) -> Any:
+        # Each gathered task runs in a copy of the context; this does not
+        # affect the caller's unit of work.
+        _current.set(None)
+        return await awaitable
+
+    return list(await asyncio.gather(*(detached(a) for a in awaitables)))
+
+
+class _SharedSession:
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def __aenter__(self) -> AsyncSession:
+        return self._session
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        # What closing a per-call session would do, minus releasing the
+        # connection: drop loaded objects (so later calls see fresh rows) and
+        # roll back a failed call.
+        if exc_type is not None:
+            await self._session.rollback()
+        self._session.expunge_all()
+
+
+class SessionFactory:
+    """``async_sessionmaker`` replacement that joins the active unit of work."""
+
+    def __init__(self, sessionmaker: async_sessionmaker[AsyncSession]) -> None:
+        self.sessionmaker = sessionmaker
+
+    def __call__(self):
+        work = _current.get()
+        if work is None:
+            return self.sessionmaker()
+        return _SharedSession(work.session(self.sessionmaker))
@@ -0,0 +1,118 @@
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+
+class ResponseCache:
+    """Persistent cache of JSON-serializable responses in a SQLite file.
+
+    Each entry is stored under a hash of the request with its zlib-compressed
+    JSON body and the time it was fetched, so a lookup or write touches one row
+    regardless of cache size. Entries older than ``ttl`` seconds are treated as
+    misses (``None`` keeps entries forever).
+
+    One connection is shared behind a lock and the database runs in WAL mode,
+    so concurrent tasks, threads and processes can read and write safely. The
+    ``a``-prefixed methods run the same operations off the event loop.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        ttl: Optional[float] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.path = Path(path)
+        self.ttl = ttl
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+
+    @staticmethod
+    def key(*parts: str) -> str:
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update(part.encode())
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT body, fetched_at FROM responses WHERE key = ?", (key,)
+                )
+                .fetchone()
+            )
+            if row is None or (
+                self.ttl is not None and self.clock() - row[1] > self.ttl
+            ):
+                self.misses += 1
+                return None
+            self.hits += 1
+        return json.loads(zlib.decompress(row[0]))
+
+    def set(self, key: str, value: Any) -> None:
+        body = zlib.compress(json.dumps(value, separators=(",", ":")).encode())
+        with self._lock:
+            connection = self._connect()
+            connection.execute(
+                "INSERT OR REPLACE INTO responses (key, body, fetched_at) "
+                "VALUES (?, ?, ?)",
+                (key, body, self.clock()),
+            )
+            connection.commit()
+
+    def delete_expired(self) -> int:
+        if self.ttl is None:
+            return 0
+        with self._lock:
+            connection = self._connect()
+            cursor = connection.execute(
+                "DELETE FROM responses WHERE fetched_at < ?",
+                (self.clock() - self.ttl,),
+            )
+            connection.commit()
+            return cursor.rowcount
+
+    async def aget(self, key: str) -> Any | None:
+        return await asyncio.to_thread(self.get, key)
+
+    async def aset(self, key: str, value: Any) -> None:
+        await asyncio.to_thread(self.set, key, value)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(
+                self.path, timeout=30, check_same_thread=False
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, body BLOB NOT NULL, fetched_at REAL NOT NULL)"
+            )
+            connection.commit()
+            self._connection = connection
+        return self._connection
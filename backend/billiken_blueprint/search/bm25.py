@@ -0,0 +1,157 @@
+"""In-memory BM25 index over course codes, titles and descriptions.
+
+Vector search is good at "courses about X" but regularly misses literal
+matches such as a course code ("CSCI 2100") or a technology name ("SQL"). This
+index covers those queries and is fused with the vector results in
+``get_courses_from_user_query``.
+"""
+
+import re
+from collections import Counter, defaultdict
+from typing import Iterable, Optional, Sequence
+
+import numpy as np
+
+from billiken_blueprint.domain.courses.course import CourseWithDescription
+from billiken_blueprint.search.course_records import course_metadata, course_record_id
+
+# Course codes in a query may be typed as "CSCI 2100", "csci2100" or "CSCI-2100".
+_COURSE_CODE_PATTERN = re.compile(r"\b([a-z]{2,4})\s*-?\s*(\d{4}[a-z]?)\b")
+_TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#]*")
+_STOP_WORDS = frozenset(
+    """
+    a an and are as at be by for from has have i in into is it its me my of on
+    or that the their this to was were will with want learn about course
+    courses class classes
+    """.split()
+)
+
+# Repeating code and title tokens is a cheap stand-in for BM25F field weights.
+CODE_WEIGHT = 3
+TITLE_WEIGHT = 2
+
+
+def tokenize(text: str) -> list[str]:
+    text = text.lower()
+    codes = [major + number for major, number in _COURSE_CODE_PATTERN.findall(text)]
+    words = [w for w in _TOKEN_PATTERN.findall(text) if w not in _STOP_WORDS]
+    return codes + words
+
+
+def course_code_token(major_code: str, course_number: str) -> str:
+    return f"{major_code}{course_number}".lower()
+
+
+class Bm25Index:
+    def __init__(
+        self,
+        courses: Sequence[CourseWithDescription],
+        k1: float = 1.2,
+        b: float = 0.75,
+    ):
+        self.k1 = k1
+        self.b = b
+        self.ids = [course_record_id(course) for course in courses]
+        self.metadatas = [course_metadata(course) for course in courses]
+        self.documents = [course.description for course in courses]
+        self.course_ids = np.array([course.id for course in courses], dtype=np.int64)
+        self.course_ints = np.array(
+            [metadata["course_int"] for metadata in self.metadatas], dtype=np.int64
+        )
+
+        self._rows_by_code: dict[str, int] = {}
+        self._title_tokens: list[frozenset[str]] = []
+        postings: dict[str, list[tuple[int, int]]] = defaultdict(list)
+        lengths = []
+        for row, course in enumerate(courses):
+            code = course_code_token(course.major_code, course.course_number)
+            self._rows_by_code[code] = row
+            title_tokens = tokenize(course.title)
+            self._title_tokens.append(frozenset(title_tokens))
+
+            tokens = (
+                [code, course.major_code.lower(), course.course_number.lower()]
+                * CODE_WEIGHT
+                + title_tokens * TITLE_WEIGHT
+                + tokenize(course.description)
+            )
+            lengths.append(len(tokens))
+            for token, count in Counter(tokens).items():
+                postings[token].append((row, count))
+
+        self._doc_lengths = np.array(lengths, dtype=np.float32)
+        self._avg_doc_length = float(self._doc_lengths.mean()) if lengths else 0.0
+        self._postings = {
+            token: (
+                np.array([row for row, _ in entries], dtype=np.int64),
+                np.array([count for _, count in entries], dtype=np.float32),
+            )
+            for token, entries in postings.items()
+        }
+
+    @classmethod
+    def from_courses(cls, courses: Iterable[CourseWithDescription]) -> "Bm25Index":
+        return cls([course for course in courses if course.description])
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def search(
+        self,
+        query: str,
+        limit: int = 20,
+        excluded_course_ids: Iterable[int] = (),
+        max_course_int: Optional[int] = None,
+    ) -> list[tuple[int, float]]:
+        """Return ``(row, score)`` pairs for the best matching courses."""
+        scores = np.zeros(len(self), dtype=np.float32)
+        n = len(self)
+        for token in set(tokenize(query)):
+            if token not in self._postings:
+                continue
+            rows, counts = self._postings[token]
+            idf = np.log(1 + (n - len(rows) + 0.5) / (len(rows) + 0.5))
+            norm = self.k1 * (
+                1 - self.b + self.b * self._doc_lengths[rows] / self._avg_doc_length
+            )
+            scores[rows] += idf * counts * (self.k1 + 1) / (counts + norm)
+
+        mask = (scores > 0) & self._allowed(excluded_course_ids, max_course_int)
+        candidates = np.flatnonzero(mask)
+        if len(candidates) > limit:
+            top = np.argpartition(-scores[candidates], limit - 1)[:limit]
+            candidates = candidates[top]
+        order = np.argsort(-scores[candidates], kind="stable")
+        return [(int(row), float(scores[row])) for row in candidates[order]]
+
+    def strong_matches(
+        self,
+        query: str,
+        excluded_course_ids: Iterable[int] = (),
+        max_course_int: Optional[int] = None,
+    ) -> list[int]:
+        """Rows the query names outright: by course code or by exact title."""
+        allowed = self._allowed(excluded_course_ids, max_course_int)
+        tokens = tokenize(query)
+
+        rows = [
+            self._rows_by_code[token]
+            for token in tokens
+            if token in self._rows_by_code
+        ]
+        query_tokens = frozenset(tokens)
+        if query_tokens:
+            rows += [
+                row
+                for row, title_tokens in enumerate(self._title_tokens)
+                if title_tokens == query_tokens
+            ]
+        return [row for row in dict.fromkeys(rows) if allowed[row]]
+
+    def _allowed(
+        self, excluded_course_ids: Iterable[int], max_course_int: Optional[int]
+    ) -> np.ndarray:
+        mask = ~np.isin(self.course_ids, list(excluded_course_ids))
+        if max_course_int is not None:
+            mask &= self.course_ints < max_course_int
+        return mask
@@ -0,0 +1,46 @@
+"""Resolve the free-text course field of RMP reviews to catalog courses.
+
+Reviews name their course as typed by the student ("CSCI 3100", "csci3100",
+"CSCI-3100 Algorithms"). ``CourseCodeResolver`` keeps every catalog course
+under a normalized code, so resolving a review is a regex and a dict lookup
+instead of a database query.
+"""
+
+import re
+from typing import Iterable, Optional
+
+from billiken_blueprint.domain.courses.course import Course
+
+_REVIEW_COURSE_CODE = re.compile(r"([A-Z]+)\s*-?\s*(\d{4})")
+
+
+def normalize_course_code(course_code: str) -> str:
+    """Normalize a course code: "CSCI 3100" and "csci-3100" become "CSCI3100"."""
+    return course_code.replace(" ", "").replace("-", "").upper()
+
+
+def extract_course_code(course_string: Optional[str]) -> Optional[str]:
+    """The first course code in a review's course field, normalized."""
+    if not course_string:
+        return None
+    match = _REVIEW_COURSE_CODE.search(course_string.upper())
+    if match is None:
+        return None
+    return match.group(1) + match.group(2)
+
+
+class CourseCodeResolver:
+    def __init__(self, courses: Iterable[Course]):
+        self._course_ids: dict[str, int] = {}
+        for course in courses:
+            code = normalize_course_code(f"{course.major_code}{course.course_number}")
+            # Like get_by_code, the first course with a code wins.
+            self._course_ids.setdefault(code, course.id)
+
+    def __len__(self) -> int:
+        return len(self._course_ids)
+
+    def resolve(self, course_string: Optional[str]) -> Optional[int]:
+        """Id of the course a review's course field refers to, if known."""
+        code = extract_course_code(course_string)
+        return self._course_ids.get(code) if code else None
@@ -0,0 +1,17 @@
+from billiken_blueprint.domain.courses.course import CourseWithDescription
+
+
+def course_record_id(course: CourseWithDescription) -> str:
+    """Id of the course's entry in the course descriptions collection."""
+    return f"doc_{course.id}"
+
+
+def course_metadata(course: CourseWithDescription) -> dict:
+    """Metadata stored with each course description embedding."""
+    return {
+        "course_id": course.id,
+        "major_code": course.major_code,
+        "course_number": course.course_number,
+        "course_code": f"{course.major_code} {course.course_number}",
+        "course_int": int(course.course_number.rstrip("Xx")),
+    }
@@ -0,0 +1,137 @@
+"""Incremental, resumable build of the course descriptions embedding index.
+
+Each record stores a ``content_hash`` of the embedded text and the embedding
+model version. A build embeds only courses whose hash is missing or different,
+upserts every finished batch straight into the index and calls ``checkpoint``
+after it. An interrupted run therefore resumes where it stopped: completed
+batches already carry their new hash and are skipped the next time.
+"""
+
+import asyncio
+import hashlib
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional, Sequence
+
+from billiken_blueprint.domain.courses.course import CourseWithDescription
+from billiken_blueprint.rate_limit import AsyncRateLimiter
+from billiken_blueprint.search.course_records import course_metadata, course_record_id
+
+EmbedBatch = Callable[[Sequence[CourseWithDescription]], Sequence]
+
+
+@dataclass
+class EmbeddingBuildReport:
+    total: int
+    embedded: int
+    updated: int
+    unchanged: int
+    deleted: int
+    seconds: float
+
+    @property
+    def courses_per_second(self) -> float:
+        return self.embedded / self.seconds if self.seconds else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.total} courses: {self.embedded} embedded, "
+            f"{self.updated} metadata updated, {self.unchanged} unchanged, "
+            f"{self.deleted} deleted in {self.seconds:.1f}s "
+            f"({self.courses_per_second:.1f} courses/sec)"
+        )
+
+
+def content_hash(course: CourseWithDescription, model_version: str) -> str:
+    digest = hashlib.sha256()
+    digest.update(model_version.encode())
+    digest.update(b"\0")
+    digest.update(course.description.encode())
+    return digest.hexdigest()
+
+
+async def build_course_embeddings(
+    courses: Sequence[CourseWithDescription],
+    collection,
+    embed_batch: EmbedBatch,
+    model_version: str,
+    batch_size: Optional[int] = 100,
+    requests_per_minute: float = 100,
+    max_in_flight: int = 4,
+    checkpoint: Callable[[], None] = lambda: None,
+) -> EmbeddingBuildReport:
+    """Bring ``collection`` in line with ``courses``.
+
+    ``embed_batch`` is called with at most ``batch_size`` courses (all of them
+    when ``None``) in a worker thread, with at most ``max_in_flight`` calls
+    running and no more than ``requests_per_minute`` started per minute.
+    """
+    start = time.perf_counter()
+    courses = [course for course in courses if course.description]
+
+    existing = collection.get(include=["metadatas"])
+    stored_metadata = dict(zip(existing["ids"], existing["metadatas"]))
+
+    to_embed = []
+    to_update = []
+    for course in courses:
+        metadata = _metadata_with_hash(course, model_version)
+        stored = stored_metadata.get(course_record_id(course))
+        if stored is None or stored.get("content_hash") != metadata["content_hash"]:
+            to_embed.append(course)
+        elif stored != metadata:
+            to_update.append(course)
+
+    current_ids = {course_record_id(course) for course in courses}
+    stale_ids = [id for id in stored_metadata if id not in current_ids]
+    if stale_ids:
+        collection.delete(ids=stale_ids)
+    if to_update:
+        collection.update(
+            ids=[course_record_id(course) for course in to_update],
+            metadatas=[_metadata_with_hash(c, model_version) for c in to_update],
+            documents=[course.description for course in to_update],
+        )
+    if stale_ids or to_update:
+        checkpoint()
+
+    size = batch_size or max(len(to_embed), 1)
+    batches = [to_embed[i : i + size] for i in range(0, len(to_embed), size)]
+    limiter = AsyncRateLimiter(requests_per_minute, burst=max_in_flight)
+    semaphore = asyncio.Semaphore(max_in_flight)
+
+    async def embed(batch):
+        async with semaphore:
+            await limiter.acquire()
+            return batch, await asyncio.to_thread(embed_batch, batch)
+
+    tasks = [asyncio.create_task(embed(batch)) for batch in batches]
+    try:
+        for done in asyncio.as_completed(tasks):
+            batch, embeddings = await done
+            collection.upsert(
+                ids=[course_record_id(course) for course in batch],
+                embeddings=[embedding.values for embedding in embeddings],
+                metadatas=[_metadata_with_hash(c, model_version) for c in batch],
+                documents=[course.description for course in batch],
+            )
+            checkpoint()
+    finally:
+        for task in tasks:
+            task.cancel()
+
+    return EmbeddingBuildReport(
+        total=len(courses),
+        embedded=len(to_embed),
+        updated=len(to_update),
+        unchanged=len(courses) - len(to_embed) - len(to_update),
+        deleted=len(stale_ids),
+        seconds=time.perf_counter() - start,
+    )
+
+
+def _metadata_with_hash(course: CourseWithDescription, model_version: str) -> dict:
+    return {
+        **course_metadata(course),
+        "content_hash": content_hash(course, model_version),
+    }
@@ -0,0 +1,312 @@
+"""Fuzzy instructor-name matching for the RMP import scripts.
+
+Names from RateMyProfessors and from the course listings differ in nicknames
+("Jim" / "James"), typos, titles, parenthesised preferred names and initials.
+``NameMatcher`` indexes the known names once under several blocking keys
+(canonical name, phonetic last name, last-name trigrams), so each
+lookup scores only a handful of candidates instead of every instructor.
+"""
+
+import re
+import unicodedata
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from typing import Generic, Iterable, Optional, TypeVar
+
+T = TypeVar("T")
+
+# Nickname -> formal first name.
+NICKNAMES = {
+    "abby": "abigail",
+    "alex": "alexander",
+    "sandy": "alexander",
+    "andy": "andrew",
+    "drew": "andrew",
+    "ben": "benjamin",
+    "benny": "benjamin",
+    "chuck": "charles",
+    "charlie": "charles",
+    "chris": "christopher",
+    "cj": "christopher",
+    "dan": "daniel",
+    "danny": "daniel",
+    "ed": "edward",
+    "eddie": "edward",
+    "beth": "elizabeth",
+    "liz": "elizabeth",
+    "greg": "gregory",
+    "jen": "jennifer",
+    "jenny": "jennifer",
+    "jim": "james",
+    "jimmy": "james",
+    "joe": "joseph",
+    "joey": "joseph",
+    "josh": "joshua",
+    "kate": "katherine",
+    "katie": "katherine",
+    "kathy": "katherine",
+    "matt": "matthew",
+    "mike": "michael",
+    "mikey": "michael",
+    "nate": "nathaniel",
+    "nat": "nathaniel",
+    "phil": "philip",
+    "bob": "robert",
+    "rob": "robert",
+    "dick": "richard",
+    "rick": "richard",
+    "sam": "samuel",
+    "sue": "susan",
+    "steve": "steven",
+    "stephen": "steven",
+    "ted": "theodore",
+    "tim": "timothy",
+    "timmy": "timothy",
+    "tom": "thomas",
+    "tommy": "thomas",
+    "bill": "william",
+    "will": "william",
+}
+
+# Known misspellings in the source data.
+TYPOS = {"adbul": "abdul"}
+
+# Individual aliases the rules above cannot derive ("Tae Ahn" goes by Ted).
+NAME_ALIASES = {"tae ahn": "ted ahn"}
+
+# How a person's name should be shown, when the sources disagree.
+PREFERRED_NAMES = [
+    "Ted Ahn",
+    "Jamal Abdul-Hafidh",
+    "James Gill",
+    "Philip Huling",
+    "Samuel Stoll",
+    "Christopher Halverson",
+    "Abigail Stylianou",
+]
+
+_TITLES = {"dr", "prof", "professor", "mr", "mrs", "ms", "jr", "sr", "ii", "iii", "phd"}
+_PARENTHESISED = re.compile(r"\(([^)]*)\)")
+_WORD = re.compile(r"[a-z][a-z'\-]*")
+
+MATCH_THRESHOLD = 0.9
+# Trigrams shared by more names than this are too common to block on.
+MAX_TRIGRAM_POSTINGS = 500
+
+
+@dataclass(frozen=True)
+class ParsedName:
+    first: str
+    last: str
+    # A preferred name given in parentheses: "Tae-Hyuk (Ted) Ahn".
+    nickname: Optional[str] = None
+
+    @property
+    def key(self) -> str:
+        return f"{canonical_first_name(self.nickname or self.first)} {self.last}".strip()
+
+
+def parse_name(name: str) -> ParsedName:
+    text = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode()
+    text = text.lower()
+    for typo, fix in TYPOS.items():
+        text = text.replace(typo, fix)
+
+    nickname = None
+    parenthesised = _PARENTHESISED.search(text)
+    if parenthesised:
+        words = _WORD.findall(parenthesised.group(1))
+        nickname = words[0] if words else None
+        text = _PARENTHESISED.sub(" ", text)
+
+    words = [
+        word.strip("'-")
+        for word in _WORD.findall(text.replace(".", " ").replace(",", " "))
+        if word.strip("'-") not in _TITLES
+    ]
+    if not words:
+        return ParsedName("", "")
+    if len(words) == 1:
+        return ParsedName("", words[0])
+
+    alias = NAME_ALIASES.get(f"{words[0]} {words[-1]}")
+    if alias:
+        first, last = alias.split()
+        return ParsedName(first, last, nickname)
+    return ParsedName(words[0], words[-1], nickname)
+
+
+def canonical_first_name(first: str) -> str:
+    return NICKNAMES.get(first, first)
+
+
+def name_key(name: str) -> str:
+    """Canonical "first last" key; names of the same person share a key."""
+    return parse_name(name).key
+
+
+_PREFERRED_BY_KEY = {name_key(name): name for name in PREFERRED_NAMES}
+
+
+def preferred_name(name: str) -> str:
+    return _PREFERRED_BY_KEY.get(name_key(name), name)
+
+
+def soundex(word: str) -> str:
+    codes = {
+        **dict.fromkeys("bfpv", "1"),
+        **dict.fromkeys("cgjkqsxz", "2"),
+        **dict.fromkeys("dt", "3"),
+        "l": "4",
+        **dict.fromkeys("mn", "5"),
+        "r": "6",
+    }
+    letters = [c for c in word.lower() if c.isalpha()]
+    if not letters:
+        return ""
+    key = letters[0].upper()
+    previous = codes.get(letters[0], "")
+    for c in letters[1:]:
+        code = codes.get(c, "")
+        if code and code != previous:
+            key += code
+        if c not in "hw":
+            previous = code
+    return (key + "000")[:4]
+
+
+def trigrams(word: str) -> set[str]:
+    padded = f"  {word} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def _similarity(a: set[str], b: set[str]) -> float:
+    return len(a & b) / len(a | b) if a and b else 0.0
+
+
+@dataclass
+class NameMatch(Generic[T]):
+    value: T
+    name: str
+    score: float
+
+
+@dataclass
+class _Entry(Generic[T]):
+    name: str
+    parsed: ParsedName
+    value: T
+    last_trigrams: set[str]
+
+
+class NameMatcher(Generic[T]):
+    """Index of known names for scored fuzzy lookups.
+
+    ``match`` returns the best candidate scoring at least ``threshold``. At
+    the default threshold the last name must agree (after normalisation) and
+    the first name must agree up to nicknames, prefixes ("Greg" / "Gregory")
+    or initials. ``candidates`` ranks looser matches for review.
+    """
+
+    def __init__(self, names: Iterable[tuple[str, T]] = ()):
+        self._entries: list[_Entry[T]] = []
+        self._by_key: dict[str, list[int]] = defaultdict(list)
+        self._by_soundex: dict[str, list[int]] = defaultdict(list)
+        self._by_trigram: dict[str, list[int]] = defaultdict(list)
+        for name, value in names:
+            self.add(name, value)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, name: str, value: T) -> None:
+        parsed = parse_name(name)
+        entry = _Entry(name, parsed, value, trigrams(parsed.last))
+        index = len(self._entries)
+        self._entries.append(entry)
+        self._by_key[parsed.key].append(index)
+        self._by_soundex[soundex(parsed.last)].append(index)
+        for trigram in entry.last_trigrams:
+            self._by_trigram[trigram].append(index)
+
+    def match(
+        self, name: str, threshold: float = MATCH_THRESHOLD
+    ) -> Optional[NameMatch[T]]:
+        parsed = parse_name(name)
+        exact = self._by_key.get(parsed.key)
+        if exact and parsed.key:
+            entry = self._entries[exact[0]]
+            return NameMatch(entry.value, entry.name, 1.0)
+
+        # Same-sounding last names include identical ones.
+        best = None
+        query_trigrams = trigrams(parsed.last)
+        for index in self._by_soundex.get(soundex(parsed.last), ()):
+            entry = self._entries[index]
+            score = _score(parsed, query_trigrams, entry)
+            if score >= threshold and (best is None or score > best.score):
+                best = NameMatch(entry.value, entry.name, score)
+        return best
+
+    def candidates(self, name: str, limit: int = 5) -> list[NameMatch[T]]:
+        """The ``limit`` best-scoring known names, best first."""
+        parsed = parse_name(name)
+        query_trigrams = trigrams(parsed.last)
+        indexes = set(self._by_key.get(parsed.key, ()))
+        indexes.update(self._by_soundex.get(soundex(parsed.last), ()))
+
+        shared = Counter()
+        for trigram in query_trigrams:
+            postings = self._by_trigram.get(trigram, ())
+            if len(postings) <= MAX_TRIGRAM_POSTINGS:
+                shared.update(postings)
+        # Names sharing at least half of the query's last-name trigrams.
+        minimum = max(1, len(query_trigrams) // 2)
+        indexes.update(index for index, count in shared.items() if count >= minimum)
+
+        ranked = sorted(
+            (
+                NameMatch(entry.value, entry.name, _score(parsed, query_trigrams, entry))
+                for entry in (self._entries[index] for index in sorted(indexes))
+            ),
+            key=lambda match: -match.score,
+        )
+        return ranked[:limit]
+
+
+def _score(query: ParsedName, query_trigrams: set[str], entry: _Entry) -> float:
+    """Weighted agreement of last names (0.6) and first names (0.4)."""
+    candidate = entry.parsed
+    if query.key == candidate.key:
+        return 1.0
+
+    if query.last == candidate.last:
+        last = 1.0
+    elif soundex(query.last) == soundex(candidate.last):
+        last = 0.8
+    else:
+        last = _similarity(query_trigrams, entry.last_trigrams)
+
+    return 0.6 * last + 0.4 * _first_name_score(query, candidate)
+
+
+def _first_name_score(a: ParsedName, b: ParsedName) -> float:
+    firsts_a = {a.first, *([a.nickname] if a.nickname else [])} - {""}
+    firsts_b = {b.first, *([b.nickname] if b.nickname else [])} - {""}
+    if not firsts_a or not firsts_b:
+        # Only a last name on one side.
+        return 0.5
+
+    best = 0.0
+    for x in firsts_a:
+        for y in firsts_b:
+            if canonical_first_name(x) == canonical_first_name(y):
+                return 1.0
+            if x.startswith(y) or y.startswith(x):
+                score = 0.8 if min(len(x), len(y)) == 1 else 0.9
+            elif soundex(x) == soundex(y):
+                score = 0.7
+            else:
+                score = 0.7 * _similarity(trigrams(x), trigrams(y))
+            best = max(best, score)
+    return best
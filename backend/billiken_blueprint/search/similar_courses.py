@@ -0,0 +1,287 @@
+"""Precomputed "similar courses" graph over the course embeddings.
+
+Every course keeps its top-N nearest neighbours by cosine similarity so
+``GET /courses/{id}/similar`` can answer from memory without an embedding call.
+The graph records the ``content_hash`` each row was computed from. A rebuild
+recomputes only what changed embeddings can affect:
+
+- rows of new or changed courses, and rows whose neighbour list contained a
+  changed or removed course, are recomputed against the whole catalog;
+- every other row is only compared with the changed courses and the result is
+  merged into its existing list.
+"""
+
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Sequence
+
+import numpy as np
+
+DEFAULT_NEIGHBORS = 10
+
+# Rows per block of the similarity matrix; bounds memory at block x catalog.
+_BLOCK_ROWS = 1024
+
+
+@dataclass
+class SimilarCourse:
+    course_id: int
+    course_code: str
+    score: float
+
+
+class SimilarCoursesGraph:
+    def __init__(
+        self,
+        course_ids: np.ndarray,
+        course_codes: np.ndarray,
+        content_hashes: np.ndarray,
+        neighbors: np.ndarray,
+        scores: np.ndarray,
+    ):
+        # ``neighbors`` holds row positions (-1 pads short lists); ``scores``
+        # holds the matching cosine similarities in descending order.
+        self.course_ids = course_ids
+        self.course_codes = course_codes
+        self.content_hashes = content_hashes
+        self.neighbors = neighbors
+        self.scores = scores
+        self._rows = {int(id): row for row, id in enumerate(course_ids)}
+
+    @property
+    def n_neighbors(self) -> int:
+        return self.neighbors.shape[1]
+
+    def __len__(self) -> int:
+        return len(self.course_ids)
+
+    def __contains__(self, course_id: int) -> bool:
+        return course_id in self._rows
+
+    def similar(self, course_id: int, limit: Optional[int] = None) -> list[SimilarCourse]:
+        row = self._rows[course_id]
+        return [
+            SimilarCourse(
+                course_id=int(self.course_ids[neighbor]),
+                course_code=str(self.course_codes[neighbor]),
+                score=float(score),
+            )
+            for neighbor, score in zip(
+                self.neighbors[row][:limit], self.scores[row][:limit]
+            )
+            if neighbor >= 0
+        ]
+
+    @classmethod
+    def build(
+        cls,
+        course_ids: Sequence[int],
+        course_codes: Sequence[str],
+        content_hashes: Sequence[str],
+        embeddings: np.ndarray,
+        n_neighbors: int = DEFAULT_NEIGHBORS,
+    ) -> "SimilarCoursesGraph":
+        vectors = _normalize_rows(np.asarray(embeddings, dtype=np.float32))
+        rows = np.arange(len(vectors))
+        neighbors, scores = _top_neighbors(vectors, rows, rows, n_neighbors)
+        return cls(
+            np.asarray(course_ids, dtype=np.int64),
+            np.asarray(course_codes, dtype=str),
+            np.asarray(content_hashes, dtype=str),
+            neighbors,
+            np.where(neighbors >= 0, scores, 0).astype(np.float32),
+        )
+
+    def rebuild(
+        self,
+        course_ids: Sequence[int],
+        course_codes: Sequence[str],
+        content_hashes: Sequence[str],
+        embeddings: np.ndarray,
+    ) -> tuple["SimilarCoursesGraph", int]:
+        """Graph for the new catalog state and the number of rows recomputed."""
+        vectors = _normalize_rows(np.asarray(embeddings, dtype=np.float32))
+        course_ids = np.asarray(course_ids, dtype=np.int64)
+        n_neighbors = self.n_neighbors
+
+        # Map each new row to its previous row, or -1 when new or changed.
+        previous_rows = np.full(len(course_ids), -1, dtype=np.int64)
+        for row, (id, content_hash) in enumerate(zip(course_ids, content_hashes)):
+            previous = self._rows.get(int(id))
+            if previous is not None and self.content_hashes[previous] == content_hash:
+                previous_rows[row] = previous
+        kept = previous_rows >= 0
+
+        # Position now of each previous row that survives unchanged. The extra
+        # trailing -1 makes padding entries (-1) map to -1.
+        new_row_of_previous = np.full(len(self) + 1, -1, dtype=np.int64)
+        new_row_of_previous[previous_rows[kept]] = np.flatnonzero(kept)
+
+        # Rows whose old neighbour lists mention a changed or removed course.
+        old_neighbors = self.neighbors[previous_rows[kept]]
+        remapped = np.where(old_neighbors >= 0, new_row_of_previous[old_neighbors], -1)
+        lost_neighbor = ((old_neighbors >= 0) & (remapped < 0)).any(axis=1)
+
+        recompute = ~kept
+        recompute[np.flatnonzero(kept)[lost_neighbor]] = True
+        recompute_rows = np.flatnonzero(recompute)
+        changed_rows = np.flatnonzero(~kept)
+        patch_rows = np.flatnonzero(~recompute)
+
+        neighbors = np.full((len(vectors), n_neighbors), -1, dtype=np.int64)
+        scores = np.full((len(vectors), n_neighbors), -np.inf, dtype=np.float32)
+
+        all_rows = np.arange(len(vectors))
+        neighbors[recompute_rows], scores[recompute_rows] = _top_neighbors(
+            vectors, recompute_rows, all_rows, n_neighbors
+        )
+
+        if len(patch_rows):
+            previous = previous_rows[patch_rows]
+            old = np.where(
+                self.neighbors[previous] >= 0,
+                new_row_of_previous[self.neighbors[previous]],
+                -1,
+            )
+            old_scores = np.where(old >= 0, self.scores[previous], -np.inf)
+            fresh, fresh_scores = _top_neighbors(
+                vectors, patch_rows, changed_rows, n_neighbors
+            )
+            neighbors[patch_rows], scores[patch_rows] = _merge_top(
+                np.concatenate([old, fresh], axis=1),
+                np.concatenate([old_scores, fresh_scores], axis=1),
+                n_neighbors,
+            )
+
+        graph = SimilarCoursesGraph(
+            course_ids,
+            np.asarray(course_codes, dtype=str),
+            np.asarray(content_hashes, dtype=str),
+            neighbors,
+            np.where(neighbors >= 0, scores, 0).astype(np.float32),
+        )
+        return graph, len(recompute_rows)
+
+    def save(self, path: str | Path) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp.npz")
+        np.savez(
+            tmp_path,
+            course_ids=self.course_ids,
+            course_codes=self.course_codes,
+            content_hashes=self.content_hashes,
+            neighbors=self.neighbors,
+            scores=self.scores,
+        )
+        tmp_path.replace(path)
+
+    @classmethod
+    def load(cls, path: str | Path) -> "SimilarCoursesGraph":
+        with np.load(path) as data:
+            return cls(
+                data["course_ids"],
+                data["course_codes"],
+                data["content_hashes"],
+                data["neighbors"],
+                data["scores"],
+            )
+
+
+def refresh_similar_courses(
+    collection, path: str | Path, n_neighbors: int = DEFAULT_NEIGHBORS
+) -> tuple[SimilarCoursesGraph, int]:
+    """Rebuild the graph at ``path`` from every embedding in ``collection``.
+
+    Returns the graph and how many rows had to be recomputed.
+    """
+    records = collection.get(include=["embeddings", "metadatas"])
+    metadatas = records["metadatas"]
+    course_ids = [metadata["course_id"] for metadata in metadatas]
+    course_codes = [metadata["course_code"] for metadata in metadatas]
+    content_hashes = [metadata.get("content_hash", "") for metadata in metadatas]
+    embeddings = np.asarray(records["embeddings"], dtype=np.float32)
+
+    path = Path(path)
+    if path.exists():
+        previous = SimilarCoursesGraph.load(path)
+        if previous.n_neighbors == n_neighbors:
+            graph, recomputed = previous.rebuild(
+                course_ids, course_codes, content_hashes, embeddings
+            )
+            graph.save(path)
+            return graph, recomputed
+
+    graph = SimilarCoursesGraph.build(
+        course_ids, course_codes, content_hashes, embeddings, n_neighbors
+    )
+    graph.save(path)
+    return graph, len(graph)
+
+
+# Loaded graphs by path, with the file they were loaded from.
+_loaded_graphs: dict[str, tuple[tuple[int, int], SimilarCoursesGraph]] = {}
+
+
+def load_similar_courses_graph(path: str) -> SimilarCoursesGraph:
+    """Load the similar courses graph, again whenever ``save`` replaces it."""
+    stat = os.stat(path)
+    version = (stat.st_ino, stat.st_mtime_ns)
+    loaded = _loaded_graphs.get(path)
+    if loaded is None or loaded[0] != version:
+        loaded = (version, SimilarCoursesGraph.load(path))
+        _loaded_graphs[path] = loaded
+    return loaded[1]
+
+
+def _top_neighbors(
+    vectors: np.ndarray,
+    query_rows: np.ndarray,
+    candidate_rows: np.ndarray,
+    n_neighbors: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Top neighbours of ``query_rows`` among ``candidate_rows``, excluding self."""
+    neighbors = np.full((len(query_rows), n_neighbors), -1, dtype=np.int64)
+    scores = np.full((len(query_rows), n_neighbors), -np.inf, dtype=np.float32)
+    if len(candidate_rows) == 0:
+        return neighbors, scores
+
+    candidate_vectors = vectors[candidate_rows]
+    k = min(n_neighbors, len(candidate_rows))
+    for start in range(0, len(query_rows), _BLOCK_ROWS):
+        block_rows = query_rows[start : start + _BLOCK_ROWS]
+        similarities = vectors[block_rows] @ candidate_vectors.T
+        similarities[block_rows[:, None] == candidate_rows[None, :]] = -np.inf
+
+        if k < len(candidate_rows):
+            top = np.argpartition(-similarities, k - 1, axis=1)[:, :k]
+        else:
+            top = np.tile(np.arange(len(candidate_rows)), (len(block_rows), 1))
+        top_scores = np.take_along_axis(similarities, top, axis=1)
+        order = np.argsort(-top_scores, axis=1, kind="stable")
+        top = np.take_along_axis(top, order, axis=1)
+        top_scores = np.take_along_axis(top_scores, order, axis=1)
+
+        block = slice(start, start + len(block_rows))
+        neighbors[block, :k] = np.where(
+            np.isfinite(top_scores), candidate_rows[top], -1
+        )
+        scores[block, :k] = top_scores
+    return neighbors, scores
+
+
+def _merge_top(
+    neighbors: np.ndarray, scores: np.ndarray, n_neighbors: int
+) -> tuple[np.ndarray, np.ndarray]:
+    order = np.argsort(-scores, axis=1, kind="stable")[:, :n_neighbors]
+    return (
+        np.take_along_axis(neighbors, order, axis=1),
+        np.take_along_axis(scores, order, axis=1),
+    )
+
+
+def _normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
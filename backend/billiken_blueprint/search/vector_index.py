@@ -0,0 +1,491 @@
+"""In-process vector index for the course descriptions.
+
+The catalog is only a few thousand descriptions, so brute-force cosine
+similarity over a memory-mapped matrix is faster and far lighter than running
+a ChromaDB client in every worker. ``NumpyVectorIndex`` implements the subset of
+the ``chromadb.Collection`` API that the app uses (``query``, ``get``,
+``upsert``, ``update``, ``delete``, ``count``) and returns results in the same
+shape, so it can be swapped in via ``config.VECTOR_INDEX_BACKEND``.
+
+On disk an index is a directory containing:
+
+- ``embeddings.npy``: L2-normalized vectors as float16, or int8 with a
+  per-row float32 scale in ``scales.npy``
+- ``records.json``: ids, metadatas and documents, row-aligned with the matrix
+- ``manifest.json``: dtype, dimension and distance space
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Iterable, Mapping, Optional, Sequence
+
+import numpy as np
+
+SUPPORTED_DTYPES = ("float16", "int8")
+SUPPORTED_SPACES = ("cosine", "l2")
+
+# Rows are scored in blocks so float16/int8 storage is upcast a slice at a time
+# instead of materializing a float32 copy of the whole matrix.
+_SCORE_BLOCK_ROWS = 4096
+
+_COMPARISONS = {
+    "$eq": np.equal,
+    "$ne": np.not_equal,
+    "$lt": np.less,
+    "$lte": np.less_equal,
+    "$gt": np.greater,
+    "$gte": np.greater_equal,
+}
+
+
+class NumpyVectorIndex:
+    def __init__(self, dtype: str = "float16", space: str = "cosine"):
+        if dtype not in SUPPORTED_DTYPES:
+            raise ValueError(f"Unsupported dtype {dtype!r}")
+        if space not in SUPPORTED_SPACES:
+            raise ValueError(f"Unsupported space {space!r}")
+
+        self.dtype = dtype
+        self.space = space
+        self._embeddings: Optional[np.ndarray] = None
+        self._scales: Optional[np.ndarray] = None
+        self._ids: list[str] = []
+        self._metadatas: list[dict] = []
+        self._documents: list[Optional[str]] = []
+        self._positions: dict[str, int] = {}
+        self._columns: dict[str, np.ndarray] = {}
+
+    # ------------------------------------------------------------------ #
+    # Chroma-compatible API
+    # ------------------------------------------------------------------ #
+
+    def count(self) -> int:
+        return len(self._ids)
+
+    def query(
+        self,
+        query_embeddings: Sequence[float] | Sequence[Sequence[float]],
+        n_results: int = 10,
+        include: Iterable[str] = ("metadatas", "documents", "distances"),
+        where: Optional[Mapping[str, Any]] = None,
+    ) -> dict:
+        queries = np.atleast_2d(np.asarray(query_embeddings, dtype=np.float32))
+        queries = _normalize_rows(queries)
+        include = set(include)
+
+        mask = self._where_mask(where)
+        candidates = np.flatnonzero(mask)
+        k = min(n_results, len(candidates))
+
+        result: dict[str, list] = {"ids": []}
+        for key in ("metadatas", "documents", "distances", "embeddings"):
+            if key in include:
+                result[key] = []
+
+        for query in queries:
+            rows, similarities = self._top_k(query, candidates, k)
+            result["ids"].append([self._ids[i] for i in rows])
+            if "metadatas" in result:
+                result["metadatas"].append([self._metadatas[i] for i in rows])
+            if "documents" in result:
+                result["documents"].append([self._documents[i] for i in rows])
+            if "distances" in result:
+                result["distances"].append(
+                    self._to_distances(similarities).tolist()
+                )
+            if "embeddings" in result:
+                result["embeddings"].append(self._dequantize(rows).tolist())
+
+        return result
+
+    def get(
+        self,
+        ids: Optional[str | Sequence[str]] = None,
+        where: Optional[Mapping[str, Any]] = None,
+        limit: Optional[int] = None,
+        include: Iterable[str] = ("metadatas", "documents"),
+    ) -> dict:
+        mask = self._where_mask(where)
+        if ids is not None:
+            ids = [ids] if isinstance(ids, str) else list(ids)
+            rows = [
+                self._positions[id]
+                for id in ids
+                if id in self._positions and mask[self._positions[id]]
+            ]
+        else:
+            rows = np.flatnonzero(mask).tolist()
+        if limit is not None:
+            rows = rows[:limit]
+
+        include = set(include)
+        result: dict[str, list] = {"ids": [self._ids[i] for i in rows]}
+        if "metadatas" in include:
+            result["metadatas"] = [self._metadatas[i] for i in rows]
+        if "documents" in include:
+            result["documents"] = [self._documents[i] for i in rows]
+        if "embeddings" in include:
+            result["embeddings"] = self._dequantize(rows).tolist()
+        return result
+
+    def upsert(
+        self,
+        ids: str | Sequence[str],
+        embeddings: Sequence[float] | Sequence[Sequence[float]],
+        metadatas: Optional[Mapping | Sequence[Mapping]] = None,
+        documents: Optional[str | Sequence[str]] = None,
+    ) -> None:
+        ids = [ids] if isinstance(ids, str) else list(ids)
+        vectors = np.atleast_2d(np.asarray(embeddings, dtype=np.float32))
+        if isinstance(metadatas, Mapping):
+            metadatas = [metadatas]
+        if isinstance(documents, str):
+            documents = [documents]
+        metadatas = list(metadatas) if metadatas is not None else [{}] * len(ids)
+        documents = list(documents) if documents is not None else [None] * len(ids)
+
+        if not (len(ids) == len(vectors) == len(metadatas) == len(documents)):
+            raise ValueError("ids, embeddings, metadatas and documents must align")
+        if self._embeddings is not None and vectors.shape[1] != self.dimension:
+            raise ValueError(
+                f"Expected embeddings of dimension {self.dimension}, "
+                f"got {vectors.shape[1]}"
+            )
+
+        stored, scales = self._quantize(_normalize_rows(vectors))
+        embedding_matrix = self._writable_embeddings()
+        scale_vector = self._writable_scales()
+
+        new_rows = []
+        for offset, id in enumerate(ids):
+            position = self._positions.get(id)
+            if position is None:
+                new_rows.append(offset)
+                continue
+            embedding_matrix[position] = stored[offset]
+            if scale_vector is not None:
+                scale_vector[position] = scales[offset]
+            self._metadatas[position] = dict(metadatas[offset])
+            self._documents[position] = documents[offset]
+
+        if new_rows:
+            appended = stored[new_rows]
+            embedding_matrix = (
+                appended
+                if embedding_matrix is None
+                else np.concatenate([embedding_matrix, appended])
+            )
+            if scales is not None:
+                appended_scales = scales[new_rows]
+                scale_vector = (
+                    appended_scales
+                    if scale_vector is None
+                    else np.concatenate([scale_vector, appended_scales])
+                )
+            for offset in new_rows:
+                self._positions[ids[offset]] = len(self._ids)
+                self._ids.append(ids[offset])
+                self._metadatas.append(dict(metadatas[offset]))
+                self._documents.append(documents[offset])
+
+        self._embeddings = embedding_matrix
+        self._scales = scale_vector
+        self._rebuild_columns()
+
+    def update(
+        self,
+        ids: str | Sequence[str],
+        metadatas: Optional[Mapping | Sequence[Mapping]] = None,
+        documents: Optional[str | Sequence[str]] = None,
+    ) -> None:
+        """Replace metadata and/or documents of existing records in place."""
+        ids = [ids] if isinstance(ids, str) else list(ids)
+        if isinstance(metadatas, Mapping):
+            metadatas = [metadatas]
+        if isinstance(documents, str):
+            documents = [documents]
+
+        for offset, id in enumerate(ids):
+            position = self._positions.get(id)
+            if position is None:
+                continue
+            if metadatas is not None:
+                self._metadatas[position] = dict(metadatas[offset])
+            if documents is not None:
+                self._documents[position] = documents[offset]
+        if metadatas is not None:
+            self._rebuild_columns()
+
+    def delete(self, ids: str | Sequence[str]) -> None:
+        ids = [ids] if isinstance(ids, str) else list(ids)
+        doomed = {self._positions[id] for id in ids if id in self._positions}
+        if not doomed:
+            return
+
+        keep = np.array(
+            [i for i in range(len(self._ids)) if i not in doomed], dtype=np.int64
+        )
+        self._embeddings = np.asarray(self._embeddings)[keep]
+        if self._scales is not None:
+            self._scales = np.asarray(self._scales)[keep]
+        self._ids = [self._ids[i] for i in keep]
+        self._metadatas = [self._metadatas[i] for i in keep]
+        self._documents = [self._documents[i] for i in keep]
+        self._positions = {id: i for i, id in enumerate(self._ids)}
+        self._rebuild_columns()
+
+    # ------------------------------------------------------------------ #
+    # Persistence
+    # ------------------------------------------------------------------ #
+
+    @property
+    def dimension(self) -> int:
+        return 0 if self._embeddings is None else self._embeddings.shape[1]
+
+    def save(self, path: str | Path) -> None:
+        """Write the index to ``path``, replacing any previous files atomically."""
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+
+        embeddings = (
+            self._embeddings
+            if self._embeddings is not None
+            else np.zeros((0, 0), dtype=self._storage_dtype)
+        )
+        _atomic_save_npy(path / "embeddings.npy", embeddings)
+        if self._scales is not None:
+            _atomic_save_npy(path / "scales.npy", self._scales)
+        elif (path / "scales.npy").exists():
+            (path / "scales.npy").unlink()
+
+        _atomic_write_json(
+            path / "records.json",
+            {
+                "ids": self._ids,
+                "metadatas": self._metadatas,
+                "documents": self._documents,
+            },
+        )
+        _atomic_write_json(
+            path / "manifest.json",
+            {
+                "dtype": self.dtype,
+                "space": self.space,
+                "dimension": self.dimension,
+                "count": self.count(),
+            },
+        )
+
+    @classmethod
+    def load(cls, path: str | Path, mmap: bool = True) -> "NumpyVectorIndex":
+        """Load an index written by ``save``.
+
+        With ``mmap`` the embedding matrix stays on disk and pages are shared
+        between worker processes. It is copied into memory on the first write.
+        """
+        path = Path(path)
+        with open(path / "manifest.json", "r") as f:
+            manifest = json.load(f)
+        with open(path / "records.json", "r") as f:
+            records = json.load(f)
+
+        index = cls(dtype=manifest["dtype"], space=manifest["space"])
+        mmap_mode = "r" if mmap else None
+        if manifest["count"]:
+            index._embeddings = np.load(path / "embeddings.npy", mmap_mode=mmap_mode)
+            if index.dtype == "int8":
+                index._scales = np.load(path / "scales.npy", mmap_mode=mmap_mode)
+        index._ids = records["ids"]
+        index._metadatas = records["metadatas"]
+        index._documents = records["documents"]
+        index._positions = {id: i for i, id in enumerate(index._ids)}
+        index._rebuild_columns()
+        return index
+
+    @classmethod
+    def from_collection(
+        cls, collection, dtype: str = "float16", space: str = "cosine"
+    ) -> "NumpyVectorIndex":
+        """Build an index from every record in a Chroma collection."""
+        records = collection.get(include=["embeddings", "metadatas", "documents"])
+        index = cls(dtype=dtype, space=space)
+        if len(records["ids"]):
+            index.upsert(
+                ids=records["ids"],
+                embeddings=records["embeddings"],
+                metadatas=records["metadatas"],
+                documents=records["documents"],
+            )
+        return index
+
+    # ------------------------------------------------------------------ #
+    # Internals
+    # ------------------------------------------------------------------ #
+
+    @property
+    def _storage_dtype(self):
+        return np.float16 if self.dtype == "float16" else np.int8
+
+    def _quantize(
+        self, vectors: np.ndarray
+    ) -> tuple[np.ndarray, Optional[np.ndarray]]:
+        if self.dtype == "float16":
+            return vectors.astype(np.float16), None
+
+        scales = np.abs(vectors).max(axis=1) / 127.0
+        scales[scales == 0] = 1.0
+        quantized = np.rint(vectors / scales[:, None]).astype(np.int8)
+        return quantized, scales.astype(np.float32)
+
+    def _dequantize(self, rows) -> np.ndarray:
+        if self._embeddings is None:
+            return np.zeros((0, 0), dtype=np.float32)
+        block = np.asarray(self._embeddings[rows], dtype=np.float32)
+        if self._scales is not None:
+            block *= np.asarray(self._scales[rows])[:, None]
+        return block
+
+    def _writable_embeddings(self) -> Optional[np.ndarray]:
+        if self._embeddings is None:
+            return None
+        if not self._embeddings.flags.writeable:
+            self._embeddings = np.array(self._embeddings)
+        return self._embeddings
+
+    def _writable_scales(self) -> Optional[np.ndarray]:
+        if self._scales is None:
+            return None
+        if not self._scales.flags.writeable:
+            self._scales = np.array(self._scales)
+        return self._scales
+
+    def _top_k(
+        self, query: np.ndarray, candidates: np.ndarray, k: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        if k == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+
+        similarities = self._score(query)
+        if len(candidates) != len(similarities):
+            similarities = similarities[candidates]
+
+        if k < len(similarities):
+            top = np.argpartition(-similarities, k - 1)[:k]
+        else:
+            top = np.arange(len(similarities))
+        top = top[np.argsort(-similarities[top], kind="stable")]
+
+        rows = candidates[top] if len(candidates) else top
+        return rows, similarities[top]
+
+    def _score(self, query: np.ndarray) -> np.ndarray:
+        n = self.count()
+        scores = np.empty(n, dtype=np.float32)
+        for start in range(0, n, _SCORE_BLOCK_ROWS):
+            stop = min(start + _SCORE_BLOCK_ROWS, n)
+            block = np.asarray(self._embeddings[start:stop], dtype=np.float32)
+            scores[start:stop] = block @ query
+            if self._scales is not None:
+                scores[start:stop] *= self._scales[start:stop]
+        return scores
+
+    def _to_distances(self, similarities: np.ndarray) -> np.ndarray:
+        if self.space == "l2":
+            # Squared euclidean distance between unit vectors, as Chroma reports.
+            return np.maximum(2.0 - 2.0 * similarities, 0.0)
+        return 1.0 - similarities
+
+    def _rebuild_columns(self) -> None:
+        keys = {key for metadata in self._metadatas for key in metadata}
+        columns = {}
+        for key in keys:
+            values = [metadata.get(key) for metadata in self._metadatas]
+            present = [value for value in values if value is not None]
+            if present and all(
+                isinstance(value, (int, float)) and not isinstance(value, bool)
+                for value in present
+            ):
+                columns[key] = np.array(
+                    [np.nan if value is None else value for value in values],
+                    dtype=np.float64,
+                )
+            else:
+                columns[key] = np.array(values, dtype=object)
+        self._columns = columns
+
+    def _where_mask(self, where: Optional[Mapping[str, Any]]) -> np.ndarray:
+        if not where:
+            return np.ones(self.count(), dtype=bool)
+
+        mask = np.ones(self.count(), dtype=bool)
+        for key, condition in where.items():
+            if key == "$and":
+                for clause in condition:
+                    mask &= self._where_mask(clause)
+            elif key == "$or":
+                alternatives = np.zeros(self.count(), dtype=bool)
+                for clause in condition:
+                    alternatives |= self._where_mask(clause)
+                mask &= alternatives
+            else:
+                mask &= self._field_mask(key, condition)
+        return mask
+
+    def _field_mask(self, key: str, condition: Any) -> np.ndarray:
+        column = self._columns.get(key)
+        if column is None:
+            column = np.full(self.count(), None, dtype=object)
+        if not isinstance(condition, Mapping):
+            condition = {"$eq": condition}
+
+        mask = np.ones(self.count(), dtype=bool)
+        for operator, operand in condition.items():
+            if operator in _COMPARISONS:
+                with np.errstate(invalid="ignore"):
+                    mask &= _COMPARISONS[operator](column, operand).astype(bool)
+            elif operator == "$in":
+                mask &= np.isin(column, list(operand))
+            elif operator == "$nin":
+                mask &= ~np.isin(column, list(operand))
+            else:
+                raise ValueError(f"Unsupported where operator {operator!r}")
+        return mask
+
+
+def _normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+def _atomic_save_npy(path: Path, array: np.ndarray) -> None:
+    tmp_path = path.with_suffix(".tmp.npy")
+    np.save(tmp_path, np.asarray(array))
+    os.replace(tmp_path, path)
+
+
+def _atomic_write_json(path: Path, data) -> None:
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
+
+
+# Loaded indexes by path, with the manifest file they were loaded from.
+_loaded_indexes: dict[str, tuple[tuple[int, int], NumpyVectorIndex]] = {}
+
+
+def load_course_descriptions_index(path: str) -> NumpyVectorIndex:
+    """Load the course descriptions index, again whenever it is rebuilt.
+
+    ``save`` replaces the manifest last, so a new manifest file means a
+    complete new index.
+    """
+    stat = os.stat(Path(path) / "manifest.json")
+    version = (stat.st_ino, stat.st_mtime_ns)
+    loaded = _loaded_indexes.get(path)
+    if loaded is None or loaded[0] != version:
+        loaded = (version, NumpyVectorIndex.load(path))
+        _loaded_indexes[path] = loaded
+    return loaded[1]
@@ -1,9 +1,11 @@
+import atexit
 import chromadb
 import chromadb.utils.embedding_functions
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 import os
 
 from billiken_blueprint.repositories import (
+    catalog_version_repository,
     course_attribute_repository,
     degree_repository,
     identity_user_repository,
@@ -14,10 +16,16 @@ from billiken_blueprint.repositories import (
     rating_repository,
     rmp_review_repository,
 )
+from billiken_blueprint.repositories.unit_of_work import SessionFactory
+from billiken_blueprint.single_flight import SingleFlight
+from billiken_blueprint.use_cases.schedule_executor import ScheduleExecutor
+from billiken_blueprint import config
 
 # SQLAlchemy
 engine = create_async_engine("sqlite+aiosqlite:///data/data.db", echo=False)
-async_sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
+# Repositories share one session per request inside a unit of work
+# (dependencies.get_unit_of_work); elsewhere each call opens its own.
+async_sessionmaker = SessionFactory(async_sessionmaker(engine, expire_on_commit=False))
 
 
 # Repositories
@@ -30,6 +38,9 @@ course_repository = course_repository.CourseRepository(async_sessionmaker)
 rating_repository = rating_repository.RatingRepository(async_sessionmaker)
 degree_repository = degree_repository.DegreeRepository(async_sessionmaker)
 section_repository = section_repository.SectionRepository(async_sessionmaker)
+catalog_version_repository = catalog_version_repository.CatalogVersionRepository(
+    async_sessionmaker
+)
 
 # Initialize RMP review repository with dependencies for file-based fallback
 rmp_review_repository = rmp_review_repository.RmpReviewRepository(
@@ -40,3 +51,14 @@ rmp_review_repository = rmp_review_repository.RmpReviewRepository(
 course_attribute_repository = course_attribute_repository.CourseAttributeRepository(
     async_sessionmaker
 )
+
+# Concurrent requests share one load of the same catalog data.
+single_flight = SingleFlight()
+
+schedule_executor = ScheduleExecutor(
+    workers=config.SCHEDULE_WORKERS,
+    max_pending=config.SCHEDULE_MAX_PENDING,
+    timeout=config.SCHEDULE_TIMEOUT,
+)
+# Stops the workers and removes the published snapshots.
+atexit.register(schedule_executor.shutdown)
@@ -0,0 +1,82 @@
+import asyncio
+import contextvars
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class SingleFlightStats:
+    loads: int = 0
+    coalesced: int = 0
+    failures: int = 0
+    coalesced_wait_seconds: float = 0.0
+
+    @property
+    def coalesced_ratio(self) -> float:
+        calls = self.loads + self.coalesced
+        return self.coalesced / calls if calls else 0.0
+
+    @property
+    def mean_coalesced_wait(self) -> float:
+        return self.coalesced_wait_seconds / self.coalesced if self.coalesced else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.loads} loads ({self.failures} failed), {self.coalesced} "
+            f"coalesced ({self.coalesced_ratio:.0%}, "
+            f"{self.mean_coalesced_wait * 1000:.1f}ms mean wait)"
+        )
+
+
+class SingleFlight:
+    """Coalesces concurrent identical loads into one.
+
+    The first ``do(name, key, load)`` call starts ``load()``; calls for the
+    same name and key made while it runs wait for it and share its result or
+    exception instead of starting their own. Nothing is kept once the load
+    finishes, so this only deduplicates work in flight; caching is up to the
+    caller.
+
+    The load runs as its own task in an empty context, so it does not join any
+    caller's unit of work and keeps running if the caller that started it is
+    cancelled. ``stats`` counts loads and coalesced waits per name.
+    """
+
+    def __init__(self):
+        self.stats: dict[str, SingleFlightStats] = defaultdict(SingleFlightStats)
+        self._in_flight: dict[tuple[str, Hashable], asyncio.Task] = {}
+
+    def in_flight(self, name: str, key: Hashable) -> bool:
+        return (name, key) in self._in_flight
+
+    async def do(
+        self, name: str, key: Hashable, load: Callable[[], Awaitable[T]]
+    ) -> T:
+        stats = self.stats[name]
+        task = self._in_flight.get((name, key))
+        if task is not None:
+            stats.coalesced += 1
+            started_at = time.perf_counter()
+            try:
+                return await asyncio.shield(task)
+            finally:
+                stats.coalesced_wait_seconds += time.perf_counter() - started_at
+
+        async def run() -> T:
+            return await load()
+
+        stats.loads += 1
+        task = asyncio.create_task(run(), context=contextvars.Context())
+        self._in_flight[(name, key)] = task
+        task.add_done_callback(lambda task: self._finished(name, key, task))
+        return await asyncio.shield(task)
+
+    def _finished(self, name: str, key: Hashable, task: asyncio.Task) -> None:
+        if self._in_flight.get((name, key)) is task:
+            del self._in_flight[(name, key)]
+        if task.cancelled() or task.exception() is not None:
+            self.stats[name].failures += 1
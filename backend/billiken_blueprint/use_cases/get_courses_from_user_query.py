@@ -1,27 +1,75 @@
 import chromadb
-from billiken_blueprint.ai.genai_client import genai_client
-from google.genai import types
+from billiken_blueprint import config
+from billiken_blueprint.ai.course_embeddings import get_query_course_embedding
 from billiken_blueprint.ai.get_course_suggestions import user_input_to_keywords
+from billiken_blueprint.search.bm25 import Bm25Index
+
+RESULT_COUNT = 5
+MAX_COURSE_INT = 5000
+# Candidates taken from each retriever before reciprocal rank fusion.
+FUSION_CANDIDATES = 20
+RRF_K = 60
 
 
 def get_courses_from_user_query(
     user_query: str,
     chroma_collection: chromadb.Collection,
     excluded_course_ids: list[int] = [],
+    lexical_index: Bm25Index | None = None,
 ) -> dict:
-    MODEL = "gemini-embedding-001"
+    lexical_hits = []
+    strong_hits = []
+    if lexical_index is not None:
+        lexical_hits = lexical_index.search(
+            user_query,
+            limit=FUSION_CANDIDATES,
+            excluded_course_ids=excluded_course_ids,
+            max_course_int=MAX_COURSE_INT,
+        )
+        strong_hits = lexical_index.strong_matches(
+            user_query,
+            excluded_course_ids=excluded_course_ids,
+            max_course_int=MAX_COURSE_INT,
+        )
 
-    client = genai_client
+    query_text = user_query
+    # Keyword expansion is an LLM round trip. Skip it when the query already
+    # names a course, and with the local provider, which stays offline.
+    if config.EMBEDDING_PROVIDER != "local" and not strong_hits:
+        keywords = user_input_to_keywords(user_query)
+        query_text = user_query + " " + " ".join(keywords)
 
-    keywords = user_input_to_keywords(user_query)
+    query_embedding = get_query_course_embedding(query_text).values
 
-    result = client.models.embed_content(
-        model=MODEL,
-        contents=user_query + " " + " ".join(keywords),
-        config=types.EmbedContentConfig(task_type="RETRIEVAL_QUERY"),
+    vector_results = _query_vector_index(
+        chroma_collection,
+        query_embedding,
+        excluded_course_ids,
+        limit=RESULT_COUNT if lexical_index is None else FUSION_CANDIDATES,
     )
+    if lexical_index is None:
+        return vector_results
+
+    return _fuse_results(vector_results, lexical_index, lexical_hits, strong_hits)
 
-    query_embedding = result.embeddings[0].values
+
+def _query_vector_index(
+    chroma_collection: chromadb.Collection,
+    query_embedding: list[float],
+    excluded_course_ids: list[int],
+    limit: int,
+) -> dict:
+    # Filter excluded courses in the index as well so most queries are answered
+    # by the first page; the post-filter below still guards against backends
+    # that ignore part of the where clause.
+    where = {"course_int": {"$lt": MAX_COURSE_INT}}
+    if excluded_course_ids:
+        where = {
+            "$and": [
+                where,
+                {"course_id": {"$nin": list(excluded_course_ids)}},
+            ]
+        }
 
     n_results = 20
     max_results = 100
@@ -31,7 +79,7 @@ def get_courses_from_user_query(
             query_embeddings=query_embedding,
             n_results=n_results,
             include=["metadatas", "distances", "documents"],
-            where={"course_int": {"$lt": 5000}},
+            where=where,
         )
 
         if not results["ids"] or not results["ids"][0]:
@@ -57,10 +105,10 @@ def get_courses_from_user_query(
                 filtered_distances.append(original_distances[i])
                 filtered_documents.append(original_documents[i])
 
-                if len(filtered_ids) == 5:
+                if len(filtered_ids) == limit:
                     break
 
-        if len(filtered_ids) == 5 or n_results == max_results:
+        if len(filtered_ids) == limit or n_results == max_results:
             return {
                 "ids": [filtered_ids],
                 "metadatas": [filtered_metadatas],
@@ -71,3 +119,58 @@ def get_courses_from_user_query(
         n_results += 20
 
     return results
+
+
+
+def _fuse_results(
+    vector_results: dict,
+    lexical_index: Bm25Index,
+    lexical_hits: list[tuple[int, float]],
+    strong_hits: list[int],
+) -> dict:
+    """Merge both rankings with reciprocal rank fusion.
+
+    Courses named outright by the query (strong lexical hits) are pinned first.
+    Courses found only lexically have no vector distance and report ``None``.
+    """
+    records = {}
+    scores = {}
+
+    if vector_results["ids"]:
+        for rank, record in enumerate(
+            zip(
+                vector_results["ids"][0],
+                vector_results["metadatas"][0],
+                vector_results["distances"][0],
+                vector_results["documents"][0],
+            )
+        ):
+            records[record[0]] = record
+            scores[record[0]] = 1 / (RRF_K + rank + 1)
+
+    for rank, (row, _) in enumerate(lexical_hits):
+        id = lexical_index.ids[row]
+        records.setdefault(
+            id,
+            (id, lexical_index.metadatas[row], None, lexical_index.documents[row]),
+        )
+        scores[id] = scores.get(id, 0) + 1 / (RRF_K + rank + 1)
+
+    pinned = []
+    for row in strong_hits:
+        id = lexical_index.ids[row]
+        records.setdefault(
+            id,
+            (id, lexical_index.metadatas[row], None, lexical_index.documents[row]),
+        )
+        pinned.append(id)
+
+    ranked = sorted(scores, key=lambda id: scores[id], reverse=True)
+    ordered = list(dict.fromkeys(pinned + ranked))[:RESULT_COUNT]
+
+    return {
+        "ids": [ordered],
+        "metadatas": [[records[id][1] for id in ordered]],
+        "distances": [[records[id][2] for id in ordered]],
+        "documents": [[records[id][3] for id in ordered]],
+    }
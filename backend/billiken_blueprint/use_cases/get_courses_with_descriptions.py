@@ -9,8 +9,10 @@ def get_courses_with_descriptions(
 ) -> Sequence[CourseWithDescription]:
     course_by_code = {f"{course.major_code} {course.course_number}": course for course in courses}
     descriptions_by_course_code = defaultdict(set[str])
+    title_by_course_code = {}
     for section in sections:
         descriptions_by_course_code[section.course_code].add(section.description)
+        title_by_course_code.setdefault(section.course_code, section.title)
 
     return [CourseWithDescription(
         major_code=course_by_code[course_code].major_code, 
@@ -18,7 +20,8 @@ def get_courses_with_descriptions(
         id=course_by_code[course_code].id,
         attribute_ids=course_by_code[course_code].attribute_ids,
         prerequisites=course_by_code[course_code].prerequisites,
-        description=descriptions.pop()
+        description=descriptions.pop(),
+        title=title_by_course_code[course_code],
     ) 
         for course_code, descriptions in descriptions_by_course_code.items() 
         if len(descriptions) == 1]
@@ -1,10 +1,11 @@
 from typing import Sequence
 
+import numpy as np
+
 from billiken_blueprint.domain.courses.course import CourseCode, CourseWithAttributes
 from billiken_blueprint.domain.degrees.degree import (
     Degree,
     SectionWithRequirementsFulfilled,
-    section_overlaps_timeslots,
 )
 from billiken_blueprint.domain.degrees.degree_requirement import (
     CourseRule,
@@ -12,6 +13,7 @@ from billiken_blueprint.domain.degrees.degree_requirement import (
     DegreeRequirement,
 )
 from billiken_blueprint.domain.section import Section
+from billiken_blueprint.domain.section_table import SectionTable
 from billiken_blueprint.domain.student import Student, TimeSlot
 
 
@@ -48,13 +50,55 @@ def get_recommended_sections(
     student: Student,
     taken_courses: Sequence[CourseWithAttributes],
     all_courses: Sequence[CourseWithAttributes],
-    all_sections: Sequence[Section],
+    all_sections: Sequence[Section] | SectionTable,
     course_equivalencies: Sequence[Sequence[CourseCode]],
     unavailability_times: Sequence[TimeSlot] = [],
     avoid_times: Sequence[TimeSlot] = [],
     instructor_ratings_map: dict[str, float] | None = None,
     discarded_section_ids: Sequence[int] = [],
 ) -> Sequence[SectionWithRequirementsFulfilled]:
+    sections = _as_table(all_sections)
+    rows, course_requirements = _recommend(
+        degree,
+        student,
+        taken_courses,
+        all_courses,
+        sections,
+        course_equivalencies,
+        unavailability_times,
+        avoid_times,
+        instructor_ratings_map,
+        discarded_section_ids,
+    )
+    return [
+        SectionWithRequirementsFulfilled(
+            section=sections.section(row),
+            fulfilled_requirements=course_requirements[sections.course_index[row]],
+        )
+        for row in rows
+    ]
+
+
+def _as_table(sections: Sequence[Section] | SectionTable) -> SectionTable:
+    if isinstance(sections, SectionTable):
+        return sections
+    return SectionTable.from_sections(sections)
+
+
+def _recommend(
+    degree: Degree,
+    student: Student,
+    taken_courses: Sequence[CourseWithAttributes],
+    all_courses: Sequence[CourseWithAttributes],
+    sections: SectionTable,
+    course_equivalencies: Sequence[Sequence[CourseCode]],
+    unavailability_times: Sequence[TimeSlot],
+    avoid_times: Sequence[TimeSlot],
+    instructor_ratings_map: dict[str, float] | None,
+    discarded_section_ids: Sequence[int],
+) -> tuple[np.ndarray, list[list[str]]]:
+    """Recommended rows of ``sections``, best first, and the requirement
+    labels each of the table's courses fulfills."""
     # Same scoring mechanism as last implementation,
     # but this time we should first check which courses
     # satisfy degree requirements. Then we should traverse the
@@ -124,65 +168,64 @@ def get_recommended_sections(
         f"{c.major_code} {c.course_number}": c for c in course_scores.keys()
     }
 
-    discarded_ids_set = set(discarded_section_ids)
-
-    sections = [
-        section
-        for section in all_sections
-        if section.course_code in course_codes_to_course
-        and course_codes_to_course[section.course_code] not in set(taken_courses)
-        and not section_overlaps_timeslots(section, unavailability_times)
-        and section.id not in discarded_ids_set
-    ]
+    # Per course of the table (not per section): the course it is scored as,
+    # and whether its sections are candidates at all.
+    taken_courses_set = set(taken_courses)
+    table_courses = [course_codes_to_course.get(code) for code in sections.course_codes]
+    wanted_courses = np.array(
+        [c is not None and c not in taken_courses_set for c in table_courses],
+        dtype=bool,
+    )
+    table_course_scores = np.array(
+        [course_scores[c] if c is not None else 0 for c in table_courses],
+        dtype=float,
+    )
+    prerequisites_met = np.array(
+        [
+            c is not None
+            and (
+                c.prerequisites is None
+                or c.prerequisites.is_satisfied_by(taken_courses)
+            )
+            for c in table_courses
+        ],
+        dtype=bool,
+    )
 
-    def get_section_score(section: Section) -> float:
-        score = course_scores[course_codes_to_course[section.course_code]]
-        if section_overlaps_timeslots(section, avoid_times):
-            score -= 10
-
-        # Add average instructor rating to the score
-        if instructor_ratings_map and section.instructor_names:
-            instructor_ratings = []
-            for name in section.instructor_names:
-                name_stripped = name.strip()
-                # Try exact match first, then case-insensitive match
-                rating = instructor_ratings_map.get(
-                    name_stripped
-                ) or instructor_ratings_map.get(name_stripped.lower())
-                if rating is not None:
-                    instructor_ratings.append(rating)
-
-            # Calculate average rating if we have any valid ratings
-            if instructor_ratings:
-                avg_rating = sum(instructor_ratings) / len(instructor_ratings)
-                # Add the average rating to the score (ratings are typically 0-5)
-                score += avg_rating
-
-        return score
-
-    sections_sorted = sorted(
-        sections,
-        key=get_section_score,
-        reverse=True,
+    candidates = (
+        wanted_courses[sections.course_index]
+        & ~sections.overlaps_timeslots(unavailability_times)
+        & ~sections.has_id(discarded_section_ids)
     )
 
+    scores = table_course_scores[sections.course_index]
+    scores -= 10 * sections.overlaps_timeslots(avoid_times)
+
+    # Add average instructor rating to the score
+    if instructor_ratings_map:
+
+        def instructor_rating(name: str) -> float | None:
+            name_stripped = name.strip()
+            # Try exact match first, then case-insensitive match
+            return instructor_ratings_map.get(
+                name_stripped
+            ) or instructor_ratings_map.get(name_stripped.lower())
+
+        # Ratings are typically 0-5
+        scores += sections.mean_instructor_rating(instructor_rating)
+
+    rows = np.flatnonzero(candidates)
+    # Highest score first; ties keep catalog order.
+    rows = rows[np.argsort(-scores[rows], kind="stable")]
+
     # Filter out sections where prerequisites are not satisfied
-    sections_sorted = [
-        section
-        for section in sections_sorted
-        if (course := course_codes_to_course[section.course_code]).prerequisites is None
-        or course.prerequisites.is_satisfied_by(taken_courses)
-    ]
+    rows = rows[prerequisites_met[sections.course_index[rows]]]
 
-    return [
-        SectionWithRequirementsFulfilled(
-            section=section,
-            fulfilled_requirements=course_to_requirements.get(
-                course_codes_to_course[section.course_code], []
-            ),
-        )
-        for section in sections_sorted
+    course_requirements = [
+        course_to_requirements.get(c, []) if c is not None else []
+        for c in table_courses
     ]
+    return rows, course_requirements
 
 
 def get_schedule(
@@ -190,19 +233,20 @@ def get_schedule(
     student: Student,
     taken_courses: Sequence[CourseWithAttributes],
     all_courses: Sequence[CourseWithAttributes],
-    all_sections: Sequence[Section],
+    all_sections: Sequence[Section] | SectionTable,
     course_equivalencies: Sequence[Sequence[CourseCode]],
     unavailability_times: Sequence[TimeSlot] = [],
     avoid_times: Sequence[TimeSlot] = [],
     instructor_ratings_map: dict[str, float] | None = None,
     discarded_section_ids: Sequence[int] = [],
 ) -> Sequence[SectionWithRequirementsFulfilled]:
-    recommended_sections = get_recommended_sections(
+    sections = _as_table(all_sections)
+    rows, course_requirements = _recommend(
         degree,
         student,
         taken_courses,
         all_courses,
-        all_sections,
+        sections,
         course_equivalencies,
         unavailability_times,
         avoid_times,
@@ -222,47 +266,43 @@ def get_schedule(
                 satisfied_count += 1
         requirements_status[req.label] = max(0, req.needed - satisfied_count)
 
-    schedule: Sequence[SectionWithRequirementsFulfilled] = []
-    added_course_codes = set()
+    schedule_rows: list[int] = []
+    course_index = sections.course_index[rows]
+    added_courses = np.zeros(len(sections.course_codes), dtype=bool)
 
     # Dynamic greedy selection
     for _ in range(6):
-        best_section_wrapper = None
-        best_score = 0
-
-        for rec in recommended_sections:
-            section = rec.section
-
-            # Skip if already added
-            if section.course_code in added_course_codes:
-                continue
-
-            # Skip if overlaps with current schedule
-            if any(section.overlaps(s.section) for s in schedule):
-                continue
-
-            # Calculate dynamic score: how many *currently needed* requirements does it satisfy?
-            score = 0
-            for req_label in rec.fulfilled_requirements:
-                if requirements_status.get(req_label, 0) > 0:
-                    score += 1
-
-            # We want the section that satisfies the MOST needed requirements
-            if score > best_score:
-                best_score = score
-                best_section_wrapper = rec
-
-        # If we found a useful section, add it
-        if best_section_wrapper and best_score > 0:
-            schedule.append(best_section_wrapper)
-            added_course_codes.add(best_section_wrapper.section.course_code)
-
-            # Decrement needed counts
-            for req_label in best_section_wrapper.fulfilled_requirements:
-                if requirements_status.get(req_label, 0) > 0:
-                    requirements_status[req_label] -= 1
-        else:
+        # Dynamic score: how many *currently needed* requirements a course satisfies.
+        course_needed = np.array(
+            [
+                sum(1 for label in labels if requirements_status.get(label, 0) > 0)
+                for labels in course_requirements
+            ],
+            dtype=np.int64,
+        )
+        row_scores = course_needed[course_index]
+        # Skip courses already added and sections overlapping the schedule.
+        row_scores[added_courses[course_index]] = 0
+        row_scores[sections.overlaps_rows(schedule_rows)[rows]] = 0
+
+        # We want the first section that satisfies the MOST needed requirements
+        if not len(rows) or row_scores.max() <= 0:
             # No more useful sections found
             break
+        best_row = int(rows[np.argmax(row_scores)])
+        schedule_rows.append(best_row)
+        added_courses[sections.course_index[best_row]] = True
+
+        # Decrement needed counts
+        for req_label in course_requirements[sections.course_index[best_row]]:
+            if requirements_status.get(req_label, 0) > 0:
+                requirements_status[req_label] -= 1
 
-    return schedule
+    # Only the chosen rows become Section objects.
+    return [
+        SectionWithRequirementsFulfilled(
+            section=sections.section(row),
+            fulfilled_requirements=course_requirements[sections.course_index[row]],
+        )
+        for row in schedule_rows
+    ]
@@ -0,0 +1,236 @@
+"""Schedule generation in a process pool, off the event loop.
+
+``get_schedule`` is pure-Python CPU work; run inline, one large schedule
+stalls every other request on the worker. ``ScheduleExecutor`` runs it in a
+process pool instead. The catalog (courses with attributes and a semester's
+sections) is the bulk of the input and changes only with a section sync, so
+it is published once per catalog version as a pickled snapshot file; workers
+load each snapshot the first time they need it and keep it in memory, and
+calls carry only the per-student inputs. Publishing a snapshot retires the
+previous one for the same semester; its file is removed once no pending call
+still reads it, and later calls for its key raise ``SnapshotUnavailable``.
+
+Calls that would exceed ``max_pending`` queued or running schedules are
+rejected with ``ScheduleExecutorBusy`` rather than queued without bound, and
+``run`` gives up after ``timeout`` seconds with ``ScheduleTimeout``.
+"""
+
+import asyncio
+import functools
+import multiprocessing
+import os
+import pickle
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional, Sequence
+
+from billiken_blueprint.domain.courses.course import CourseCode, CourseWithAttributes
+from billiken_blueprint.domain.degrees.degree import Degree
+from billiken_blueprint.domain.section_table import SectionTable
+from billiken_blueprint.domain.student import Student, TimeSlot
+from billiken_blueprint.use_cases.get_schedule import (
+    SectionWithRequirementsFulfilled,
+    get_schedule,
+)
+
+
+@dataclass
+class CatalogSnapshot:
+    key: str
+    all_courses: list[CourseWithAttributes]
+    all_sections: SectionTable
+    # A newer snapshot for the same semester replaces this one.
+    semester: str = ""
+
+
+@dataclass
+class ScheduleRequest:
+    degree: Degree
+    student: Student
+    taken_course_ids: Sequence[int]
+    course_equivalencies: Sequence[Sequence[CourseCode]]
+    unavailability_times: Sequence[TimeSlot] = field(default_factory=list)
+    avoid_times: Sequence[TimeSlot] = field(default_factory=list)
+    instructor_ratings_map: Optional[dict[str, float]] = None
+    discarded_section_ids: Sequence[int] = field(default_factory=list)
+
+
+def compute_schedule(
+    snapshot: CatalogSnapshot, request: ScheduleRequest
+) -> list[SectionWithRequirementsFulfilled]:
+    courses_by_id = {course.id: course for course in snapshot.all_courses}
+    taken_courses = [
+        courses_by_id[course_id]
+        for course_id in request.taken_course_ids
+        if course_id in courses_by_id
+    ]
+    return list(
+        get_schedule(
+            request.degree,
+            request.student,
+            taken_courses,
+            snapshot.all_courses,
+            snapshot.all_sections,
+            request.course_equivalencies,
+            unavailability_times=request.unavailability_times,
+            avoid_times=request.avoid_times,
+            instructor_ratings_map=request.instructor_ratings_map,
+            discarded_section_ids=request.discarded_section_ids,
+        )
+    )
+
+
+class ScheduleExecutorBusy(Exception):
+    pass
+
+
+class ScheduleTimeout(Exception):
+    pass
+
+
+class SnapshotUnavailable(Exception):
+    pass
+
+
+# Snapshots loaded by this worker process, most recently used last.
+_WORKER_SNAPSHOTS: "OrderedDict[str, CatalogSnapshot]" = OrderedDict()
+WORKER_SNAPSHOT_LIMIT = 4
+
+
+def _worker_snapshot(key: str, path: str) -> CatalogSnapshot:
+    snapshot = _WORKER_SNAPSHOTS.get(key)
+    if snapshot is None:
+        with open(path, "rb") as f:
+            snapshot = pickle.load(f)
+        _WORKER_SNAPSHOTS[key] = snapshot
+        while len(_WORKER_SNAPSHOTS) > WORKER_SNAPSHOT_LIMIT:
+            _WORKER_SNAPSHOTS.popitem(last=False)
+    _WORKER_SNAPSHOTS.move_to_end(key)
+    return snapshot
+
+
+def _run_in_worker(task: Callable, key: str, path: str, request: Any) -> Any:
+    return task(_worker_snapshot(key, path), request)
+
+
+class ScheduleExecutor:
+    def __init__(
+        self,
+        workers: int = 2,
+        max_pending: Optional[int] = None,
+        timeout: float = 30.0,
+        task: Callable[[CatalogSnapshot, Any], Any] = compute_schedule,
+        mp_context: Optional[multiprocessing.context.BaseContext] = None,
+    ):
+        self.workers = workers
+        self.max_pending = max_pending if max_pending is not None else workers * 4
+        self.timeout = timeout
+        self.task = task
+        # Spawned workers do not inherit the server's threads or connections.
+        self._mp_context = mp_context or multiprocessing.get_context("spawn")
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._snapshot_dir: Optional[str] = None
+        self._snapshot_paths: dict[str, str] = {}
+        self._snapshot_files = 0
+        # The live snapshot per semester, and per key the calls still using it.
+        self._current_keys: dict[str, str] = {}
+        self._key_users: dict[str, int] = {}
+        # Superseded snapshots whose files pending calls still read.
+        self._retired_paths: dict[str, list[str]] = {}
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def has_snapshot(self, key: str) -> bool:
+        return key in self._snapshot_paths
+
+    def publish(self, snapshot: CatalogSnapshot) -> None:
+        """Make ``snapshot`` available to the workers under ``snapshot.key``,
+        retiring the previous snapshot for its semester."""
+        with self._lock:
+            if snapshot.key in self._snapshot_paths:
+                return
+            if self._snapshot_dir is None:
+                self._snapshot_dir = tempfile.mkdtemp(prefix="schedule-snapshots-")
+            path = os.path.join(self._snapshot_dir, f"{self._snapshot_files}.pickle")
+            self._snapshot_files += 1
+            with open(path, "wb") as f:
+                pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+            self._snapshot_paths[snapshot.key] = path
+
+            previous = self._current_keys.get(snapshot.semester)
+            self._current_keys[snapshot.semester] = snapshot.key
+            if previous is not None:
+                previous_path = self._snapshot_paths.pop(previous)
+                if self._key_users.get(previous):
+                    self._retired_paths.setdefault(previous, []).append(
+                        previous_path
+                    )
+                else:
+                    _unlink(previous_path)
+
+    async def run(self, snapshot_key: str, request: Any) -> Any:
+        """Compute ``request`` against a published snapshot in the pool."""
+        with self._lock:
+            path = self._snapshot_paths.get(snapshot_key)
+            if path is None:
+                raise SnapshotUnavailable(f"snapshot {snapshot_key!r} was retired")
+            if self._pending >= self.max_pending:
+                raise ScheduleExecutorBusy(
+                    f"{self._pending} schedules already pending"
+                )
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    self.workers, mp_context=self._mp_context
+                )
+            future = self._pool.submit(
+                _run_in_worker, self.task, snapshot_key, path, request
+            )
+            self._pending += 1
+            self._key_users[snapshot_key] = self._key_users.get(snapshot_key, 0) + 1
+        # A timed-out schedule still occupies its worker until it finishes,
+        # so it counts as pending (and keeps its snapshot file) until then.
+        future.add_done_callback(functools.partial(self._release, snapshot_key))
+
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), self.timeout)
+        except asyncio.TimeoutError:
+            raise ScheduleTimeout(f"schedule took longer than {self.timeout}s")
+
+    def _release(self, snapshot_key: str, _future) -> None:
+        with self._lock:
+            self._pending -= 1
+            self._key_users[snapshot_key] -= 1
+            if self._key_users[snapshot_key]:
+                return
+            del self._key_users[snapshot_key]
+            paths = self._retired_paths.pop(snapshot_key, [])
+        for path in paths:
+            _unlink(path)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+            snapshot_dir, self._snapshot_dir = self._snapshot_dir, None
+            self._snapshot_paths.clear()
+            self._current_keys.clear()
+            self._retired_paths.clear()
+        # Not under the lock: finishing schedules release through it.
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+        if snapshot_dir is not None:
+            shutil.rmtree(snapshot_dir, ignore_errors=True)
+
+
+def _unlink(path: str) -> None:
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
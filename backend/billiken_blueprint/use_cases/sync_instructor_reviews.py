@@ -0,0 +1,60 @@
+from dataclasses import dataclass
+from typing import Sequence
+
+from billiken_blueprint.domain.ratings.rmp_review import RmpReview
+from billiken_blueprint.repositories.rmp_review_repository import RmpReviewRepository
+
+
+@dataclass
+class ReviewSyncSummary:
+    instructor_id: int
+    inserted: int = 0
+    deleted: int = 0
+    unchanged: int = 0
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.inserted or self.deleted)
+
+    def __str__(self) -> str:
+        return (
+            f"{self.inserted} inserted, {self.deleted} deleted, "
+            f"{self.unchanged} unchanged"
+        )
+
+
+async def sync_instructor_reviews(
+    instructor_id: int,
+    reviews: Sequence[RmpReview],
+    rmp_review_repository: RmpReviewRepository,
+) -> ReviewSyncSummary:
+    """Bring an instructor's stored RMP reviews in line with ``reviews``.
+
+    Reviews are matched by content hash, so only reviews that are new since the
+    last import are inserted and only stored reviews missing from ``reviews``
+    are deleted; unchanged reviews keep their rows and ids.
+    """
+    summary = ReviewSyncSummary(instructor_id=instructor_id)
+    stored = await rmp_review_repository.get_stored_by_instructor_id(instructor_id)
+
+    stored_ids_by_hash: dict[str, list[int]] = {}
+    for review in stored:
+        stored_ids_by_hash.setdefault(review.content_hash(), []).append(review.id)
+
+    inserts = []
+    for review in reviews:
+        ids = stored_ids_by_hash.get(review.content_hash())
+        if ids:
+            # Consume one stored row per fetched review, so duplicates balance.
+            ids.pop()
+            summary.unchanged += 1
+        else:
+            inserts.append(review)
+
+    deleted_ids = [id for ids in stored_ids_by_hash.values() for id in ids]
+    summary.inserted = len(inserts)
+    summary.deleted = len(deleted_ids)
+
+    if summary.changed:
+        await rmp_review_repository.apply_changes(inserts, deleted_ids)
+    return summary
@@ -0,0 +1,69 @@
+from dataclasses import dataclass, field
+from typing import Iterable, Optional, Sequence
+
+from billiken_blueprint.domain.section import Section
+from billiken_blueprint.repositories.section_repository import SectionRepository
+
+
+@dataclass
+class SectionSyncSummary:
+    semester: str
+    inserted: list[str] = field(default_factory=list)
+    updated: list[str] = field(default_factory=list)
+    deleted: list[str] = field(default_factory=list)
+    unchanged: int = 0
+    catalog_version: Optional[int] = None
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.inserted or self.updated or self.deleted)
+
+    def __str__(self) -> str:
+        summary = (
+            f"{self.semester}: {len(self.inserted)} inserted, "
+            f"{len(self.updated)} updated, {len(self.deleted)} deleted, "
+            f"{self.unchanged} unchanged"
+        )
+        if self.catalog_version is not None:
+            summary += f" (catalog version {self.catalog_version})"
+        return summary
+
+
+async def sync_semester_sections(
+    semester: str,
+    sections: Sequence[Section],
+    section_repository: SectionRepository,
+    departments: Optional[Iterable[str]] = None,
+) -> SectionSyncSummary:
+    """Bring the stored sections of ``semester`` in line with ``sections``.
+
+    Stored content hashes are compared with the fetched sections so only
+    inserts, updates and deletes are written, in one transaction. Stored
+    sections missing from ``sections`` are deleted; pass ``departments`` when
+    the listing covers only some departments so others are left alone.
+    """
+    summary = SectionSyncSummary(semester=semester)
+    stored_hashes = await section_repository.get_content_hashes(
+        semester, departments
+    )
+
+    upserts = []
+    fetched_crns = set()
+    for section in sections:
+        fetched_crns.add(section.crn)
+        if section.crn not in stored_hashes:
+            summary.inserted.append(section.crn)
+        elif stored_hashes[section.crn] != section.content_hash():
+            summary.updated.append(section.crn)
+        else:
+            summary.unchanged += 1
+            continue
+        upserts.append(section)
+
+    summary.deleted = sorted(set(stored_hashes) - fetched_crns)
+
+    if summary.changed:
+        summary.catalog_version = await section_repository.apply_changes(
+            semester, upserts, summary.deleted
+        )
+    return summary
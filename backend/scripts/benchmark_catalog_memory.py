@@ -0,0 +1,145 @@
+"""Measure the memory held by in-memory catalog objects.
+
+Usage:
+    python scripts/benchmark_catalog_memory.py [--sections N] [--db PATH]
+
+Builds ``N`` sections and courses the way the repositories do, from JSON rows,
+so every string starts out as its own object, and reports the bytes retained
+per object (tracemalloc) and per pickled object (the size of a schedule
+worker's catalog snapshot). With ``--db`` the sections and courses are read
+from that SQLite database instead of being generated.
+"""
+
+import argparse
+import json
+import pickle
+import random
+import sqlite3
+import sys
+import tracemalloc
+from pathlib import Path
+
+# Add the parent directory to the path so we can import billiken_blueprint
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from billiken_blueprint.domain.courses.course import Course
+from billiken_blueprint.domain.section import Section
+
+CAMPUSES = ["North Campus (Main Campus)", "Madrid Campus", "Online"]
+MAJORS = ["CSCI", "MATH", "ENGL", "HIST", "PHIL", "BIOL", "CHEM", "PHYS", "THEO"]
+TIMES = [("0800", "0850"), ("0900", "0950"), ("1000", "1050"), ("1100", "1215")]
+
+
+def synthetic_rows(n: int) -> tuple[list[str], list[str]]:
+    rng = random.Random(0)
+    instructors = [f"Instructor {i} Lastname{i}" for i in range(n // 4 + 1)]
+    course_codes = [f"{rng.choice(MAJORS)} {1000 + i}" for i in range(n // 3 + 1)]
+    sections = []
+    for i in range(n):
+        days = rng.choice([(0, 2, 4), (1, 3), (2,)])
+        start, end = rng.choice(TIMES)
+        sections.append(
+            json.dumps(
+                {
+                    "id": i,
+                    "crn": str(10000 + i),
+                    "instructor_names": rng.sample(instructors, rng.choice([1, 1, 2])),
+                    "campus_code": rng.choice(CAMPUSES),
+                    "description": "",
+                    "title": f"Course title {i % 500}",
+                    "course_code": rng.choice(course_codes),
+                    "semester": "202520",
+                    "meeting_times": [
+                        {"day": day, "start_time": start, "end_time": end}
+                        for day in days
+                    ],
+                }
+            )
+        )
+    courses = [
+        json.dumps(
+            {
+                "id": i,
+                "major_code": code.split()[0],
+                "course_number": code.split()[1],
+                "attribute_ids": rng.sample(range(40), rng.choice([0, 1, 2])),
+                "prerequisites": None,
+            }
+        )
+        for i, code in enumerate(course_codes)
+    ]
+    return sections, courses
+
+
+def database_rows(path: str) -> tuple[list[str], list[str]]:
+    with sqlite3.connect(path) as connection:
+        sections = [
+            json.dumps(
+                {
+                    "id": row[0],
+                    "crn": row[1],
+                    "instructor_names": json.loads(row[2]),
+                    "campus_code": row[3],
+                    "description": row[4],
+                    "title": row[5],
+                    "course_code": row[6],
+                    "semester": row[7],
+                    "meeting_times": json.loads(row[8]),
+                }
+            )
+            for row in connection.execute(
+                "SELECT id, crn, instructor_names, campus_code, description, "
+                "title, course_code, semester, meeting_times FROM sections"
+            )
+        ]
+        courses = [
+            json.dumps(
+                {
+                    "id": row[0],
+                    "major_code": row[1],
+                    "course_number": row[2],
+                    "attribute_ids": json.loads(row[3]),
+                    "prerequisites": json.loads(row[4]) if row[4] else None,
+                }
+            )
+            for row in connection.execute(
+                "SELECT id, major_code, course_number, attribute_ids, "
+                "prerequisites FROM courses"
+            )
+        ]
+    return sections, courses
+
+
+def measure(rows: list[str], from_dict) -> tuple[float, float]:
+    """Bytes retained and pickled per object built from ``rows``."""
+    tracemalloc.start()
+    # Decoded rows are dropped as we go, so only what the objects keep counts.
+    objects = [from_dict(json.loads(row)) for row in rows]
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    pickled = len(pickle.dumps(objects, protocol=pickle.HIGHEST_PROTOCOL))
+    return allocated / len(objects), pickled / len(objects)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sections", type=int, default=20_000)
+    parser.add_argument("--db", help="SQLite database to read the catalog from")
+    args = parser.parse_args()
+
+    if args.db:
+        sections, courses = database_rows(args.db)
+    else:
+        sections, courses = synthetic_rows(args.sections)
+
+    print(f"{'object':<8} {'count':>7} {'bytes':>8} {'pickled':>8}")
+    for name, rows, from_dict in (
+        ("section", sections, Section.from_dict),
+        ("course", courses, Course.from_dict),
+    ):
+        allocated, pickled = measure(rows, from_dict)
+        print(f"{name:<8} {len(rows):>7} {allocated:>8.0f} {pickled:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
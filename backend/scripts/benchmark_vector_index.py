@@ -0,0 +1,190 @@
+"""Compare query latency and memory of the Chroma and numpy retrieval backends.
+
+Usage:
+    python scripts/benchmark_vector_index.py export [--dtype float16|int8]
+    python scripts/benchmark_vector_index.py bench [--synthetic N] [--dim D]
+
+``export`` copies the persisted Chroma collection into a numpy index at
+``config.VECTOR_INDEX_PATH``. ``bench`` runs each backend in its own process so
+the resident set size reflects only that backend. Without ``--synthetic`` it
+benchmarks the real collection and exported index.
+"""
+
+import argparse
+import multiprocessing
+import resource
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add the parent directory to the path so we can import billiken_blueprint
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+WHERE = {"course_int": {"$lt": 5000}}
+
+
+def rss_mb() -> float:
+    """Current resident set size in MiB (peak RSS where /proc is unavailable)."""
+    try:
+        with open("/proc/self/statm", "r") as f:
+            pages = int(f.read().split()[1])
+        return pages * resource.getpagesize() / 2**20
+    except OSError:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 2**20 if sys.platform == "darwin" else peak / 2**10
+
+
+def synthetic_records(n: int, dim: int):
+    rng = np.random.default_rng(0)
+    embeddings = rng.standard_normal((n, dim)).astype(np.float32)
+    ids = [f"doc_{i}" for i in range(n)]
+    metadatas = [
+        {
+            "course_id": i,
+            "course_code": f"SYN {1000 + i % 5000}",
+            "course_int": 1000 + i % 5000,
+        }
+        for i in range(n)
+    ]
+    documents = [f"Synthetic course description {i}" for i in range(n)]
+    return ids, embeddings, metadatas, documents
+
+
+def time_queries(collection, queries: np.ndarray, n_results: int) -> list[float]:
+    timings = []
+    for query in queries:
+        start = time.perf_counter()
+        collection.query(
+            query_embeddings=query.tolist(),
+            n_results=n_results,
+            include=["metadatas", "distances", "documents"],
+            where=WHERE,
+        )
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def run_backend(backend: str, args, results):
+    baseline = rss_mb()
+    if backend == "chroma":
+        import chromadb
+
+        if args.synthetic:
+            ids, embeddings, metadatas, documents = synthetic_records(
+                args.synthetic, args.dim
+            )
+            client = chromadb.PersistentClient(path=args.workdir + "/chroma")
+            collection = client.get_or_create_collection(
+                "benchmark", metadata={"hnsw:space": "cosine"}
+            )
+            for start in range(0, len(ids), 1000):
+                stop = start + 1000
+                collection.upsert(
+                    ids=ids[start:stop],
+                    embeddings=embeddings[start:stop].tolist(),
+                    metadatas=metadatas[start:stop],
+                    documents=documents[start:stop],
+                )
+            del ids, embeddings, metadatas, documents
+        else:
+            from billiken_blueprint.chromadb import course_descriptions_collection
+
+            collection = course_descriptions_collection
+    else:
+        from billiken_blueprint import config
+        from billiken_blueprint.search.vector_index import NumpyVectorIndex
+
+        if args.synthetic:
+            path = Path(args.workdir) / f"numpy-{args.dtype}"
+            if not (path / "manifest.json").exists():
+                ids, embeddings, metadatas, documents = synthetic_records(
+                    args.synthetic, args.dim
+                )
+                index = NumpyVectorIndex(dtype=args.dtype)
+                index.upsert(ids, embeddings, metadatas, documents)
+                index.save(path)
+                del index, ids, embeddings, metadatas, documents
+        else:
+            path = config.VECTOR_INDEX_PATH
+        collection = NumpyVectorIndex.load(path)
+
+    loaded = rss_mb()
+    dim = args.dim if args.synthetic else len(
+        collection.get(limit=1, include=["embeddings"])["embeddings"][0]
+    )
+    queries = np.random.default_rng(1).standard_normal((args.queries, dim))
+
+    time_queries(collection, queries[:5], args.n_results)  # warm up
+    timings = time_queries(collection, queries, args.n_results)
+
+    results[backend] = {
+        "count": collection.count(),
+        "p50_ms": statistics.median(timings),
+        "p95_ms": statistics.quantiles(timings, n=20)[-1],
+        "rss_loaded_mb": loaded - baseline,
+        "rss_total_mb": rss_mb(),
+    }
+
+
+def export(args):
+    from billiken_blueprint import config
+    from billiken_blueprint.chromadb import course_descriptions_collection
+    from billiken_blueprint.search.vector_index import NumpyVectorIndex
+
+    index = NumpyVectorIndex.from_collection(
+        course_descriptions_collection, dtype=args.dtype
+    )
+    index.save(config.VECTOR_INDEX_PATH)
+    print(f"Exported {index.count()} embeddings to {config.VECTOR_INDEX_PATH}")
+
+
+def bench(args):
+    with tempfile.TemporaryDirectory() as workdir:
+        args.workdir = workdir
+        context = multiprocessing.get_context("spawn")
+        manager = context.Manager()
+        results = manager.dict()
+        for backend in ("chroma", "numpy"):
+            process = context.Process(target=run_backend, args=(backend, args, results))
+            process.start()
+            process.join()
+
+        print(
+            f"{'backend':<8} {'count':>7} {'p50 ms':>8} {'p95 ms':>8} "
+            f"{'index MiB':>10} {'RSS MiB':>8}"
+        )
+        for backend, row in results.items():
+            print(
+                f"{backend:<8} {row['count']:>7} {row['p50_ms']:>8.2f} "
+                f"{row['p95_ms']:>8.2f} {row['rss_loaded_mb']:>10.1f} "
+                f"{row['rss_total_mb']:>8.1f}"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    export_parser = subparsers.add_parser("export")
+    export_parser.add_argument("--dtype", default="float16", choices=["float16", "int8"])
+
+    bench_parser = subparsers.add_parser("bench")
+    bench_parser.add_argument("--synthetic", type=int, default=0)
+    bench_parser.add_argument("--dim", type=int, default=3072)
+    bench_parser.add_argument("--dtype", default="float16", choices=["float16", "int8"])
+    bench_parser.add_argument("--queries", type=int, default=200)
+    bench_parser.add_argument("--n-results", type=int, default=20)
+
+    args = parser.parse_args()
+    if args.command == "export":
+        export(args)
+    else:
+        bench(args)
+
+
+if __name__ == "__main__":
+    main()
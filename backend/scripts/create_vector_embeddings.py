@@ -1,112 +1,99 @@
-from billiken_blueprint.chromadb import chroma_client
-from chromadb.utils.embedding_functions.google_embedding_function import GoogleGenerativeAiEmbeddingFunction
-from billiken_blueprint.ai.genai_client import genai_client
-from chromadb.api.types import EmbeddingFunction
-from chromadb.api.types import Documents
+"""Build or refresh the course descriptions embedding index.
+
+Only courses whose description (or the embedding model) changed since the last
+run are embedded, in the largest batches the provider accepts. Progress is
+saved after every batch, so an interrupted run can simply be started again.
+Afterwards the similar courses graph is refreshed for the changed embeddings.
+
+Usage:
+    python scripts/create_vector_embeddings.py [--refit] [--requests-per-minute N]
+        [--max-in-flight N] [--batch-size N]
+"""
+
+import argparse
+import asyncio
 import sys
 from pathlib import Path
-import time
-from google.genai import types
-from google.genai.errors import APIError
-from venv import logger
-import os
 
 # Add the parent directory to the path so we can import billiken_blueprint
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from billiken_blueprint.ai.course_embeddings import get_retrieval_course_embeddings
-from billiken_blueprint.use_cases.get_courses_with_descriptions import get_courses_with_descriptions
-from billiken_blueprint import services
-
-class GeminiEmbeddingFunction(EmbeddingFunction):
-    RPM = 100
-    DEBOUNCE = 60 / RPM
-    last_query_time = 0
-
-    def __init__(self):
-        self.last_query_time = time.time()
-    def __call__(self, texts: Documents) -> list[list[float]]:
-        MODEL_ID = "gemini-embedding-001"
-        if time.time() - self.last_query_time < self.DEBOUNCE:
-            time.sleep(self.DEBOUNCE - (time.time() - self.last_query_time))
-        self.last_query_time = time.time()
-        try:
-            result = genai_client.models.embed_content(
-                model=MODEL_ID,
-                contents=texts,
-                config=types.EmbedContentConfig(
-                    task_type="RETRIEVAL_DOCUMENT"
-                )
-            )
-            embeddings = result.embeddings[0].values
-            print(embeddings)
-            return embeddings
-
-        except APIError as e:
-            logger.error(f"API Error getting query embedding: {e}")
-            raise
-
-        except Exception as e:
-            logger.error(f"Error getting query embedding: {e}")
-            raise
+from billiken_blueprint import config, services
+from billiken_blueprint.ai import course_embeddings
+from billiken_blueprint.ai.local_embeddings import fit_course_model
+from billiken_blueprint.search.embedding_build import build_course_embeddings
+from billiken_blueprint.search.similar_courses import refresh_similar_courses
+from billiken_blueprint.search.vector_index import NumpyVectorIndex
+from billiken_blueprint.use_cases.get_courses_with_descriptions import (
+    get_courses_with_descriptions,
+)
+
+
+def open_index():
+    """Return the configured index and a callback that persists it."""
+    if config.VECTOR_INDEX_BACKEND == "numpy":
+        path = Path(config.VECTOR_INDEX_PATH)
+        if (path / "manifest.json").exists():
+            index = NumpyVectorIndex.load(path, mmap=False)
+        else:
+            index = NumpyVectorIndex(dtype=config.VECTOR_INDEX_DTYPE)
+        return index, lambda: index.save(path)
+
+    # Chroma persists every write itself.
+    from billiken_blueprint.chromadb import course_descriptions_collection
+
+    return course_descriptions_collection, lambda: None
+
 
 async def main():
-    RPM = 100
-    DEBOUNCE = 60 / RPM
-    last_query_time = 0
-    MODEL_ID = "gemini-embedding-001"
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--refit",
+        action="store_true",
+        help="refit the local embedding model (re-embeds every course)",
+    )
+    parser.add_argument(
+        "--requests-per-minute", type=float, default=config.EMBEDDING_REQUESTS_PER_MINUTE
+    )
+    parser.add_argument(
+        "--max-in-flight", type=int, default=config.EMBEDDING_MAX_IN_FLIGHT
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=course_embeddings.max_batch_size()
+    )
+    args = parser.parse_args()
 
     courses = await services.course_repository.get_all()
     sections = await services.section_repository.get_all()
-    
-    courses_with_descriptions = get_courses_with_descriptions(courses, sections)
-
-    client = chroma_client
-    collection_name = "course_descriptions"
-    ef = GoogleGenerativeAiEmbeddingFunction(api_key=os.getenv("GEMINI_API_KEY"), model_name=MODEL_ID, task_type="RETRIEVAL_DOCUMENT",
-        api_key_env_var="GEMINI_API_KEY")
-    collection = client.get_or_create_collection(
-        name=collection_name, 
-        embedding_function=ef)
-    
-    for course in courses_with_descriptions:
-        id = f"doc_{course.id}"
-        course_int = int(course.course_number.rstrip("Xx"))
-        meta = {
-            "course_id": course.id,
-            "major_code": course.major_code,
-            "course_number": course.course_number,
-            "course_code": f"{course.major_code} {course.course_number}",
-            "course_int": course_int,
-        }
-        if (result := collection.get([id], limit=1, include=["embeddings", "metadatas"])) and result["ids"]:
-            if result["metadatas"][0] != meta:
-                print("Updating course %s" % course.id)
-                collection.update(
-                    documents=course.description,
-                    metadatas=meta,
-                    ids=id,
-                    embeddings=result["embeddings"],
-                )
-            else:
-                print("Skipping course %s" % course.id)
-            continue
-        
-        if course.description == "":
-            print("Skipping course %s" % course.id)
-            continue
-
-        if time.time() - last_query_time < DEBOUNCE:
-            time.sleep(DEBOUNCE - (time.time() - last_query_time))
-        last_query_time = time.time()
-
-        print("Adding course %s" % course.id)
-        collection.add(
-            documents=course.description,
-            metadatas=meta,
-            ids=id,
-        )
+    courses_with_descriptions = [
+        course
+        for course in get_courses_with_descriptions(courses, sections)
+        if course.description
+    ]
+
+    if config.EMBEDDING_PROVIDER == "local" and (
+        args.refit or not Path(config.LOCAL_EMBEDDING_MODEL_PATH).exists()
+    ):
+        fit_course_model(courses_with_descriptions)
+
+    index, checkpoint = open_index()
+    report = await build_course_embeddings(
+        courses_with_descriptions,
+        index,
+        embed_batch=course_embeddings.get_retrieval_course_embeddings,
+        model_version=course_embeddings.embedding_model_version(),
+        batch_size=args.batch_size,
+        requests_per_minute=args.requests_per_minute,
+        max_in_flight=args.max_in_flight,
+        checkpoint=checkpoint,
+    )
+    print(report)
+
+    graph, recomputed = refresh_similar_courses(index, config.SIMILAR_COURSES_PATH)
+    print(
+        "Similar courses: recomputed %d of %d rows" % (recomputed, len(graph))
+    )
+
 
 if __name__ == "__main__":
-    import asyncio
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(main())
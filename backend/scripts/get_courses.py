@@ -1,55 +1,91 @@
-from sqlalchemy import desc
-from websockets import serve
-from billiken_blueprint import courses_at_slu, services
-from billiken_blueprint.domain import course
-from billiken_blueprint.domain.course import Course
+"""Crawl courses.slu.edu for the given departments and sync their sections.
+
+Only sections that were added, changed or dropped since the last sync are
+written. Departments whose crawl hit errors are left untouched.
+
+Usage:
+    python scripts/get_courses.py [DEPARTMENT ...] [--semester 202620] [--workers 8]
+"""
+
+import argparse
 import asyncio
+import sys
+from pathlib import Path
+
+# Add the parent directory to the path so we can import billiken_blueprint
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from billiken_blueprint import courses_at_slu, services
+from billiken_blueprint.domain.courses.course import Course
 from billiken_blueprint.domain.instructor import Professor
+from billiken_blueprint.use_cases.sync_semester_sections import (
+    sync_semester_sections,
+)
 
 
-async def main():
-    courses = await courses_at_slu.get_courses(
-        keyword="csci", semester=courses_at_slu.Semester.SPRING
-    )
-    crns_by_code = {}
-    for course in courses:
-        crns_by_code[course.code] = crns_by_code.get(course.code, [])
-        crns_by_code[course.code].append(course.crn)
-
-    for code, crns in crns_by_code.items():
-        for crn in crns:
-            section = await courses_at_slu.get_section(
-                code, crn, crns, semester=courses_at_slu.Semester.SPRING
-            )
-            instructor_names = section.instructor_names
-            db_instructors = []
-            course = await services.course_repository.get_by_code(code)
-            if not course:
-                course = Course(
+async def save_courses_and_instructors(sections):
+    courses_by_code = {}
+    instructors_by_name = {}
+    for section in sections:
+        course = courses_by_code.get(section.course_code)
+        if course is None:
+            course = await services.course_repository.get_by_code(section.course_code)
+        if course is None:
+            major_code, course_number = section.course_code.split()
+            course = await services.course_repository.save(
+                Course(
                     id=None,
-                    course_code=code,
-                    major=code.split(" ")[0],
-                    title=section.title,
-                    description=section.description,
-                    course_number=code.split(" ")[1],
+                    major_code=major_code,
+                    course_number=course_number,
+                    attribute_ids=[],
+                    prerequisites=None,
                 )
-                course = await services.course_repository.save(course)
-            for name in instructor_names:
-                db_instructor = await services.instructor_repository.get_by_name(name)
-                if not db_instructor:
-                    db_instructor = await services.instructor_repository.save(
-                        Professor(id=None, name=name)
-                    )
-                db_instructors.append(db_instructor)
-            await services.course_section_repository.save(
-                course_section=section,
-                course_id=course.id,  # type: ignore
-                crn=crn,
-                instructor_ids=[
-                    instr.id for instr in db_instructors if instr.id is not None
-                ],
             )
+        courses_by_code[section.course_code] = course
+
+        for name in section.instructor_names:
+            if name in instructors_by_name:
+                continue
+            instructor = await services.instructor_repository.get_by_name(name)
+            if instructor is None:
+                instructor = await services.instructor_repository.save(
+                    Professor(id=None, name=name)
+                )
+            instructors_by_name[name] = instructor
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("departments", nargs="*", default=["csci"])
+    parser.add_argument("--semester", default=courses_at_slu.Semester.SPRING)
+    parser.add_argument("--workers", type=int, default=8)
+    args = parser.parse_args()
+
+    async with courses_at_slu.CoursesAtSluClient() as client:
+        crawler = courses_at_slu.CatalogCrawler(
+            client, args.semester, workers=args.workers
+        )
+        sections, report = await crawler.crawl(args.departments)
+
+    print(report)
+    for failure in report.failures:
+        print("  failed:", failure)
+
+    departments = {
+        department.lower()
+        for department in args.departments
+        if department not in report.failed_departments
+    }
+    sections = [
+        section
+        for section in sections
+        if section.course_code.split()[0].lower() in departments
+    ]
+    await save_courses_and_instructors(sections)
+    summary = await sync_semester_sections(
+        args.semester, sections, services.section_repository, departments
+    )
+    print(summary)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,70 @@
+"""Fetch degree requirements from Degree Works for a catalog year.
+
+Audits already fetched for the catalog year are reused (pass --refresh to
+re-request them), and requirements are re-parsed and saved only for degrees
+whose audit changed. Needs cookie.txt with a Degree Works session cookie and
+the BANNER_ID environment variable.
+
+Usage:
+    python scripts/get_degree_requirements.py [--catalog-year 2025] [--refresh]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+# Add the parent directory to the path so we can import billiken_blueprint
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from billiken_blueprint import services
+from billiken_blueprint.degree_works import DegreeWorksClient
+from billiken_blueprint.degree_works.api import DegreeWorksDegree, DegreeWorksDegrees
+from billiken_blueprint.degree_works.ingest import ingest_degrees, open_audit_store
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--catalog-year", default="2025")
+    parser.add_argument("--refresh", action="store_true")
+    args = parser.parse_args()
+
+    with open("cookie.txt", "r") as f:
+        auth_cookie = f.read().strip()
+    banner_id = os.environ["BANNER_ID"]
+
+    degrees = [
+        degree
+        for degree in vars(DegreeWorksDegrees).values()
+        if isinstance(degree, DegreeWorksDegree)
+    ]
+    degree_ids = await services.degree_repository.get_ids_by_degree_works_codes()
+    store = open_audit_store()
+
+    async with DegreeWorksClient(auth_cookie, banner_id) as client:
+        results = await ingest_degrees(
+            degrees, args.catalog_year, client, store, refresh=args.refresh
+        )
+
+    for result in results:
+        degree = result.degree
+        name = f"{degree.major} {degree.degree_type} ({degree.college})"
+        if not result.changed:
+            print(f"{name}: unchanged")
+            continue
+        id = degree_ids.get((degree.major, degree.degree_type, degree.college))
+        if id is None:
+            print(f"{name}: no degree with these Degree Works codes, skipping")
+            continue
+        await services.degree_repository.save_requirements_for_degree(
+            id, result.requirements
+        )
+        await store.mark_parsed(degree, result.catalog_year, result.content_hash)
+        print(f"{name}: saved {len(result.requirements)} requirements")
+
+    print(f"{client.requests} audit requests for {len(results)} degrees")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
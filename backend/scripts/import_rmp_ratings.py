@@ -1,4 +1,9 @@
-"""Import RateMyProfessor ratings and reviews from JSON file and match with instructors."""
+"""Import RateMyProfessor ratings and reviews from JSON file and match with instructors.
+
+Reviews are synced per instructor: only reviews that are new since the last
+import are inserted and reviews no longer in the file are deleted, so an
+incremental scraper refresh results in a small write.
+"""
 
 import asyncio
 import json
@@ -14,6 +19,29 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from billiken_blueprint import services
 from billiken_blueprint.domain.instructor import Professor
 from billiken_blueprint.domain.ratings.rmp_review import RmpReview
+from billiken_blueprint.search.course_codes import CourseCodeResolver
+from billiken_blueprint.search.name_matcher import NameMatcher, preferred_name
+from billiken_blueprint.use_cases.sync_instructor_reviews import (
+    sync_instructor_reviews,
+)
+
+# Date formats written by the scraper ("May 4, 2023", "5/4/2023", "May 2023").
+REVIEW_DATE_FORMATS = ("%b %d, %Y", "%B %d, %Y", "%m/%d/%Y", "%m/%d/%y", "%b %Y", "%B %Y")
+
+
+def parse_review_date(value) -> datetime | None:
+    text = str(value).strip()
+    try:
+        return datetime.fromisoformat(text.replace("Z", "+00:00"))
+    except ValueError:
+        pass
+    text = re.sub(r"(\d)(st|nd|rd|th),", r"\1,", text)
+    for date_format in REVIEW_DATE_FORMATS:
+        try:
+            return datetime.strptime(text, date_format)
+        except ValueError:
+            continue
+    return None
 
 
 async def import_rmp_ratings():
@@ -97,98 +125,28 @@ async def import_rmp_ratings():
 
     # Get all existing instructors
     existing_instructors = await services.instructor_repository.get_all()
-    instructor_by_name = {
-        instructor.name.lower(): instructor for instructor in existing_instructors
-    }
+    matcher = NameMatcher(
+        (instructor.name, instructor) for instructor in existing_instructors
+    )
+    course_resolver = CourseCodeResolver(await services.course_repository.get_all())
 
     matched = 0
     not_matched = []
     total_reviews = 0
+    deleted_reviews = 0
+    unchanged_reviews = 0
 
     for rmp_prof in rmp_data:
         name = rmp_prof.get("name", "").strip()
         if not name:
             continue
 
-        # Debug: check if _department is set
-        dept_from_prof = rmp_prof.get("_department")
-
-        # Try exact match first
-        instructor = instructor_by_name.get(name.lower())
-
-        # If no exact match, try partial matches (handle variations like "Dr. Name" vs "Name", "Greg" vs "Gregory")
-        if not instructor:
-            # Try matching by last name or removing middle names/initials
-            rmp_name_parts = name.lower().split()
-            for existing_name, existing_instructor in instructor_by_name.items():
-                existing_parts = existing_name.split()
-                # Match if last names match
-                if (
-                    rmp_name_parts
-                    and existing_parts
-                    and rmp_name_parts[-1] == existing_parts[-1]
-                ):  # Last name match
-                    # Also check if first names are similar (e.g., "Greg" vs "Gregory")
-                    rmp_first = rmp_name_parts[0] if rmp_name_parts else ""
-                    existing_first = existing_parts[0] if existing_parts else ""
-                    # Match if first names are the same or one is a prefix of the other (Greg/Gregory, Jim/James)
-                    if (
-                        rmp_first == existing_first
-                        or rmp_first.startswith(existing_first)
-                        or existing_first.startswith(rmp_first)
-                        or (
-                            rmp_first in ["greg", "jim", "jimmy"]
-                            and existing_first in ["gregory", "james"]
-                        )
-                        or (
-                            existing_first in ["greg", "jim", "jimmy"]
-                            and rmp_first in ["gregory", "james"]
-                        )
-                    ):
-                        instructor = existing_instructor
-                        # Update name if RMP has a better version (e.g., "Tae-Hyuk (Ted) Ahn" -> "Ted Ahn")
-                        if "ted" in name.lower() and "ted" not in existing_name.lower():
-                            # Update to use Ted if RMP has it
-                            updated_instructor = Professor(
-                                id=existing_instructor.id,
-                                name=(
-                                    "Ted Ahn"
-                                    if "ahn" in name.lower()
-                                    else existing_instructor.name
-                                ),
-                                rmp_rating=rmp_prof.get("overall_rating"),
-                                rmp_num_ratings=rmp_prof.get("num_ratings"),
-                                rmp_url=rmp_prof.get("profile_url"),
-                                department=rmp_prof.get("_department")
-                                or existing_instructor.department,
-                            )
-                            await services.instructor_repository.save(
-                                updated_instructor
-                            )
-                        break
-                # Also try substring matching
-                if name.lower() in existing_name or existing_name in name.lower():
-                    instructor = existing_instructor
-                    break
-
-        if instructor:
-            # Update instructor with RMP aggregated data
+        match = matcher.match(name)
+        if match:
+            instructor = match.value
             # Use the department from RMP data, or keep existing if RMP doesn't have one
-            department = dept_from_prof or instructor.department
-            if not department and dept_from_prof:
-                department = dept_from_prof  # Ensure we use _department if it exists
-
-            # Normalize name: always use "Ted Ahn" instead of "Tae Ahn" or "Tae-Hyuk (Ted) Ahn"
-            instructor_name = instructor.name
-            if "ahn" in name.lower() and (
-                "ted" in name.lower() or "tae" in name.lower()
-            ):
-                instructor_name = "Ted Ahn"
-            elif "ahn" in instructor.name.lower() and (
-                "tae" in instructor.name.lower()
-                and "ted" not in instructor.name.lower()
-            ):
-                instructor_name = "Ted Ahn"
+            department = rmp_prof.get("_department") or instructor.department
+            instructor_name = preferred_name(instructor.name)
 
             updated_instructor = Professor(
                 id=instructor.id,
@@ -205,12 +163,7 @@ async def import_rmp_ratings():
             )
         else:
             # Create new instructor if not found (for math professors or others not in CSCI courses)
-            # Normalize name: always use "Ted Ahn" instead of "Tae Ahn" or "Tae-Hyuk (Ted) Ahn"
-            instructor_name = name
-            if "ahn" in name.lower() and (
-                "ted" in name.lower() or "tae" in name.lower()
-            ):
-                instructor_name = "Ted Ahn"
+            instructor_name = preferred_name(name)
 
             new_instructor = Professor(
                 id=None,
@@ -221,6 +174,8 @@ async def import_rmp_ratings():
                 department=rmp_prof.get("_department"),
             )
             instructor = await services.instructor_repository.save(new_instructor)
+            # Later records for the same person (e.g. in both files) match it.
+            matcher.add(instructor.name, instructor)
             matched += 1
             print(
                 f"✓ Created new instructor: {instructor_name} (Rating: {rmp_prof.get('overall_rating')}, Dept: {rmp_prof.get('_department')})"
@@ -237,36 +192,11 @@ async def import_rmp_ratings():
                         # Parse date if available
                         review_date = None
                         if review_data.get("date"):
-                            try:
-                                # Try to parse date string if it's in a standard format
-                                review_date = datetime.fromisoformat(
-                                    str(review_data["date"]).replace("Z", "+00:00")
-                                )
-                            except (ValueError, TypeError):
-                                pass
-
-                        # Try to match course code from RMP review to database course
-                        course_id = None
+                            review_date = parse_review_date(review_data["date"])
+
+                        # Match the course code from the RMP review to a catalog course
                         course_string = review_data.get("course")
-                        if course_string:
-                            # Extract course code pattern (e.g., "CSCI 3100" or "CSCI3100")
-                            # Match patterns like "CSCI 3100", "CSCI3100", "MATH 1200", etc.
-                            course_code_match = re.search(
-                                r"([A-Z]+)\s*(\d{4})", course_string.upper()
-                            )
-                            if course_code_match:
-                                department = course_code_match.group(1)
-                                number = course_code_match.group(2)
-                                potential_course_code = f"{department} {number}"
-
-                                # Try to find matching course in database
-                                db_course = (
-                                    await services.course_repository.get_by_code(
-                                        potential_course_code
-                                    )
-                                )
-                                if db_course:
-                                    course_id = db_course.id
+                        course_id = course_resolver.resolve(course_string)
 
                         rmp_review = RmpReview(
                             id=None,  # Auto-increment
@@ -284,16 +214,17 @@ async def import_rmp_ratings():
                         )
                         rmp_reviews.append(rmp_review)
 
-                    # Delete existing reviews for this instructor and save new ones
-                    await services.rmp_review_repository.delete_by_instructor_id(
-                        instructor.id
+                    # Write only the difference from the stored reviews
+                    summary = await sync_instructor_reviews(
+                        instructor.id,
+                        rmp_reviews,
+                        services.rmp_review_repository,
                     )
-                    if rmp_reviews:
-                        await services.rmp_review_repository.save_many(rmp_reviews)
-                        total_reviews += len(rmp_reviews)
-                        print(
-                            f"  → Imported {len(rmp_reviews)} reviews for {instructor.name}"
-                        )
+                    total_reviews += summary.inserted
+                    deleted_reviews += summary.deleted
+                    unchanged_reviews += summary.unchanged
+                    if summary.changed:
+                        print(f"  → Reviews for {instructor.name}: {summary}")
                 except Exception as e:
                     # Skip reviews import if table doesn't exist or other error
                     print(
@@ -306,6 +237,7 @@ async def import_rmp_ratings():
     print(f"\nSummary:")
     print(f"  Matched instructors: {matched}/{len(rmp_data)}")
     print(f"  Total reviews imported: {total_reviews}")
+    print(f"  Reviews deleted: {deleted_reviews}, unchanged: {unchanged_reviews}")
     print(f"  Not matched: {len(not_matched)}")
     if not_matched:
         print(f"\nUnmatched professors:")
@@ -1,5 +1,9 @@
-"""Merge duplicate instructors (e.g., Ted Ahn and Tae Ahn)."""
+"""Merge duplicate instructors (e.g., Ted Ahn and Tae Ahn).
 
+Usage: python scripts/merge_duplicate_instructors.py [--dry-run]
+"""
+
+import argparse
 import asyncio
 import sys
 from pathlib import Path
@@ -9,86 +13,13 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from billiken_blueprint import services
 from billiken_blueprint.domain.instructor import Professor
-from sqlalchemy import update, delete
-from billiken_blueprint.repositories.instructor_repository import DBInstructor
-from billiken_blueprint.repositories.rating_repository import DBRating
-from billiken_blueprint.repositories.rmp_review_repository import DBRmpReview
-
-
-def normalize_name_for_matching(name: str) -> str:
-    """Normalize name for matching (e.g., Ted Ahn variations, typos, common name variations)."""
-    name_lower = name.lower().strip()
-    
-    # Normalize Ted Ahn variations
-    if "ahn" in name_lower and ("ted" in name_lower or "tae" in name_lower):
-        return "ted ahn"
-    
-    # Normalize Jamal Abdul-Hafidh typo (Adbul -> Abdul)
-    if "jamal" in name_lower and "abdul" in name_lower.replace("adbul", "abdul") and "hafidh" in name_lower:
-        return "jamal abdul-hafidh"
-    
-    # Normalize common typos/variations
-    name_normalized = name_lower
-    # Fix common typos
-    name_normalized = name_normalized.replace("adbul", "abdul")
-    
-    # Normalize common first name variations
-    parts = name_normalized.split()
-    if len(parts) >= 2:
-        first_name = parts[0]
-        last_name = parts[-1]
-        
-        # Common name variations mapping
-        name_variations = {
-            "jim": "james",
-            "jimmy": "james",
-            "phil": "philip",
-            "sam": "samuel",
-            "bob": "robert",
-            "rob": "robert",
-            "dick": "richard",
-            "rick": "richard",
-            "bill": "william",
-            "will": "william",
-            "mike": "michael",
-            "mikey": "michael",
-            "chris": "christopher",
-            "cj": "christopher",  # CJ Halverson -> Christopher Halverson
-            "chuck": "charles",
-            "charlie": "charles",
-            "ted": "theodore",
-            "ed": "edward",
-            "eddie": "edward",
-            "tom": "thomas",
-            "tommy": "thomas",
-            "dan": "daniel",
-            "danny": "daniel",
-            "joe": "joseph",
-            "joey": "joseph",
-            "steve": "steven",
-            "stephen": "steven",
-            "greg": "gregory",
-            "alex": "alexander",
-            "sandy": "alexander",
-            "andy": "andrew",
-            "drew": "andrew",
-            "josh": "joshua",
-            "matt": "matthew",
-            "nate": "nathaniel",
-            "nat": "nathaniel",
-            "ben": "benjamin",
-            "benny": "benjamin",
-            "tim": "timothy",
-            "timmy": "timothy",
-            "abby": "abigail",  # Abby -> Abigail
-        }
-        
-        # Normalize first name
-        normalized_first = name_variations.get(first_name, first_name)
-        
-        return f"{normalized_first} {last_name}"
-    
-    return name_normalized
+from billiken_blueprint.repositories.instructor_repository import InstructorMerge
+from billiken_blueprint.search.name_matcher import (
+    NICKNAMES,
+    PREFERRED_NAMES,
+    name_key,
+    preferred_name,
+)
 
 
 def choose_canonical_instructor(instructors: list[Professor]) -> Professor:
@@ -117,16 +48,6 @@ def choose_canonical_instructor(instructors: list[Professor]) -> Professor:
     if without_typos:
         instructors = without_typos
     
-    # Prefer full name over nickname
-    nickname_to_full = {
-        "jim": "james",
-        "phil": "philip",
-        "sam": "samuel",
-        "ted": "theodore",  # But "Ted Ahn" is special case
-        "cj": "christopher",
-        "abby": "abigail",
-    }
-    
     # Prefer full names over nicknames
     full_name_versions = []
     nickname_versions = []
@@ -135,7 +56,7 @@ def choose_canonical_instructor(instructors: list[Professor]) -> Professor:
         # Skip Ted Ahn special case
         if "ahn" in inst.name.lower():
             continue
-        if first_name in nickname_to_full.values() or first_name not in nickname_to_full:
+        if first_name not in NICKNAMES:
             # This is a full name or not a known nickname
             full_name_versions.append(inst)
         else:
@@ -145,24 +66,16 @@ def choose_canonical_instructor(instructors: list[Professor]) -> Professor:
     if full_name_versions:
         instructors = full_name_versions
     
-    # Prefer normalized name (Ted Ahn over Tae Ahn)
+    # Prefer the preferred spelling (Ted Ahn over Tae Ahn)
     for inst in instructors:
-        normalized = normalize_name_for_matching(inst.name)
-        if normalized == "ted ahn" and "ted" in inst.name.lower():
-            return inst
-        if normalized == "jamal abdul-hafidh" and "abdul" in inst.name.lower() and "adbul" not in inst.name.lower():
-            return inst
-    
-    # Prefer name that matches normalized form
-    for inst in instructors:
-        if normalize_name_for_matching(inst.name) == normalize_name_for_matching(inst.name):
+        if inst.name in PREFERRED_NAMES:
             return inst
     
     # Fall back to lowest ID
     return min(instructors, key=lambda x: x.id or 999999)
 
 
-async def merge_duplicate_instructors():
+async def merge_duplicate_instructors(dry_run: bool = False):
     """Find and merge duplicate instructors."""
     print("Finding duplicate instructors...")
     print("=" * 60)
@@ -173,7 +86,7 @@ async def merge_duplicate_instructors():
     # Group by normalized name
     by_normalized = {}
     for instructor in all_instructors:
-        normalized = normalize_name_for_matching(instructor.name)
+        normalized = name_key(instructor.name)
         if normalized not in by_normalized:
             by_normalized[normalized] = []
         by_normalized[normalized].append(instructor)
@@ -186,117 +99,41 @@ async def merge_duplicate_instructors():
         return
     
     print(f"\nFound {len(duplicates)} sets of duplicate instructors:")
-    total_to_merge = 0
+    merges = []
     for normalized, instructors in duplicates.items():
         print(f"\n  Normalized: '{normalized}'")
         canonical = choose_canonical_instructor(instructors)
-        print(f"    → Canonical: ID {canonical.id} - '{canonical.name}'")
+        # Canonical name (prefer normalized and full names); preferred_name
+        # also fixes known typos such as "Adbul".
+        canonical_name = preferred_name(canonical.name)
+        print(f"    → Canonical: ID {canonical.id} - '{canonical_name}'")
         for inst in instructors:
             if inst.id != canonical.id:
                 print(f"      - ID {inst.id}: '{inst.name}' (will be merged into {canonical.id})")
-                total_to_merge += 1
+                merges.append(InstructorMerge(inst.id, canonical.id, canonical_name))
     
     print("\n" + "=" * 60)
-    print(f"Will merge {total_to_merge} duplicate instructors into {len(duplicates)} canonical ones")
+    print(f"Will merge {len(merges)} duplicate instructors into {len(duplicates)} canonical ones")
     
-    if total_to_merge == 0:
-        print("No duplicates to merge.")
-        return
-    
-    print("\nMerging duplicates...")
-    merged_count = 0
+    # Ratings and RMP reviews follow the canonical instructor; sections keep
+    # their instructor_names, which the section sync rewrites from the source.
+    report = await services.instructor_repository.merge(merges, dry_run=dry_run)
+    print()
+    print(report)
     
-    async with services.async_sessionmaker() as session:
-        for normalized, instructors in duplicates.items():
-            canonical = choose_canonical_instructor(instructors)
-            canonical_id = canonical.id
-            
-            # Determine canonical name (prefer normalized and full names)
-            if normalized == "ted ahn":
-                canonical_name = "Ted Ahn"
-            elif normalized == "james gill":
-                canonical_name = "James Gill"
-            elif normalized == "philip huling":
-                canonical_name = "Philip Huling"
-            elif normalized == "samuel stoll":
-                canonical_name = "Samuel Stoll"
-            elif normalized == "christopher halverson":
-                canonical_name = "Christopher Halverson"
-            elif normalized == "abigail stylianou":
-                canonical_name = "Abigail Stylianou"
-            else:
-                canonical_name = canonical.name
-            
-            # Merge data: prefer non-null values from duplicates
-            merged_rmp_rating = canonical.rmp_rating
-            merged_rmp_num_ratings = canonical.rmp_num_ratings
-            merged_rmp_url = canonical.rmp_url
-            merged_department = canonical.department
-            
-            for inst in instructors:
-                if inst.id == canonical_id:
-                    continue
-                
-                # Merge RMP data if canonical doesn't have it
-                if not merged_rmp_rating and inst.rmp_rating:
-                    merged_rmp_rating = inst.rmp_rating
-                    merged_rmp_num_ratings = inst.rmp_num_ratings
-                    merged_rmp_url = inst.rmp_url
-                
-                # Merge department if canonical doesn't have it
-                if not merged_department and inst.department:
-                    merged_department = inst.department
-            
-            # Fix typos in canonical name (e.g., "Adbul" -> "Abdul")
-            if "adbul" in canonical_name.lower():
-                canonical_name = canonical_name.replace("Adbul", "Abdul").replace("adbul", "abdul")
-            
-            # Update canonical instructor with merged data
-            update_stmt = update(DBInstructor).where(
-                DBInstructor.id == canonical_id
-            ).values(
-                name=canonical_name,
-                rmp_rating=merged_rmp_rating,
-                rmp_num_ratings=merged_rmp_num_ratings,
-                rmp_url=merged_rmp_url,
-                department=merged_department,
-            )
-            await session.execute(update_stmt)
-            
-            # Update all foreign key references
-            for inst in instructors:
-                if inst.id == canonical_id:
-                    continue
-                
-                duplicate_id = inst.id
-                
-                # Update ratings.professor_id
-                ratings_update = update(DBRating).where(
-                    DBRating.professor_id == duplicate_id
-                ).values(professor_id=canonical_id)
-                await session.execute(ratings_update)
-                
-                # Update rmp_reviews.instructor_id
-                rmp_update = update(DBRmpReview).where(
-                    DBRmpReview.instructor_id == duplicate_id
-                ).values(instructor_id=canonical_id)
-                await session.execute(rmp_update)
-                
-                # Note: instructor_sections is a junction table, but sections use instructor_names (JSON array)
-                # We'll handle that separately if needed, but it's less critical
-                
-                # Delete duplicate instructor
-                delete_stmt = delete(DBInstructor).where(DBInstructor.id == duplicate_id)
-                await session.execute(delete_stmt)
-                
-                merged_count += 1
-                print(f"  ✓ Merged ID {duplicate_id} into ID {canonical_id}")
-        
-        await session.commit()
-    
-    print(f"\n✓ Successfully merged {merged_count} duplicate instructors!")
-    print(f"  Remaining instructors: {len(all_instructors) - merged_count}")
+    if dry_run:
+        print("\nDry run: nothing was written.")
+        return
+    print(f"\n✓ Successfully merged {report.merged} duplicate instructors!")
+    print(f"  Remaining instructors: {len(all_instructors) - report.merged}")
 
 
 if __name__ == "__main__":
-    asyncio.run(merge_duplicate_instructors())
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Report what would change without writing anything",
+    )
+    args = parser.parse_args()
+    asyncio.run(merge_duplicate_instructors(dry_run=args.dry_run))
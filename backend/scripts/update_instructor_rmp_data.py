@@ -6,7 +6,6 @@ but does NOT import individual reviews (those load from files automatically).
 
 import asyncio
 import json
-import re
 from pathlib import Path
 import sys
 
@@ -15,6 +14,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from billiken_blueprint import services
 from billiken_blueprint.domain.instructor import Professor
+from billiken_blueprint.search.name_matcher import NameMatcher, preferred_name
 
 
 async def update_instructor_rmp_data():
@@ -80,65 +80,13 @@ async def update_instructor_rmp_data():
 
     print(f"Total RMP professor records: {len(rmp_data)}")
 
-    def normalize_name_for_matching(name: str) -> str:
-        """Normalize name for matching (e.g., Ted Ahn variations, common name variations)."""
-        name_lower = name.lower().strip()
-        
-        # Normalize Ted Ahn variations
-        if "ahn" in name_lower and ("ted" in name_lower or "tae" in name_lower):
-            return "ted ahn"
-        
-        # Normalize Jamal Abdul-Hafidh typo
-        if "jamal" in name_lower and "abdul" in name_lower.replace("adbul", "abdul") and "hafidh" in name_lower:
-            return "jamal abdul-hafidh"
-        
-        # Normalize common typos
-        name_normalized = name_lower.replace("adbul", "abdul")
-        
-        # Normalize common first name variations
-        parts = name_normalized.split()
-        if len(parts) >= 2:
-            first_name = parts[0]
-            last_name = parts[-1]
-            
-            name_variations = {
-                "jim": "james", "jimmy": "james",
-                "phil": "philip",
-                "sam": "samuel",
-                "chris": "christopher", "cj": "christopher",
-                "abby": "abigail",
-                "mike": "michael",
-                "tom": "thomas",
-                "dan": "daniel",
-                "joe": "joseph",
-                "steve": "steven", "stephen": "steven",
-                "greg": "gregory",
-                "alex": "alexander",
-                "andy": "andrew",
-                "josh": "joshua",
-                "matt": "matthew",
-                "ben": "benjamin",
-                "tim": "timothy",
-            }
-            
-            normalized_first = name_variations.get(first_name, first_name)
-            return f"{normalized_first} {last_name}"
-        
-        return name_normalized
-
     # Get all existing instructors
     existing_instructors = await services.instructor_repository.get_all()
-    # Create lookup by both exact name and normalized name
-    instructor_by_name = {}
-    instructor_by_normalized = {}
-    for instructor in existing_instructors:
-        instructor_by_name[instructor.name.lower()] = instructor
-        normalized = normalize_name_for_matching(instructor.name)
-        if normalized not in instructor_by_normalized:
-            instructor_by_normalized[normalized] = instructor
+    matcher = NameMatcher(
+        (instructor.name, instructor) for instructor in existing_instructors
+    )
 
     matched = 0
-    not_matched = []
     created_count = 0
 
     for rmp_prof in rmp_data:
@@ -147,62 +95,13 @@ async def update_instructor_rmp_data():
             continue
 
         dept_from_prof = rmp_prof.get("_department")
+        match = matcher.match(name)
 
-        # Try exact match first
-        instructor = instructor_by_name.get(name.lower())
-
-        # Try normalized name match (for Ted Ahn, etc.)
-        if not instructor:
-            normalized_rmp_name = normalize_name_for_matching(name)
-            instructor = instructor_by_normalized.get(normalized_rmp_name)
-
-        # If no exact match, try partial matches by last name
-        if not instructor:
-            rmp_name_parts = name.lower().split()
-            for existing_name, existing_instructor in instructor_by_name.items():
-                existing_parts = existing_name.split()
-                # Match if last names match
-                if (
-                    rmp_name_parts
-                    and existing_parts
-                    and rmp_name_parts[-1] == existing_parts[-1]
-                ):
-                    rmp_first = rmp_name_parts[0] if rmp_name_parts else ""
-                    existing_first = existing_parts[0] if existing_parts else ""
-                    if (
-                        rmp_first == existing_first
-                        or rmp_first.startswith(existing_first)
-                        or existing_first.startswith(rmp_first)
-                        or (
-                            rmp_first in ["greg", "jim", "jimmy"]
-                            and existing_first in ["gregory", "james"]
-                        )
-                        or (
-                            existing_first in ["greg", "jim", "jimmy"]
-                            and rmp_first in ["gregory", "james"]
-                        )
-                    ):
-                        instructor = existing_instructor
-                        break
-                # Also try substring matching
-                if name.lower() in existing_name or existing_name in name.lower():
-                    instructor = existing_instructor
-                    break
-
-        if instructor:
+        if match:
             # Update instructor with RMP aggregated data only
+            instructor = match.value
             department = dept_from_prof or instructor.department
-
-            # Normalize name for Ted Ahn
-            instructor_name = instructor.name
-            if "ahn" in name.lower() and (
-                "ted" in name.lower() or "tae" in name.lower()
-            ):
-                instructor_name = "Ted Ahn"
-            elif "ahn" in instructor.name.lower() and (
-                "tae" in instructor.name.lower() and "ted" not in instructor.name.lower()
-            ):
-                instructor_name = "Ted Ahn"
+            instructor_name = preferred_name(instructor.name)
 
             updated_instructor = Professor(
                 id=instructor.id,
@@ -218,50 +117,23 @@ async def update_instructor_rmp_data():
                 f"✓ Updated: {instructor_name} (Rating: {rmp_prof.get('overall_rating')}, Dept: {department})"
             )
         else:
-            # Before creating new instructor, check if normalized name already exists
-            normalized_rmp_name = normalize_name_for_matching(name)
-            existing_normalized = instructor_by_normalized.get(normalized_rmp_name)
-            
-            if existing_normalized:
-                # Found by normalized name - update that one instead
-                instructor = existing_normalized
-                department = dept_from_prof or instructor.department
-                instructor_name = "Ted Ahn" if normalized_rmp_name == "ted ahn" else instructor.name
-                
-                updated_instructor = Professor(
-                    id=instructor.id,
-                    name=instructor_name,
-                    rmp_rating=rmp_prof.get("overall_rating"),
-                    rmp_num_ratings=rmp_prof.get("num_ratings"),
-                    rmp_url=rmp_prof.get("profile_url"),
-                    department=department,
-                )
-                await services.instructor_repository.save(updated_instructor)
-                matched += 1
-                print(
-                    f"✓ Updated (normalized match): {instructor_name} (was: {instructor.name}, Rating: {rmp_prof.get('overall_rating')}, Dept: {department})"
-                )
-            else:
-                # Create new instructor if truly not found
-                instructor_name = name
-                if "ahn" in name.lower() and (
-                    "ted" in name.lower() or "tae" in name.lower()
-                ):
-                    instructor_name = "Ted Ahn"
+            # Create new instructor if truly not found
+            instructor_name = preferred_name(name)
 
-                new_instructor = Professor(
-                    id=None,
-                    name=instructor_name,
-                    rmp_rating=rmp_prof.get("overall_rating"),
-                    rmp_num_ratings=rmp_prof.get("num_ratings"),
-                    rmp_url=rmp_prof.get("profile_url"),
-                    department=dept_from_prof,
-                )
-                await services.instructor_repository.save(new_instructor)
-                created_count += 1
-                print(
-                    f"✓ Created: {instructor_name} (Rating: {rmp_prof.get('overall_rating')}, Dept: {dept_from_prof})"
-                )
+            new_instructor = Professor(
+                id=None,
+                name=instructor_name,
+                rmp_rating=rmp_prof.get("overall_rating"),
+                rmp_num_ratings=rmp_prof.get("num_ratings"),
+                rmp_url=rmp_prof.get("profile_url"),
+                department=dept_from_prof,
+            )
+            instructor = await services.instructor_repository.save(new_instructor)
+            matcher.add(instructor.name, instructor)
+            created_count += 1
+            print(
+                f"✓ Created: {instructor_name} (Rating: {rmp_prof.get('overall_rating')}, Dept: {dept_from_prof})"
+            )
 
     print(f"\nSummary:")
     print(f"  Updated instructors: {matched}")
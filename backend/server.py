@@ -1,10 +1,11 @@
 from operator import ipow
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
 from starlette.middleware.cors import CORSMiddleware
 from billiken_blueprint.api import routers
+from billiken_blueprint.dependencies import get_unit_of_work
 
 
-app = FastAPI()
+app = FastAPI(dependencies=[Depends(get_unit_of_work)])
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
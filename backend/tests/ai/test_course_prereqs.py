@@ -0,0 +1,194 @@
+import json
+import re
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from google.genai.errors import APIError
+
+from billiken_blueprint.ai.course_prereqs import (
+    normalize_snippet,
+    parse_many_prereqs,
+    parse_prereqs,
+)
+from billiken_blueprint.rate_limit import AdaptiveRateLimiter
+from billiken_blueprint.response_cache import ResponseCache
+
+AMBIGUOUS = "CSCI 1300 or CSCI 1010 and MATH 1660"
+MODEL_OUTPUT = {
+    "operator": "OR",
+    "operands": [
+        {
+            "major_code": "CSCI",
+            "course_number": 1300,
+            "end_number": None,
+            "concurrent_allowed": False,
+        }
+    ],
+}
+
+
+@patch("billiken_blueprint.ai.course_prereqs.course_prereqs_gemini.parse_prereqs")
+def test_regular_snippets_never_reach_the_model(mock_model, tmp_path):
+    result = parse_prereqs("CSCI 2100; MATH 1660", ResponseCache(tmp_path / "c.db"))
+
+    assert [operand["course_number"] for operand in result["operands"]] == [
+        "2100",
+        "1660",
+    ]
+    mock_model.assert_not_called()
+
+
+@patch(
+    "billiken_blueprint.ai.course_prereqs.course_prereqs_gemini.parse_prereqs",
+    return_value=MODEL_OUTPUT,
+)
+def test_rejected_snippets_fall_back_once(mock_model, tmp_path):
+    cache = ResponseCache(tmp_path / "c.db")
+
+    first = parse_prereqs(AMBIGUOUS, cache)
+    second = parse_prereqs(AMBIGUOUS, cache)
+
+    assert first == second
+    assert first["operands"][0]["course_number"] == "1300"
+    mock_model.assert_called_once_with(AMBIGUOUS)
+
+
+class FakeGenaiClient:
+    """Stands in for ``genai.Client``: answers batch requests from a table of
+    snippet text to prerequisites, optionally throttling first."""
+
+    def __init__(self, answers, throttle=0, skip=()):
+        self.answers = answers
+        self.throttle = throttle
+        self.skip = set(skip)
+        self.requests = []
+        self.models = self
+
+    def generate_content(self, model, contents, config):
+        self.requests.append(contents)
+        if self.throttle:
+            self.throttle -= 1
+            raise APIError(
+                429,
+                {
+                    "error": {
+                        "code": 429,
+                        "status": "RESOURCE_EXHAUSTED",
+                        "details": [{"retryDelay": "0s"}],
+                    }
+                },
+            )
+        results = []
+        for id, text in re.findall(r'<snippet id="(\d+)">(.*?)</snippet>', contents):
+            if text in self.skip:
+                self.skip.discard(text)
+                continue
+            results.append({"id": int(id), "prerequisites": self.answers[text]})
+        return SimpleNamespace(text=json.dumps({"results": results}))
+
+
+def answer(course_number):
+    return {
+        "operator": "AND",
+        "operands": [
+            {
+                "major_code": "CSCI",
+                "course_number": course_number,
+                "end_number": None,
+                "concurrent_allowed": False,
+            }
+        ],
+    }
+
+
+AMBIGUOUS_SNIPPETS = [
+    f"CSCI {number} or CSCI 1010 and MATH 1660" for number in range(2000, 2005)
+]
+ANSWERS = {text: answer(2000 + i) for i, text in enumerate(AMBIGUOUS_SNIPPETS)}
+
+
+def fast_limiter():
+    return AdaptiveRateLimiter(rate=1000, period=1.0)
+
+
+def test_normalize_snippet_ignores_markup():
+    a = '<a href="/search/?p=CSCI%201300" data-group="code:CSCI 1300" >CSCI 1300</a>  or&nbsp;x'
+    b = '<a href="/x" data-group="code:CSCI 1300" class="notoffered">CSCI 1300</a> or x'
+    assert normalize_snippet(a) == normalize_snippet(b) == "CSCI 1300 or x"
+
+
+@pytest.mark.asyncio
+async def test_batches_only_what_the_parser_rejects(tmp_path):
+    client = FakeGenaiClient(ANSWERS)
+    snippets = ["CSCI 2100; MATH 1660", *AMBIGUOUS_SNIPPETS, AMBIGUOUS_SNIPPETS[0]]
+
+    results = await parse_many_prereqs(
+        snippets,
+        cache=ResponseCache(tmp_path / "c.db"),
+        batch_size=2,
+        limiter=fast_limiter(),
+        genai_client=client,
+    )
+
+    assert results[0]["operands"][0]["course_number"] == "2100"
+    assert [result["operands"][0]["course_number"] for result in results[1:]] == [
+        "2000",
+        "2001",
+        "2002",
+        "2003",
+        "2004",
+        "2000",
+    ]
+    # Five distinct rejected snippets in batches of two.
+    assert len(client.requests) == 3
+
+
+@pytest.mark.asyncio
+async def test_cached_snippets_are_not_reparsed(tmp_path):
+    cache = ResponseCache(tmp_path / "c.db")
+    await parse_many_prereqs(
+        AMBIGUOUS_SNIPPETS,
+        cache=cache,
+        limiter=fast_limiter(),
+        genai_client=FakeGenaiClient(ANSWERS),
+    )
+
+    client = FakeGenaiClient(ANSWERS)
+    results = await parse_many_prereqs(
+        [f"<span>{text}</span>" for text in AMBIGUOUS_SNIPPETS],
+        cache=cache,
+        limiter=fast_limiter(),
+        genai_client=client,
+    )
+
+    assert client.requests == []
+    assert results[4]["operands"][0]["course_number"] == "2004"
+
+
+@pytest.mark.asyncio
+async def test_throttling_slows_the_limiter_and_retries(tmp_path):
+    client = FakeGenaiClient(ANSWERS, throttle=2)
+    limiter = fast_limiter()
+
+    results = await parse_many_prereqs(
+        AMBIGUOUS_SNIPPETS, cache=None, limiter=limiter, genai_client=client
+    )
+
+    assert len(results) == 5
+    assert len(client.requests) == 3
+    # Halved twice, then one success adds a request back.
+    assert limiter.rate == pytest.approx(1000 / 4 + 1)
+
+
+@pytest.mark.asyncio
+async def test_snippets_missing_from_a_batch_are_retried(tmp_path):
+    client = FakeGenaiClient(ANSWERS, skip=[AMBIGUOUS_SNIPPETS[1]])
+
+    results = await parse_many_prereqs(
+        AMBIGUOUS_SNIPPETS, cache=None, limiter=fast_limiter(), genai_client=client
+    )
+
+    assert results[1]["operands"][0]["course_number"] == "2001"
+    assert len(client.requests) == 2
+    assert client.requests[1].count("<snippet") == 1
@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+
+from billiken_blueprint.ai import local_embeddings
+from billiken_blueprint.ai.local_embeddings import LocalEmbeddingModel, tokenize
+from billiken_blueprint.domain.courses.course import CourseWithDescription
+
+DOCUMENTS = [
+    "CSCI 1300 Introduction to object oriented programming in Python",
+    "CSCI 2100 Data structures: lists, trees, hash tables and graphs",
+    "CSCI 4740 Machine learning: supervised learning, neural networks",
+    "CSCI 4750 Applied machine learning and data mining",
+    "MATH 1510 Calculus I: limits, derivatives and integrals",
+    "MATH 1520 Calculus II: integrals, sequences and series",
+    "CHEM 1110 General chemistry: atoms, bonding and reactions",
+    "CHEM 2410 Organic chemistry: reactions of carbon compounds",
+]
+
+
+def test_tokenize_drops_stop_words_and_adds_bigrams():
+    assert tokenize("The Data Structures of CSCI 2100") == [
+        "data",
+        "structures",
+        "csci",
+        "2100",
+        "data structures",
+        "structures csci",
+        "csci 2100",
+    ]
+
+
+def test_fit_is_deterministic():
+    first = LocalEmbeddingModel.fit(DOCUMENTS, dimensions=4, min_df=1)
+    second = LocalEmbeddingModel.fit(DOCUMENTS, dimensions=4, min_df=1)
+
+    np.testing.assert_array_equal(first.components, second.components)
+    np.testing.assert_array_equal(
+        first.transform(["machine learning"]), second.transform(["machine learning"])
+    )
+
+
+def test_transform_ranks_related_documents_first():
+    model = LocalEmbeddingModel.fit(DOCUMENTS, dimensions=6, min_df=1)
+    documents = model.transform(DOCUMENTS)
+
+    query = model.transform(["organic chemistry reactions"])[0]
+    best = np.argsort(-(documents @ query))[:2]
+
+    assert set(best) == {6, 7}
+    assert np.linalg.norm(query) == pytest.approx(1.0, abs=1e-5)
+
+
+def test_unknown_tokens_embed_to_zero_vector():
+    model = LocalEmbeddingModel.fit(DOCUMENTS, dimensions=4, min_df=1)
+
+    assert not model.transform(["zzzz qqqq"]).any()
+
+
+def test_save_and_load_round_trip(tmp_path):
+    model = LocalEmbeddingModel.fit(DOCUMENTS, dimensions=4, min_df=1)
+    model.save(tmp_path / "model.npz")
+
+    loaded = LocalEmbeddingModel.load(tmp_path / "model.npz")
+
+    np.testing.assert_allclose(
+        loaded.transform(DOCUMENTS), model.transform(DOCUMENTS), atol=1e-6
+    )
+
+
+def test_course_embeddings_match_gemini_interface(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        local_embeddings.config, "LOCAL_EMBEDDING_MODEL_PATH", tmp_path / "model.npz"
+    )
+    local_embeddings.get_course_model.cache_clear()
+    courses = [
+        CourseWithDescription(
+            major_code=text.split()[0],
+            course_number=text.split()[1],
+            id=i,
+            attribute_ids=[],
+            prerequisites=None,
+            description=text.split(" ", 2)[2],
+        )
+        for i, text in enumerate(DOCUMENTS)
+    ]
+
+    try:
+        embeddings = local_embeddings.get_retrieval_course_embeddings(courses)
+        query = local_embeddings.get_query_course_embedding("calculus")
+    finally:
+        local_embeddings.get_course_model.cache_clear()
+
+    assert len(embeddings) == len(courses)
+    assert len(query.values) == len(embeddings[0].values)
+    assert (tmp_path / "model.npz").exists()
@@ -0,0 +1,225 @@
+import httpx
+import pytest
+import pytest_asyncio
+
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from billiken_blueprint.base import Base
+from billiken_blueprint.dependencies import (
+    get_current_identity,
+    get_schedule_executor,
+)
+from billiken_blueprint.domain.courses.course import Course
+from billiken_blueprint.domain.courses.course_attribute import CourseAttribute
+from billiken_blueprint.domain.degrees.degree import Degree
+from billiken_blueprint.domain.section import MeetingTime, Section
+from billiken_blueprint.domain.student import Student
+from billiken_blueprint.identity import IdentityUser
+from billiken_blueprint.use_cases.schedule_executor import SnapshotUnavailable
+from server import app
+
+
+@pytest_asyncio.fixture
+async def async_engine():
+    """A database per test: the endpoint's concurrent loads contend for the
+    in-memory database's one connection, which binds it to the test's loop."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+class RecordingExecutor:
+    """Stands in for the process pool; records the snapshots published."""
+
+    def __init__(self):
+        self.snapshots = []
+        self.runs = []
+        self.retired = set()
+
+    def has_snapshot(self, key):
+        return any(snapshot.key == key for snapshot in self.snapshots)
+
+    def publish(self, snapshot):
+        self.snapshots.append(snapshot)
+
+    async def run(self, snapshot_key, request):
+        if snapshot_key in self.retired:
+            raise SnapshotUnavailable(snapshot_key)
+        self.runs.append(snapshot_key)
+        return []
+
+
+@pytest_asyncio.fixture
+async def schedule_client(
+    app_client,
+    identity_user_repository,
+    student_repository,
+    degree_repository,
+):
+    degree = await degree_repository.save(
+        Degree(
+            degree_works_major_code="CS",
+            degree_works_degree_type="BS",
+            degree_works_college_code="AS",
+            id=1,
+            name="Computer Science",
+            requirements=[],
+        )
+    )
+    await degree_repository.save_requirements_for_degree(degree.id, [])
+    student = await student_repository.save(
+        Student(
+            id=None,
+            name="Test Student",
+            degree_id=degree.id,
+            graduation_year=2027,
+            completed_course_ids=[],
+            desired_course_ids=[],
+            unavailability_times=[],
+            avoid_times=[],
+        )
+    )
+    identity_user = IdentityUser(
+        id=1, email="test@example.com", password_hash="hash", student_id=student.id
+    )
+    await identity_user_repository.save(identity_user)
+
+    executor = RecordingExecutor()
+    app.dependency_overrides[get_current_identity] = lambda: identity_user
+    app.dependency_overrides[get_schedule_executor] = lambda: executor
+    # The endpoint loads concurrently; serve it on the test's own event loop,
+    # which the database connections are bound to.
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        yield client, executor
+
+
+async def generate(client):
+    response = await client.get(
+        "/api/degree-requirements/autogenerate-schedule",
+        params={"semester": "202520"},
+    )
+    assert response.status_code == 200
+    return response
+
+
+def make_course(course_number, id=None, attribute_ids=()):
+    return Course(
+        id=id,
+        major_code="CSCI",
+        course_number=course_number,
+        attribute_ids=list(attribute_ids),
+        prerequisites=None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_snapshot_is_reused_while_the_catalog_is_unchanged(schedule_client):
+    client, executor = schedule_client
+
+    await generate(client)
+    await generate(client)
+
+    assert len(executor.snapshots) == 1
+    assert executor.runs == [executor.snapshots[0].key] * 2
+
+
+@pytest.mark.asyncio
+async def test_saving_a_course_publishes_a_new_snapshot(
+    schedule_client, course_repository
+):
+    client, executor = schedule_client
+    await generate(client)
+
+    course = await course_repository.save(make_course("1300"))
+    await generate(client)
+
+    assert len(executor.snapshots) == 2
+    assert executor.snapshots[0].all_courses == []
+    assert [c.id for c in executor.snapshots[1].all_courses] == [course.id]
+
+    # Updates count too, not just inserts.
+    await course_repository.save(make_course("1301", id=course.id))
+    await generate(client)
+
+    assert len(executor.snapshots) == 3
+    assert executor.snapshots[2].all_courses[0].course_number == "1301"
+    assert executor.runs[-1] == executor.snapshots[2].key
+
+
+@pytest.mark.asyncio
+async def test_saving_an_attribute_publishes_a_new_snapshot(
+    schedule_client, course_repository, course_attribute_repository
+):
+    client, executor = schedule_client
+    attribute = await course_attribute_repository.save(
+        CourseAttribute(
+            id=None,
+            name="Core",
+            degree_works_label="CORE",
+            courses_at_slu_label="core",
+        )
+    )
+    await course_repository.save(make_course("1300", attribute_ids=[attribute.id]))
+    await generate(client)
+
+    await course_attribute_repository.save(
+        CourseAttribute(
+            id=attribute.id,
+            name="University Core",
+            degree_works_label="CORE",
+            courses_at_slu_label="core",
+        )
+    )
+    await generate(client)
+
+    assert len(executor.snapshots) == 2
+    [course] = executor.snapshots[1].all_courses
+    assert [a.name for a in course.attributes] == ["University Core"]
+
+
+@pytest.mark.asyncio
+async def test_saving_a_section_publishes_a_new_snapshot(
+    schedule_client, section_repository
+):
+    client, executor = schedule_client
+    await generate(client)
+
+    await section_repository.save(
+        Section(
+            id=None,
+            crn="10001",
+            instructor_names=["Grace Hopper"],
+            campus_code="North Campus (Main Campus)",
+            description="",
+            title="Intro",
+            course_code="CSCI 1300",
+            semester="202520",
+            meeting_times=[MeetingTime(day=0, start_time="0900", end_time="0950")],
+        )
+    )
+    await generate(client)
+
+    assert len(executor.snapshots) == 2
+    assert len(executor.snapshots[0].all_sections) == 0
+    assert executor.snapshots[1].all_sections.section(0).crn == "10001"
+
+
+@pytest.mark.asyncio
+async def test_retired_snapshot_asks_the_client_to_retry(schedule_client):
+    client, executor = schedule_client
+    await generate(client)
+    assert executor.snapshots[0].semester == "202520"
+
+    # A newer catalog replaced the snapshot between publishing and running.
+    executor.retired.add(executor.snapshots[0].key)
+    response = await client.get(
+        "/api/degree-requirements/autogenerate-schedule",
+        params={"semester": "202520"},
+    )
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
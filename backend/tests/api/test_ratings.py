@@ -0,0 +1,83 @@
+import pytest
+from sqlalchemy import event
+
+from billiken_blueprint.dependencies import (
+    get_course_repository,
+    get_instructor_repository,
+    get_rating_repository,
+)
+from billiken_blueprint.domain.courses.course import Course
+from billiken_blueprint.domain.instructor import Professor
+from billiken_blueprint.domain.ratings.rating import Rating
+from billiken_blueprint.repositories.course_repository import CourseRepository
+from billiken_blueprint.repositories.instructor_repository import InstructorRepository
+from billiken_blueprint.repositories.rating_repository import RatingRepository
+from billiken_blueprint.repositories.unit_of_work import SessionFactory
+from server import app
+
+
+async def seed_ratings(instructor_repository, course_repository, rating_repository):
+    for i in range(10):
+        instructor = await instructor_repository.save(
+            Professor(None, f"Instructor {i}", None, None, None, None)
+        )
+        course = await course_repository.save(
+            Course(
+                id=None,
+                major_code="CSCI",
+                course_number=str(1000 + i),
+                attribute_ids=[],
+                prerequisites=None,
+            )
+        )
+        await rating_repository.save(
+            Rating(None, course.id, instructor.id, 1, 4, "Good")
+        )
+
+
+def count_checkouts(async_engine, request):
+    count = [0]
+
+    def on_checkout(*args):
+        count[0] += 1
+
+    event.listen(async_engine.sync_engine, "checkout", on_checkout)
+    try:
+        response = request()
+    finally:
+        event.remove(async_engine.sync_engine, "checkout", on_checkout)
+    return response, count[0]
+
+
+@pytest.mark.asyncio
+async def test_list_ratings_uses_one_connection_per_request(
+    app_client,
+    async_engine,
+    async_sessionmaker,
+    instructor_repository,
+    course_repository,
+    rating_repository,
+):
+    await seed_ratings(instructor_repository, course_repository, rating_repository)
+
+    # One session per repository call: a checkout per instructor and course.
+    response, per_call = count_checkouts(
+        async_engine, lambda: app_client.get("/api/ratings")
+    )
+    assert response.status_code == 200
+    assert len(response.json()) == 10
+    assert per_call > 20
+
+    shared = SessionFactory(async_sessionmaker)
+    app.dependency_overrides[get_instructor_repository] = lambda: (
+        InstructorRepository(shared)
+    )
+    app.dependency_overrides[get_course_repository] = lambda: CourseRepository(shared)
+    app.dependency_overrides[get_rating_repository] = lambda: RatingRepository(shared)
+
+    response, per_request = count_checkouts(
+        async_engine, lambda: app_client.get("/api/ratings")
+    )
+    assert response.status_code == 200
+    assert len(response.json()) == 10
+    assert per_request == 1
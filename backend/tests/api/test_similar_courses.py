@@ -0,0 +1,26 @@
+import numpy as np
+
+from billiken_blueprint.dependencies import get_similar_courses_graph
+from billiken_blueprint.search.similar_courses import SimilarCoursesGraph
+from server import app
+
+
+def test_similar_courses_endpoint(app_client):
+    graph = SimilarCoursesGraph.build(
+        course_ids=[1, 2, 3],
+        course_codes=["CSCI 1300", "CSCI 2100", "MATH 1510"],
+        content_hashes=["a", "b", "c"],
+        embeddings=np.array([[1.0, 0.0], [0.9, 0.1], [0.0, 1.0]]),
+        n_neighbors=2,
+    )
+    app.dependency_overrides[get_similar_courses_graph] = lambda: graph
+
+    response = app_client.get("/api/courses/1/similar", params={"limit": 1})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [c["courseCode"] for c in body] == ["CSCI 2100"]
+    assert body[0]["id"] == 2
+
+    missing = app_client.get("/api/courses/99/similar")
+    assert missing.status_code == 404
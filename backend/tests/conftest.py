@@ -21,6 +21,9 @@ from billiken_blueprint.repositories.course_attribute_repository import (
     CourseAttributeRepository,
 )
 from billiken_blueprint.repositories.rmp_review_repository import RmpReviewRepository
+from billiken_blueprint.repositories.catalog_version_repository import (
+    CatalogVersionRepository,
+)
 from server import app
 
 
@@ -123,6 +126,12 @@ def rmp_review_repository(async_sessionmaker):
     return RmpReviewRepository(async_sessionmaker)
 
 
+@pytest.fixture(scope="function")
+def catalog_version_repository(async_sessionmaker):
+    """Create a test catalog version repository using in-memory database."""
+    return CatalogVersionRepository(async_sessionmaker)
+
+
 from billiken_blueprint.dependencies import (
     get_identity_user_repository,
     get_student_repository,
@@ -133,6 +142,7 @@ from billiken_blueprint.dependencies import (
     get_rating_repository,
     get_course_attribute_repository,
     get_rmp_review_repository,
+    get_catalog_version_repository,
 )
 
 
@@ -147,6 +157,7 @@ def app_client(
     rating_repository,
     course_attribute_repository,
     rmp_review_repository,
+    catalog_version_repository,
 ):
     """Create a FastAPI test client with overridden dependencies."""
     app.dependency_overrides[get_identity_user_repository] = (
@@ -162,6 +173,9 @@ def app_client(
         lambda: course_attribute_repository
     )
     app.dependency_overrides[get_rmp_review_repository] = lambda: rmp_review_repository
+    app.dependency_overrides[get_catalog_version_repository] = (
+        lambda: catalog_version_repository
+    )
 
     test_client = TestClient(app)
     yield test_client
@@ -0,0 +1,43 @@
+import json
+import urllib.parse
+from pathlib import Path
+
+import httpx
+import pytest
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+class FakeFose:
+    """Serves recorded courses.slu.edu responses and records every request."""
+
+    def __init__(self):
+        self.requests: list[tuple[str, dict]] = []
+        self.failures: list[httpx.Response] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        route = request.url.params["route"]
+        payload = json.loads(urllib.parse.unquote(request.content.decode()))
+        self.requests.append((route, payload))
+        if self.failures:
+            return self.failures.pop(0)
+
+        if route == "search":
+            name = "search_" + payload["criteria"][0]["value"].lower()
+        else:
+            # Details fixtures are recorded per keyed section, like the API's
+            # responses: only the keyed section's instructors are detailed.
+            name = "details_" + payload["group"].removeprefix("code:").lower()
+            name += "_" + payload["key"].replace(":", "_")
+        path = FIXTURES / (name.replace(" ", "_") + ".json")
+        if not path.exists():
+            return httpx.Response(404)
+        return httpx.Response(200, json=json.loads(path.read_text()))
+
+    def routes(self, route: str) -> list[dict]:
+        return [payload for r, payload in self.requests if r == route]
+
+
+@pytest.fixture
+def fake_fose():
+    return FakeFose()
@@ -0,0 +1,72 @@
+import httpx
+import pytest
+
+from billiken_blueprint.courses_at_slu import CoursesAtSluClient, get_courses
+from billiken_blueprint.response_cache import ResponseCache
+
+
+def make_client(fake_fose, **kwargs):
+    kwargs.setdefault("cache", None)
+    return CoursesAtSluClient(
+        requests_per_second=1000,
+        backoff_base=0.001,
+        transport=httpx.MockTransport(fake_fose),
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_search_parses_listings(fake_fose):
+    async with make_client(fake_fose) as client:
+        courses = await get_courses("csci", "202520", None, client=client)
+
+    assert [course.crn for course in courses] == ["10001", "10002", "10004", "10003", "20001"]
+    assert courses[0].code == "CSCI 1300"
+    assert fake_fose.routes("search")[0]["other"] == {"srcdb": "202520"}
+
+
+@pytest.mark.asyncio
+async def test_retries_throttled_and_failed_responses(fake_fose):
+    fake_fose.failures = [
+        httpx.Response(429, headers={"Retry-After": "0"}),
+        httpx.Response(503),
+    ]
+    async with make_client(fake_fose) as client:
+        data = await client.search("202520", keyword="csci")
+
+    assert data["count"] == 5
+    assert client.stats.requests == 3
+    assert client.stats.retries == 2
+
+
+@pytest.mark.asyncio
+async def test_gives_up_after_max_retries(fake_fose):
+    fake_fose.failures = [httpx.Response(503) for _ in range(3)]
+    async with make_client(fake_fose, max_retries=2) as client:
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.search("202520", keyword="csci")
+
+    assert client.stats.requests == 3
+
+
+@pytest.mark.asyncio
+async def test_client_errors_are_not_retried(fake_fose):
+    async with make_client(fake_fose) as client:
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.search("202520", keyword="hist")
+
+    assert client.stats.requests == 1
+    assert client.stats.retries == 0
+
+
+@pytest.mark.asyncio
+async def test_cached_responses_skip_the_network(fake_fose, tmp_path):
+    cache = ResponseCache(tmp_path / "cache.sqlite3")
+    async with make_client(fake_fose, cache=cache) as client:
+        first = await client.details("CSCI 2100", "202520", ["10003"], crn="10003")
+        second = await client.details("CSCI 2100", "202520", ["10003"], crn="10003")
+
+    assert first == second
+    assert len(fake_fose.requests) == 1
+    assert client.stats.cache_hits == 1
+    assert client.stats.cache_hit_ratio == 0.5
@@ -0,0 +1,61 @@
+import httpx
+import pytest
+
+from billiken_blueprint.courses_at_slu import CatalogCrawler, CoursesAtSluClient
+
+
+@pytest.mark.asyncio
+async def test_crawl_yields_domain_sections(fake_fose):
+    async with CoursesAtSluClient(
+        cache=None,
+        requests_per_second=1000,
+        transport=httpx.MockTransport(fake_fose),
+    ) as client:
+        sections, report = await CatalogCrawler(client, "202520", workers=4).crawl(
+            ["csci"]
+        )
+
+    by_crn = {section.crn: section for section in sections}
+    # MATH 1510 matched the keyword but belongs to another department.
+    assert sorted(by_crn) == ["10001", "10002", "10003", "10004"]
+
+    section = by_crn["10003"]
+    assert section.course_code == "CSCI 2100"
+    assert section.semester == "202520"
+    assert section.title == "Data Structures"
+    assert section.campus_code == "STL"
+    assert section.instructor_names == ["Edsger Dijkstra"]
+    assert [mt.day for mt in section.meeting_times] == [0, 2, 4]
+    assert section.meeting_times[0].start_time == "1000"
+
+    # Full names for every section, not just the keyed one.
+    assert by_crn["10002"].instructor_names == ["Grace Hopper"]
+    assert by_crn["10004"].instructor_names == ["Alan Turing"]
+
+    assert (report.departments, report.courses, report.sections) == (1, 2, 4)
+    assert report.failures == []
+    assert report.failed_departments == set()
+    # One search plus one details call per distinct instructor listing of a
+    # course: CSCI 1300's third section shares its instructor with the first.
+    assert len(fake_fose.routes("search")) == 1
+    assert len(fake_fose.routes("details")) == 3
+    assert report.stats.requests == 4
+
+
+@pytest.mark.asyncio
+async def test_failures_are_reported_not_raised(fake_fose):
+    async with CoursesAtSluClient(
+        cache=None,
+        requests_per_second=1000,
+        max_retries=0,
+        transport=httpx.MockTransport(fake_fose),
+    ) as client:
+        sections, report = await CatalogCrawler(client, "202520").crawl(
+            ["csci", "hist"]
+        )
+
+    assert len(sections) == 4
+    assert report.departments == 1
+    assert len(report.failures) == 1
+    assert report.failures[0].startswith("department hist")
+    assert report.failed_departments == {"hist"}
@@ -0,0 +1,87 @@
+import json
+
+import httpx
+import pytest
+
+from billiken_blueprint.courses_at_slu import CoursesAtSluClient, get_sections
+from billiken_blueprint.courses_at_slu.get_sections import parse_sections
+from tests.courses_at_slu.conftest import FIXTURES
+
+
+def load_details(name):
+    return json.loads((FIXTURES / f"details_{name}.json").read_text())
+
+
+@pytest.mark.asyncio
+async def test_one_call_per_distinct_instructor_listing(fake_fose):
+    async with CoursesAtSluClient(
+        cache=None, transport=httpx.MockTransport(fake_fose)
+    ) as client:
+        sections = await get_sections(
+            "CSCI 1300", "202520", ["10001", "10002", "10004"], client=client
+        )
+
+    details = fake_fose.routes("details")
+    # 10004 lists the same instructor as 10001, so it is never keyed.
+    assert [payload["key"] for payload in details] == ["crn:10001", "crn:10002"]
+    assert details[0]["matched"] == "crn:10001,10002,10004"
+    assert [section.crn for section in sections] == ["10001", "10002", "10004"]
+    assert [section.instructor_names for section in sections] == [
+        ["Alan Turing"],
+        ["Grace Hopper"],
+        ["Alan Turing"],
+    ]
+    assert all(section.course_code == "CSCI 1300" for section in sections)
+    assert all(section.semester == "202520" for section in sections)
+
+
+@pytest.mark.asyncio
+async def test_placeholder_instructors_are_not_fetched(monkeypatch):
+    data = load_details("csci_1300_crn_10001")
+    data["allInGroup"][1]["instr"] = "Staff"
+    data["allInGroup"] = data["allInGroup"][:2]
+    calls = []
+
+    async def details(*args, **kwargs):
+        calls.append(kwargs)
+        return data
+
+    async with CoursesAtSluClient(cache=None) as client:
+        monkeypatch.setattr(client, "details", details)
+        _, staffed = await get_sections(
+            "CSCI 1300", "202520", ["10001", "10002"], client=client
+        )
+
+    assert calls == [{"crn": "10001"}]
+    assert staffed.instructor_names == []
+
+
+def test_parse_sections_per_crn_fields():
+    first, second, _ = parse_sections(
+        load_details("csci_1300_crn_10001"), "CSCI 1300", "202520"
+    )
+
+    assert [(mt.day, mt.start_time) for mt in first.meeting_times] == [
+        (0, "900"),
+        (2, "900"),
+    ]
+    assert [(mt.day, mt.end_time) for mt in second.meeting_times] == [
+        (1, "1215"),
+        (3, "1215"),
+    ]
+    # Full names for the detailed section, the listing's names otherwise.
+    assert first.instructor_names == ["Alan Turing"]
+    assert second.instructor_names == ["G. Hopper"]
+    assert first.campus_code == second.campus_code == "STL"
+    assert second.description == "An introduction to programming with objects."
+
+
+def test_parse_sections_prefers_entry_campus():
+    data = load_details("csci_1300_crn_10001")
+    data["allInGroup"][1]["campus_code"] = "MAD"
+    data["allInGroup"][1]["meetingTimes"] = ""
+
+    _, second, _ = parse_sections(data, "CSCI 1300", "202520")
+
+    assert second.campus_code == "MAD"
+    assert second.meeting_times == []
@@ -0,0 +1,169 @@
+import json
+
+import pytest
+
+from billiken_blueprint.courses_at_slu.prereq_parser import (
+    PrereqParseError,
+    parse_prereqs,
+)
+from billiken_blueprint.domain.courses.course_code import CourseCode
+from billiken_blueprint.domain.courses.course_prerequisite import (
+    NestedCoursePrerequisite,
+)
+from tests.courses_at_slu.conftest import FIXTURES
+
+
+def link(code, text=None):
+    return (
+        f'<a href="/search/?p={code.replace(" ", "%20")}" data-action="result-detail" '
+        f'data-group="code:{code}" >{text or code}</a>'
+    )
+
+
+def course(major_code, course_number, end_number=None, concurrent_allowed=False):
+    return {
+        "major_code": major_code,
+        "course_number": course_number,
+        "end_number": end_number,
+        "concurrent_allowed": concurrent_allowed,
+    }
+
+
+def canonical(node):
+    """Structure of a prerequisite tree, ignoring operand order and redundant
+    grouping (single-operand, nested same-operator and empty groups)."""
+    if "operator" not in node:
+        return (
+            node["major_code"],
+            str(node["course_number"]),
+            node["end_number"],
+            node["concurrent_allowed"],
+        )
+    operands = set()
+    for operand in node["operands"]:
+        operand = canonical(operand)
+        if operand is None:
+            continue
+        if isinstance(operand, tuple) and operand[0] == node["operator"]:
+            operands |= operand[1]
+        else:
+            operands.add(operand)
+    if not operands:
+        return None
+    if len(operands) == 1:
+        return operands.pop()
+    return (node["operator"], frozenset(operands))
+
+
+# A hand-written unit corpus, not catalog data: the raw snippets were not kept
+# with data_dumps/courses.json, so each snippet here was written in
+# courses.slu.edu markup to describe the prerequisites stored for that course
+# (only CSCI 1300's is the real catalog snippet, from ai/course_prereqs_gemini.py).
+# Passing shows the grammar covers these shapes, not that the parser agrees
+# with the model on real catalog text.
+CORPUS = json.loads((FIXTURES / "prereq_corpus.json").read_text())
+
+
+@pytest.mark.parametrize(
+    "entry", CORPUS, ids=[entry["course_code"] for entry in CORPUS]
+)
+def test_parses_hand_written_corpus(entry):
+    assert canonical(parse_prereqs(entry["snippet"])) == canonical(entry["expected"])
+
+
+def test_single_course_with_grade():
+    assert parse_prereqs(link("CSCI 5030") + " with a grade of C- or higher") == {
+        "operator": "AND",
+        "operands": [course("CSCI", "5030")],
+    }
+
+
+def test_comma_list_takes_final_conjunction():
+    text = f"{link('MATH 1510')}, {link('MATH 1520')}, or {link('MATH 2530')}"
+    assert parse_prereqs(text) == {
+        "operator": "OR",
+        "operands": [
+            course("MATH", "1510"),
+            course("MATH", "1520"),
+            course("MATH", "2530"),
+        ],
+    }
+
+
+def test_semicolons_join_clauses_with_and():
+    text = (
+        f"{link('CSCI 2300')}; ({link('CSCI 2510')} or "
+        f"{link('ECE 3127')} (Can be taken Concurrently))"
+    )
+    assert parse_prereqs(text) == {
+        "operator": "AND",
+        "operands": [
+            course("CSCI", "2300"),
+            {
+                "operator": "OR",
+                "operands": [
+                    course("CSCI", "2510"),
+                    course("ECE", "3127", concurrent_allowed=True),
+                ],
+            },
+        ],
+    }
+
+
+def test_ranges_from_links_and_plain_text():
+    linked = f"0 Course from {link('THEO 1600')}-{link('THEO 1699', '1699')}"
+    assert parse_prereqs(linked)["operands"] == [course("THEO", "1600", 1699)]
+    assert parse_prereqs("SPAN 3021-3999")["operands"] == [
+        course("SPAN", "3021", 3999)
+    ]
+
+
+def test_non_course_requirements_are_omitted():
+    text = f"({link('MATH 1400')} or 1520 on the Math Placement Exam); Junior standing"
+    assert parse_prereqs(text) == {
+        "operator": "AND",
+        "operands": [course("MATH", "1400")],
+    }
+    assert parse_prereqs(link("SLU CORE")) == {"operator": "AND", "operands": []}
+
+
+def test_output_loads_as_domain_prerequisite():
+    text = f"{link('CSCI 1300')} and {link('MATH 1660')} (Can be taken Concurrently)"
+    prerequisite = NestedCoursePrerequisite.from_dict(parse_prereqs(text))
+
+    assert prerequisite.is_satisfied_by(
+        [CourseCode("CSCI", "1300"), CourseCode("MATH", "1660")]
+    )
+    assert not prerequisite.is_satisfied_by([CourseCode("CSCI", "1300")])
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        f"({link('CSCI 1300')} or {link('CSCI 1010')}",
+        f"{link('CSCI 1300')} or {link('CSCI 1010')} and {link('MATH 1660')}",
+        f"{link('CSCI 1300')} {link('CSCI 1010')}",
+        f"{link('CSCI 1010')}-{link('MATH 1090', '1090')}",
+        f"{link('CSCI 1300')})",
+    ],
+    ids=["unbalanced", "mixed-conjunctions", "adjacent", "cross-major", "extra-paren"],
+)
+def test_ambiguous_snippets_are_rejected(text):
+    with pytest.raises(PrereqParseError):
+        parse_prereqs(text)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        f"Not open to students with credit in {link('CSCI 1010')}",
+        f"{link('CSCI 1010')} or permission of instructor",
+        f"Two of {link('CSCI 1010')}, {link('CSCI 1020')}, {link('CSCI 1030')}",
+        f"2 Courses from {link('CSCI 1010')}-{link('CSCI 1090', '1090')}",
+    ],
+    ids=["exclusion", "permission", "count-word", "count"],
+)
+def test_unrecognised_text_is_rejected(text):
+    # Dropping the text would turn each of these into a hard requirement.
+    with pytest.raises(PrereqParseError):
+        parse_prereqs(text)
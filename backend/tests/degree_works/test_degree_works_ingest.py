@@ -0,0 +1,111 @@
+import copy
+import json
+from pathlib import Path
+
+import httpx
+import pytest
+
+from billiken_blueprint.degree_works import DegreeWorksClient
+from billiken_blueprint.degree_works.api import DegreeWorksDegrees, parse_audit
+from billiken_blueprint.degree_works.ingest import AuditStore, ingest_degrees
+from billiken_blueprint.domain.degrees.degree_requirement import (
+    CourseInRange,
+    CourseWithAttribute,
+    DegreeRequirement,
+)
+from billiken_blueprint.response_cache import ResponseCache
+
+AUDIT = json.loads((Path(__file__).parent / "fixtures" / "audit_cs_bs.json").read_text())
+DEGREES = [DegreeWorksDegrees.cs_bs, DegreeWorksDegrees.cs_ba, DegreeWorksDegrees.math_bs]
+
+
+class FakeDegreeWorks:
+    def __init__(self):
+        self.audits = {}
+        self.requests = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content)
+        major = payload["goals"][0]["value"]
+        self.requests.append((major, payload["degree"], payload["catalogYear"]))
+        audit = self.audits.get((major, payload["degree"]), AUDIT)
+        # Every run stamps a new header, which must not count as a change.
+        audit = {**audit, "auditHeader": {"auditId": str(len(self.requests))}}
+        return httpx.Response(200, json=audit)
+
+
+def make_client(fake):
+    return DegreeWorksClient(
+        "session=abc",
+        "001",
+        requests_per_second=1000,
+        max_in_flight=4,
+        transport=httpx.MockTransport(fake),
+    )
+
+
+async def ingest_and_save(fake, store, catalog_year="2025", refresh=False):
+    async with make_client(fake) as client:
+        results = await ingest_degrees(
+            DEGREES, catalog_year, client, store, refresh=refresh
+        )
+    for result in results:
+        if result.changed:
+            await store.mark_parsed(
+                result.degree, result.catalog_year, result.content_hash
+            )
+    return results
+
+
+def test_parse_audit_builds_domain_requirements():
+    requirements = parse_audit(AUDIT)
+
+    assert [requirement.label for requirement in requirements] == [
+        "Cura Personalis 1: Self in Community",
+        "Any course with the Reflection attribute",
+        "Data Structures",
+        "Upper Division Electives",
+    ]
+    assert requirements[1].course_rules.courses == [
+        CourseWithAttribute(attribute_names=["CRFA"])
+    ]
+    electives = requirements[3]
+    assert electives.needed == 3
+    assert electives.course_rules.courses == [CourseInRange("CSCI", "3000", "4999")]
+    # Saved requirements load back through the domain model.
+    assert DegreeRequirement.from_dict(electives.to_dict()) == electives
+
+
+@pytest.mark.asyncio
+async def test_audits_are_fetched_once_per_catalog_year(tmp_path):
+    fake = FakeDegreeWorks()
+    store = AuditStore(ResponseCache(tmp_path / "audits.sqlite3"))
+
+    first = await ingest_and_save(fake, store)
+    second = await ingest_and_save(fake, store)
+
+    assert len(fake.requests) == 3
+    assert all(result.fetched and result.changed for result in first)
+    assert not any(result.fetched or result.changed for result in second)
+
+
+@pytest.mark.asyncio
+async def test_refresh_parses_only_changed_degrees(tmp_path):
+    fake = FakeDegreeWorks()
+    store = AuditStore(ResponseCache(tmp_path / "audits.sqlite3"))
+    await ingest_and_save(fake, store)
+
+    changed = copy.deepcopy(AUDIT)
+    changed["blockArray"][1]["ruleArray"][0]["requirement"]["courseArray"][0][
+        "number"
+    ] = "2300"
+    fake.audits[("MATH", "BS")] = changed
+    results = await ingest_and_save(fake, store, catalog_year="2026")
+
+    assert len(fake.requests) == 6
+    assert {result.degree.major: result.changed for result in results} == {
+        "CS": False,
+        "MATH": True,
+    }
+    math = next(result for result in results if result.degree.major == "MATH")
+    assert math.requirements[2].course_rules.courses[0].course_number == "2300"
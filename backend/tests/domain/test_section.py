@@ -0,0 +1,71 @@
+import dataclasses
+import pickle
+
+import pytest
+
+from billiken_blueprint.domain.courses.course import Course
+from billiken_blueprint.domain.section import MeetingTime, Section, time_to_minutes
+
+
+def make_section(instructor="Jane Doe", campus="North Campus (Main Campus)"):
+    return Section(
+        id=1,
+        crn="10001",
+        instructor_names=["".join(instructor)],
+        campus_code="".join(campus),
+        description="",
+        title="Intro",
+        course_code="CSCI 1300",
+        semester="202520",
+        meeting_times=[MeetingTime(day="0", start_time="0900", end_time="0950")],
+    )
+
+
+def test_time_to_minutes():
+    assert time_to_minutes("0900") == 540
+    assert time_to_minutes("09:50") == 590
+    assert time_to_minutes("1315") == 795
+    assert time_to_minutes("TBA") is None
+
+
+def test_meeting_times_overlap_by_minutes():
+    monday_nine = MeetingTime(day=0, start_time="0900", end_time="0950")
+
+    assert monday_nine.overlaps(MeetingTime(day=0, start_time="0930", end_time="1045"))
+    assert not monday_nine.overlaps(MeetingTime(day=0, start_time="0950", end_time="1040"))
+    assert not monday_nine.overlaps(MeetingTime(day=1, start_time="0900", end_time="0950"))
+    assert not monday_nine.overlaps(MeetingTime(day=0, start_time="", end_time=""))
+    assert (monday_nine.start_minute, monday_nine.end_minute) == (540, 590)
+
+
+def test_meeting_time_keeps_its_original_format():
+    meeting_time = MeetingTime(day="2", start_time="0900", end_time="0950")
+
+    assert meeting_time == MeetingTime(day=2, start_time="0900", end_time="0950")
+    assert make_section().to_dict()["meeting_times"] == [
+        {"day": 0, "start_time": "0900", "end_time": "0950"}
+    ]
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        meeting_time.day = 3
+
+
+def test_sections_share_repeated_strings():
+    # Built from separate string objects, as rows decoded from the database are.
+    first, second = make_section(), make_section()
+
+    assert first.campus_code is second.campus_code
+    assert first.instructor_names[0] is second.instructor_names[0]
+    assert not hasattr(first, "__dict__")
+
+
+def test_catalog_objects_survive_pickling():
+    course = Course(
+        id=1, major_code="CSCI", course_number="1300", attribute_ids=[], prerequisites=None
+    )
+    assert pickle.loads(pickle.dumps(course)) == course
+
+    # A snapshot keeps sharing the strings its sections shared.
+    sections = pickle.loads(pickle.dumps([make_section(), make_section()]))
+    assert sections == [make_section(), make_section()]
+    assert sections[0].campus_code is sections[1].campus_code
+    assert sections[0].meeting_times[0].start_minute == 540
@@ -0,0 +1,120 @@
+import pickle
+import random
+
+
+from billiken_blueprint.domain.degrees.degree import section_overlaps_timeslots
+from billiken_blueprint.domain.section import MeetingTime, Section
+from billiken_blueprint.domain.section_table import SectionTable
+from billiken_blueprint.domain.student import TimeSlot
+
+
+def make_section(
+    id, course_code="CSCI 1300", campus="Main", instructors=("A",), times=()
+):
+    return Section(
+        id=id,
+        crn=str(10000 + (id or 0)),
+        instructor_names=list(instructors),
+        campus_code=campus,
+        description="",
+        title=course_code,
+        course_code=course_code,
+        semester="202520",
+        meeting_times=[
+            MeetingTime(day=day, start_time=start, end_time=end)
+            for day, start, end in times
+        ],
+    )
+
+
+SECTIONS = [
+    make_section(1, times=[(0, "0900", "0950"), (2, "0900", "0950")]),
+    make_section(2, "MATH 1510", campus="Madrid", instructors=("B", "C")),
+    make_section(None, "CSCI 2100", instructors=(), times=[(1, "1100", "1215")]),
+    make_section(4, "CSCI 2100", times=[(1, "1103", "1152")]),
+]
+
+
+def test_round_trips_sections():
+    table = SectionTable.from_sections(SECTIONS)
+
+    assert len(table) == 4
+    assert table.sections(range(4)) == SECTIONS
+    assert table.course_codes == ["CSCI 1300", "MATH 1510", "CSCI 2100"]
+    assert table.course_index.tolist() == [0, 1, 2, 2]
+    assert pickle.loads(pickle.dumps(table)).sections([3]) == [SECTIONS[3]]
+
+
+def test_vectorized_filters():
+    table = SectionTable.from_sections(SECTIONS)
+
+    assert table.campus_is("Madrid").tolist() == [False, True, False, False]
+    assert not table.campus_is("Online").any()
+    assert table.has_id([2, 4, 99]).tolist() == [False, True, False, True]
+
+    madrid = table.take(table.campus_is("Madrid"))
+    assert madrid.sections(range(len(madrid))) == [SECTIONS[1]]
+
+
+def test_mean_instructor_rating():
+    table = SectionTable.from_sections(SECTIONS)
+    ratings = {"A": 4.0, "B": 2.0}
+
+    means = table.mean_instructor_rating(ratings.get)
+
+    # C is unrated, so section 2 averages B alone; section 3 has no instructors.
+    assert means.tolist() == [4.0, 2.0, 0.0, 4.0]
+
+
+def test_overlaps_match_meeting_times():
+    rng = random.Random(0)
+
+    def random_time():
+        # Mostly on the five-minute grid, sometimes off it or unparseable.
+        minute = rng.choice([rng.randrange(0, 1440, 5), rng.randrange(0, 1440), None])
+        return "" if minute is None else f"{minute // 60:02d}{minute % 60:02d}"
+
+    def random_meetings(n):
+        return [(rng.randrange(0, 8), random_time(), random_time()) for _ in range(n)]
+
+    sections = [
+        make_section(i, times=random_meetings(rng.randrange(0, 4))) for i in range(300)
+    ]
+    table = SectionTable.from_sections(sections)
+
+    for _ in range(50):
+        slots = [TimeSlot(day, start, end) for day, start, end in random_meetings(3)]
+        expected = [section_overlaps_timeslots(s, slots) for s in sections]
+        assert table.overlaps_timeslots(slots).tolist() == expected
+
+        rows = rng.sample(range(len(sections)), 2)
+        expected = [
+            any(s.overlaps(sections[row]) for row in rows) for s in sections
+        ]
+        assert table.overlaps_rows(rows).tolist() == expected
+
+
+def test_overlap_on_the_grid_uses_the_mask():
+    table = SectionTable.from_sections(SECTIONS)
+
+    # Back to back does not overlap; the off-grid section 4 is checked exactly.
+    assert table.overlaps_timeslots([TimeSlot(0, "0950", "1040")]).tolist() == [
+        False,
+        False,
+        False,
+        False,
+    ]
+    assert table.overlaps_timeslots([TimeSlot(1, "1150", "1200")]).tolist() == [
+        False,
+        False,
+        True,
+        True,
+    ]
+    assert table.overlaps_timeslots([TimeSlot(1, "1152", "1155")]).tolist() == [
+        False,
+        False,
+        True,
+        False,
+    ]
+    assert not table.overlaps_timeslots([]).any()
+    assert table.exact_masks.tolist() == [True, True, True, False]
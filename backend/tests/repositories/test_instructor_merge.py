@@ -0,0 +1,111 @@
+import pytest
+
+from billiken_blueprint.domain.instructor import Professor
+from billiken_blueprint.domain.ratings.rating import Rating
+from billiken_blueprint.domain.ratings.rmp_review import RmpReview
+from billiken_blueprint.repositories.instructor_repository import InstructorMerge
+
+
+def make_review(comment, instructor_id):
+    return RmpReview(
+        id=None,
+        instructor_id=instructor_id,
+        course="CSCI 1300",
+        quality=4.0,
+        difficulty=2.0,
+        comment=comment,
+        would_take_again=True,
+        grade="A",
+        attendance=None,
+        tags=[],
+        review_date=None,
+    )
+
+
+async def save(repository, name, **fields):
+    return await repository.save(
+        Professor(
+            id=None,
+            name=name,
+            rmp_rating=fields.get("rmp_rating"),
+            rmp_num_ratings=fields.get("rmp_num_ratings"),
+            rmp_url=fields.get("rmp_url"),
+            department=fields.get("department"),
+        )
+    )
+
+
+async def seed(instructor_repository, rating_repository, rmp_review_repository):
+    ahn = await save(instructor_repository, "Ted Ahn")
+    tae = await save(
+        instructor_repository,
+        "Tae Ahn",
+        rmp_rating=4.1,
+        rmp_num_ratings=30,
+        rmp_url="https://www.ratemyprofessors.com/professor/1",
+        department="Computer Science",
+    )
+    gill = await save(instructor_repository, "Jim Gill", department="Mathematics")
+    james = await save(instructor_repository, "James Gill", department="Math")
+    await rating_repository.save(
+        Rating(None, None, tae.id, 1, 4, "Great", difficulty=2.0)
+    )
+    await rmp_review_repository.save(make_review("a", instructor_id=tae.id))
+    await rmp_review_repository.save(make_review("b", instructor_id=gill.id))
+    merges = [
+        InstructorMerge(tae.id, ahn.id, "Ted Ahn"),
+        InstructorMerge(james.id, gill.id, "James Gill"),
+    ]
+    return ahn, tae, gill, james, merges
+
+
+@pytest.mark.asyncio
+async def test_merge_moves_references_and_fills_missing_fields(
+    instructor_repository, rating_repository, rmp_review_repository
+):
+    ahn, tae, gill, james, merges = await seed(
+        instructor_repository, rating_repository, rmp_review_repository
+    )
+
+    report = await instructor_repository.merge(merges)
+
+    assert (report.merged, report.ratings_moved, report.reviews_moved) == (2, 1, 1)
+    assert await instructor_repository.get_by_id(tae.id) is None
+    assert await instructor_repository.get_by_id(james.id) is None
+
+    merged_ahn = await instructor_repository.get_by_id(ahn.id)
+    assert merged_ahn.rmp_rating == 4.1
+    assert merged_ahn.rmp_num_ratings == 30
+    assert merged_ahn.department == "Computer Science"
+    merged_gill = await instructor_repository.get_by_id(gill.id)
+    assert merged_gill.name == "James Gill"
+    # The canonical instructor keeps its own department.
+    assert merged_gill.department == "Mathematics"
+
+    ratings = await rating_repository.get_all(instructor_id=ahn.id)
+    assert len(ratings) == 1
+    assert len(await rmp_review_repository.get_stored_by_instructor_id(ahn.id)) == 1
+    assert report.changes[gill.id] == {"name": ("Jim Gill", "James Gill")}
+    assert report.changes[ahn.id]["rmp_rating"] == (None, 4.1)
+
+
+@pytest.mark.asyncio
+async def test_dry_run_reports_without_writing(
+    instructor_repository, rating_repository, rmp_review_repository
+):
+    ahn, tae, gill, james, merges = await seed(
+        instructor_repository, rating_repository, rmp_review_repository
+    )
+
+    report = await instructor_repository.merge(merges, dry_run=True)
+
+    assert report.dry_run
+    assert (report.merged, report.ratings_moved, report.reviews_moved) == (2, 1, 1)
+    assert "Would merge 2" in str(report)
+    assert await instructor_repository.get_by_id(tae.id) is not None
+    assert (await instructor_repository.get_by_id(gill.id)).name == "Jim Gill"
+    assert len(await rmp_review_repository.get_stored_by_instructor_id(tae.id)) == 1
+
+    # The temporary mapping table is gone, so a real merge can follow.
+    report = await instructor_repository.merge(merges)
+    assert report.merged == 2
@@ -340,3 +340,37 @@ class TestRmpReviewRepository:
 
         assert saved.id is not None
         assert saved.course_id is None
+
+    async def test_backfill_course_ids(
+        self, rmp_review_repository: RmpReviewRepository
+    ):
+        """Test listing reviews without a course ID and setting them in bulk."""
+        saved = []
+        for course, course_id in [("CSCI 3100", None), ("MATH1510", None), ("CSCI 2100", 7)]:
+            saved.append(
+                await rmp_review_repository.save(
+                    RmpReview(
+                        id=None,
+                        instructor_id=10,
+                        course=course,
+                        course_id=course_id,
+                        quality=4.0,
+                        difficulty=2.0,
+                        comment="Fine",
+                        would_take_again=True,
+                        grade="A",
+                        attendance=None,
+                        tags=[],
+                        review_date=None,
+                    )
+                )
+            )
+
+        missing = await rmp_review_repository.get_without_course_id()
+        assert sorted(missing) == [(saved[0].id, "CSCI 3100"), (saved[1].id, "MATH1510")]
+
+        await rmp_review_repository.set_course_ids({saved[0].id: 31, saved[1].id: 15})
+
+        stored = await rmp_review_repository.get_stored_by_instructor_id(10)
+        assert sorted(review.course_id for review in stored) == [7, 15, 31]
+        assert await rmp_review_repository.get_without_course_id() == []
@@ -150,6 +150,34 @@ class TestSectionRepository:
         assert len(spring_sections) == 1
         assert spring_sections[0].semester == "Spring 2025"
 
+    async def test_get_table_for_semester(self, section_repository: SectionRepository):
+        """Test loading a semester's sections as a columnar table."""
+        saved = [
+            await section_repository.save(
+                Section(
+                    id=None,
+                    crn=crn,
+                    instructor_names=["Dr. C", "Dr. D"][: i + 1],
+                    campus_code="MAIN",
+                    description="Algorithms",
+                    title="CSCI 3100",
+                    course_code="CSCI-3100",
+                    semester="Fall 2024",
+                    meeting_times=[
+                        MeetingTime(day=i, start_time="10:00", end_time="10:50")
+                    ],
+                )
+            )
+            for i, crn in enumerate(["33333", "55555"])
+        ]
+
+        table = await section_repository.get_table_for_semester("Fall 2024")
+
+        assert len(table) == 2
+        assert table.sections(range(len(table))) == saved
+        assert table.course_codes == ["CSCI-3100"]
+        assert len(await section_repository.get_table_for_semester("Spring 2025")) == 0
+
     async def test_get_by_course_code_and_semester(
         self, section_repository: SectionRepository
     ):
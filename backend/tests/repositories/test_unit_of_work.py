@@ -0,0 +1,125 @@
+import asyncio
+import time
+
+import pytest
+from sqlalchemy import event
+
+from billiken_blueprint.domain.instructor import Professor
+from billiken_blueprint.repositories.instructor_repository import InstructorRepository
+from billiken_blueprint.repositories.unit_of_work import (
+    SessionFactory,
+    run_concurrently,
+    unit_of_work,
+)
+
+
+@pytest.fixture
+def checkouts(async_engine):
+    """Count connections checked out of the engine's pool."""
+    count = [0]
+
+    def on_checkout(*args):
+        count[0] += 1
+
+    event.listen(async_engine.sync_engine, "checkout", on_checkout)
+    yield count
+    event.remove(async_engine.sync_engine, "checkout", on_checkout)
+
+
+@pytest.fixture
+def repository(async_sessionmaker):
+    return InstructorRepository(SessionFactory(async_sessionmaker))
+
+
+def professor(name, rating=None, id=None):
+    return Professor(
+        id=id,
+        name=name,
+        rmp_rating=rating,
+        rmp_num_ratings=None,
+        rmp_url=None,
+        department=None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_each_call_checks_out_a_connection_without_unit_of_work(
+    repository, checkouts
+):
+    saved = await repository.save(professor("Ada Lovelace"))
+    checkouts[0] = 0
+
+    for _ in range(5):
+        await repository.get_by_id(saved.id)
+
+    assert checkouts[0] == 5
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_shares_one_connection(repository, checkouts):
+    saved = await repository.save(professor("Ada Lovelace"))
+    checkouts[0] = 0
+
+    async with unit_of_work():
+        for _ in range(5):
+            assert (await repository.get_by_id(saved.id)).name == "Ada Lovelace"
+        await repository.get_all()
+
+    assert checkouts[0] == 1
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_sees_its_own_writes(repository):
+    async with unit_of_work():
+        saved = await repository.save(professor("Ada Lovelace", rating=3.0))
+        assert (await repository.get_by_id(saved.id)).rmp_rating == 3.0
+
+        await repository.save(professor("Ada Lovelace", rating=4.5, id=saved.id))
+
+        assert (await repository.get_by_id(saved.id)).rmp_rating == 4.5
+
+    # Writes are committed, not discarded with the unit of work.
+    assert (await repository.get_by_id(saved.id)).rmp_rating == 4.5
+
+
+@pytest.mark.asyncio
+async def test_failed_call_does_not_poison_the_unit_of_work(repository):
+    async with unit_of_work():
+        saved = await repository.save(professor("Ada Lovelace"))
+        with pytest.raises(Exception):
+            await repository.save(professor(None, id=saved.id))
+
+        assert (await repository.get_by_id(saved.id)).name == "Ada Lovelace"
+
+
+@pytest.mark.asyncio
+async def test_run_concurrently_overlaps_loads():
+    async def load(value):
+        await asyncio.sleep(0.1)
+        return value
+
+    start = time.perf_counter()
+    results = await run_concurrently(load("a"), load("b"), load("c"))
+
+    assert results == ["a", "b", "c"]
+    assert time.perf_counter() - start < 0.25
+
+
+@pytest.mark.asyncio
+async def test_run_concurrently_gives_each_load_its_own_session(
+    repository, checkouts
+):
+    saved = await repository.save(professor("Ada Lovelace"))
+    checkouts[0] = 0
+
+    async with unit_of_work():
+        await repository.get_all()
+        found, everyone = await run_concurrently(
+            repository.get_by_id(saved.id), repository.get_all()
+        )
+        # Back on the request's shared session afterwards.
+        await repository.get_by_id(saved.id)
+
+    assert found.name == "Ada Lovelace"
+    assert [p.name for p in everyone] == ["Ada Lovelace"]
+    assert checkouts[0] == 3
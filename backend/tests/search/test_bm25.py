@@ -0,0 +1,81 @@
+from billiken_blueprint.domain.courses.course import CourseWithDescription
+from billiken_blueprint.search.bm25 import Bm25Index, tokenize
+
+
+def course(id, code, title, description):
+    major_code, course_number = code.split()
+    return CourseWithDescription(
+        major_code=major_code,
+        course_number=course_number,
+        id=id,
+        attribute_ids=[],
+        prerequisites=None,
+        description=description,
+        title=title,
+    )
+
+
+COURSES = [
+    course(1, "CSCI 1300", "Intro to Object-Oriented Programming", "Programming in Python."),
+    course(2, "CSCI 2100", "Data Structures", "Lists, trees, hash tables and graphs."),
+    course(3, "CSCI 4710", "Databases", "Relational design and SQL queries."),
+    course(4, "CSCI 4750", "Machine Learning", "Supervised and unsupervised learning."),
+    course(5, "CSCI 5750", "Machine Learning", "Graduate machine learning."),
+    course(6, "MATH 2100", "Linear Algebra", "Vectors and matrices."),
+    course(7, "PHIL 1050", "Ethics", ""),
+]
+
+
+def test_tokenize_normalizes_course_codes():
+    assert tokenize("csci-2100")[0] == "csci2100"
+    assert tokenize("CSCI 2100")[0] == "csci2100"
+    assert "c++" in tokenize("Intro to C++")
+
+
+def test_courses_without_descriptions_are_not_indexed():
+    index = Bm25Index.from_courses(COURSES)
+
+    assert len(index) == 6
+    assert index.search("ethics") == []
+
+
+def test_search_ranks_exact_code_first():
+    index = Bm25Index.from_courses(COURSES)
+
+    rows = [row for row, _ in index.search("CSCI 2100")]
+
+    assert index.metadatas[rows[0]]["course_code"] == "CSCI 2100"
+    assert "MATH 2100" in [index.metadatas[row]["course_code"] for row in rows]
+
+
+def test_search_matches_technology_names():
+    index = Bm25Index.from_courses(COURSES)
+
+    rows = [row for row, _ in index.search("SQL")]
+
+    assert [index.ids[row] for row in rows] == ["doc_3"]
+
+
+def test_search_applies_exclusions_and_course_level():
+    index = Bm25Index.from_courses(COURSES)
+
+    rows = [
+        row
+        for row, _ in index.search(
+            "machine learning", excluded_course_ids=[4], max_course_int=5000
+        )
+    ]
+
+    assert rows == []
+
+
+def test_strong_matches_by_code_and_exact_title():
+    index = Bm25Index.from_courses(COURSES)
+
+    by_code = index.strong_matches("what is csci4710 like?")
+    by_title = index.strong_matches("Machine learning", max_course_int=5000)
+    weak = index.strong_matches("learning about trees")
+
+    assert [index.ids[row] for row in by_code] == ["doc_3"]
+    assert [index.ids[row] for row in by_title] == ["doc_4"]
+    assert weak == []
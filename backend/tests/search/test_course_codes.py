@@ -0,0 +1,37 @@
+from billiken_blueprint.domain.courses.course import Course
+from billiken_blueprint.search.course_codes import (
+    CourseCodeResolver,
+    extract_course_code,
+    normalize_course_code,
+)
+
+
+def make_course(id, major_code, course_number):
+    return Course(
+        id=id,
+        major_code=major_code,
+        course_number=course_number,
+        attribute_ids=[],
+        prerequisites=None,
+    )
+
+
+def test_extract_course_code():
+    assert extract_course_code("CSCI 3100") == "CSCI3100"
+    assert extract_course_code("csci3100") == "CSCI3100"
+    assert extract_course_code("CSCI-3100 Algorithms") == "CSCI3100"
+    assert extract_course_code("Algorithms") is None
+    assert extract_course_code(None) is None
+    assert normalize_course_code("math - 1510") == "MATH1510"
+
+
+def test_resolver_maps_review_courses_to_ids():
+    resolver = CourseCodeResolver(
+        [make_course(1, "CSCI", "3100"), make_course(2, "MATH", "1510")]
+    )
+
+    assert len(resolver) == 2
+    assert resolver.resolve("CSCI3100") == 1
+    assert resolver.resolve("math 1510") == 2
+    assert resolver.resolve("CSCI 9999") is None
+    assert resolver.resolve("") is None
@@ -0,0 +1,114 @@
+import pytest
+from google.genai import types
+
+from billiken_blueprint.domain.courses.course import CourseWithDescription
+from billiken_blueprint.search.embedding_build import build_course_embeddings
+from billiken_blueprint.search.vector_index import NumpyVectorIndex
+
+
+def course(id, description):
+    return CourseWithDescription(
+        major_code="CSCI",
+        course_number=str(1000 + id),
+        id=id,
+        attribute_ids=[],
+        prerequisites=None,
+        description=description,
+    )
+
+
+class FakeEmbedder:
+    def __init__(self, fail_on_call=None):
+        self.batches = []
+        self.fail_on_call = fail_on_call
+
+    def __call__(self, batch):
+        self.batches.append([c.id for c in batch])
+        if len(self.batches) == self.fail_on_call:
+            raise RuntimeError("quota exceeded")
+        return [types.ContentEmbedding(values=[1.0, float(c.id)]) for c in batch]
+
+
+async def build(courses, index, embedder, **kwargs):
+    kwargs.setdefault("batch_size", 2)
+    kwargs.setdefault("max_in_flight", 1)
+    return await build_course_embeddings(
+        courses,
+        index,
+        embed_batch=embedder,
+        model_version="test-model",
+        requests_per_minute=60_000,
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_embeds_all_courses_in_batches():
+    index = NumpyVectorIndex()
+    embedder = FakeEmbedder()
+    courses = [course(i, f"desc {i}") for i in range(1, 6)] + [course(6, "")]
+
+    report = await build(courses, index, embedder)
+
+    assert sorted(map(len, embedder.batches)) == [1, 2, 2]
+    assert index.count() == 5
+    assert report.embedded == 5
+    assert report.total == 5
+
+
+@pytest.mark.asyncio
+async def test_second_run_only_embeds_changes():
+    index = NumpyVectorIndex()
+    await build([course(i, f"desc {i}") for i in range(1, 5)], index, FakeEmbedder())
+
+    embedder = FakeEmbedder()
+    report = await build(
+        [course(1, "desc 1"), course(2, "new desc"), course(3, "desc 3")],
+        index,
+        embedder,
+    )
+
+    assert embedder.batches == [[2]]
+    assert report.unchanged == 2
+    assert report.deleted == 1
+    assert index.get()["ids"] == ["doc_1", "doc_2", "doc_3"]
+    assert index.get(ids="doc_2")["documents"] == ["new desc"]
+
+
+@pytest.mark.asyncio
+async def test_model_version_change_reembeds_everything():
+    index = NumpyVectorIndex()
+    courses = [course(i, f"desc {i}") for i in range(1, 4)]
+    await build(courses, index, FakeEmbedder())
+
+    embedder = FakeEmbedder()
+    report = await build_course_embeddings(
+        courses, index, embedder, model_version="other-model", batch_size=None
+    )
+
+    assert embedder.batches == [[1, 2, 3]]
+    assert report.embedded == 3
+
+
+@pytest.mark.asyncio
+async def test_interrupted_build_resumes_from_checkpoint(tmp_path):
+    index = NumpyVectorIndex()
+    courses = [course(i, f"desc {i}") for i in range(1, 7)]
+
+    with pytest.raises(RuntimeError):
+        await build(
+            courses,
+            index,
+            FakeEmbedder(fail_on_call=2),
+            checkpoint=lambda: index.save(tmp_path),
+        )
+
+    resumed = NumpyVectorIndex.load(tmp_path, mmap=False)
+    assert resumed.get()["ids"] == ["doc_1", "doc_2"]
+
+    embedder = FakeEmbedder()
+    report = await build(courses, resumed, embedder)
+
+    assert sorted(id for batch in embedder.batches for id in batch) == [3, 4, 5, 6]
+    assert report.unchanged == 2
+    assert resumed.count() == 6
@@ -0,0 +1,75 @@
+from billiken_blueprint.search.name_matcher import (
+    NameMatcher,
+    name_key,
+    preferred_name,
+    soundex,
+)
+
+INSTRUCTORS = [
+    ("James Gill", 1),
+    ("Gregory Smith", 2),
+    ("Abigail Stylianou", 3),
+    ("Tae Ahn", 4),
+    ("Jamal Abdul-Hafidh", 5),
+    ("Kate Holdener", 6),
+    ("Michael Liljegren", 7),
+]
+
+
+def test_name_key_normalizes_nicknames_titles_and_typos():
+    assert name_key("Dr. Jim Gill") == name_key("James Gill")
+    assert name_key("Tae-Hyuk (Ted) Ahn") == name_key("Tae Ahn") == name_key("Ted Ahn")
+    assert name_key("Jamal Adbul-Hafidh") == name_key("Jamal Abdul-Hafidh")
+    assert name_key("José Núñez") == "jose nunez"
+    assert name_key("Michael A. Liljegren") == name_key("Mike Liljegren")
+
+
+def test_preferred_name():
+    assert preferred_name("Tae Ahn") == "Ted Ahn"
+    assert preferred_name("Jim Gill") == "James Gill"
+    assert preferred_name("Gregory Smith") == "Gregory Smith"
+
+
+def test_soundex():
+    assert soundex("Robert") == soundex("Rupert") == "R163"
+    assert soundex("Ashcraft") == "A261"
+    assert soundex("") == ""
+
+
+def test_match_finds_exact_and_fuzzy_first_names():
+    matcher = NameMatcher(INSTRUCTORS)
+
+    assert matcher.match("Jim Gill").value == 1
+    assert matcher.match("Tae-Hyuk (Ted) Ahn").value == 4
+    assert matcher.match("Abby Stylianou").score == 1.0
+    # Prefix and initial of the first name.
+    assert matcher.match("Greg Smith").value == 2
+    assert matcher.match("G. Smith").value == 2
+    assert matcher.match("Gregory Smith").score > matcher.match("G. Smith").score
+
+
+def test_match_requires_last_name_and_compatible_first_name():
+    matcher = NameMatcher(INSTRUCTORS)
+
+    assert matcher.match("John Smith") is None
+    assert matcher.match("Kate Holdner") is None
+    assert matcher.match("Kate Holdner", threshold=0.8).value == 6
+
+
+def test_candidates_rank_misspelled_names():
+    matcher = NameMatcher(INSTRUCTORS)
+
+    candidates = matcher.candidates("Kathy Holdner", limit=3)
+
+    assert candidates[0].value == 6
+    assert all(a.score >= b.score for a, b in zip(candidates, candidates[1:]))
+
+
+def test_added_names_are_matched():
+    matcher = NameMatcher(INSTRUCTORS)
+    assert matcher.match("Yao Xu") is None
+
+    matcher.add("Yao Xu", 8)
+
+    assert matcher.match("yao xu").value == 8
+    assert len(matcher) == len(INSTRUCTORS) + 1
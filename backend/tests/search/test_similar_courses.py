@@ -0,0 +1,111 @@
+import numpy as np
+
+from billiken_blueprint.search.similar_courses import (
+    SimilarCoursesGraph,
+    load_similar_courses_graph,
+    refresh_similar_courses,
+)
+from billiken_blueprint.search.vector_index import NumpyVectorIndex
+
+
+def random_catalog(n, dim=16, seed=0):
+    rng = np.random.default_rng(seed)
+    ids = list(range(1, n + 1))
+    return (
+        ids,
+        [f"CSCI {1000 + id}" for id in ids],
+        [f"hash-{id}" for id in ids],
+        rng.standard_normal((n, dim)).astype(np.float32),
+    )
+
+
+def brute_force_neighbors(embeddings, n_neighbors):
+    vectors = embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+    similarities = vectors @ vectors.T
+    np.fill_diagonal(similarities, -np.inf)
+    return np.argsort(-similarities, axis=1)[:, :n_neighbors]
+
+
+def test_build_matches_brute_force_and_excludes_self():
+    ids, codes, hashes, embeddings = random_catalog(50)
+
+    graph = SimilarCoursesGraph.build(ids, codes, hashes, embeddings, n_neighbors=5)
+
+    np.testing.assert_array_equal(
+        graph.neighbors, brute_force_neighbors(embeddings, 5)
+    )
+    similar = graph.similar(1)
+    assert len(similar) == 5
+    assert all(s.course_id != 1 for s in similar)
+    assert [s.score for s in similar] == sorted((s.score for s in similar), reverse=True)
+
+
+def test_small_catalog_pads_neighbor_lists():
+    ids, codes, hashes, embeddings = random_catalog(3)
+
+    graph = SimilarCoursesGraph.build(ids, codes, hashes, embeddings, n_neighbors=5)
+
+    assert len(graph.similar(2)) == 2
+    assert graph.similar(2, limit=1)[0].course_code in {"CSCI 1001", "CSCI 1003"}
+
+
+def test_rebuild_only_recomputes_affected_rows_and_matches_full_build():
+    ids, codes, hashes, embeddings = random_catalog(200)
+    graph = SimilarCoursesGraph.build(ids, codes, hashes, embeddings, n_neighbors=5)
+
+    rng = np.random.default_rng(1)
+    embeddings = embeddings.copy()
+    embeddings[10] = rng.standard_normal(16)
+    hashes = list(hashes)
+    hashes[10] = "changed"
+    # Drop course 200 and add course 201.
+    ids = ids[:-1] + [201]
+    codes = codes[:-1] + ["CSCI 1201"]
+    hashes = hashes[:-1] + ["hash-201"]
+    embeddings[-1] = rng.standard_normal(16)
+
+    rebuilt, recomputed = graph.rebuild(ids, codes, hashes, embeddings)
+    full = SimilarCoursesGraph.build(ids, codes, hashes, embeddings, n_neighbors=5)
+
+    np.testing.assert_array_equal(rebuilt.neighbors, full.neighbors)
+    np.testing.assert_allclose(rebuilt.scores, full.scores, atol=1e-6)
+    assert 2 <= recomputed < len(ids)
+
+
+def test_refresh_persists_and_reuses_graph(tmp_path):
+    ids, codes, hashes, embeddings = random_catalog(20)
+    index = NumpyVectorIndex()
+    index.upsert(
+        ids=[f"doc_{id}" for id in ids],
+        embeddings=embeddings,
+        metadatas=[
+            {"course_id": id, "course_code": code, "content_hash": content_hash}
+            for id, code, content_hash in zip(ids, codes, hashes)
+        ],
+    )
+    path = tmp_path / "similar.npz"
+
+    _, first = refresh_similar_courses(index, path, n_neighbors=3)
+    graph, second = refresh_similar_courses(index, path, n_neighbors=3)
+
+    assert first == 20
+    assert second == 0
+    assert len(SimilarCoursesGraph.load(path).similar(5)) == 3
+    assert len(graph) == 20
+
+
+def test_loaded_graph_is_reused_until_rebuilt(tmp_path):
+    ids, codes, hashes, embeddings = random_catalog(20)
+    path = str(tmp_path / "similar.npz")
+    SimilarCoursesGraph.build(ids, codes, hashes, embeddings, 3).save(path)
+    loaded = load_similar_courses_graph(path)
+    assert load_similar_courses_graph(path) is loaded
+
+    smaller = SimilarCoursesGraph.build(
+        ids[:10], codes[:10], hashes[:10], embeddings[:10], 3
+    )
+    smaller.save(path)
+
+    reloaded = load_similar_courses_graph(path)
+    assert reloaded is not loaded
+    assert len(reloaded) == 10
@@ -0,0 +1,133 @@
+import numpy as np
+import pytest
+
+from billiken_blueprint.search.vector_index import (
+    NumpyVectorIndex,
+    load_course_descriptions_index,
+)
+
+
+def make_index(dtype="float16"):
+    index = NumpyVectorIndex(dtype=dtype)
+    index.upsert(
+        ids=["doc_1", "doc_2", "doc_3", "doc_4"],
+        embeddings=[
+            [1.0, 0.0, 0.0],
+            [0.9, 0.1, 0.0],
+            [0.0, 1.0, 0.0],
+            [0.7, 0.0, 0.7],
+        ],
+        metadatas=[
+            {"course_id": 1, "course_code": "CSCI 1300", "course_int": 1300},
+            {"course_id": 2, "course_code": "CSCI 2100", "course_int": 2100},
+            {"course_id": 3, "course_code": "MATH 1510", "course_int": 1510},
+            {"course_id": 4, "course_code": "CSCI 5030", "course_int": 5030},
+        ],
+        documents=["intro", "data structures", "calculus", "grad seminar"],
+    )
+    return index
+
+
+@pytest.mark.parametrize("dtype", ["float16", "int8"])
+def test_query_returns_chroma_shape_ordered_by_similarity(dtype):
+    index = make_index(dtype)
+
+    result = index.query(
+        query_embeddings=[2.0, 0.0, 0.0],
+        n_results=3,
+        include=["metadatas", "distances", "documents"],
+    )
+
+    assert set(result) == {"ids", "metadatas", "distances", "documents"}
+    assert result["ids"] == [["doc_1", "doc_2", "doc_4"]]
+    assert result["documents"][0][0] == "intro"
+    assert result["metadatas"][0][1]["course_code"] == "CSCI 2100"
+    distances = result["distances"][0]
+    assert distances == sorted(distances)
+    assert distances[0] == pytest.approx(0.0, abs=1e-2)
+
+
+def test_query_applies_where_filters():
+    index = make_index()
+
+    result = index.query(
+        query_embeddings=[1.0, 0.0, 0.0],
+        n_results=10,
+        where={
+            "$and": [
+                {"course_int": {"$lt": 5000}},
+                {"course_id": {"$nin": [1]}},
+            ]
+        },
+    )
+
+    assert result["ids"] == [["doc_2", "doc_3"]]
+
+
+def test_query_equality_and_in_filters():
+    index = make_index()
+
+    by_code = index.query([1.0, 0.0, 0.0], where={"course_code": "MATH 1510"})
+    by_ids = index.query([1.0, 0.0, 0.0], where={"course_id": {"$in": [3, 4]}})
+
+    assert by_code["ids"] == [["doc_3"]]
+    assert by_ids["ids"] == [["doc_4", "doc_3"]]
+
+
+def test_upsert_replaces_existing_and_delete_removes():
+    index = make_index()
+
+    index.upsert(
+        ids="doc_3",
+        embeddings=[1.0, 0.0, 0.0],
+        metadatas={"course_id": 3, "course_code": "MATH 1510", "course_int": 1510},
+        documents="calculus",
+    )
+    index.delete(["doc_1"])
+
+    assert index.count() == 3
+    result = index.query([1.0, 0.0, 0.0], n_results=1)
+    assert result["ids"] == [["doc_3"]]
+    assert index.get(ids=["doc_1"])["ids"] == []
+
+
+def test_save_and_load_memory_maps_embeddings(tmp_path):
+    index = make_index("int8")
+    index.save(tmp_path)
+
+    loaded = NumpyVectorIndex.load(tmp_path)
+
+    assert isinstance(loaded._embeddings, np.memmap)
+    assert loaded.count() == 4
+    assert loaded.dtype == "int8"
+    assert (
+        loaded.query([0.0, 1.0, 0.0], n_results=1)["ids"]
+        == index.query([0.0, 1.0, 0.0], n_results=1)["ids"]
+    )
+
+    # Writes copy the read-only mapping into memory instead of failing.
+    loaded.upsert("doc_5", [0.0, 0.0, 1.0], {"course_id": 5, "course_int": 1000})
+    assert loaded.count() == 5
+
+
+def test_loaded_index_is_reused_until_rebuilt(tmp_path):
+    make_index().save(tmp_path)
+    loaded = load_course_descriptions_index(str(tmp_path))
+    assert load_course_descriptions_index(str(tmp_path)) is loaded
+
+    index = make_index()
+    index.delete(ids=["doc_4"])
+    index.save(tmp_path)
+
+    reloaded = load_course_descriptions_index(str(tmp_path))
+    assert reloaded is not loaded
+    assert reloaded.count() == 3
+
+
+def test_from_collection_copies_records():
+    source = make_index()
+
+    copy = NumpyVectorIndex.from_collection(source, dtype="int8")
+
+    assert copy.get()["ids"] == source.get()["ids"]
+    assert copy.query([0.0, 1.0, 0.0], n_results=1)["ids"] == [["doc_3"]]
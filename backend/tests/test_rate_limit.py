@@ -0,0 +1,50 @@
+import asyncio
+import time
+
+import pytest
+
+from billiken_blueprint.rate_limit import AdaptiveRateLimiter, AsyncRateLimiter
+
+
+@pytest.mark.asyncio
+async def test_burst_then_throttles():
+    limiter = AsyncRateLimiter(rate=20, period=1.0, burst=2)
+
+    start = time.monotonic()
+    await asyncio.gather(*(limiter.acquire() for _ in range(4)))
+    elapsed = time.monotonic() - start
+
+    # Two immediate tokens, then two more at 50 ms intervals.
+    assert 0.08 <= elapsed < 0.5
+
+
+def test_rejects_non_positive_rate():
+    with pytest.raises(ValueError):
+        AsyncRateLimiter(rate=0)
+
+
+@pytest.mark.asyncio
+async def test_adaptive_limiter_backs_off_and_recovers():
+    limiter = AdaptiveRateLimiter(rate=8, period=1.0, min_rate=2, max_rate=9)
+
+    limiter.throttled()
+    assert limiter.rate == 4
+    limiter.throttled()
+    limiter.throttled()
+    assert limiter.rate == 2
+
+    for _ in range(10):
+        limiter.succeeded()
+    assert limiter.rate == 9
+
+
+@pytest.mark.asyncio
+async def test_adaptive_limiter_waits_out_retry_after():
+    limiter = AdaptiveRateLimiter(rate=1000, period=1.0)
+    await limiter.acquire()
+
+    limiter.throttled(retry_after=0.1)
+    start = time.monotonic()
+    await limiter.acquire()
+
+    assert time.monotonic() - start >= 0.1
@@ -0,0 +1,58 @@
+import asyncio
+import sqlite3
+import zlib
+
+import pytest
+
+from billiken_blueprint.response_cache import ResponseCache
+
+
+def test_round_trip_and_persistence(tmp_path):
+    cache = ResponseCache(tmp_path / "cache.sqlite3")
+    key = ResponseCache.key("https://example.com", "payload")
+
+    assert cache.get(key) is None
+    cache.set(key, {"results": [{"code": "CSCI 1300"}]})
+    cache.close()
+
+    reopened = ResponseCache(tmp_path / "cache.sqlite3")
+    assert reopened.get(key) == {"results": [{"code": "CSCI 1300"}]}
+    assert (reopened.hits, reopened.misses) == (1, 0)
+
+
+def test_bodies_are_compressed(tmp_path):
+    cache = ResponseCache(tmp_path / "cache.sqlite3")
+    cache.set("k", {"description": "x" * 10_000})
+    cache.close()
+
+    with sqlite3.connect(tmp_path / "cache.sqlite3") as connection:
+        (body,) = connection.execute("SELECT body FROM responses").fetchone()
+    assert len(body) < 1_000
+    assert zlib.decompress(body).startswith(b'{"description"')
+
+
+def test_entries_expire_after_ttl(tmp_path):
+    now = [1_000.0]
+    cache = ResponseCache(tmp_path / "cache.sqlite3", ttl=60, clock=lambda: now[0])
+    cache.set("k", [1, 2, 3])
+
+    now[0] += 59
+    assert cache.get("k") == [1, 2, 3]
+    now[0] += 2
+    assert cache.get("k") is None
+    assert cache.delete_expired() == 1
+    assert cache.hit_ratio == pytest.approx(0.5)
+
+
+def test_key_separates_parts():
+    assert ResponseCache.key("ab", "c") != ResponseCache.key("a", "bc")
+
+
+@pytest.mark.asyncio
+async def test_concurrent_async_writers(tmp_path):
+    cache = ResponseCache(tmp_path / "cache.sqlite3")
+
+    await asyncio.gather(*(cache.aset(f"k{i}", {"i": i}) for i in range(100)))
+    values = await asyncio.gather(*(cache.aget(f"k{i}") for i in range(100)))
+
+    assert values == [{"i": i} for i in range(100)]
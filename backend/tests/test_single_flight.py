@@ -0,0 +1,103 @@
+import asyncio
+from contextvars import ContextVar
+
+import pytest
+
+from billiken_blueprint.single_flight import SingleFlight
+
+
+class CountingLoad:
+    def __init__(self, result="catalog", delay=0.05, error=None):
+        self.result = result
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_loads_run_once():
+    single_flight = SingleFlight()
+    load = CountingLoad()
+
+    results = await asyncio.gather(
+        *(single_flight.do("catalog", 1, load) for _ in range(10))
+    )
+
+    assert results == ["catalog"] * 10
+    assert load.calls == 1
+    stats = single_flight.stats["catalog"]
+    assert (stats.loads, stats.coalesced, stats.failures) == (1, 9, 0)
+    assert stats.coalesced_ratio == pytest.approx(0.9)
+    assert stats.mean_coalesced_wait > 0.03
+    assert not single_flight.in_flight("catalog", 1)
+
+
+@pytest.mark.asyncio
+async def test_different_keys_and_later_calls_load_again():
+    single_flight = SingleFlight()
+    load = CountingLoad()
+
+    await asyncio.gather(
+        single_flight.do("catalog", 1, load),
+        single_flight.do("catalog", 2, load),
+        single_flight.do("degree", 1, load),
+    )
+    assert load.calls == 3
+
+    # Nothing is cached once a load finishes.
+    await single_flight.do("catalog", 1, load)
+    assert load.calls == 4
+
+
+@pytest.mark.asyncio
+async def test_failures_are_shared_and_not_remembered():
+    single_flight = SingleFlight()
+    failing = CountingLoad(error=RuntimeError("database is locked"))
+
+    results = await asyncio.gather(
+        *(single_flight.do("catalog", 1, failing) for _ in range(3)),
+        return_exceptions=True,
+    )
+
+    assert failing.calls == 1
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert single_flight.stats["catalog"].failures == 1
+    assert await single_flight.do("catalog", 1, CountingLoad()) == "catalog"
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_load():
+    single_flight = SingleFlight()
+    load = CountingLoad()
+
+    first = asyncio.create_task(single_flight.do("catalog", 1, load))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(single_flight.do("catalog", 1, load))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == "catalog"
+    assert first.cancelled()
+    assert load.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_load_runs_outside_the_callers_context():
+    request_state = ContextVar("request_state", default=None)
+    request_state.set("request 1")
+    seen = []
+
+    async def load():
+        seen.append(request_state.get())
+        return 1
+
+    await SingleFlight().do("catalog", 1, load)
+
+    assert seen == [None]
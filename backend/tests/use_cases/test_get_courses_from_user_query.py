@@ -5,17 +5,19 @@ from billiken_blueprint.use_cases.get_courses_from_user_query import (
 )
 
 
-@patch("billiken_blueprint.use_cases.get_courses_from_user_query.genai_client")
+@patch(
+    "billiken_blueprint.use_cases.get_courses_from_user_query.get_query_course_embedding"
+)
 @patch(
     "billiken_blueprint.use_cases.get_courses_from_user_query.user_input_to_keywords"
 )
-def test_get_courses_filters_excluded(mock_keywords, mock_genai):
+def test_get_courses_filters_excluded(mock_keywords, mock_embed):
     # Setup Mocks
     mock_keywords.return_value = ["key", "words"]
 
     mock_embedding = MagicMock()
     mock_embedding.values = [0.1, 0.2, 0.3]
-    mock_genai.models.embed_content.return_value.embeddings = [mock_embedding]
+    mock_embed.return_value = mock_embedding
 
     mock_collection = MagicMock()
 
@@ -68,14 +70,16 @@ def test_get_courses_filters_excluded(mock_keywords, mock_genai):
     mock_collection.query.assert_called()
 
 
-@patch("billiken_blueprint.use_cases.get_courses_from_user_query.genai_client")
+@patch(
+    "billiken_blueprint.use_cases.get_courses_from_user_query.get_query_course_embedding"
+)
 @patch(
     "billiken_blueprint.use_cases.get_courses_from_user_query.user_input_to_keywords"
 )
-def test_get_courses_pagination(mock_keywords, mock_genai):
+def test_get_courses_pagination(mock_keywords, mock_embed):
     # Setup Mocks
     mock_keywords.return_value = ["key", "words"]
-    mock_genai.models.embed_content.return_value.embeddings = [MagicMock(values=[0.1])]
+    mock_embed.return_value = MagicMock(values=[0.1])
 
     mock_collection = MagicMock()
 
@@ -122,3 +126,104 @@ def test_get_courses_pagination(mock_keywords, mock_genai):
     # Expected: 19, 20, 21, 22, 23
     assert result_ids == [19, 20, 21, 22, 23]
     assert len(result_ids) == 5
+
+
+@patch(
+    "billiken_blueprint.use_cases.get_courses_from_user_query.get_query_course_embedding"
+)
+@patch(
+    "billiken_blueprint.use_cases.get_courses_from_user_query.user_input_to_keywords"
+)
+def test_local_provider_skips_keyword_expansion(mock_keywords, mock_embed):
+    mock_embed.return_value = MagicMock(values=[0.1])
+    mock_collection = MagicMock()
+    mock_collection.query.return_value = {
+        "ids": [["doc_1"]],
+        "metadatas": [[{"course_id": 1}]],
+        "distances": [[0.1]],
+        "documents": [["desc"]],
+    }
+
+    with patch(
+        "billiken_blueprint.use_cases.get_courses_from_user_query.config.EMBEDDING_PROVIDER",
+        "local",
+    ):
+        get_courses_from_user_query("machine learning", mock_collection)
+
+    mock_keywords.assert_not_called()
+    mock_embed.assert_called_once_with("machine learning")
+
+
+def _lexical_index():
+    from billiken_blueprint.domain.courses.course import CourseWithDescription
+    from billiken_blueprint.search.bm25 import Bm25Index
+
+    return Bm25Index.from_courses(
+        [
+            CourseWithDescription(
+                major_code="CSCI",
+                course_number=number,
+                id=id,
+                attribute_ids=[],
+                prerequisites=None,
+                description=description,
+                title=title,
+            )
+            for id, number, title, description in [
+                (1, "1300", "Intro to Programming", "Programming in Python."),
+                (2, "2100", "Data Structures", "Lists, trees and graphs."),
+                (3, "4710", "Databases", "Relational design and SQL."),
+            ]
+        ]
+    )
+
+
+def _vector_results(course_ids):
+    return {
+        "ids": [[f"doc_{i}" for i in course_ids]],
+        "metadatas": [[{"course_id": i} for i in course_ids]],
+        "distances": [[0.1 * n for n in range(len(course_ids))]],
+        "documents": [["desc"] * len(course_ids)],
+    }
+
+
+@patch(
+    "billiken_blueprint.use_cases.get_courses_from_user_query.get_query_course_embedding"
+)
+@patch(
+    "billiken_blueprint.use_cases.get_courses_from_user_query.user_input_to_keywords"
+)
+def test_hybrid_fuses_lexical_hits(mock_keywords, mock_embed):
+    mock_keywords.return_value = ["key"]
+    mock_embed.return_value = MagicMock(values=[0.1])
+    mock_collection = MagicMock()
+    mock_collection.query.return_value = _vector_results([1, 2])
+
+    result = get_courses_from_user_query(
+        "SQL", mock_collection, lexical_index=_lexical_index()
+    )
+
+    ids = result["ids"][0]
+    assert set(ids) == {"doc_1", "doc_2", "doc_3"}
+    # Found only by BM25, so it has no vector distance.
+    assert result["distances"][0][ids.index("doc_3")] is None
+    mock_keywords.assert_called_once()
+
+
+@patch(
+    "billiken_blueprint.use_cases.get_courses_from_user_query.get_query_course_embedding"
+)
+@patch(
+    "billiken_blueprint.use_cases.get_courses_from_user_query.user_input_to_keywords"
+)
+def test_strong_lexical_match_skips_keyword_expansion(mock_keywords, mock_embed):
+    mock_embed.return_value = MagicMock(values=[0.1])
+    mock_collection = MagicMock()
+    mock_collection.query.return_value = _vector_results([1, 2, 3])
+
+    result = get_courses_from_user_query(
+        "CSCI 4710", mock_collection, lexical_index=_lexical_index()
+    )
+
+    mock_keywords.assert_not_called()
+    assert result["ids"][0][0] == "doc_3"
@@ -0,0 +1,244 @@
+import asyncio
+import os
+import time
+
+import httpx
+import pytest
+from fastapi import FastAPI, HTTPException
+
+from billiken_blueprint.domain.courses.course import CourseWithAttributes
+from billiken_blueprint.domain.degrees.degree import Degree
+from billiken_blueprint.domain.degrees.degree_requirement import (
+    CourseRule,
+    CourseWithCode,
+    DegreeRequirement,
+)
+from billiken_blueprint.domain.section import MeetingTime, Section
+from billiken_blueprint.domain.section_table import SectionTable
+from billiken_blueprint.domain.student import Student
+from billiken_blueprint.use_cases.get_schedule import get_schedule
+from billiken_blueprint.use_cases.schedule_executor import (
+    CatalogSnapshot,
+    ScheduleExecutor,
+    ScheduleExecutorBusy,
+    ScheduleRequest,
+    ScheduleTimeout,
+    SnapshotUnavailable,
+)
+
+
+# Tasks run in spawned workers, so they live at module level.
+def sleep_task(snapshot, seconds):
+    time.sleep(seconds)
+    return snapshot.key
+
+
+def burn_cpu_task(snapshot, seconds):
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+    return snapshot.key
+
+
+EMPTY = CatalogSnapshot("empty", [], [])
+
+
+def make_catalog():
+    courses = [
+        CourseWithAttributes(
+            id=i,
+            major_code="CSCI",
+            course_number=f"{i}000",
+            attribute_ids=[],
+            prerequisites=None,
+            attributes=[],
+        )
+        for i in (1, 2, 3)
+    ]
+    sections = [
+        Section(
+            id=i,
+            crn=str(i),
+            instructor_names=[],
+            campus_code="STL",
+            description="",
+            title=f"S{i}",
+            course_code=f"CSCI {i}000",
+            semester="Fall",
+            meeting_times=[MeetingTime(day=i, start_time="1000", end_time="1100")],
+        )
+        for i in (1, 2, 3)
+    ]
+    degree = Degree(
+        id=1,
+        name="CS",
+        degree_works_major_code="CS",
+        degree_works_degree_type="BS",
+        degree_works_college_code="ENGI",
+        requirements=[
+            DegreeRequirement(
+                label="Req",
+                needed=3,
+                course_rules=CourseRule(
+                    courses=[CourseWithCode("CSCI", f"{i}000") for i in (1, 2, 3)],
+                    exclude=[],
+                ),
+            )
+        ],
+    )
+    student = Student(
+        id=1,
+        name="Test",
+        degree_id=1,
+        graduation_year=2025,
+        completed_course_ids=[1],
+        desired_course_ids=[],
+        unavailability_times=[],
+        avoid_times=[],
+    )
+    return courses, sections, degree, student
+
+
+@pytest.mark.asyncio
+async def test_schedule_in_pool_matches_inline_schedule():
+    courses, sections, degree, student = make_catalog()
+    executor = ScheduleExecutor(workers=1)
+    try:
+        executor.publish(
+            CatalogSnapshot("v1", courses, SectionTable.from_sections(sections))
+        )
+        assert executor.has_snapshot("v1")
+
+        schedule = await executor.run(
+            "v1", ScheduleRequest(degree, student, [1], [])
+        )
+    finally:
+        executor.shutdown()
+
+    inline = get_schedule(degree, student, [courses[0]], courses, sections, [])
+    assert [s.section.crn for s in schedule] == [s.section.crn for s in inline]
+    assert "1" not in [s.section.crn for s in schedule]
+
+
+@pytest.mark.asyncio
+async def test_timeout_and_backpressure():
+    executor = ScheduleExecutor(
+        workers=1, max_pending=1, timeout=0.5, task=sleep_task
+    )
+    try:
+        executor.publish(EMPTY)
+        # Start the worker so the timings below exclude process start-up.
+        executor.timeout = 30
+        assert await executor.run("empty", 0) == "empty"
+        executor.timeout = 0.5
+
+        with pytest.raises(ScheduleTimeout):
+            await executor.run("empty", 2.0)
+        # The timed-out schedule keeps its worker busy, so it still counts.
+        assert executor.pending == 1
+        with pytest.raises(ScheduleExecutorBusy):
+            await executor.run("empty", 0)
+    finally:
+        executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_publishing_retires_the_semesters_previous_snapshot():
+    executor = ScheduleExecutor(workers=1, task=sleep_task)
+    try:
+        executor.publish(CatalogSnapshot("v1:fall", [], [], "Fall"))
+        executor.publish(CatalogSnapshot("v1:spring", [], [], "Spring"))
+        # The workers have not started yet, so this run reads the snapshot
+        # file after v2 replaces it.
+        running = asyncio.create_task(executor.run("v1:fall", 0))
+        await asyncio.sleep(0)
+        executor.publish(CatalogSnapshot("v2:fall", [], [], "Fall"))
+
+        assert not executor.has_snapshot("v1:fall")
+        assert executor.has_snapshot("v1:spring")
+        with pytest.raises(SnapshotUnavailable):
+            await executor.run("v1:fall", 0)
+
+        # The pending run kept the retired file until it finished.
+        assert await running == "v1:fall"
+        assert len(os.listdir(executor._snapshot_dir)) == 2
+        assert await executor.run("v2:fall", 0) == "v2:fall"
+    finally:
+        executor.shutdown()
+
+
+def p99(samples):
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+
+
+async def light_endpoint_p99(app: FastAPI, heavy_requests: int) -> float:
+    """p99 latency of /light while ``heavy_requests`` schedules are computed.
+
+    Light requests are due every 20ms; latency is measured from when a request
+    was due, so time spent waiting for a blocked event loop counts.
+    """
+    interval = 0.02
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        begin = time.perf_counter()
+        heavy = [
+            asyncio.create_task(client.get("/heavy")) for _ in range(heavy_requests)
+        ]
+        latencies = []
+        due = begin
+        while not all(task.done() for task in heavy):
+            await asyncio.sleep(max(0.0, due - time.perf_counter()))
+            response = await client.get("/light")
+            latencies.append(time.perf_counter() - due)
+            assert response.status_code == 200
+            due += interval
+        statuses = [(await task).status_code for task in heavy]
+    assert set(statuses) <= {200, 503}
+    assert 200 in statuses
+    return p99(latencies)
+
+
+def make_app(heavy) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/light")
+    async def light():
+        return {"ok": True}
+
+    @app.get("/heavy")
+    async def heavy_endpoint():
+        return await heavy()
+
+    return app
+
+
+@pytest.mark.asyncio
+async def test_light_endpoints_stay_fast_while_schedules_compute():
+    """Load test: p99 of a lightweight endpoint with schedules inline vs pooled."""
+    cpu_seconds = 0.3
+
+    async def inline():
+        return burn_cpu_task(EMPTY, cpu_seconds)
+
+    executor = ScheduleExecutor(
+        workers=2, max_pending=4, timeout=30, task=burn_cpu_task
+    )
+    executor.publish(EMPTY)
+
+    async def pooled():
+        try:
+            return await executor.run("empty", cpu_seconds)
+        except ScheduleExecutorBusy:
+            raise HTTPException(status_code=503)
+
+    try:
+        await executor.run("empty", 0)  # start the workers
+        inline_p99 = await light_endpoint_p99(make_app(inline), heavy_requests=4)
+        pooled_p99 = await light_endpoint_p99(make_app(pooled), heavy_requests=6)
+    finally:
+        executor.shutdown()
+
+    # Inline, a light request waits behind whole schedule computations.
+    assert inline_p99 >= cpu_seconds * 0.8
+    assert pooled_p99 < 0.1
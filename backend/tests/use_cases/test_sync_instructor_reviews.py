@@ -0,0 +1,98 @@
+from datetime import datetime
+
+import pytest
+
+from billiken_blueprint.domain.ratings.rmp_review import RmpReview
+from billiken_blueprint.use_cases.sync_instructor_reviews import (
+    sync_instructor_reviews,
+)
+
+
+def make_review(comment, instructor_id=1, review_date=datetime(2024, 1, 15)):
+    return RmpReview(
+        id=None,
+        instructor_id=instructor_id,
+        course="CSCI 1300",
+        quality=4.5,
+        difficulty=2.0,
+        comment=comment,
+        would_take_again=True,
+        grade="A",
+        attendance="Mandatory",
+        tags=["helpful", "organized"],
+        review_date=review_date,
+    )
+
+
+def test_content_hash_ignores_ids_and_tag_order():
+    review = make_review("Great professor!")
+    stored = make_review("Great professor!")
+    stored.id = 12
+    stored.course_id = 100
+    stored.tags = ["organized", "helpful"]
+
+    assert review.content_hash() == stored.content_hash()
+    assert (
+        review.content_hash()
+        != make_review("Great professor!", review_date=datetime(2024, 2, 1)).content_hash()
+    )
+
+
+@pytest.mark.asyncio
+async def test_first_sync_inserts_every_review(rmp_review_repository):
+    summary = await sync_instructor_reviews(
+        1, [make_review("a"), make_review("b")], rmp_review_repository
+    )
+
+    assert (summary.inserted, summary.deleted, summary.unchanged) == (2, 0, 0)
+    stored = await rmp_review_repository.get_stored_by_instructor_id(1)
+    assert sorted(review.comment for review in stored) == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_resync_writes_only_the_delta(rmp_review_repository):
+    await sync_instructor_reviews(
+        1, [make_review("a"), make_review("b")], rmp_review_repository
+    )
+    ids_before = {
+        review.comment: review.id
+        for review in await rmp_review_repository.get_stored_by_instructor_id(1)
+    }
+
+    summary = await sync_instructor_reviews(
+        1, [make_review("c"), make_review("a")], rmp_review_repository
+    )
+
+    assert (summary.inserted, summary.deleted, summary.unchanged) == (1, 1, 1)
+    stored = {
+        review.comment: review.id
+        for review in await rmp_review_repository.get_stored_by_instructor_id(1)
+    }
+    assert sorted(stored) == ["a", "c"]
+    # The unchanged review keeps its row.
+    assert stored["a"] == ids_before["a"]
+
+
+@pytest.mark.asyncio
+async def test_unchanged_sync_writes_nothing(rmp_review_repository):
+    reviews = [make_review("a"), make_review("a")]
+    await sync_instructor_reviews(1, reviews, rmp_review_repository)
+
+    summary = await sync_instructor_reviews(1, reviews, rmp_review_repository)
+
+    assert not summary.changed
+    assert summary.unchanged == 2
+    assert len(await rmp_review_repository.get_stored_by_instructor_id(1)) == 2
+
+
+@pytest.mark.asyncio
+async def test_sync_leaves_other_instructors_alone(rmp_review_repository):
+    await sync_instructor_reviews(1, [make_review("a")], rmp_review_repository)
+    await sync_instructor_reviews(
+        2, [make_review("b", instructor_id=2)], rmp_review_repository
+    )
+
+    await sync_instructor_reviews(1, [], rmp_review_repository)
+
+    assert await rmp_review_repository.get_stored_by_instructor_id(1) == []
+    assert len(await rmp_review_repository.get_stored_by_instructor_id(2)) == 1
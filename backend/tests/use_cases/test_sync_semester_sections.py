@@ -0,0 +1,157 @@
+import pytest
+import sqlalchemy
+
+from billiken_blueprint.domain.section import MeetingTime, Section
+from billiken_blueprint.repositories.catalog_version_repository import SECTIONS
+from billiken_blueprint.repositories.section_repository import DBSection
+from billiken_blueprint.use_cases.sync_semester_sections import (
+    sync_semester_sections,
+)
+
+
+def make_section(crn, course_code="CSCI 1300", start_time="0900", semester="202520"):
+    return Section(
+        id=None,
+        crn=crn,
+        instructor_names=["Alan Turing"],
+        campus_code="STL",
+        description="Programming with objects.",
+        title="Intro to OOP",
+        course_code=course_code,
+        semester=semester,
+        meeting_times=[MeetingTime(day=0, start_time=start_time, end_time="0950")],
+    )
+
+
+def test_content_hash_ignores_id_and_meeting_time_order():
+    section = make_section("10001")
+    section.meeting_times.append(MeetingTime(day=2, start_time="0900", end_time="0950"))
+    reordered = make_section("10001")
+    reordered.id = 7
+    reordered.meeting_times.insert(
+        0, MeetingTime(day=2, start_time="0900", end_time="0950")
+    )
+
+    assert section.content_hash() == reordered.content_hash()
+    assert section.content_hash() != make_section("10001", start_time="1000").content_hash()
+
+
+@pytest.mark.asyncio
+async def test_first_sync_inserts_everything(
+    section_repository, catalog_version_repository
+):
+    summary = await sync_semester_sections(
+        "202520", [make_section("10001"), make_section("10002")], section_repository
+    )
+
+    assert summary.inserted == ["10001", "10002"]
+    assert (summary.updated, summary.deleted, summary.unchanged) == ([], [], 0)
+    assert summary.catalog_version == 1
+    assert await catalog_version_repository.get(SECTIONS) == 1
+    assert len(await section_repository.get_all_for_semester("202520")) == 2
+
+
+@pytest.mark.asyncio
+async def test_resync_applies_only_changes(
+    section_repository, catalog_version_repository
+):
+    await sync_semester_sections(
+        "202520",
+        [make_section("10001"), make_section("10002"), make_section("10003")],
+        section_repository,
+    )
+    original_ids = {
+        section.crn: section.id
+        for section in await section_repository.get_all_for_semester("202520")
+    }
+
+    summary = await sync_semester_sections(
+        "202520",
+        [
+            make_section("10001"),
+            make_section("10002", start_time="1000"),
+            make_section("10004"),
+        ],
+        section_repository,
+    )
+
+    assert summary.inserted == ["10004"]
+    assert summary.updated == ["10002"]
+    assert summary.deleted == ["10003"]
+    assert summary.unchanged == 1
+    assert summary.catalog_version == 2
+
+    stored = {
+        section.crn: section
+        for section in await section_repository.get_all_for_semester("202520")
+    }
+    assert sorted(stored) == ["10001", "10002", "10004"]
+    assert stored["10002"].id == original_ids["10002"]
+    assert stored["10002"].meeting_times[0].start_time == "1000"
+
+
+@pytest.mark.asyncio
+async def test_unchanged_sync_does_not_bump_version(
+    section_repository, catalog_version_repository
+):
+    sections = [make_section("10001")]
+    await sync_semester_sections("202520", sections, section_repository)
+
+    summary = await sync_semester_sections("202520", sections, section_repository)
+
+    assert not summary.changed
+    assert summary.unchanged == 1
+    assert summary.catalog_version is None
+    assert await catalog_version_repository.get(SECTIONS) == 1
+
+
+@pytest.mark.asyncio
+async def test_rows_without_stored_hash_are_updated(
+    section_repository, async_sessionmaker
+):
+    await section_repository.save(make_section("10001"))
+    # Rows saved before content hashes existed have none stored.
+    async with async_sessionmaker() as session:
+        await session.execute(sqlalchemy.update(DBSection).values(content_hash=None))
+        await session.commit()
+
+    summary = await sync_semester_sections(
+        "202520", [make_section("10001")], section_repository
+    )
+
+    assert summary.updated == ["10001"]
+    assert await section_repository.get_content_hashes("202520") == {
+        "10001": make_section("10001").content_hash()
+    }
+
+
+@pytest.mark.asyncio
+async def test_department_scope_limits_deletes(section_repository):
+    await sync_semester_sections(
+        "202520",
+        [make_section("10001"), make_section("20001", course_code="MATH 1510")],
+        section_repository,
+    )
+
+    summary = await sync_semester_sections(
+        "202520", [], section_repository, departments=["csci"]
+    )
+
+    assert summary.deleted == ["10001"]
+    stored = await section_repository.get_all_for_semester("202520")
+    assert [section.crn for section in stored] == ["20001"]
+
+
+@pytest.mark.asyncio
+async def test_other_semesters_are_untouched(section_repository):
+    await sync_semester_sections(
+        "202510", [make_section("10001", semester="202510")], section_repository
+    )
+
+    summary = await sync_semester_sections(
+        "202520", [make_section("10001")], section_repository
+    )
+
+    assert summary.inserted == ["10001"]
+    assert summary.deleted == []
+    assert len(await section_repository.get_all_for_semester("202510")) == 1
@@ -1,8 +1,8 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-import argparse, json, sqlite3
-from typing import Any, Dict, List
+import argparse, json, os, sqlite3
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 # ---------- type helpers ----------
 
@@ -20,14 +20,40 @@ def merge_type(t1: str, t2: str) -> str:
     if {"INTEGER","REAL"} == {t1, t2}: return "REAL"
     return "TEXT"
 
-def collect_schema(rows: List[Dict[str, Any]]) -> Dict[str, str]:
-    schema: Dict[str, str] = {}
+def collect_schema(rows: List[Dict[str, Any]],
+                   schema: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+    schema = {} if schema is None else schema
     for r in rows:
         for k, v in r.items():
             t = infer_type(v)
             schema[k] = merge_type(schema[k], t) if k in schema else t
     return schema
 
+PY_TYPE_SAMPLES = {bool: True, int: 0, float: 0.0, str: "", list: [], dict: {}, type(None): None}
+
+class SchemaCollector:
+    """collect_schema for streamed rows: records each distinct (keys, value
+    types) signature with C-level calls and infers column types from the
+    few distinct signatures at the end."""
+
+    def __init__(self):
+        self.signatures = set()
+
+    def add(self, rows: List[Dict[str, Any]]):
+        for r in rows:
+            self.signatures.add((tuple(r), tuple(map(type, r.values()))))
+
+    def schema(self) -> Dict[str, str]:
+        schema: Dict[str, str] = {}
+        for keys, types in self.signatures:
+            collect_schema([dict(zip(keys, map(PY_TYPE_SAMPLES.get, types)))], schema)
+        return schema
+
+    def json_columns(self) -> set:
+        """Columns holding lists/dicts, which are stored as JSON strings."""
+        return {k for keys, types in self.signatures
+                for k, t in zip(keys, types) if t in (list, dict)}
+
 def coerce_sql_value(v: Any):
     # Make values safe for sqlite bindings
     if isinstance(v, bool):
@@ -38,22 +64,79 @@ def coerce_sql_value(v: Any):
 
 # ---------- data shaping ----------
 
+def split_item(it: Dict[str, Any], review_key: str) -> Tuple[dict, List[dict]]:
+    """A professor object -> (professor row, review rows)."""
+    reviews = it.get(review_key, []) if review_key in it and isinstance(it[review_key], list) else []
+    root = {k: v for k, v in it.items() if k != review_key}
+    return root, [rv if isinstance(rv, dict) else {"comment": str(rv)} for rv in reviews]
+
 def to_rows(items: List[Dict[str, Any]], review_key: str) -> tuple[List[dict], List[dict]]:
     prof_rows: List[Dict[str, Any]] = []
     review_rows: List[Dict[str, Any]] = []
     for it in items:
         if not isinstance(it, dict):
             continue
-        reviews = it.get(review_key, []) if review_key in it and isinstance(it[review_key], list) else []
-        root = {k: v for k, v in it.items() if k != review_key}
+        root, reviews = split_item(it, review_key)
         prof_rows.append(root)
-        for rv in reviews:
-            if isinstance(rv, dict):
-                review_rows.append(rv)
-            else:
-                review_rows.append({"comment": str(rv)})
+        review_rows.extend(reviews)
     return prof_rows, review_rows
 
+def load_items(path: str) -> List[Any]:
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    if isinstance(data, dict):
+        # If top-level is an object, pick the first list value
+        return next((v for v in data.values() if isinstance(v, list)), [])
+    if isinstance(data, list):
+        return data
+    raise SystemExit("Unsupported JSON shape: top-level must be a list or an object containing a list.")
+
+def iter_items(path: str, chunk_size: int = 1 << 20) -> Iterator[Any]:
+    """Professor objects from a JSON array or a JSON-lines file (e.g. a scrape
+    checkpoint), decoded a chunk at a time so the input never has to fit in
+    memory. Other shapes fall back to load_items."""
+    if path.endswith(".jsonl"):
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        return
+
+    decoder = json.JSONDecoder()
+    with open(path, "r", encoding="utf-8") as f:
+        buf, eof = f.read(chunk_size), False
+        pos = len(buf) - len(buf.lstrip())
+        if buf[pos:pos + 1] != "[":
+            yield from load_items(path)
+            return
+        pos += 1
+        while True:
+            # Skip separators, reading on when the buffer runs out.
+            while pos < len(buf) and buf[pos] in " \t\r\n,":
+                pos += 1
+            if pos == len(buf) and not eof:
+                buf, pos = f.read(chunk_size), 0
+                eof = not buf
+                continue
+            if pos == len(buf) or buf[pos] == "]":
+                return
+            try:
+                item, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                end = None
+            # A value that is cut off, or ends exactly at the buffer's end
+            # (a number may continue), needs more input.
+            if (end is None or end == len(buf)) and not eof:
+                more = f.read(chunk_size)
+                eof = not more
+                buf, pos = buf[pos:] + more, 0
+                continue
+            if end is None:
+                raise SystemExit(f"Invalid JSON in {path}")
+            yield item
+            pos = end
+
 # ---------- DDL helpers ----------
 
 def create_prof_table(cur: sqlite3.Cursor, schema: Dict[str, str]):
@@ -69,10 +152,6 @@ def create_prof_table(cur: sqlite3.Cursor, schema: Dict[str, str]):
           {", ".join(cols)}
         )
     """)
-    if "name" in schema:
-        cur.execute('CREATE INDEX IF NOT EXISTS idx_prof_name ON professors(name)')
-    if "department" in schema:
-        cur.execute('CREATE INDEX IF NOT EXISTS idx_prof_dept ON professors(department)')
 
 def create_review_table(cur: sqlite3.Cursor, schema: Dict[str, str]):
     cols = [f'"{k}" {t}' for k, t in schema.items()]
@@ -84,9 +163,18 @@ def create_review_table(cur: sqlite3.Cursor, schema: Dict[str, str]):
           FOREIGN KEY(professor_id) REFERENCES professors(id)
         )
     """)
-    if "course" in schema:
+
+def create_indexes(cur: sqlite3.Cursor, prof_schema: Dict[str, str], review_schema: Dict[str, str]):
+    # Built after the rows are in: one sort per index instead of a b-tree
+    # update per inserted row.
+    if "name" in prof_schema:
+        cur.execute('CREATE INDEX IF NOT EXISTS idx_prof_name ON professors(name)')
+    if "department" in prof_schema:
+        cur.execute('CREATE INDEX IF NOT EXISTS idx_prof_dept ON professors(department)')
+    cur.execute('CREATE INDEX IF NOT EXISTS idx_rev_professor ON reviews(professor_id)')
+    if "course" in review_schema:
         cur.execute('CREATE INDEX IF NOT EXISTS idx_rev_course ON reviews(course)')
-    if "date" in schema:
+    if "date" in review_schema:
         cur.execute('CREATE INDEX IF NOT EXISTS idx_rev_date ON reviews(date)')
 
 # ---------- insert helper ----------
@@ -105,6 +193,148 @@ def insert_many(cur: sqlite3.Cursor, table: str, rows: List[Dict[str, Any]]) ->
         ids.append(cur.lastrowid)
     return ids
 
+# ---------- bulk load ----------
+
+PARQUET_TYPES = {"INTEGER": "int64", "REAL": "float64", "TEXT": "string"}
+
+class ParquetSink:
+    """Streams row batches of one table to a Parquet file (needs pyarrow)."""
+
+    def __init__(self, path: str, columns: List[str], types: List[str]):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise SystemExit("--parquet needs pyarrow: pip install pyarrow")
+        self._pa = pa
+        self.types = types
+        self.schema = pa.schema([(c, PARQUET_TYPES[t]) for c, t in zip(columns, types)])
+        self.writer = pq.ParquetWriter(path, self.schema)
+
+    def write(self, rows: List[tuple]):
+        if not rows:
+            return
+        columns = []
+        for values, t, f in zip(zip(*rows), self.types, self.schema):
+            if t == "TEXT":
+                # Mixed-type columns are TEXT in SQLite; stringify the odd values.
+                values = [v if v is None or isinstance(v, str) else str(v) for v in values]
+            elif t == "INTEGER":
+                values = [int(v) if isinstance(v, bool) else v for v in values]
+            columns.append(self._pa.array(values, type=f.type))
+        self.writer.write_table(self._pa.Table.from_arrays(columns, schema=self.schema))
+
+    def close(self):
+        self.writer.close()
+
+def bulk_load(inp: str, out: str, review_key: str, batch_size: int = 50000,
+              parquet: bool = False) -> Tuple[int, int]:
+    """Load ``inp`` into SQLite in two streaming passes: one to infer the
+    schema, one to insert. All rows go in with executemany inside a single
+    transaction (WAL, synchronous=OFF), professor ids are assigned here
+    rather than read back per row, and indexes are built at the end.
+    Returns (professors, reviews) inserted."""
+    profs, revs = SchemaCollector(), SchemaCollector()
+    for it in iter_items(inp):
+        if isinstance(it, dict):
+            root, reviews = split_item(it, review_key)
+            profs.add([root])
+            revs.add(reviews)
+    prof_schema = profs.schema() or {"profile_url": "TEXT", "name": "TEXT"}
+    review_schema = revs.schema() or {"comment": "TEXT", "quality": "REAL"}
+    prof_cols, review_cols = list(prof_schema), list(review_schema)
+    # sqlite3 binds bools as ints; only list/dict columns need converting.
+    prof_json = [prof_cols.index(c) for c in profs.json_columns()]
+    review_json = [review_cols.index(c) for c in revs.json_columns()]
+    encode = json.JSONEncoder(ensure_ascii=False).encode
+
+    def row_values(row: Dict[str, Any], cols: List[str], json_idx: List[int]) -> List[Any]:
+        values = list(map(row.get, cols))
+        for i in json_idx:
+            if isinstance(values[i], (list, dict)):
+                values[i] = encode(values[i])
+        return values
+
+    sinks: List[ParquetSink] = []
+    if parquet:
+        stem = os.path.splitext(out)[0]
+        sinks = [
+            ParquetSink(f"{stem}.professors.parquet", ["id"] + prof_cols,
+                        ["INTEGER"] + [prof_schema[c] for c in prof_cols]),
+            ParquetSink(f"{stem}.reviews.parquet", ["professor_id"] + review_cols,
+                        ["INTEGER"] + [review_schema[c] for c in review_cols]),
+        ]
+
+    conn = sqlite3.connect(out, isolation_level=None)
+    cur = conn.cursor()
+    # Safe for a load that is simply rerun if it fails.
+    cur.execute("PRAGMA journal_mode=WAL")
+    cur.execute("PRAGMA synchronous=OFF")
+    cur.execute("PRAGMA temp_store=MEMORY")
+    cur.execute("PRAGMA cache_size=-262144")
+    create_prof_table(cur, prof_schema)
+    create_review_table(cur, review_schema)
+
+    # Professors already in the file keep their ids (profile_url is UNIQUE).
+    prof_ids: Dict[Any, int] = {}
+    if "profile_url" in prof_schema:
+        prof_ids = dict(cur.execute(
+            'SELECT "profile_url", id FROM professors WHERE "profile_url" IS NOT NULL'))
+    next_id = (cur.execute("SELECT MAX(id) FROM professors").fetchone()[0] or 0) + 1
+
+    col_sql = lambda cols: ", ".join(f'"{c}"' for c in cols)
+    prof_sql = (f'INSERT INTO professors (id, {col_sql(prof_cols)}) '
+                f'VALUES ({", ".join(["?"] * (len(prof_cols) + 1))})')
+    review_sql = (f'INSERT INTO reviews (professor_id, {col_sql(review_cols)}) '
+                  f'VALUES ({", ".join(["?"] * (len(review_cols) + 1))})')
+
+    prof_batch: List[tuple] = []
+    review_batch: List[tuple] = []
+    n_profs = n_reviews = 0
+
+    def flush():
+        cur.executemany(prof_sql, prof_batch)
+        cur.executemany(review_sql, review_batch)
+        if sinks:
+            sinks[0].write(prof_batch)
+            sinks[1].write(review_batch)
+        prof_batch.clear()
+        review_batch.clear()
+
+    cur.execute("BEGIN")
+    try:
+        for it in iter_items(inp):
+            if not isinstance(it, dict):
+                continue
+            root, reviews = split_item(it, review_key)
+            url = root.get("profile_url")
+            prof_id = prof_ids.get(url) if url is not None else None
+            if prof_id is None:
+                prof_id, next_id = next_id, next_id + 1
+                if url is not None:
+                    prof_ids[url] = prof_id
+                prof_batch.append((prof_id, *row_values(root, prof_cols, prof_json)))
+                n_profs += 1
+            for rv in reviews:
+                review_batch.append((prof_id, *row_values(rv, review_cols, review_json)))
+            n_reviews += len(reviews)
+            if len(review_batch) >= batch_size or len(prof_batch) >= batch_size:
+                flush()
+        flush()
+        cur.execute("COMMIT")
+    except BaseException:
+        cur.execute("ROLLBACK")
+        raise
+    finally:
+        for sink in sinks:
+            sink.close()
+
+    create_indexes(cur, prof_schema, review_schema)
+    # Leave a single self-contained database file behind.
+    cur.execute("PRAGMA journal_mode=DELETE")
+    conn.close()
+    return n_profs, n_reviews
+
 # ---------- main ----------
 
 def main():
@@ -113,19 +343,25 @@ def main():
     p.add_argument("--out", dest="out", default="professors.sqlite", help="Output SQLite file")
     p.add_argument("--review-key", dest="review_key", default="reviews",
                    help="Name of the array field that contains reviews (default: reviews)")
+    p.add_argument("--bulk", action="store_true",
+                   help="Stream the input and load it in one transaction with executemany "
+                        "(for large dumps; also reads .jsonl)")
+    p.add_argument("--batch-size", dest="batch_size", type=int, default=50000,
+                   help="Rows per executemany call in --bulk mode (default: 50000)")
+    p.add_argument("--parquet", action="store_true",
+                   help="With --bulk, also write <out>.professors.parquet and "
+                        "<out>.reviews.parquet (requires pyarrow)")
     args = p.parse_args()
 
-    with open(args.inp, "r", encoding="utf-8") as f:
-        data = json.load(f)
-
-    if isinstance(data, dict):
-        # If top-level is an object, pick the first list value
-        items = next((v for v in data.values() if isinstance(v, list)), [])
-    elif isinstance(data, list):
-        items = data
-    else:
-        raise SystemExit("Unsupported JSON shape: top-level must be a list or an object containing a list.")
+    if args.parquet and not args.bulk:
+        p.error("--parquet requires --bulk")
+    if args.bulk:
+        n_profs, n_reviews = bulk_load(args.inp, args.out, args.review_key,
+                                       batch_size=args.batch_size, parquet=args.parquet)
+        print(f"Imported {n_profs} professors and {n_reviews} reviews into {args.out}")
+        return
 
+    items = load_items(args.inp)
     prof_rows, review_rows = to_rows(items, args.review_key)
 
     prof_schema   = collect_schema(prof_rows)   or {"profile_url": "TEXT", "name": "TEXT"}
@@ -163,6 +399,7 @@ def main():
     if expanded_reviews:
         insert_many(cur, "reviews", expanded_reviews)
 
+    create_indexes(cur, prof_schema, review_schema)
     conn.commit()
     conn.close()
     print(f"Imported {len(prof_rows)} professors and {len(expanded_reviews)} reviews into {args.out}")
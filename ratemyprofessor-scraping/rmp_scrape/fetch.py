@@ -7,9 +7,18 @@ RateMyProfessors scraper (resilient, r6)
 - Robust count, scrolling, and school-name extraction
 - Optional per-professor review scraping (include_reviews / max_reviews)
 - Accepts README-style short flags; supports text or .py config
+- Optional worker pool (workers > 1): profiles are scraped by N headless
+  drivers in separate processes and merged back in page order
+- Waits on page conditions (card count, page height, staleness) instead of
+  fixed sleeps
+- Optional HTTP mode (mode = "http"): reads the site's GraphQL API instead of
+  rendering pages (see http_fetch.py)
+- Checkpoints each finished professor and resumes after an interruption;
+  incremental mode fetches only reviews newer than the previous output's
+  (see incremental.py)
 """
 
-__SCRAPER_VERSION__ = "r6"
+__SCRAPER_VERSION__ = "r7"
 
 import os
 import re
@@ -19,14 +28,29 @@ import time
 import pathlib
 import importlib.util
 import argparse
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import WebDriverException
+
+from incremental import (
+    Checkpoint, filter_since, load_baseline, merge_reviews, parse_review_date,
+    refresh_plan, write_json_atomic,
+)
+
+
+PROFILE_CARD_CSS = 'a[href*="/professor/"]'
+REVIEW_BLOCK_XPATH = (
+    '//*[contains(@data-testid,"review") or contains(@class,"Review__") '
+    'or contains(@class,"Rating__StyledRating")]'
+)
 
 
 # ------------------------ Config helpers ------------------------ #
@@ -110,6 +134,10 @@ class CliArgs:
     config: Optional[str] = None
     include_reviews: bool = False
     max_reviews: int = 100
+    headless: bool = False
+    workers: int = 1
+    mode: str = "browser"
+    incremental: bool = False
 
 
 def build_args() -> CliArgs:
@@ -127,6 +155,14 @@ def build_args() -> CliArgs:
                         type=lambda s: str(s).lower() in ("1","true","yes","on"),
                         default=None)
     parser.add_argument("-mr", "--max_reviews", dest="max_reviews", type=int, default=None)
+    parser.add_argument("-hl", "--headless", dest="headless",
+                        type=lambda s: str(s).lower() in ("1","true","yes","on"),
+                        default=None)
+    parser.add_argument("-w", "--workers", dest="workers", type=int, default=None)
+    parser.add_argument("-m", "--mode", dest="mode", choices=("browser", "http"), default=None)
+    parser.add_argument("-inc", "--incremental", dest="incremental",
+                        type=lambda s: str(s).lower() in ("1","true","yes","on"),
+                        default=None)
     ns = parser.parse_args()
 
     args = CliArgs()
@@ -143,6 +179,10 @@ def build_args() -> CliArgs:
     if ns.file_path is not None: args.file_path = ns.file_path
     if ns.include_reviews is not None: args.include_reviews = ns.include_reviews
     if ns.max_reviews is not None: args.max_reviews = ns.max_reviews
+    if ns.headless is not None: args.headless = ns.headless
+    if ns.workers is not None: args.workers = ns.workers
+    if ns.mode is not None: args.mode = ns.mode
+    if ns.incremental is not None: args.incremental = ns.incremental
     args.config = ns.config
     return args
 
@@ -150,7 +190,7 @@ def build_args() -> CliArgs:
 # ------------------------ Scraper ------------------------ #
 
 class RateMyProf:
-    def __init__(self, args: CliArgs):
+    def __init__(self, args: CliArgs, headless: Optional[bool] = None):
         self.args = args
         if not args.sid:
             raise ValueError("Missing 'sid' (school ID). Provide in config or CLI (-s / --sid).")
@@ -162,8 +202,12 @@ class RateMyProf:
         if self.department_id is not None:
             self.url += f"&did={self.department_id}"
 
+        if headless is None:
+            headless = bool(args.headless)
+
         chrome_opts = ChromeOptions()
-        # chrome_opts.add_argument("--headless=new")  # uncomment for headless
+        if headless:
+            chrome_opts.add_argument("--headless=new")
         chrome_opts.add_argument("--no-sandbox")
         chrome_opts.add_argument("--disable-dev-shm-usage")
         chrome_opts.add_argument("--window-size=1280,1600")
@@ -172,11 +216,49 @@ class RateMyProf:
         self.driver = webdriver.Chrome(options=chrome_opts)
         self.wait = WebDriverWait(self.driver, 20)
 
+    def quit(self):
+        try:
+            self.driver.quit()
+        except Exception:
+            pass
+
     # ----------------- Navigation helpers ----------------- #
 
     def get(self, url: str):
         self.driver.get(url)
 
+    def _wait_until(self, condition, timeout: float) -> bool:
+        """Wait for ``condition`` (an expected condition or ``lambda driver``);
+        returns False instead of raising when it does not hold in time."""
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(condition)
+            return True
+        except WebDriverException:
+            # TimeoutException, or the page changed under the condition.
+            return False
+
+    def _count(self, by: str, selector: str) -> int:
+        try:
+            return len(self.driver.find_elements(by, selector))
+        except WebDriverException:
+            return 0
+
+    def _page_height(self) -> int:
+        return int(self.driver.execute_script("return document.body.scrollHeight") or 0)
+
+    def _wait_for_results(self, timeout: float) -> bool:
+        return self._wait_until(
+            lambda d: d.find_elements(By.CSS_SELECTOR, PROFILE_CARD_CSS)
+            or d.find_elements(By.XPATH, '//h1[@data-testid="pagination-header-main-results"]'),
+            timeout,
+        )
+
+    def _click(self, button, testing: bool = False, label: str = ""):
+        self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", button)
+        self._wait_until(EC.element_to_be_clickable(button), 2)
+        self.driver.execute_script("arguments[0].click();", button)
+        if testing and label: print(label)
+
     def _dismiss_overlays(self):
         try:
             xpaths = [
@@ -190,7 +272,7 @@ class RateMyProf:
                 btns = self.driver.find_elements(By.XPATH, xp)
                 if btns:
                     self.driver.execute_script("arguments[0].click();", btns[0])
-                    time.sleep(0.3)
+                    self._wait_until(EC.invisibility_of_element(btns[0]), 2)
                     break
         except Exception:
             pass
@@ -199,61 +281,50 @@ class RateMyProf:
         try:
             btns = self.driver.find_elements(By.XPATH, '//button[contains(., "Show More")]')
             if btns:
-                self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", btns[0])
-                time.sleep(0.15)
-                self.driver.execute_script("arguments[0].click();", btns[0])
-                if testing: print("[expand] clicked Show More")
+                self._click(btns[0], testing, "[expand] clicked Show More")
                 return True
         except Exception as e:
             if testing: print("[expand] Show More click failed:", str(e))
         return False
 
-    def _smart_scroll(self, pause: float = 0.35, max_tries: int = 3, testing: bool = False):
+    def _smart_scroll(self, timeout: float = 1.0, max_tries: int = 3, testing: bool = False):
+        """Scroll down until the page stops growing; each step waits up to
+        ``timeout`` seconds for lazy-loaded content to extend the page."""
         try:
-            last_h = self.driver.execute_script("return document.body.scrollHeight")
+            last_h = self._page_height()
         except Exception:
             return
         if testing: print(f"[scroll] initial height={last_h}")
+        grew = lambda d: self._page_height() > last_h
         for i in range(max_tries):
             self.driver.execute_script("window.scrollBy(0, Math.floor(window.innerHeight*0.9));")
-            time.sleep(pause)
+            if not self._wait_until(grew, timeout):
+                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+                if not self._wait_until(grew, timeout):
+                    break
             try:
-                new_h = self.driver.execute_script("return document.body.scrollHeight")
+                last_h = self._page_height()
             except Exception:
                 break
-            if testing: print(f"[scroll] try={i+1} height={new_h}")
-            if new_h <= last_h:
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(pause)
-                try:
-                    new_h = self.driver.execute_script("return document.body.scrollHeight")
-                except Exception:
-                    break
-                if new_h <= last_h:
-                    break
-            last_h = new_h
+            if testing: print(f"[scroll] try={i+1} height={last_h}")
 
     def _expand_results(self, timeout_sec: int = 10, testing: bool = False):
         self._dismiss_overlays()
         start = time.time()
         stable_rounds = 0
         while time.time() - start < timeout_sec:
-            cards = self.driver.find_elements(By.CSS_SELECTOR, 'a[href*="/professor/"]')
-            count = len(cards) if cards is not None else 0
+            count = self._count(By.CSS_SELECTOR, PROFILE_CARD_CSS)
             if testing: print(f"[expand] visible cards: {count}")
 
             clicked = self._click_show_more_if_present(testing=testing)
             if clicked:
-                try:
-                    WebDriverWait(self.driver, 8).until(
-                        lambda d: len(d.find_elements(By.CSS_SELECTOR, 'a[href*="/professor/"]')) > count
-                    )
-                except Exception:
-                    pass
+                self._wait_until(
+                    lambda d: len(d.find_elements(By.CSS_SELECTOR, PROFILE_CARD_CSS)) > count, 8
+                )
 
-            self._smart_scroll(pause=0.35, max_tries=2, testing=testing)
+            self._smart_scroll(timeout=1.0, max_tries=2, testing=testing)
 
-            new_count = len(self.driver.find_elements(By.CSS_SELECTOR, 'a[href*="/professor/"]'))
+            new_count = self._count(By.CSS_SELECTOR, PROFILE_CARD_CSS)
             if new_count <= count:
                 stable_rounds += 1
             else:
@@ -263,8 +334,6 @@ class RateMyProf:
                 if testing: print("[expand] no more growth; stopping")
                 break
 
-            time.sleep(0.25)
-
     # ----------------- Reviews helpers ----------------- #
 
     def _reviews_click_show_more(self, testing: bool = False) -> bool:
@@ -278,10 +347,7 @@ class RateMyProf:
             for xp in xpaths:
                 btns = self.driver.find_elements(By.XPATH, xp)
                 if btns:
-                    self.driver.execute_script("arguments[0].scrollIntoView({block:\'center\'});", btns[0])
-                    time.sleep(0.15)
-                    self.driver.execute_script("arguments[0].click();", btns[0])
-                    if testing: print("[reviews] clicked Show/Load More")
+                    self._click(btns[0], testing, "[reviews] clicked Show/Load More")
                     return True
         except Exception as e:
             if testing: print("[reviews] Show/Load More failed:", e)
@@ -291,21 +357,18 @@ class RateMyProf:
         start = time.time()
         stable_rounds = 0
         while time.time() - start < max_wait_sec:
-            blocks = self.driver.find_elements(
-                By.XPATH,
-                '//*[contains(@data-testid,"review") or contains(@class,"Review__") or contains(@class,"Rating__StyledRating")]'
-            )
-            count = len(blocks)
+            count = self._count(By.XPATH, REVIEW_BLOCK_XPATH)
             if testing: print(f"[reviews] visible review blocks: {count}")
 
             clicked = self._reviews_click_show_more(testing=testing)
             self.driver.execute_script("window.scrollBy(0, Math.floor(window.innerHeight*0.9));")
-            time.sleep(0.35)
+            # A click should load more reviews; a bare scroll only might.
+            self._wait_until(
+                lambda d: len(d.find_elements(By.XPATH, REVIEW_BLOCK_XPATH)) > count,
+                5 if clicked else 0.5,
+            )
 
-            new_count = len(self.driver.find_elements(
-                By.XPATH,
-                '//*[contains(@data-testid,"review") or contains(@class,"Review__") or contains(@class,"Rating__StyledRating")]'
-            ))
+            new_count = self._count(By.XPATH, REVIEW_BLOCK_XPATH)
             if new_count <= count:
                 stable_rounds += 1
             else:
@@ -415,13 +478,27 @@ class RateMyProf:
 
         return review
 
-    def _scrape_reviews(self, max_reviews: int = 100, testing: bool = False) -> List[dict]:
-        reviews: List[dict] = []
+    def _scrape_reviews(self, max_reviews: int = 100, testing: bool = False,
+                        since=None) -> List[dict]:
+        """Reviews on the current profile page, newest first; with ``since``
+        only those dated on or after it (the page is expanded only when the
+        first reviews shown are all that recent)."""
+        if since is not None:
+            visible = self._parse_review_blocks(max_reviews)
+            dates = [parse_review_date(r["date"]) for r in visible]
+            if any(d is not None and d < since for d in dates):
+                if testing: print(f"[reviews] new reviews all visible (since {since})")
+                return filter_since(visible, since)
+
         self._expand_reviews(max_wait_sec=12, testing=testing)
-        blocks = self.driver.find_elements(
-            By.XPATH,
-            '//*[contains(@data-testid,"review") or contains(@class,"Review__") or contains(@class,"Rating__StyledRating")]'
-        )
+        reviews = filter_since(self._parse_review_blocks(max_reviews), since)
+        if testing:
+            print(f"[reviews] collected {len(reviews)} review rows")
+        return reviews
+
+    def _parse_review_blocks(self, max_reviews: int) -> List[dict]:
+        reviews: List[dict] = []
+        blocks = self.driver.find_elements(By.XPATH, REVIEW_BLOCK_XPATH)
         for el in blocks:
             try:
                 r = self._parse_single_review_block(el)
@@ -431,8 +508,6 @@ class RateMyProf:
                         break
             except Exception:
                 continue
-        if testing:
-            print(f"[reviews] collected {len(reviews)} review rows")
         return reviews
 
     # ----------------- Parsing helpers ----------------- #
@@ -510,7 +585,7 @@ class RateMyProf:
 
         if num_profs is None:
             try:
-                cards = self.driver.find_elements(By.CSS_SELECTOR, 'a[href*="/professor/"]')
+                cards = self.driver.find_elements(By.CSS_SELECTOR, PROFILE_CARD_CSS)
                 num_profs = len(cards) if cards is not None else 0
             except Exception:
                 num_profs = 0
@@ -524,7 +599,9 @@ class RateMyProf:
 
     # ----------------- Main scrape ----------------- #
 
-    def scrape_professors(self, args: CliArgs) -> List[Dict[str, object]]:
+    def collect_profile_links(self, args: CliArgs) -> Tuple[str, List[str]]:
+        """Load the search page, expand it, and return the school name and the
+        unique professor profile URLs in page order."""
         testing = bool(args.testing)
         if testing:
             print("-----------------scrape_professors()----------------")
@@ -533,7 +610,7 @@ class RateMyProf:
             print("University SID: ", args.sid)
 
         self.get(self.url)
-        time.sleep(1.0)
+        self._wait_for_results(timeout=20)
 
         self._expand_results(timeout_sec=int(args.show_more_timeout or 10), testing=testing)
 
@@ -548,13 +625,13 @@ class RateMyProf:
                         print("Timeout waiting for num_professors(). Proceeding with 0.")
                     num_profs = 0
                     break
-                time.sleep(1.0)
+                self._wait_for_results(timeout=5)
 
         self._expand_results(timeout_sec=int(args.show_more_timeout or 10), testing=testing)
 
         school_name = self.get_school_name()
 
-        cards = self.driver.find_elements(By.CSS_SELECTOR, 'a[href*="/professor/"]')
+        cards = self.driver.find_elements(By.CSS_SELECTOR, PROFILE_CARD_CSS)
         links: List[str] = []
         seen: set[str] = set()
         for a in cards:
@@ -572,96 +649,228 @@ class RateMyProf:
         if testing:
             print("-------------scrape_professors() cont.--------------")
             print(f"Found {len(links)} professor links (unique).")
+        return school_name, links
 
-        professors: List[Dict[str, object]] = []
-        for i, url in enumerate(links, 1):
-            prof: Dict[str, object] = {
-                "school": school_name,
-                "school_sid": args.sid,
-                "department_id": args.did,
-                "profile_url": url,
-                "name": None,
-                "department": None,
-                "overall_rating": None,
-                "num_ratings": None,
-            }
+    def scrape_profile(self, url: str, school_name: str, args: CliArgs,
+                       baseline: Optional[Dict[str, object]] = None) -> Dict[str, object]:
+        """Scrape one profile. ``baseline`` is the professor's record from the
+        previous output in incremental mode; its reviews are reused or only
+        extended with newer ones."""
+        testing = bool(args.testing)
+        prof = empty_profile(url, school_name, args)
+        try:
+            self.driver.get(url)
+
+            # Name
             try:
-                self.driver.get(url)
+                h1 = WebDriverWait(self.driver, 10).until(
+                    EC.visibility_of_element_located((By.XPATH, "//h1"))
+                )
+                nm = (h1.text or "").strip()
+                prof["name"] = nm or None
+            except Exception:
+                pass
 
-                # Name
-                try:
-                    h1 = WebDriverWait(self.driver, 10).until(
-                        EC.visibility_of_element_located((By.XPATH, "//h1"))
-                    )
-                    nm = (h1.text or "").strip()
-                    prof["name"] = nm or None
-                except Exception:
-                    pass
+            # Overall rating
+            try:
+                cand = self.driver.find_elements(
+                    By.XPATH,
+                    '//*[contains(@class,"RatingValue__Numerator") or contains(@data-testid,"rating") or contains(text(),"Overall Quality")]'
+                )
+                found = None
+                for el in cand:
+                    txt = (el.text or "").strip()
+                    m = re.search(r"\b(\d+(?:\.\d+)?)\b", txt)
+                    if m:
+                        found = float(m.group(1))
+                        break
+                prof["overall_rating"] = found
+            except Exception:
+                pass
 
-                # Overall rating
-                try:
-                    cand = self.driver.find_elements(
-                        By.XPATH,
-                        '//*[contains(@class,"RatingValue__Numerator") or contains(@data-testid,"rating") or contains(text(),"Overall Quality")]'
-                    )
-                    found = None
-                    for el in cand:
-                        txt = (el.text or "").strip()
-                        m = re.search(r"\b(\d+(?:\.\d+)?)\b", txt)
-                        if m:
-                            found = float(m.group(1))
-                            break
-                    prof["overall_rating"] = found
-                except Exception:
-                    pass
+            # Number of ratings
+            try:
+                body_txt = self.driver.find_element(By.TAG_NAME, "body").text
+                m = re.search(r"\b(\d+)\s+Ratings?\b", body_txt, flags=re.IGNORECASE)
+                if m:
+                    prof["num_ratings"] = int(m.group(1))
+            except Exception:
+                pass
 
-                # Number of ratings
-                try:
-                    body_txt = self.driver.find_element(By.TAG_NAME, "body").text
-                    m = re.search(r"\b(\d+)\s+Ratings?\b", body_txt, flags=re.IGNORECASE)
-                    if m:
-                        prof["num_ratings"] = int(m.group(1))
-                except Exception:
-                    pass
+            # Department (best-effort)
+            try:
+                body_txt = self.driver.find_element(By.TAG_NAME, "body").text
+            except Exception:
+                body_txt = ""
+            try:
+                m = re.search(r"Department\s*:?\s*([A-Za-z0-9 &/\-]+)", body_txt)
+                if m:
+                    prof["department"] = m.group(1).strip()
+            except Exception:
+                pass
 
-                # Department (best-effort)
-                try:
-                    body_txt = self.driver.find_element(By.TAG_NAME, "body").text
-                except Exception:
-                    body_txt = ""
+            # Reviews (optional)
+            if getattr(args, "include_reviews", False):
+                max_reviews = int(getattr(args, "max_reviews", 100) or 100)
+                plan, since = refresh_plan(prof, baseline)
                 try:
-                    m = re.search(r"Department\s*:?\s*([A-Za-z0-9 &/\-]+)", body_txt)
-                    if m:
-                        prof["department"] = m.group(1).strip()
-                except Exception:
-                    pass
-
-                # Reviews (optional)
-                if getattr(args, "include_reviews", False):
-                    try:
-                        prof["reviews"] = self._scrape_reviews(
-                            max_reviews=int(getattr(args, "max_reviews", 100) or 100),
-                            testing=testing
+                    if plan == "reuse":
+                        prof["reviews"] = baseline["reviews"]
+                    else:
+                        reviews = self._scrape_reviews(
+                            max_reviews=max_reviews, testing=testing, since=since
                         )
-                    except Exception as e:
-                        if testing: print("[reviews] error:", e)
-                        prof["reviews"] = []
+                        if plan == "since":
+                            reviews = merge_reviews(reviews, baseline["reviews"], max_reviews)
+                        prof["reviews"] = reviews
+                except Exception as e:
+                    if testing: print("[reviews] error:", e)
+                    prof["reviews"] = (baseline or {}).get("reviews") or []
 
-            except Exception:
-                pass
+        except Exception:
+            pass
+        return prof
+
+    def scrape_professors(self, args: CliArgs) -> List[Dict[str, object]]:
+        testing = bool(args.testing)
+        checkpoint, done, baseline = open_run(args)
+        school_name, links = self.collect_profile_links(args)
 
-            professors.append(prof)
+        professors: List[Dict[str, object]] = []
+        for i, url in enumerate(links, 1):
+            if url in done:
+                professors.append(done[url])
+            else:
+                prof = self.scrape_profile(url, school_name, args, baseline.get(url))
+                checkpoint.append(prof)
+                professors.append(prof)
             if testing and (i % 5 == 0 or i == len(links)):
                 print(f"Scraped {i}/{len(links)} profiles")
 
-        out_path = args.file_path or "all_professors.json"
-        with open(out_path, "w", encoding="utf-8") as f:
-            json.dump(professors, f, ensure_ascii=False, indent=2)
+        write_professors(professors, args)
+        checkpoint.clear()
+        return professors
 
-        if testing:
-            print(f"\nWrote {len(professors)} records to: {out_path}")
 
-        return professors
+# ------------------------ Worker pool ------------------------ #
+
+def empty_profile(url: str, school_name: str, args: CliArgs) -> Dict[str, object]:
+    return {
+        "school": school_name,
+        "school_sid": args.sid,
+        "department_id": args.did,
+        "profile_url": url,
+        "name": None,
+        "department": None,
+        "overall_rating": None,
+        "num_ratings": None,
+    }
+
+
+def open_run(args: CliArgs) -> Tuple[Checkpoint, Dict[str, Dict[str, object]], Dict[str, Dict[str, object]]]:
+    """Checkpoint for this run, the professors it already finished, and the
+    previous output's professors (incremental mode only)."""
+    out_path = args.file_path or "all_professors.json"
+    checkpoint = Checkpoint.for_output(out_path)
+    done = checkpoint.load()
+    baseline = load_baseline(out_path) if args.incremental else {}
+    if args.testing and (done or baseline):
+        print(f"[resume] {len(done)} professors checkpointed, {len(baseline)} in previous output")
+    return checkpoint, done, baseline
+
+
+def write_professors(professors: List[Dict[str, object]], args: CliArgs) -> str:
+    out_path = args.file_path or "all_professors.json"
+    write_json_atomic(out_path, professors)
+
+    if args.testing:
+        print(f"\nWrote {len(professors)} records to: {out_path}")
+    return out_path
+
+
+def partition_links(indexed: List[Tuple[int, str]], workers: int) -> List[List[Tuple[int, str]]]:
+    """Deal (page position, link) pairs round-robin into at most ``workers``
+    partitions; the positions let results be merged back in order."""
+    partitions = [indexed[w::workers] for w in range(max(1, workers))]
+    return [p for p in partitions if p]
+
+
+def _scrape_partition(args: CliArgs, school_name: str, partition: List[Tuple[int, str]],
+                      baseline: Dict[str, Dict[str, object]]) -> List[Tuple[int, Dict[str, object]]]:
+    # Runs in a worker process with its own headless browser; every worker
+    # appends to the run's shared checkpoint.
+    checkpoint = Checkpoint.for_output(args.file_path or "all_professors.json")
+    scraper = RateMyProf(args, headless=True)
+    results = []
+    try:
+        for i, url in partition:
+            prof = scraper.scrape_profile(url, school_name, args, baseline.get(url))
+            checkpoint.append(prof)
+            results.append((i, prof))
+        return results
+    finally:
+        scraper.quit()
+
+
+def scrape_professors_parallel(args: CliArgs) -> List[Dict[str, object]]:
+    """Scrape with ``args.workers`` headless browsers in separate processes.
+
+    The search page is expanded once; the profile links are then dealt across
+    the workers and the results are merged back into page order, so the output
+    matches a sequential run over the same links.
+    """
+    testing = bool(args.testing)
+    checkpoint, done, baseline = open_run(args)
+    scraper = RateMyProf(args, headless=True)
+    try:
+        school_name, links = scraper.collect_profile_links(args)
+    finally:
+        scraper.quit()
+
+    results: Dict[int, Dict[str, object]] = {
+        i: done[url] for i, url in enumerate(links) if url in done
+    }
+    pending = [(i, url) for i, url in enumerate(links) if url not in done]
+    partitions = partition_links(pending, int(args.workers))
+    failed: List[List[Tuple[int, str]]] = []
+    if partitions:
+        # Chrome and its driver do not survive fork(); start workers fresh.
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=len(partitions), mp_context=context) as pool:
+            futures = {
+                pool.submit(
+                    _scrape_partition, args, school_name, partition,
+                    {url: baseline[url] for _, url in partition if url in baseline},
+                ): partition
+                for partition in partitions
+            }
+            for future in as_completed(futures):
+                partition = futures[future]
+                try:
+                    results.update(future.result())
+                except Exception as e:
+                    print(f"[WARN] worker failed on {len(partition)} profiles: {e}")
+                    failed.append(partition)
+                if testing:
+                    print(f"Scraped {len(results)}/{len(links)} profiles")
+
+    if failed:
+        # A failed worker checkpointed the profiles it finished before it
+        # stopped; the rest get a placeholder record, like a failed profile in
+        # the sequential scrape.
+        done = checkpoint.load()
+        for partition in failed:
+            for i, url in partition:
+                results[i] = done.get(url) or empty_profile(url, school_name, args)
+
+    professors = [results[i] for i in sorted(results)]
+    write_professors(professors, args)
+    if failed:
+        # Keep the checkpoint so the same command retries the missing profiles.
+        print(f"[resume] checkpoint kept at {checkpoint.path}")
+    else:
+        checkpoint.clear()
+    return professors
 
 
 # ------------------------ Main ------------------------ #
@@ -678,12 +887,22 @@ if __name__ == "__main__":
     print("file_path: ", args.file_path)
     print("include_reviews: ", args.include_reviews)
     print("max_reviews: ", args.max_reviews)
-
-    scraper = RateMyProf(args)
-    try:
-        scraper.scrape_professors(args)
-    finally:
+    print("headless: ", args.headless)
+    print("workers: ", args.workers)
+    print("mode: ", args.mode)
+    print("incremental: ", args.incremental)
+
+    if args.mode == "http":
+        from http_fetch import scrape_professors_http
+        checkpoint, done, baseline = open_run(args)
+        write_professors(scrape_professors_http(args, checkpoint=checkpoint, done=done,
+                                                baseline=baseline), args)
+        checkpoint.clear()
+    elif int(args.workers or 1) > 1:
+        scrape_professors_parallel(args)
+    else:
+        scraper = RateMyProf(args)
         try:
-            scraper.driver.quit()
-        except Exception:
-            pass
+            scraper.scrape_professors(args)
+        finally:
+            scraper.quit()
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Checkpoint/resume and incremental refresh helpers shared by the browser and
+HTTP fetch modes.
+- Checkpoint: each finished professor is appended as one JSON line, so an
+  interrupted run resumes where it stopped; the file is removed once the
+  output is written
+- Baseline: the previous output (file_path) keyed by profile_url; a professor
+  whose rating count is unchanged reuses its stored reviews, otherwise only
+  reviews from the latest stored date onwards are fetched and merged in
+"""
+
+import os
+import json
+import pathlib
+from datetime import date, datetime
+from typing import Optional, Dict, List, Tuple
+
+
+DATE_FORMATS = ("%b %d, %Y", "%B %d, %Y", "%m/%d/%Y", "%m/%d/%y", "%b %Y", "%B %Y", "%Y-%m-%d")
+
+
+def parse_review_date(value) -> Optional[date]:
+    """Parse the date formats the scrapers produce ("May 4, 2023",
+    "5/4/2023", "May 2023", ISO); None when unknown."""
+    if not value:
+        return None
+    s = str(value).strip()
+    # Ordinal suffixes as shown on profile pages: "May 4th, 2023".
+    for suffix in ("st,", "nd,", "rd,", "th,"):
+        s = s.replace(suffix, ",")
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(s, fmt).date()
+        except ValueError:
+            continue
+    try:
+        return datetime.fromisoformat(s[:10]).date()
+    except ValueError:
+        return None
+
+
+def review_key(review: Dict[str, object]) -> Tuple:
+    return (review.get("date"), review.get("course"), review.get("comment"),
+            review.get("quality"), review.get("difficulty"))
+
+
+def latest_review_date(prof: Optional[Dict[str, object]]) -> Optional[date]:
+    if not prof:
+        return None
+    dates = [parse_review_date(r.get("date")) for r in prof.get("reviews") or []]
+    dates = [d for d in dates if d is not None]
+    return max(dates) if dates else None
+
+
+def refresh_plan(prof: Dict[str, object],
+                 baseline: Optional[Dict[str, object]]) -> Tuple[str, Optional[date]]:
+    """How to refresh the reviews of ``prof`` given its previous record.
+
+    ("reuse", None): the rating count is unchanged, keep the stored reviews.
+    ("since", d): fetch only reviews dated d or later and merge them in.
+    ("full", None): fetch everything; used without stored reviews, when a
+    stored review is undated (new ones cannot be told apart), or when the
+    rating count went down (reviews were removed).
+    """
+    if baseline is None or "reviews" not in baseline:
+        return "full", None
+    new_count, old_count = prof.get("num_ratings"), baseline.get("num_ratings")
+    if new_count is not None and new_count == old_count:
+        return "reuse", None
+    if new_count is not None and old_count is not None and new_count < old_count:
+        return "full", None
+    stored = baseline["reviews"] or []
+    if not stored or any(parse_review_date(r.get("date")) is None for r in stored):
+        return "full", None
+    return "since", latest_review_date(baseline)
+
+
+def filter_since(reviews: List[Dict[str, object]], since: Optional[date]) -> List[Dict[str, object]]:
+    if since is None:
+        return list(reviews)
+    kept = []
+    for review in reviews:
+        d = parse_review_date(review.get("date"))
+        if d is None or d >= since:
+            kept.append(review)
+    return kept
+
+
+def merge_reviews(new: List[Dict[str, object]], old: List[Dict[str, object]],
+                  max_reviews: int) -> List[Dict[str, object]]:
+    """New reviews first (both lists are newest first), without duplicates."""
+    merged: List[Dict[str, object]] = []
+    seen = set()
+    for review in list(new) + list(old):
+        key = review_key(review)
+        if key in seen:
+            continue
+        seen.add(key)
+        merged.append(review)
+    return merged[:max_reviews]
+
+
+def load_baseline(path: Optional[str]) -> Dict[str, Dict[str, object]]:
+    if not path or not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"[WARN] Could not read previous output {path}: {e}")
+        return {}
+    return {p["profile_url"]: p for p in data if isinstance(p, dict) and p.get("profile_url")}
+
+
+def write_json_atomic(path: str, data) -> None:
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+class Checkpoint:
+    """Append-only JSON-lines log of finished professors.
+
+    Each record is written with a single ``write`` to a file opened in append
+    mode, so several worker processes can share one checkpoint. A torn last
+    line (a crash mid-write) is skipped on load and that professor is simply
+    fetched again."""
+
+    def __init__(self, path: str):
+        self.path = pathlib.Path(path)
+
+    @staticmethod
+    def for_output(file_path: str) -> "Checkpoint":
+        return Checkpoint(f"{file_path}.checkpoint.jsonl")
+
+    def load(self) -> Dict[str, Dict[str, object]]:
+        done: Dict[str, Dict[str, object]] = {}
+        if not self.path.exists():
+            return done
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    prof = json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(prof, dict) and prof.get("profile_url"):
+                    done[prof["profile_url"]] = prof
+        return done
+
+    def append(self, prof: Dict[str, object]) -> None:
+        line = json.dumps(prof, ensure_ascii=False) + "\n"
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def clear(self) -> None:
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
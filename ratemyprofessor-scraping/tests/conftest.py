@@ -0,0 +1,53 @@
+import json
+import re
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+ROOT = Path(__file__).parent.parent
+FIXTURES = Path(__file__).parent / "fixtures"
+
+# The scraper modules import each other as top-level modules.
+sys.path.insert(0, str(ROOT / "rmp_scrape"))
+sys.path.insert(0, str(ROOT))
+
+
+def fixture_name(cursor: str) -> str:
+    return re.sub(r"[^A-Za-z0-9]", "_", cursor) if cursor else "first"
+
+
+class FakeRMP:
+    """Serves GraphQL fixtures by query, teacher id and cursor, and records
+    every request."""
+
+    def __init__(self):
+        self.requests: list[dict] = []
+        self.failures: list[httpx.Response] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        self.requests.append(body)
+        if self.failures:
+            return self.failures.pop(0)
+
+        variables = body["variables"]
+        if "TeacherSearchPaginationQuery" in body["query"]:
+            name = "teacher_search"
+        else:
+            name = "ratings_" + fixture_name(variables["id"])
+        path = FIXTURES / f"{name}_{fixture_name(variables['cursor'])}.json"
+        if not path.exists():
+            return httpx.Response(404)
+        return httpx.Response(200, json=json.loads(path.read_text()))
+
+    def queries(self, operation: str) -> list[dict]:
+        return [
+            body["variables"] for body in self.requests if operation in body["query"]
+        ]
+
+
+@pytest.fixture
+def fake_rmp():
+    return FakeRMP()
@@ -0,0 +1,226 @@
+import asyncio
+import json
+from datetime import date
+from pathlib import Path
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from convert import to_rows
+from http_fetch import (
+    GraphQLError,
+    RMPGraphQLClient,
+    fetch_professors,
+    relay_id,
+    scrape_professors_http,
+)
+
+ROOT = Path(__file__).parent.parent
+LILJEGREN = relay_id("Teacher", 2999302)
+
+
+def make_client(fake_rmp, **kwargs):
+    return RMPGraphQLClient(
+        backoff_base=0, transport=httpx.MockTransport(fake_rmp), **kwargs
+    )
+
+
+def make_args(**kwargs):
+    args = dict(sid=850, did=11, testing=False, include_reviews=True, max_reviews=100)
+    args.update(kwargs)
+    return SimpleNamespace(**args)
+
+
+def browser_scrape():
+    return json.loads((ROOT / "cs_professors_with_reviews.json").read_text())
+
+
+def test_teachers_follow_the_cursor(fake_rmp):
+    async def main():
+        async with make_client(fake_rmp) as client:
+            return await client.teachers(850, 11, page_size=2), client.requests
+
+    teachers, requests = asyncio.run(main())
+
+    assert [t["legacyId"] for t in teachers] == [2999302, 3121956, 2800986]
+    searches = fake_rmp.queries("TeacherSearchPaginationQuery")
+    assert [s["cursor"] for s in searches] == ["", "YXJyYXljb25uZWN0aW9uOjE="]
+    assert searches[0]["query"]["schoolID"] == relay_id("School", 850)
+    assert searches[0]["query"]["departmentID"] == relay_id("Department", 11)
+    assert requests == 2
+
+
+def test_ratings_follow_the_cursor_up_to_the_limit(fake_rmp):
+    async def main():
+        async with make_client(fake_rmp) as client:
+            everything = await client.ratings(LILJEGREN, limit=100, page_size=4)
+            limited = await client.ratings(LILJEGREN, limit=3, page_size=4)
+            return everything, limited
+
+    everything, limited = asyncio.run(main())
+
+    assert len(everything) == 7
+    assert limited == everything[:3]
+    ratings = fake_rmp.queries("RatingsListQuery")
+    assert [(r["cursor"], r["count"]) for r in ratings] == [
+        ("", 4),
+        ("YXJyYXljb25uZWN0aW9uOjM=", 4),
+        # The limit caps the page size; one page is enough.
+        ("", 3),
+    ]
+
+
+def test_ratings_stop_at_reviews_older_than_since(fake_rmp):
+    async def main():
+        async with make_client(fake_rmp) as client:
+            return await client.ratings(
+                LILJEGREN, limit=100, page_size=4, since=date(2024, 1, 1)
+            )
+
+    ratings = asyncio.run(main())
+
+    # The first page already reaches 2023, so the second is not requested.
+    assert len(ratings) == 4
+    assert len(fake_rmp.queries("RatingsListQuery")) == 1
+
+
+@pytest.mark.parametrize("status", [429, 500, 502, 503, 504])
+def test_retries_throttled_and_failed_responses(fake_rmp, status):
+    fake_rmp.failures = [
+        httpx.Response(status, headers={"Retry-After": "0"}),
+        httpx.Response(status),
+    ]
+
+    async def main():
+        async with make_client(fake_rmp) as client:
+            return await client.teachers(850, 11), client.requests
+
+    teachers, requests = asyncio.run(main())
+
+    assert len(teachers) == 3
+    # Two failed attempts, then both pages.
+    assert requests == 4
+
+
+def test_gives_up_after_max_retries(fake_rmp):
+    fake_rmp.failures = [httpx.Response(503)] * 3
+
+    async def main():
+        async with make_client(fake_rmp, max_retries=2) as client:
+            await client.teachers(850, 11)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(main())
+    assert len(fake_rmp.requests) == 3
+
+
+def test_client_errors_are_not_retried(fake_rmp):
+    fake_rmp.failures = [httpx.Response(403)]
+
+    async def main():
+        async with make_client(fake_rmp) as client:
+            await client.teachers(850, 11)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(main())
+    assert len(fake_rmp.requests) == 1
+
+
+def test_graphql_errors_raise(fake_rmp):
+    fake_rmp.failures = [
+        httpx.Response(200, json={"errors": [{"message": "Unknown argument"}]})
+    ]
+
+    async def main():
+        async with make_client(fake_rmp) as client:
+            await client.teachers(850, 11)
+
+    with pytest.raises(GraphQLError, match="Unknown argument"):
+        asyncio.run(main())
+
+
+def test_output_matches_the_browser_scrape_schema(fake_rmp):
+    professors = scrape_professors_http(
+        make_args(), transport=httpx.MockTransport(fake_rmp)
+    )
+
+    scraped = browser_scrape()
+    professor_keys = {key for p in scraped for key in p}
+    review_keys = {key for p in scraped for r in p["reviews"] for key in r}
+    assert all(set(p) == professor_keys for p in professors)
+    assert all(set(r) == review_keys for p in professors for r in p["reviews"])
+
+    # The SQLite conversion sees the same professor columns either way.
+    rows, reviews = to_rows(professors, "reviews")
+    scraped_rows, _ = to_rows(scraped, "reviews")
+    assert set(rows[0]) == set(scraped_rows[0])
+    assert len(reviews) == 8
+
+
+def test_professors_map_onto_the_browser_scrape(fake_rmp):
+    liljegren, akbarpour, shown = scrape_professors_http(
+        make_args(), transport=httpx.MockTransport(fake_rmp)
+    )
+
+    scraped = {p["profile_url"]: p for p in browser_scrape()}
+    for professor in (liljegren, akbarpour, shown):
+        expected = dict(scraped[professor["profile_url"]])
+        del expected["reviews"]
+        # The browser scrape read the school from the page title.
+        expected["school"] = "Saint Louis University"
+        assert {k: v for k, v in professor.items() if k != "reviews"} == expected
+
+    # Unrated professors get no rating and no reviews request.
+    assert shown["overall_rating"] is None
+    assert shown["reviews"] == []
+    assert {r["id"] for r in fake_rmp.queries("RatingsListQuery")} == {
+        LILJEGREN,
+        relay_id("Teacher", 3121956),
+    }
+
+
+def test_reviews_map_onto_the_browser_scrape(fake_rmp):
+    liljegren, akbarpour, _ = scrape_professors_http(
+        make_args(), transport=httpx.MockTransport(fake_rmp)
+    )
+
+    first, second, unsure = liljegren["reviews"][:3]
+    assert first == {
+        "date": "Dec 9, 2024",
+        "course": "CSCI1070",
+        "quality": 5.0,
+        "difficulty": 1.0,
+        "comment": first["comment"],
+        "would_take_again": True,
+        "grade": "A",
+        "attendance": "Mandatory",
+        "tags": ["Caring", "Clear grading criteria", "Amazing lectures"],
+    }
+    assert second["attendance"] == "Not Mandatory"
+    # Only letter grades are kept, as in the browser scrape.
+    assert unsure["grade"] is None
+    assert unsure["tags"] == []
+
+    scraped = {p["profile_url"]: p for p in browser_scrape()}
+    for professor in (liljegren, akbarpour):
+        expected = scraped[professor["profile_url"]]["reviews"]
+        assert len(professor["reviews"]) == len(expected)
+        for review, stored in zip(professor["reviews"], expected):
+            for key in ("quality", "difficulty", "comment", "would_take_again"):
+                assert review[key] == stored[key]
+
+
+def test_max_reviews_and_checkpointed_professors(fake_rmp):
+    async def main():
+        async with make_client(fake_rmp) as client:
+            done = {
+                "https://www.ratemyprofessors.com/professor/3121956": {"name": "done"}
+            }
+            return await fetch_professors(make_args(max_reviews=2), client, done=done)
+
+    liljegren, akbarpour, _ = asyncio.run(main())
+
+    assert len(liljegren["reviews"]) == 2
+    assert akbarpour == {"name": "done"}
+    assert [r["id"] for r in fake_rmp.queries("RatingsListQuery")] == [LILJEGREN]